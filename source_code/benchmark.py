@@ -0,0 +1,476 @@
+# Arayüz olmadan çalışan performans ölçüm paketi. utils temel işlemlerini ve
+# aktivasyonları, farklı genişlik/derinlik/optimizer kombinasyonlarında ileri ve
+# geri yayılımı (budanmış seyrek katmanlar dahil), tam epoch eğitimini, CSV
+# okumayı, girdi normalizasyonunu, ağ kaydetme/yüklemeyi, diyagram dışa aktarımını, anlık görüntü kaydı/yüklemesini ve modül içe aktarma (açılış) sürelerini ölçer.
+#
+# Kullanım:
+#   python benchmark.py --output sonuc.json
+#   python benchmark.py --output yeni.json --compare temel.json --threshold 0.15
+#   python benchmark.py --quick --filter forward
+#   python benchmark.py --check            # değişmez kontrolleri (biri bozuksa çıkış kodu 1)
+
+import argparse
+import json
+import math
+import operator
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import compiler
+import utils
+from neural_network import NeuralNetwork
+from data_io import read_csv_dataset, build_checkpoint, save_checkpoint, load_checkpoint, network_from_checkpoint
+from inference import InferenceModel, predict_csv
+from ensemble import EnsembleTrainer
+from cross_validation import run_cross_validation
+from pruning import prune_network
+from quantization import quantize_network, logit_error_bound
+from telemetry import TrainingTelemetry
+from diagram_export import export_diagram
+from snapshots import SnapshotStore
+from forward_context import ParameterSnapshot
+from checkpointing import CHECKPOINT_AUTO
+from normalization import FeatureNormalizer, fit_normalizer
+from morphing import morph_network
+from training import EpochSampler, rng_state_to_json, rng_state_from_json
+
+OPTIMIZERS = ["sgd", "momentum", "adam"]
+
+def optimizer_params(optimizer_type):
+    return {"type": optimizer_type, "beta": 0.9, "beta1": 0.9, "beta2": 0.999, "epsilon": 1e-8}
+
+def random_vector(n, rng):
+    return [rng.uniform(-1.0, 1.0) for _ in range(n)]
+
+def random_matrix(rows, cols, rng):
+    return [[rng.uniform(-1.0, 1.0) for _ in range(cols)] for _ in range(rows)]
+
+def make_network(input_size, width, depth, output_size=2, output_activation="sigmoid", loss_name="mean_squared_error", seed=0, precision="float64", keep_master_weights=False):
+    random.seed(seed)
+    network = NeuralNetwork(loss_name)
+    network.configure_network(input_size, [(width, "relu")] * depth + [(output_size, output_activation)], precision=precision, keep_master_weights=keep_master_weights)
+    return network
+
+def make_dataset(n_samples, input_size, output_size, rng):
+    X = [random_vector(input_size, rng) for _ in range(n_samples)]
+    Y = [[1.0 if j == i % output_size else 0.0 for j in range(output_size)] for i in range(n_samples)]
+    return X, Y
+
+def run_training_epoch(network, X, Y, learning_rate, opt_params):
+    # GUI'deki otomatik eğitim döngüsünün (izleme kapalıyken) arayüzsüz karşılığı.
+    return network.train_epoch(X, Y, learning_rate, opt_params)
+
+def time_callable(func, repeat=5, min_time=0.05):
+    # Tek çağrı süresini ölçer: önce toplam süre min_time'ı geçecek döngü sayısı bulunur,
+    # ardından repeat kez ölçülür. Karşılaştırmada gürültüye en dayanıklı olan min_s kullanılır.
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops): func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20: break
+        loops *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops): func()
+        samples.append((time.perf_counter() - start) / loops)
+    return {"min_s": min(samples), "median_s": statistics.median(samples), "mean_s": statistics.fmean(samples), "loops": loops, "repeat": len(samples)}
+
+def utils_benchmarks(quick, work_dir):
+    rng = random.Random(1); cases = []
+    for n in ([16, 64] if quick else [16, 64, 256]):
+        vec, mat = random_vector(n, rng), random_matrix(n, n, rng)
+        cases.append((f"utils/multiply_row_vector_matrix/{n}x{n}", lambda v=vec, m=mat: utils.multiply_row_vector_matrix(v, m)))
+        cases.append((f"utils/transpose_matrix/{n}x{n}", lambda m=mat: utils.transpose_matrix(m)))
+        cases.append((f"utils/subtract_matrices/{n}x{n}", lambda m=mat: utils.subtract_matrices(m, m)))
+        cases.append((f"utils/multiply_scalar_matrix/{n}x{n}", lambda m=mat: utils.multiply_scalar_matrix(0.5, m)))
+        cases.append((f"utils/add_vectors/{n}", lambda v=vec: utils.add_vectors(v, v)))
+        cases.append((f"utils/softmax/{n}", lambda v=vec: utils.softmax(v)))
+    values = [rng.uniform(-6.0, 6.0) for _ in range(1000)]
+    for name in ["sigmoid", "relu", "tanh", "linear"]:
+        func, deriv = utils.ACTIVATION_FUNCTIONS[name]
+        vec_func, vec_deriv = utils.ACTIVATION_VECTOR_FUNCTIONS[name]
+        outputs = vec_func(values)
+        cases.append((f"activation/{name}/1000", lambda f=func: [f(x) for x in values]))
+        cases.append((f"activation/{name}_derivative/1000", lambda f=deriv: [f(x) for x in values]))
+        cases.append((f"activation_vector/{name}/1000", lambda f=vec_func: f(values)))
+        cases.append((f"activation_vector/{name}_derivative_from_output/1000", lambda f=vec_deriv, a=outputs: f(a)))
+    for name in ["sigmoid", "tanh"]:
+        cases.append((f"activation_vector_fast/{name}/1000", lambda f=utils.FAST_ACTIVATION_VECTOR_FUNCTIONS[name][0]: f(values)))
+    probs, one_hot = utils.softmax(random_vector(10, rng)), [0.0] * 9 + [1.0]
+    cases.append(("loss/mean_squared_error/10", lambda: utils.mean_squared_error(one_hot, probs)))
+    cases.append(("loss/cross_entropy/10", lambda: utils.cross_entropy_loss(one_hot, probs)))
+    return cases
+
+def network_benchmarks(quick, work_dir):
+    rng = random.Random(2); cases = []
+    widths, depths = ([8, 32], [1, 3]) if quick else ([8, 32, 128], [1, 3, 6])
+    for width in widths:
+        for depth in depths:
+            x, y = random_vector(8, rng), [1.0, 0.0]
+            network = make_network(8, width, depth)
+            cases.append((f"forward/w{width}/d{depth}", lambda n=network, x=x: list(n.forward_pass_generator(x, False))))
+            for opt in OPTIMIZERS:
+                network = make_network(8, width, depth); params = optimizer_params(opt)
+                def train_step(n=network, x=x, y=y, p=params):
+                    list(n.forward_pass_generator(x, False)); list(n.backward_pass_generator(y, 0.01, p))
+                cases.append((f"train_step/w{width}/d{depth}/{opt}", train_step))
+    # Ayrıntılı ileri yayılım: tüm adım olayları (üreteç) ve yalnızca son katman aktivasyonuna abonelik.
+    x, network = random_vector(8, rng), make_network(8, 64, 2)
+    cases.append(("forward/w64/d2/detailed/all_events", lambda n=network, x=x: list(n.forward_pass_generator(x, True))))
+    network = make_network(8, 64, 2); network.subscribe(lambda event: None, ["layer_activation"], layers=[2])
+    cases.append(("forward/w64/d2/detailed/subscribed_layer_activation", lambda n=network, x=x: n.forward(x, True)))
+    X, Y = make_dataset(32 if quick else 128, 8, 2, rng)
+    for opt in OPTIMIZERS:
+        network, params = make_network(8, 32, 2), optimizer_params(opt)
+        cases.append((f"epoch/w32/d2/{opt}/n{len(X)}", lambda n=network, p=params: run_training_epoch(n, X, Y, 0.01, p)))
+    network, params = make_network(8, 32, 2), optimizer_params("adam"); network.use_compiled = False
+    cases.append((f"epoch/w32/d2/adam/n{len(X)}/reference", lambda n=network, p=params: run_training_epoch(n, X, Y, 0.01, p)))
+    xor_X, xor_Y = [[0.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]], [[0.0], [1.0], [1.0], [0.0]]
+    for opt in OPTIMIZERS:
+        for use_compiled in [False, True]:
+            random.seed(0); network = NeuralNetwork(); network.configure_network(2, [(4, "tanh"), (1, "sigmoid")]); network.use_compiled = use_compiled
+            cases.append((f"epoch/xor_2_4_1/{opt}/{'compiled' if use_compiled else 'reference'}", lambda n=network, p=optimizer_params(opt): run_training_epoch(n, xor_X, xor_Y, 0.1, p)))
+    for opt in OPTIMIZERS:
+        # K tekrarın yığınlanmış (tek derlenmiş adım) eğitimi ile K ağın ayrı ayrı eğitimi, aynı veri akışında.
+        trainer = EnsembleTrainer(2, [(4, "tanh"), (1, "sigmoid")], 10)
+        cases.append((f"ensemble/xor_2_4_1/k10/{opt}/stacked", lambda t=trainer, p=optimizer_params(opt): t.train_epoch(xor_X, xor_Y, 0.1, p)))
+        separate = EnsembleTrainer(2, [(4, "tanh"), (1, "sigmoid")], 10).replicas
+        cases.append((f"ensemble/xor_2_4_1/k10/{opt}/separate", lambda nets=separate, p=optimizer_params(opt): [run_training_epoch(n, xor_X, xor_Y, 0.1, p) for n in nets]))
+    for processes in [1, None]:
+        # 5 katlı çapraz doğrulama: katlar bu süreçte sırayla ile paylaşımlı bellekten okuyan paralel işçiler (süreç başlatma dahil).
+        cases.append((f"cv/k5/w32/d2/n{len(X)}/{'serial' if processes == 1 else 'parallel'}",
+                      lambda p=processes: run_cross_validation(X, Y, 8, [(32, "relu"), (32, "relu"), (2, "sigmoid")], 5, 2, 0.01, optimizer_params("adam"), processes=p)))
+    x, network = random_vector(8, rng), make_network(8, 128, 2)
+    cases.append(("forward/w128/d2", lambda n=network, x=x: list(n.forward_pass_generator(x, False))))
+    # Parametreler değişmeden aynı girdinin tekrar sorulması (tahmin önbelleği isabeti).
+    network.predict(x)
+    cases.append(("forward/w128/d2/cached", lambda n=network, x=x: list(n.forward_pass_generator(x, False, True))))
+    # Son katmanın biası düzenlendikten sonra aynı girdinin yeniden hesaplanması (yalnızca değişen katmandan itibaren).
+    network = make_network(8, 128, 6); network.predict(x)
+    def edit_output_bias(n=network, x=x):
+        n.set_layer_biases(len(n.weights) - 1, n.biases[-1]); n.predict(x)
+    cases.append(("forward/w128/d6/after_output_edit", edit_output_bias))
+    for sparsity in [0.5, 0.9]:
+        # Büyüklüğe göre budanmış (CSR) katmanlar; aynı boyuttaki yoğun ölçümlerle karşılaştırılır.
+        network = make_network(8, 128, 2); prune_network(network, sparsity)
+        cases.append((f"forward/w128/d2/pruned{int(sparsity * 100)}", lambda n=network, x=x: list(n.forward_pass_generator(x, False))))
+        network, params = make_network(8, 128, 2), optimizer_params("adam"); prune_network(network, sparsity)
+        cases.append((f"epoch/w128/d2/adam/n{len(X)}/pruned{int(sparsity * 100)}", lambda n=network, p=params: run_training_epoch(n, X, Y, 0.01, p)))
+    network, params = make_network(8, 128, 2), optimizer_params("adam")
+    cases.append((f"epoch/w128/d2/adam/n{len(X)}", lambda n=network, p=params: run_training_epoch(n, X, Y, 0.01, p)))
+    for width, depth in [(32, 2), (128, 2)]:
+        # Katman telemetrisi açık (varsayılan örnekleme aralığı); aynı boyuttaki telemetrisiz epoch ile karşılaştırılır.
+        network, params = make_network(8, width, depth), optimizer_params("adam"); network.telemetry = TrainingTelemetry()
+        cases.append((f"epoch/w{width}/d{depth}/adam/n{len(X)}/telemetry", lambda n=network, p=params: run_training_epoch(n, X, Y, 0.01, p)))
+    # Girdi normalizasyonu (z-skor): örnek başına ölçeklemenin epoch'a ek süresi ve istatistiklerin tek geçişte (parçalı) hesaplanması.
+    network, params = make_network(8, 32, 2), optimizer_params("adam"); network.set_input_normalizer(fit_normalizer(X))
+    cases.append((f"epoch/w32/d2/adam/n{len(X)}/normalized", lambda n=network, p=params: run_training_epoch(n, X, Y, 0.01, p)))
+    fit_X = [random_vector(8, rng) for _ in range(2000 if quick else 10000)]
+    cases.append((f"normalize/fit/n{len(fit_X)}/f8", lambda: fit_normalizer(fit_X)))
+    x, y = random_vector(8, rng), [1.0, 0.0]
+    for every, suffix in [(0, ""), (CHECKPOINT_AUTO, "/checkpointed")]:
+        # Derin ağda aktivasyon checkpoint'i (k=⌈√L⌉): yeniden hesaplamanın adım başına ek süresi.
+        network, params = make_network(8, 64, 16), optimizer_params("adam"); network.checkpoint_every = every
+        cases.append((f"train_sample/w64/d16/adam{suffix}", lambda n=network, x=x, y=y, p=params: n.train_sample(x, y, 0.01, p)))
+    signature = compiler.network_signature(8, [(32, "relu"), (32, "relu"), (2, "sigmoid")], "mean_squared_error")
+    cases.append(("compile/generate_and_exec/w32/d2", lambda: compiler.CompiledNetwork(signature)))
+    for precision, master in [("float32", False), ("float32", True)]:
+        network, params = make_network(8, 32, 2, precision=precision, keep_master_weights=master), optimizer_params("adam")
+        suffix = precision + ("+master" if master else "")
+        cases.append((f"epoch/w32/d2/adam/n{len(X)}/{suffix}", lambda n=network, p=params: run_training_epoch(n, X, Y, 0.01, p)))
+    return cases
+
+def io_benchmarks(quick, work_dir):
+    rng = random.Random(3); cases = []
+    n_rows, n_in, n_out = (500 if quick else 5000), 8, 3
+    csv_path = os.path.join(work_dir, "bench_data.csv")
+    with open(csv_path, 'w') as f:
+        f.write(",".join([f"x{i}" for i in range(n_in)] + ["label"]) + "\n")
+        for i in range(n_rows): f.write(",".join(f"{v:.6f}" for v in random_vector(n_in, rng)) + f",{i % n_out}\n")
+    cases.append((f"io/read_csv_dataset/{n_rows}x{n_in}", lambda: read_csv_dataset(csv_path, n_in, n_out, True)))
+    cases.append((f"io/read_csv_dataset/{n_rows}x{n_in}/float32", lambda: read_csv_dataset(csv_path, n_in, n_out, True, precision="float32")))
+    network = make_network(n_in, 64, 2, n_out, "softmax", "cross_entropy")
+    X, Y = make_dataset(8, n_in, n_out, rng)
+    run_training_epoch(network, X, Y, 0.01, optimizer_params("adam"))
+    ckpt_path = os.path.join(work_dir, "bench_checkpoint.json")
+    state = build_checkpoint(network, n_in, "cross_entropy", "adam", [0.5], [0.5], 1)
+    cases.append(("io/save_checkpoint/w64/d2/adam", lambda: save_checkpoint(ckpt_path, state)))
+    save_checkpoint(ckpt_path, state)
+    cases.append(("io/load_checkpoint/w64/d2/adam", lambda: network_from_checkpoint(load_checkpoint(ckpt_path))))
+    model = InferenceModel.from_checkpoint(state)
+    X_batch, _ = make_dataset(256, n_in, n_out, rng)
+    def forward_each(n=network):
+        for x in X_batch: list(n.forward_pass_generator(x, False))
+    cases.append(("inference/forward_generator/w64/d2/n256", forward_each))
+    cases.append(("inference/predict_batch/w64/d2/n256", lambda: model.predict_batch(X_batch)))
+    snapshot = network.snapshot()
+    cases.append(("inference/snapshot_predict_batch/w64/d2/n256", lambda: snapshot.predict_batch(X_batch)))
+    def snapshot_after_output_edit(n=network):
+        n.set_layer_biases(len(n.weights) - 1, n.biases[-1]); n.snapshot()  # yalnızca çıkış katmanı kopyalanır
+    cases.append(("inference/snapshot_refresh/w64/d2/after_output_edit", snapshot_after_output_edit))
+    cases.append(("inference/snapshot_full/w64/d2", lambda n=network: ParameterSnapshot(n)))
+    int8_model = quantize_network(network, X_batch)
+    cases.append(("inference/predict_batch/w64/d2/n256/int8", lambda: int8_model.predict_batch(X_batch)))
+    pruned = make_network(n_in, 64, 2, n_out, "softmax", "cross_entropy"); prune_network(pruned, 0.9)
+    pruned_model = InferenceModel.from_checkpoint(build_checkpoint(pruned, n_in, "cross_entropy", "adam", [], [], 0))
+    cases.append(("inference/predict_batch/w64/d2/n256/pruned90", lambda: pruned_model.predict_batch(X_batch)))
+    out_path = os.path.join(work_dir, "bench_predictions.csv")
+    cases.append((f"inference/predict_csv/w64/d2/{n_rows}x{n_in}", lambda: predict_csv(model, csv_path, out_path)))
+    svg_path = os.path.join(work_dir, "bench_diagram.svg")
+    cases.append(("export/svg/w64/d2", lambda: export_diagram(network, svg_path)))
+    cases.append(("export/svg/w64/d2/weights", lambda: export_diagram(network, svg_path, show_weights=True, show_biases=True)))
+    snapshot_net = make_network(n_in, 64, 2, n_out, "softmax", "cross_entropy")
+    for fmt in ("float32", "int8"):
+        store = SnapshotStore(os.path.join(work_dir, f"bench_snapshots_{fmt}"), residual_format=fmt)
+        store.record(snapshot_net, 1); run_training_epoch(snapshot_net, X, Y, 0.01, optimizer_params("adam")); store.record(snapshot_net, 2)
+        cases.append((f"snapshot/record_delta/w64/d2/{fmt}", lambda st=store: st.record(snapshot_net, 2)))
+        cases.append((f"snapshot/load_delta/w64/d2/{fmt}", lambda st=store: st.apply(snapshot_net, 2)))
+    return cases
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+GUI_ONLY_MODULES = ["tkinter", "_tkinter", "matplotlib"]
+
+def run_python_snippet(code):
+    # Temiz bir yorumlayıcıda kod çalıştırır; içe aktarma önbelleği ölçümü etkilemez.
+    return subprocess.run([sys.executable, "-c", code], cwd=SOURCE_DIR, check=True, capture_output=True, text=True).stdout
+
+def engine_loaded_gui_modules():
+    code = "import sys, neural_network, data_io, memory, profiler; print(','.join(m for m in %r if m in sys.modules))" % (GUI_ONLY_MODULES,)
+    return [m for m in run_python_snippet(code).strip().split(",") if m]
+
+def startup_benchmarks(quick, work_dir):
+    # Yorumlayıcı açılışı ayrıca ölçülür; modül içe aktarma maliyeti = fark.
+    cases = [("startup/python_bare", lambda: run_python_snippet("pass")),
+             ("startup/import_neural_network", lambda: run_python_snippet("import neural_network")),
+             ("startup/import_gui", lambda: run_python_snippet("import gui"))]
+    try:
+        import importlib.util
+        if importlib.util.find_spec("matplotlib") is not None:
+            # Arayüzün artık grafik sekmesi ilk açıldığında ödediği, açılıştan ertelenen maliyet.
+            cases.append(("startup/deferred_matplotlib_tkagg", lambda: run_python_snippet("import matplotlib.figure, matplotlib.backends.backend_tkagg")))
+    except ImportError: pass
+    return cases
+
+def fast_math_max_errors(n_points=200001, limit=40.0):
+    # Hızlı matematik çekirdeklerinin tam yola göre ölçülen en büyük mutlak hatası.
+    zs = [-limit + 2 * limit * i / (n_points - 1) for i in range(n_points)]
+    return {name: max(abs(a - b) for a, b in zip(utils.FAST_ACTIVATION_VECTOR_FUNCTIONS[name][0](zs), utils.ACTIVATION_VECTOR_FUNCTIONS[name][0](zs)))
+            for name in ["sigmoid", "tanh"]}
+
+def check_fast_math_bound():
+    errors = fast_math_max_errors()
+    return all(v <= utils.FAST_MATH_MAX_ABS_ERROR[k] for k, v in errors.items()), ", ".join(f"{k}={v:.2e} (sınır {utils.FAST_MATH_MAX_ABS_ERROR[k]:.0e})" for k, v in errors.items())
+
+def check_engine_without_gui():
+    gui_modules = engine_loaded_gui_modules()
+    return not gui_modules, ", ".join(gui_modules) if gui_modules else "motor arayüz modülü yüklemiyor"
+
+def _same_training_state(a, b):
+    # Parametreler ve optimizer durumu birebir (== ile) eşit mi?
+    return a.weights == b.weights and a.biases == b.biases and a.get_optimizer_state() == b.get_optimizer_state()
+
+def _train_variants(configure, depth=2, n_samples=24, optimizer="adam", configure_base=None):
+    # Aynı başlangıç ağırlıklarından iki ağ; configure(ağ) ikincisini (configure_base verilirse birincisini de) farklı yola alır.
+    # İkisi aynı örneklerle eğitilir.
+    X, Y = make_dataset(n_samples, 4, 3, random.Random(1))
+    networks = [make_network(4, 8, depth, 3, "softmax", "cross_entropy") for _ in range(2)]
+    if configure_base: configure_base(networks[0])
+    configure(networks[1])
+    for network in networks:
+        for x, y in zip(X, Y): network.train_sample(x, y, 0.05, optimizer_params(optimizer))
+    return networks
+
+def check_compiled_equivalence():
+    # Derlenmiş düz kod ile referans üreteç yolu, üç optimizer için de aynı ağırlık ve optimizer durumunu üretir.
+    for optimizer in OPTIMIZERS:
+        compiled, reference = _train_variants(lambda network: setattr(network, "use_compiled", False), optimizer=optimizer)
+        if compiled.get_compiled() is None: return False, compiled.compile_status
+        if not _same_training_state(compiled, reference): return False, f"{optimizer}: derlenmiş ve referans eğitim farklı"
+    return True, f"{', '.join(OPTIMIZERS)}: 24 adım sonunda birebir aynı"
+
+def check_incremental_recompute():
+    # Tek katman düzenlemesinden sonra önbellekten kısmi yeniden hesaplama, önbelleksiz tam ileri yayılımla birebir aynıdır.
+    X = make_dataset(8, 4, 3, random.Random(2))[0]
+    reused = 0
+    for precision in ["float64", "float32"]:
+        network = make_network(4, 12, 4, 3, "softmax", "cross_entropy", precision=precision)
+        for x in X: network.predict(x)
+        for l in range(len(network.weights) - 1, -1, -1):
+            network.set_layer_weights(l, [[w * 1.01 for w in row] for row in network.weights[l]])
+            partial_before = network.prediction_cache.partial_hits
+            incremental = [(network.predict(x), network.neuron_outputs_z, network.neuron_outputs_a) for x in X]
+            reused += network.prediction_cache.partial_hits - partial_before
+            network.prediction_cache.clear()
+            full = [(network.predict(x), network.neuron_outputs_z, network.neuron_outputs_a) for x in X]
+            if incremental != full: return False, f"{precision}: katman {l + 1} düzenlemesinden sonra kısmi ve tam ileri yayılım farklı"
+    if not reused: return False, "kısmi önbellek isabeti olmadı (artımlı yol denenmedi)"
+    return True, f"float64/float32, her katman düzenlemesi: {reused} kısmi yeniden hesaplama birebir aynı"
+
+def check_int8_error_bound():
+    # int8 modelin her katmanında z hatası, aynı girdiyle float ağırlıklardan hesaplanan z'ye göre logit_error_bound'u aşmaz.
+    network = make_network(4, 16, 2, 3, "softmax", "cross_entropy")
+    network.set_input_normalizer(fit_normalizer([[3.0 * x for x in row] for row in make_dataset(64, 4, 3, random.Random(3))[0]]))
+    X = [[3.0 * x for x in row] for row in make_dataset(128, 4, 3, random.Random(4))[0]]
+    model = quantize_network(network, X[:64])
+    weights, biases = network.get_full_precision_params()
+    checked = skipped = 0; worst = 0.0
+    for row in X:
+        trace = []; model._forward_row(row, trace=trace)
+        for (a, z_q), W, b, layer in zip(trace, weights, biases, model.quantized_layers):
+            if max(map(abs, a), default=0.0) > 127 * layer["input_scale"]: skipped += 1; continue  # kalibrasyon aralığı dışı: sınır geçerli değil
+            for j, (z, b_j) in enumerate(zip(z_q, b)):
+                column = [W_row[j] for W_row in W]
+                error, bound = abs(z - (math.fsum(map(operator.mul, a, column)) + b_j)), logit_error_bound(a, column, layer["input_scale"], layer["weight_scale"])
+                if error > bound * (1 + 1e-9) + 1e-12: return False, f"z hatası {error:.3g} > sınır {bound:.3g} (nöron {j})"
+                worst = max(worst, error / bound if bound else 0.0); checked += 1
+    if not checked: return False, "kalibrasyon aralığında katman girdisi yok"
+    return True, f"{checked} nöron çıktısı sınır içinde (en büyük hata/sınır {worst:.2f}; aralık dışı {skipped} katman girdisi atlandı)"
+
+def _take_indices(sampler, n):
+    taken = []
+    while len(taken) < n:
+        indices = sampler.epoch_indices()[:n - len(taken)]
+        taken += indices; sampler.advance(len(indices))
+    return taken
+
+def check_sampler_resume():
+    # JSON'a yazılıp geri okunan örnekleyici, herhangi bir noktada kesilen eğitimde kesintisiz sırayı aynen sürdürür.
+    n_samples, total = 37, 37 * 3
+    expected = _take_indices(EpochSampler(n_samples, seed=5), total)
+    for cut in [0, 10, 36, 37, 50, 80]:
+        sampler = EpochSampler(n_samples, seed=5); head = _take_indices(sampler, cut)
+        resumed = EpochSampler.from_state(json.loads(json.dumps(sampler.state_dict())), n_samples)
+        if head + _take_indices(resumed, total - cut) != expected: return False, f"{cut}. örnekten sonra devam eden sıra farklı"
+    if rng_state_from_json(json.loads(json.dumps(rng_state_to_json()))) != random.getstate(): return False, "rastgele sayı üreteci durumu JSON'dan aynen geri yüklenmedi"
+    return True, f"{n_samples} örnek × 3 epoch, 6 kesme noktası ve RNG durumu aynen devam ediyor"
+
+def check_checkpointed_equivalence():
+    # Aktivasyon checkpoint'li eğitim (segmentler yeniden hesaplanır, güncelleme üstten alta) referans yolla birebir aynıdır.
+    reference_path = lambda network: setattr(network, "use_compiled", False)
+    for every in [CHECKPOINT_AUTO, 2]:
+        for optimizer in OPTIMIZERS:
+            reference, checkpointed = _train_variants(lambda network: setattr(network, "checkpoint_every", every), depth=9, optimizer=optimizer, configure_base=reference_path)
+            if not _same_training_state(reference, checkpointed): return False, f"k={every}, {optimizer}: checkpoint'li ve referans eğitim farklı"
+    return True, f"9 gizli katman, k=√L ve k=2, {', '.join(OPTIMIZERS)}: birebir aynı"
+
+def check_morph_preserves_function():
+    # Genişletme + derinleştirme (linear ve relu birim katman) sonrası çıktılar float64'te değişmez (yuvarlama düzeyi).
+    X = make_dataset(32, 4, 3, random.Random(5))[0]
+    network = make_network(4, 6, 2, 3, "softmax", "cross_entropy")
+    for x, y in zip(X, make_dataset(32, 4, 3, random.Random(6))[1]): network.train_sample(x, y, 0.05, optimizer_params("adam"))
+    report = morph_network(network, [(6, "relu"), (9, "relu"), (12, "relu"), (12, "linear"), (3, "softmax")], random.Random(0), X)
+    if [tuple(cfg) for cfg in network.layer_configs] != [(6, "relu"), (9, "relu"), (12, "relu"), (12, "linear"), (3, "softmax")]: return False, f"beklenmeyen mimari: {network.layer_configs}"
+    ok = report["max_output_diff"] <= 1e-12
+    return ok, f"{len(report['ops'])} işlem, {report['params_before']} → {report['params_after']} parametre, {report['checked']} örnekte en büyük çıktı farkı {report['max_output_diff']:.2e} (sınır 1e-12)"
+
+def check_streaming_normalizer():
+    # Satır satır (Welford), parça parça ve ayrı parçaların birleştirilmesi (Chan) tek geçişli tam hesapla aynı istatistikleri verir.
+    rng = random.Random(7)
+    rows = [[1e6 + rng.gauss(0, 1), rng.uniform(-5, 5), 3.0, rng.expovariate(0.1)] for _ in range(1000)]
+    columns = list(zip(*rows)); count = len(rows)
+    means = [math.fsum(col) / count for col in columns]
+    exact = {"mean": means, "m2": [math.fsum((x - m) ** 2 for x in col) for col, m in zip(columns, means)], "min": [min(col) for col in columns], "max": [max(col) for col in columns]}
+    by_row = FeatureNormalizer("standard")
+    for row in rows: by_row.update(row)
+    merged = FeatureNormalizer("standard")
+    for start, end in [(0, 1), (1, 300), (300, 301), (301, 1000)]: merged.merge(fit_normalizer(rows[start:end], chunk_size=97))
+    worst = 0.0
+    for name, normalizer in [("satır", by_row), ("parça", fit_normalizer(rows, chunk_size=64)), ("birleştirme", merged)]:
+        state = normalizer.state_dict()
+        if state["count"] != count or state["min"] != exact["min"] or state["max"] != exact["max"]: return False, f"{name}: sayı veya min/max farklı"
+        for key in ["mean", "m2"]:
+            for got, ref in zip(state[key], exact[key]):
+                error = abs(got - ref) / max(abs(ref), 1.0); worst = max(worst, error)
+                if error > 1e-9: return False, f"{name}: {key} göreli farkı {error:.2e}"
+        if FeatureNormalizer.from_state(json.loads(json.dumps(state))).state_dict() != state: return False, f"{name}: durum JSON'dan aynen geri yüklenmedi"
+    return True, f"satır/parça/birleştirme, {count} satır (ortalama 1e6 sütunu dahil): en büyük göreli fark {worst:.1e} (sınır 1e-9)"
+
+# Motorun garanti ettiği davranışlar: her kontrol (geçti_mi, ayrıntı) döndürür. Süre ölçülmez; --check ile çalışır.
+INVARIANT_CHECKS = [("fast_math/max_abs_error", check_fast_math_bound),
+                    ("startup/engine_without_gui", check_engine_without_gui),
+                    ("compiled/reference_equivalence", check_compiled_equivalence),
+                    ("prediction_cache/incremental_recompute", check_incremental_recompute),
+                    ("quantization/int8_error_bound", check_int8_error_bound),
+                    ("training/sampler_resume", check_sampler_resume),
+                    ("checkpointing/reference_equivalence", check_checkpointed_equivalence),
+                    ("morphing/function_preserving", check_morph_preserves_function),
+                    ("normalization/streaming_stats", check_streaming_normalizer)]
+
+def run_checks(name_filter=None, log=print):
+    results = {}
+    for name, check in INVARIANT_CHECKS:
+        if name_filter and name_filter not in name: continue
+        try: ok, detail = check()
+        except Exception as e: ok, detail = False, f"{type(e).__name__}: {e}"
+        results[name] = {"ok": ok, "detail": detail}
+        if log: log(f"{name:<48} {'TAMAM' if ok else 'BOZUK':<6} {detail}")
+    return results
+
+BENCHMARK_GROUPS = {"utils": utils_benchmarks, "network": network_benchmarks, "io": io_benchmarks, "startup": startup_benchmarks}
+
+def run_benchmarks(quick=False, name_filter=None, repeat=5, min_time=0.05, log=print):
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for group, factory in BENCHMARK_GROUPS.items():
+            for name, func in factory(quick, work_dir):
+                if name_filter and name_filter not in name: continue
+                results[name] = time_callable(func, repeat, min_time)
+                if log: log(f"{name:<48} {results[name]['min_s']*1e6:>14.2f} µs  (x{results[name]['loops']})")
+    fast_math_errors = fast_math_max_errors()
+    if log: log("Hızlı matematik en büyük mutlak hata: " + ", ".join(f"{k}={v:.2e} (sınır {utils.FAST_MATH_MAX_ABS_ERROR[k]:.0e})" for k, v in fast_math_errors.items()))
+    gui_modules = engine_loaded_gui_modules()
+    if log: log(f"Motor modülleri arayüz bağımlılığı yüklüyor mu: {'EVET ' + ', '.join(gui_modules) if gui_modules else 'hayır'}")
+    return {"meta": {"python": sys.version.split()[0], "implementation": platform.python_implementation(), "platform": platform.platform(),
+                     "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "quick": quick, "repeat": repeat, "engine_gui_modules": gui_modules, "fast_math_max_abs_error": fast_math_errors}, "results": results}
+
+def compare_results(current, baseline, threshold=0.15):
+    # Her ortak ölçüm için oran = şimdiki / temel (min_s). Oran > 1 + threshold ise gerileme sayılır.
+    rows = []
+    for name, cur in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or base["min_s"] <= 0: continue
+        ratio = cur["min_s"] / base["min_s"]
+        status = "GERİLEME" if ratio > 1 + threshold else ("İYİLEŞME" if ratio < 1 - threshold else "aynı")
+        rows.append((name, base["min_s"], cur["min_s"], ratio, status))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Derin Ağ Tasarım Simülatörü performans ölçümleri")
+    parser.add_argument("--output", "-o", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", "-c", help="Karşılaştırılacak temel (baseline) JSON dosyası")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Gerileme eşiği (0.15 = %%15 yavaşlama)")
+    parser.add_argument("--filter", "-k", help="Yalnızca adında bu metni içeren ölçümleri çalıştır")
+    parser.add_argument("--quick", action="store_true", help="Daha küçük boyutlarla hızlı çalıştır")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Her ölçüm turu için asgari süre (s)")
+    parser.add_argument("--check", action="store_true", help="Ölçüm yerine değişmez kontrollerini çalıştır (biri bozuksa çıkış kodu 1)")
+    args = parser.parse_args(argv)
+    if args.check:
+        checks = run_checks(args.filter)
+        failed = [name for name, result in checks.items() if not result["ok"]]
+        print(f"\n{len(checks)} kontrol çalıştı, {len(failed)} bozuk" + (f": {', '.join(failed)}" if failed else "."))
+        return 1 if failed else 0
+    results = run_benchmarks(args.quick, args.filter, max(1, args.repeat), args.min_time)
+    if args.output:
+        with open(args.output, 'w') as f: json.dump(results, f, indent=2)
+        print(f"Sonuçlar kaydedildi: {args.output}")
+    if args.compare:
+        with open(args.compare, 'r') as f: baseline = json.load(f)
+        rows = compare_results(results, baseline, args.threshold)
+        print(f"\n{'Ölçüm':<48} {'Temel (µs)':>12} {'Şimdi (µs)':>12} {'Oran':>7}  Durum")
+        for name, base_s, cur_s, ratio, status in rows: print(f"{name:<48} {base_s*1e6:>12.2f} {cur_s*1e6:>12.2f} {ratio:>7.2f}  {status}")
+        regressions = [row for row in rows if row[4] == "GERİLEME"]
+        print(f"\n{len(rows)} ölçüm karşılaştırıldı, {len(regressions)} gerileme (eşik %{args.threshold*100:.0f}).")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,82 @@
+# Aktivasyon yeniden hesaplama (gradyan checkpoint). Referans ileri yayılım
+# her katmanın z ve a vektörlerini geri yayılım için saklar; L katmanlı derin
+# ağda bu bellek L ile büyür. Checkpoint açıkken (NeuralNetwork.checkpoint_every
+# = k) yalnızca giriş, her k'ıncı katmanın ve çıkış katmanının aktivasyonları
+# saklanır. Geri yayılım segmentleri üstten alta işler: segmentin ara
+# aktivasyonları kendi checkpoint'inden yeniden hesaplanır, δ'lar bulunur,
+# alt segmente geçecek hata eski ağırlıklarla hesaplanır, segment güncellenir
+# ve ara aktivasyonları bırakılır. k = ⌈√L⌉ ile saklanan + tek segment
+# ~2√L vektördür; bedeli adım başına en fazla bir ek ileri yayılımdır.
+# Güncellemeler referans yolla bit düzeyinde aynıdır (yalnızca katman sırası
+# üstten alta döner).
+
+import copy
+import math
+import time
+
+from memory import vector_bytes, format_bytes
+from precision import DEFAULT_PRECISION
+
+CHECKPOINT_AUTO = -1  # k = ⌈√katman sayısı⌉
+
+def checkpoint_interval(n_layers, every=CHECKPOINT_AUTO):
+    # Etkin k; 0 kapalı demektir.
+    if every == CHECKPOINT_AUTO: return math.isqrt(n_layers - 1) + 1 if n_layers > 0 else 0
+    if every < 0: raise ValueError(f"Geçersiz checkpoint aralığı: {every} (0 = kapalı, {CHECKPOINT_AUTO} = otomatik)")
+    return every
+
+def checkpoint_positions(n_layers, every=CHECKPOINT_AUTO):
+    # Saklanan aktivasyon indisleri (0 = giriş, n_layers = çıkış).
+    k = checkpoint_interval(n_layers, every)
+    if k == 0: return list(range(n_layers + 1))
+    return sorted(set(range(0, n_layers, k)) | {n_layers})
+
+def checkpoint_plan(input_size, layer_configs, every=CHECKPOINT_AUTO, precision=DEFAULT_PRECISION):
+    # Adım başına aktivasyon belleği (memory.vector_bytes tahmini) ve yeniden hesaplanan katman sayısı.
+    sizes, n_layers = [input_size] + [n for n, _ in layer_configs], len(layer_configs)
+    kept = checkpoint_positions(n_layers, every)
+    pair_bytes = [vector_bytes(input_size, precision)] + [2 * vector_bytes(n, precision) for n in sizes[1:]]  # giriş: a; katman: z + a
+    full, stored = sum(pair_bytes), sum(pair_bytes[i] for i in kept)
+    segment = max((sum(pair_bytes[start + 1:end]) for start, end in zip(kept, kept[1:])), default=0)
+    recomputed = n_layers - (len(kept) - 1)
+    return {"layers": n_layers, "every": checkpoint_interval(n_layers, every), "checkpoints": len(kept), "full_bytes": full, "stored_bytes": stored,
+            "peak_bytes": stored + segment, "saved_bytes": full - stored - segment, "recomputed_layers": recomputed,
+            "recompute_fraction": recomputed / n_layers if n_layers else 0.0}
+
+def _clone_for_measurement(network):
+    # ensemble._clone_replica gibi; budama maskeleri ve girdi normalizasyonu da kopyalanır. Derlenmiş yol kapalı (iki mod aynı referans yolda ölçülür).
+    clone = type(network)(network.loss_function_name); clone.fast_math, clone.use_compiled = network.fast_math, False
+    weights, biases = network.get_full_precision_params()
+    clone.configure_network(len(network.weights[0]), network.layer_configs, weights, biases, precision=network.precision, keep_master_weights=network.keep_master_weights)
+    for l, sparse in enumerate(network.sparse_layers):
+        if sparse is not None: clone.set_layer_mask(l, sparse.keep_mask())
+    clone.load_optimizer_state(copy.deepcopy(network.get_optimizer_state())); clone.set_input_normalizer(network.input_normalizer)
+    return clone
+
+def measure_checkpointing(network, X, Y, learning_rate, optimizer_params=None, every=CHECKPOINT_AUTO, repeat=3):
+    # Ağın kopyaları üzerinde aynı örneklerle (karıştırmasız) birer epoch: checkpoint'siz ve checkpoint'li süre
+    # (repeat ölçümün en iyisi), bellek planı ve iki modun sonuç ağırlıklarının birebir aynı olup olmadığı. Ağ değişmez.
+    if not network.weights: raise ValueError("Ölçülecek ağ yok.")
+    if not X: raise ValueError("Ölçüm için veri yok.")
+    times, results = {}, {}
+    for mode, k in (("full", 0), ("checkpointed", every)):
+        best = math.inf
+        for _ in range(repeat):
+            clone = _clone_for_measurement(network); clone.checkpoint_every = k
+            t0 = time.perf_counter(); clone.train_epoch(X, Y, learning_rate, optimizer_params, shuffle=False); best = min(best, time.perf_counter() - t0)
+        times[mode], results[mode] = best, clone.get_full_precision_params()
+    plan = checkpoint_plan(len(network.weights[0]), network.layer_configs, every, network.precision)
+    plan.update(samples=len(X), full_s=times["full"], checkpointed_s=times["checkpointed"],
+                time_overhead_pct=100.0 * (times["checkpointed"] / times["full"] - 1.0) if times["full"] > 0 else 0.0,
+                identical=results["full"] == results["checkpointed"])
+    return plan
+
+def format_checkpoint_report(report):
+    lines = [f"Aktivasyon checkpoint: {report['layers']} katman, k={report['every']}, {report['checkpoints']} saklanan aktivasyon (giriş ve çıkış dahil)",
+             f"  Adım başına aktivasyon belleği: {format_bytes(report['full_bytes'])} → tepe {format_bytes(report['peak_bytes'])} "
+             f"(saklanan {format_bytes(report['stored_bytes'])}, kazanç {format_bytes(report['saved_bytes'])}, %{100.0 * report['saved_bytes'] / report['full_bytes'] if report['full_bytes'] else 0.0:.1f})",
+             f"  Yeniden hesaplanan katman: adım başına {report['recomputed_layers']} (ileri yayılıma göre %{100.0 * report['recompute_fraction']:.0f} ek iş)"]
+    if "full_s" in report:
+        lines.append(f"  Ölçülen epoch süresi ({report['samples']} örnek): {report['full_s'] * 1e3:.2f} ms → {report['checkpointed_s'] * 1e3:.2f} ms "
+                     f"(ek süre %{report['time_overhead_pct']:.1f}); ağırlıklar {'birebir aynı' if report['identical'] else 'FARKLI'}")
+    return lines
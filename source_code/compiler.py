@@ -0,0 +1,243 @@
+# Küçük ağlar için kod üreten derleyici. Katman yapılandırmasından, döngüleri
+# açılmış ve aktivasyonları satır içine alınmış düz Python ileri yayılım ve
+# ileri+delta (geri yayılım) fonksiyonları üretip exec eder. Ağırlıklar koda
+# gömülmez, argüman olarak verilir; bu yüzden yalnızca mimari (imza) değiştiğinde
+# yeniden derleme gerekir. Üretilen kod referans üreteçlerle aynı işlem sırasını
+# izler ve derleme sonrası forward_pass_generator/backward_pass_generator ile
+# doğrulanır. Topluluk eğitimi için K kopyanın ileri yayılımı, deltaları ve
+# optimizer güncellemesi de tek bir fonksiyonda açılabilir.
+
+import math
+import random
+from collections import OrderedDict
+
+from utils import softmax
+
+# Açılmış kodun boyutu ağırlık sayısıyla büyür; bu sınırın üstündeki ağlar derlenmez.
+MAX_UNROLLED_WEIGHTS = 4096
+COMPILED_CACHE_SIZE = 32
+
+ACTIVATION_EXPRESSIONS = {"sigmoid": "1 / (1 + exp(-{z})) if {z} >= -700 else 0.0", "tanh": "tanh({z})", "relu": "{z} if {z} > 0 else 0.0", "linear": "{z}"}
+FAST_ACTIVATION_EXPRESSIONS = dict(ACTIVATION_EXPRESSIONS, sigmoid="0.5 + 0.5 * tanh(0.5 * {z})")
+# Türevler saklanan çıktılardan (a) hesaplanır; None = türev 1 (çarpım atlanır).
+DERIVATIVE_EXPRESSIONS = {"sigmoid": "{a} * (1 - {a})", "tanh": "1.0 - {a} * {a}", "relu": "1.0 if {a} > 0 else 0.0", "linear": None, "softmax": None}
+
+_compiled_cache = OrderedDict()
+
+def network_signature(input_size, layer_configs, loss_function_name, fast_math=False, sparsity=None):
+    # sparsity: budanmış ağlarda katman başına (nöron başına kalan girdi indeksleri) veya None; budanmış terimler koda yazılmaz.
+    return (int(input_size), tuple((int(n), act) for n, act in layer_configs), loss_function_name, bool(fast_math), sparsity)
+
+def _kept_inputs(signature, l, j, n_prev):
+    sparsity = signature[4]
+    return range(n_prev) if sparsity is None or sparsity[l] is None else sparsity[l][j]
+
+def _kept_outputs(signature, l, i, n):
+    # Katman l'deki i. girdinin hâlâ bağlı olduğu nöronlar (geri yayılım için).
+    sparsity = signature[4]
+    return range(n) if sparsity is None or sparsity[l] is None else [j for j in range(n) if i in sparsity[l][j]]
+
+def unrolled_weight_count(signature):
+    input_size, layers = signature[0], signature[1]
+    sizes = [input_size] + [n for n, _ in layers]
+    return sum(a * b for a, b in zip(sizes, sizes[1:]))
+
+def can_compile(signature):
+    return bool(signature[1]) and unrolled_weight_count(signature) <= MAX_UNROLLED_WEIGHTS
+
+def _unpack(names, source):
+    return ", ".join(names) + (", = " if len(names) == 1 else " = ") + source
+
+def _emit_forward(signature, lines, prefix="", W="W", B="B", unpack_input=True):
+    # prefix: aynı fonksiyonda birden çok ağ (ör. topluluk kopyaları) açılırken değişken adlarını ayırır;
+    # girdi değişkenleri (a0_*) tüm kopyalarca paylaşılır.
+    input_size, layers, _, fast_math = signature[:4]
+    expressions = FAST_ACTIVATION_EXPRESSIONS if fast_math else ACTIVATION_EXPRESSIONS
+    a = lambda k, j: f"a0_{j}" if k == 0 else f"{prefix}a{k}_{j}"
+    if unpack_input: lines.append("    " + _unpack([f"a0_{i}" for i in range(input_size)], "x"))
+    prev = input_size
+    for l, (n, activation) in enumerate(layers):
+        lines.append(f"    {prefix}W_{l} = {W}[{l}]")
+        for i in range(prev): lines.append("    " + _unpack([f"{prefix}w{l}_{i}_{j}" for j in range(n)], f"{prefix}W_{l}[{i}]"))
+        lines.append("    " + _unpack([f"{prefix}b{l}_{j}" for j in range(n)], f"{B}[{l}]"))
+        for j in range(n):
+            lines.append(f"    {prefix}z{l+1}_{j} = " + " + ".join([f"{a(l, i)} * {prefix}w{l}_{i}_{j}" for i in _kept_inputs(signature, l, j, prev)] + [f"{prefix}b{l}_{j}"]))
+        if activation == "softmax":
+            lines.append("    " + _unpack([a(l+1, j) for j in range(n)], "softmax([" + ", ".join(f"{prefix}z{l+1}_{j}" for j in range(n)) + "])"))
+        else:
+            for j in range(n): lines.append(f"    {a(l+1, j)} = " + expressions[activation].format(z=f"{prefix}z{l+1}_{j}"))
+        prev = n
+    zs = "[" + ", ".join("[" + ", ".join(f"{prefix}z{l+1}_{j}" for j in range(n)) + "]" for l, (n, _) in enumerate(layers)) + "]"
+    acts = "[" + ", ".join("[" + ", ".join(a(k, j) for j in range(n)) + "]" for k, n in enumerate([input_size] + [n for n, _ in layers])) + "]"
+    return zs, acts
+
+def _emit_deltas(signature, lines, prefix="", unpack_targets=True):
+    # backward_pass_generator ile aynı formüller: çıkışta (a - y) * f'(a) (CE+softmax için a - y),
+    # gizli katmanlarda (Σ_k δ_k · W[l+1][j][k]) * f'(a).
+    _, layers, loss_function_name, _ = signature[:4]
+    L = len(layers); n_out, out_activation = layers[-1]
+    if unpack_targets: lines.append("    " + _unpack([f"y_{j}" for j in range(n_out)], "y"))
+    derivative = None if (loss_function_name == "cross_entropy" and out_activation == "softmax") else DERIVATIVE_EXPRESSIONS[out_activation]
+    for j in range(n_out):
+        error = f"{prefix}a{L}_{j} - y_{j}"
+        lines.append(f"    {prefix}d{L}_{j} = " + (f"({error}) * ({derivative.format(a=f'{prefix}a{L}_{j}')})" if derivative else error))
+    for l in range(L - 2, -1, -1):
+        n, activation = layers[l]; n_next = layers[l + 1][0]
+        derivative = DERIVATIVE_EXPRESSIONS[activation]
+        for j in range(n):
+            error = " + ".join(f"{prefix}d{l+2}_{k} * {prefix}w{l+1}_{j}_{k}" for k in _kept_outputs(signature, l + 1, j, n_next)) or "0.0"
+            lines.append(f"    {prefix}d{l+1}_{j} = " + (f"({error}) * ({derivative.format(a=f'{prefix}a{l+1}_{j}')})" if derivative else error))
+    return "[" + ", ".join("[" + ", ".join(f"{prefix}d{l+1}_{j}" for j in range(n)) + "]" for l, (n, _) in enumerate(layers)) + "]"
+
+def generate_source(signature):
+    lines = ["def forward(x, W, B):"]
+    zs, acts = _emit_forward(signature, lines)
+    lines.append(f"    return {zs}, {acts}")
+    lines.append("")
+    lines.append("def forward_backward(x, y, W, B):")
+    zs, acts = _emit_forward(signature, lines)
+    deltas = _emit_deltas(signature, lines)
+    lines.append(f"    return {zs}, {acts}, {deltas}")
+    return "\n".join(lines) + "\n"
+
+class CompiledNetwork:
+    # forward(x, W, B) -> (z listeleri, a listeleri [girdi dahil])
+    # forward_backward(x, y, W, B) -> (z listeleri, a listeleri, katman deltaları)
+    def __init__(self, signature):
+        if not can_compile(signature): raise ValueError(f"Ağ derlenemeyecek kadar büyük ({unrolled_weight_count(signature)} > {MAX_UNROLLED_WEIGHTS} ağırlık).")
+        self.signature, self.source = signature, generate_source(signature)
+        namespace = {"exp": math.exp, "tanh": math.tanh, "softmax": softmax}
+        exec(compile(self.source, f"<derlenmiş ağ {signature[0]}-{'-'.join(str(n) for n, _ in signature[1])}>", "exec"), namespace)
+        self.forward, self.forward_backward = namespace["forward"], namespace["forward_backward"]
+
+ENSEMBLE_OPTIMIZERS = ("sgd", "momentum", "adam")
+
+def _emit_update(signature, lines, prefix, r, optimizer_type):
+    # NeuralNetwork._apply_optimizer_update ile aynı ifadeler (float64, ana kopya yok); yeni satır listeleri
+    # doğrudan kopyanın ağırlık/durum listelerine yazılır. Deltalar eski ağırlıklarla hesaplandıktan sonra çağrılmalıdır.
+    input_size, layers = signature[0], signature[1]
+    a = lambda k, j: f"a0_{j}" if k == 0 else f"{prefix}a{k}_{j}"
+    matrix = lambda fmt, rows, n: "[" + ", ".join("[" + ", ".join(fmt(i, j) for j in range(n)) + "]" for i in range(rows)) + "]"
+    vector = lambda fmt, n: "[" + ", ".join(fmt(j) for j in range(n)) + "]"
+    if optimizer_type == "momentum": lines.append(f"    {prefix}VW, {prefix}VB = S[{r}]")
+    elif optimizer_type == "adam": lines.append(f"    {prefix}MW, {prefix}SW, {prefix}MB, {prefix}SB = S[{r}]"); lines.append(f"    {prefix}inv1, {prefix}inv2 = C[{r}]")
+    prev = input_size
+    for l, (n, _) in enumerate(layers):
+        w, b, d = (lambda i, j: f"{prefix}w{l}_{i}_{j}"), (lambda j: f"{prefix}b{l}_{j}"), (lambda j: f"{prefix}d{l+1}_{j}")
+        if optimizer_type == "sgd":
+            lines.append(f"    Ws[{r}][{l}] = " + matrix(lambda i, j: f"{w(i, j)} - lr * ({a(l, i)} * {d(j)})", prev, n))
+            lines.append(f"    Bs[{r}][{l}] = " + vector(lambda j: f"{b(j)} - lr * {d(j)}", n))
+        elif optimizer_type == "momentum":
+            v, vb = (lambda i, j: f"{prefix}v{l}_{i}_{j}"), (lambda j: f"{prefix}vb{l}_{j}")
+            for i in range(prev):
+                lines.append("    " + _unpack([v(i, j) for j in range(n)], f"{prefix}VW[{l}][{i}]"))
+                for j in range(n): lines.append(f"    {v(i, j)} = beta * {v(i, j)} + lr * ({a(l, i)} * {d(j)})")
+            lines.append("    " + _unpack([vb(j) for j in range(n)], f"{prefix}VB[{l}]"))
+            for j in range(n): lines.append(f"    {vb(j)} = beta * {vb(j)} + lr * {d(j)}")
+            lines.append(f"    {prefix}VW[{l}] = " + matrix(v, prev, n)); lines.append(f"    {prefix}VB[{l}] = " + vector(vb, n))
+            lines.append(f"    Ws[{r}][{l}] = " + matrix(lambda i, j: f"{w(i, j)} - {v(i, j)}", prev, n))
+            lines.append(f"    Bs[{r}][{l}] = " + vector(lambda j: f"{b(j)} - {vb(j)}", n))
+        elif optimizer_type == "adam":
+            m, s = (lambda i, j: f"{prefix}m{l}_{i}_{j}"), (lambda i, j: f"{prefix}s{l}_{i}_{j}")
+            mb, sb = (lambda j: f"{prefix}mb{l}_{j}"), (lambda j: f"{prefix}sb{l}_{j}")
+            step = lambda param, mom, sec: f"{param} - (lr * ({prefix}inv1 * {mom})) / (sqrt({prefix}inv2 * {sec}) + eps)"
+            for i in range(prev):
+                lines.append("    " + _unpack([m(i, j) for j in range(n)], f"{prefix}MW[{l}][{i}]"))
+                lines.append("    " + _unpack([s(i, j) for j in range(n)], f"{prefix}SW[{l}][{i}]"))
+                for j in range(n):
+                    lines.append(f"    g = {a(l, i)} * {d(j)}")
+                    lines.append(f"    {m(i, j)} = beta1 * {m(i, j)} + c1 * g")
+                    lines.append(f"    {s(i, j)} = beta2 * {s(i, j)} + c2 * g**2")
+            lines.append("    " + _unpack([mb(j) for j in range(n)], f"{prefix}MB[{l}]"))
+            lines.append("    " + _unpack([sb(j) for j in range(n)], f"{prefix}SB[{l}]"))
+            for j in range(n):
+                lines.append(f"    {mb(j)} = beta1 * {mb(j)} + c1 * {d(j)}")
+                lines.append(f"    {sb(j)} = beta2 * {sb(j)} + c2 * {d(j)}**2")
+            lines.append(f"    {prefix}MW[{l}] = " + matrix(m, prev, n)); lines.append(f"    {prefix}SW[{l}] = " + matrix(s, prev, n))
+            lines.append(f"    {prefix}MB[{l}] = " + vector(mb, n)); lines.append(f"    {prefix}SB[{l}] = " + vector(sb, n))
+            lines.append(f"    Ws[{r}][{l}] = " + matrix(lambda i, j: step(w(i, j), m(i, j), s(i, j)), prev, n))
+            lines.append(f"    Bs[{r}][{l}] = " + vector(lambda j: step(b(j), mb(j), sb(j)), n))
+        else: raise ValueError(f"Bilinmeyen optimizer: {optimizer_type}")
+        prev = n
+
+def generate_ensemble_source(signature, n_replicas, optimizer_type=None):
+    # optimizer_type verilmezse yalnızca forward(x, Ws, Bs) -> [her kopyanın çıkışı] üretilir. Verilirse
+    # train_step(x, y, Ws, Bs, S, C, lr, h): K kopyanın ileri yayılımı, deltaları ve güncellemesi tek fonksiyonda;
+    # S kopya başına optimizer durum listeleri, C Adam bias düzeltme çarpanları (inv1, inv2), h = (beta, beta1, beta2, eps).
+    # Güncelleme öncesi çıkışlar döner.
+    input_size, layers = signature[0], signature[1]
+    L, n_out = len(layers), layers[-1][0]
+    outputs = "[" + ", ".join("[" + ", ".join(f"r{r}_a{L}_{j}" for j in range(n_out)) + "]" for r in range(n_replicas)) + "]"
+    if optimizer_type is None:
+        lines = ["def forward(x, Ws, Bs):", "    " + _unpack([f"a0_{i}" for i in range(input_size)], "x")]
+        for r in range(n_replicas): _emit_forward(signature, lines, f"r{r}_", f"Ws[{r}]", f"Bs[{r}]", unpack_input=False)
+    else:
+        lines = ["def train_step(x, y, Ws, Bs, S, C, lr, h):", "    " + _unpack([f"a0_{i}" for i in range(input_size)], "x"),
+                 "    " + _unpack([f"y_{j}" for j in range(n_out)], "y"), "    beta, beta1, beta2, eps = h", "    c1, c2 = 1 - beta1, 1 - beta2"]
+        for r in range(n_replicas):
+            _emit_forward(signature, lines, f"r{r}_", f"Ws[{r}]", f"Bs[{r}]", unpack_input=False)
+            _emit_deltas(signature, lines, f"r{r}_", unpack_targets=False)
+            _emit_update(signature, lines, f"r{r}_", r, optimizer_type)
+    lines.append(f"    return {outputs}")
+    return "\n".join(lines) + "\n"
+
+class CompiledEnsembleGroup:
+    # K kopyalık grup; eğitim adımı fonksiyonu optimizer başına ilk kullanımda üretilir.
+    def __init__(self, signature, n_replicas):
+        self.signature, self.n_replicas, self._train_steps = signature, n_replicas, {}
+        self.forward = self._compile(None)
+
+    def _compile(self, optimizer_type):
+        namespace = {"exp": math.exp, "tanh": math.tanh, "softmax": softmax, "sqrt": math.sqrt}
+        name = f"<derlenmiş topluluk {self.n_replicas}x{self.signature[0]}-{'-'.join(str(n) for n, _ in self.signature[1])} {optimizer_type or 'forward'}>"
+        exec(compile(generate_ensemble_source(self.signature, self.n_replicas, optimizer_type), name, "exec"), namespace)
+        return namespace["forward" if optimizer_type is None else "train_step"]
+
+    def train_step(self, optimizer_type):
+        if optimizer_type not in ENSEMBLE_OPTIMIZERS: raise ValueError(f"Bilinmeyen optimizer: {optimizer_type}")
+        if optimizer_type not in self._train_steps: self._train_steps[optimizer_type] = self._compile(optimizer_type)
+        return self._train_steps[optimizer_type]
+
+def _cached(key, factory):
+    # Aynı mimariye geri dönüldüğünde kod yeniden üretilmez (imza anahtarlı LRU önbellek).
+    compiled = _compiled_cache.get(key)
+    if compiled is None:
+        compiled = _compiled_cache[key] = factory()
+        while len(_compiled_cache) > COMPILED_CACHE_SIZE: _compiled_cache.popitem(last=False)
+    else: _compiled_cache.move_to_end(key)
+    return compiled
+
+def get_compiled_network(signature):
+    return _cached(signature, lambda: CompiledNetwork(signature))
+
+def get_compiled_ensemble_group(signature, n_replicas):
+    return _cached(("ensemble", signature, n_replicas), lambda: CompiledEnsembleGroup(signature, n_replicas))
+
+def verify_against_reference(network, compiled, n_samples=3, seed=0, tolerance=0.0):
+    # Derlenmiş çıktıları ve deltaları referans üreteçlerle karşılaştırır. Geri yayılım üreteci
+    # ilk ağırlık güncellemesinden önce durdurulur; ağın durumu (çıktılar, optimizer sayaçları) geri yüklenir.
+    # (geçti_mi, en_büyük_mutlak_fark) döndürür.
+    rng = random.Random(seed); max_error = 0.0
+    saved = (network.current_input_for_forward, network.neuron_outputs_z, network.neuron_outputs_a, network.adam_t, network.optimizer_state_type, network.profiler.enabled)
+    network.profiler.enabled = False
+    try:
+        for _ in range(n_samples):
+            x = [rng.uniform(-2.0, 2.0) for _ in range(len(network.weights[0]))]
+            y = [rng.random() for _ in range(len(network.biases[-1]))]
+            zs, acts, deltas = compiled.forward_backward(network.normalize_input(x), y, network.weights, network.biases)
+            for _ in network.forward_pass_generator(x, False): pass
+            ref_deltas = [None] * len(network.weights)
+            backward = network.backward_pass_generator(y, 0.0, {"type": network.optimizer_state_type or "sgd"})
+            for event in backward:
+                if event["type"] == "output_delta_calculation": ref_deltas[-1] = event["delta_L"]
+                elif event["type"] == "hidden_delta_calculation": ref_deltas[event["layer_index"]] = event["delta_l"]
+                elif event["type"] in ("gradient_calculation", "error"): break
+            backward.close()
+            for ours, ref in ((zs, network.neuron_outputs_z), (acts, network.neuron_outputs_a), (deltas, ref_deltas)):
+                if ref is None or None in ref or len(ours) != len(ref): return False, float("inf")
+                for row, ref_row in zip(ours, ref):
+                    if len(row) != len(ref_row): return False, float("inf")
+                    for a, b in zip(row, ref_row): max_error = max(max_error, abs(a - b))
+    finally:
+        (network.current_input_for_forward, network.neuron_outputs_z, network.neuron_outputs_a, network.adam_t, network.optimizer_state_type, network.profiler.enabled) = saved
+    return max_error <= tolerance, max_error
@@ -0,0 +1,183 @@
+# Paralel k katlı çapraz doğrulama. Yüklü veri seti karıştırılıp k parçaya
+# (kat) bölünür; her kat için aynı mimarinin aynı tohumla başlatılmış bir
+# kopyası kalan k-1 kat üzerinde eğitilir ve ayrılan kat üzerinde
+# değerlendirilir. Katlar ayrı işçi süreçlerinde paralel eğitilir. Veri
+# süreçlere kopyalanarak (pickle) gönderilmez: satırlar kat sırasıyla tek bir
+# paylaşımlı bellek bloğuna (multiprocessing.shared_memory, float64) yazılır,
+# işçiye yalnızca bloğun adı, boyutlar ve katının sınırları gider. Kat başına
+# test kaybı, doğruluk ve makro F1 (metrics.classification_metrics) ile eğitim
+# kaybı toplanır ve ortalama ± standart sapma olarak raporlanır. Girdi
+# normalizasyonu istenirse istatistikler veri bloğa yazılırken kat başına tek
+# geçişte toplanır; her kat yalnızca kendi eğitim katlarının birleştirilmiş
+# istatistikleriyle ölçeklenir (test katı sızmaz). GUI'den ve komut satırından
+# kullanılabilir; ana ağ değişmez.
+
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from array import array
+from multiprocessing import shared_memory
+
+from data_io import load_checkpoint, read_csv_dataset, get_checkpoint_precision, get_checkpoint_optimizer_state, get_checkpoint_training_state
+from metrics import classification_metrics
+from neural_network import NeuralNetwork
+from quantization import is_quantized_artifact
+from precision import DEFAULT_PRECISION, copy_vector
+from normalization import NORMALIZATION_MODES, NORMALIZATION_DISPLAY_NAMES, FeatureNormalizer
+from utils import predicted_class
+
+CV_METRICS = ("loss", "accuracy", "macro_f1", "train_loss")
+CV_METRIC_DISPLAY_NAMES = {"loss": "Test Kaybı", "accuracy": "Doğruluk", "macro_f1": "Makro F1", "train_loss": "Eğitim Kaybı"}
+DEFAULT_FOLDS = 5
+
+def fold_bounds(n_samples, k):
+    # Ardışık kat sınırları; kat boyutları en fazla 1 farklıdır.
+    if k < 2: raise ValueError("Çapraz doğrulama için en az 2 kat gerekli.")
+    if n_samples < k: raise ValueError(f"Kat sayısı ({k}) örnek sayısından ({n_samples}) büyük olamaz.")
+    size, extra = divmod(n_samples, k)
+    bounds = [0]
+    for f in range(k): bounds.append(bounds[-1] + size + (1 if f < extra else 0))
+    return bounds
+
+def _rows(view, offset, n_rows, width, precision):
+    return [copy_vector(view[offset + i * width:offset + (i + 1) * width], precision) for i in range(n_rows)]
+
+def _evaluate(network, X, Y):
+    # (ortalama kayıp, doğruluk veya None, makro F1 veya None)
+    n_out, out_activation = network.layer_configs[-1]
+    outputs = [list(network.forward(x)) for x in X]
+    loss = sum(network.loss_func(y, out) for y, out in zip(Y, outputs)) / len(X)
+    if not (n_out > 1 or out_activation == "sigmoid"): return loss, None, None
+    accuracy = sum(predicted_class(out) == predicted_class(y) for y, out in zip(Y, outputs)) / len(X)
+    if n_out == 1:  # tek sigmoid çıkışı iki sınıflı (1-p, p) olarak değerlendirilir
+        true_rows, pred_rows = [[1 - predicted_class(y), predicted_class(y)] for y in Y], [[1.0 - out[0], out[0]] for out in outputs]
+    else: true_rows, pred_rows = [list(y) for y in Y], outputs
+    metrics, _ = classification_metrics(true_rows, pred_rows, max(n_out, 2))
+    return loss, accuracy, metrics.get("F1-score (Macro Avg)")
+
+def _train_fold(task):
+    # İşçi süreçte çalışır: veri paylaşımlı bellekten okunur, kat dışı satırlarla eğitilir, katla değerlendirilir.
+    t0 = time.perf_counter()
+    config, (start, end) = task["config"], task["fold_range"]
+    n, n_in, n_out, precision = task["n_samples"], config["input_size"], config["layer_configs"][-1][0], config["precision"]
+    shm = shared_memory.SharedMemory(name=task["shm_name"])
+    try:
+        view = shm.buf.cast("d")
+        try: X, Y = _rows(view, 0, n, n_in, precision), _rows(view, n * n_in, n, n_out, precision)
+        finally: view.release()
+    finally: shm.close()
+    X_train, Y_train, X_test, Y_test = X[:start] + X[end:], Y[:start] + Y[end:], X[start:end], Y[start:end]
+    if task.get("normalizer"):  # satırlar bir kez ölçeklenir; epoch başına dönüşüm yapılmaz
+        normalizer = FeatureNormalizer.from_state(task["normalizer"])
+        X_train, X_test = ([copy_vector(row, precision) for row in normalizer.transform_rows(rows)] for rows in (X_train, X_test))
+    random.seed(config["seed"])  # tüm katlar aynı başlangıç ağırlıklarıyla başlar
+    network = NeuralNetwork(config["loss_function_name"]); network.fast_math, network.use_compiled = config["fast_math"], config["use_compiled"]
+    network.configure_network(n_in, config["layer_configs"], precision=precision, keep_master_weights=config["keep_master_weights"])
+    loss_curve = [network.train_epoch(X_train, Y_train, config["learning_rate"], config["optimizer_params"]) for _ in range(config["epochs"])]
+    loss, accuracy, macro_f1 = _evaluate(network, X_test, Y_test)
+    return {"fold": task["fold"], "train_samples": len(X_train), "test_samples": len(X_test), "train_loss": loss_curve[-1] if loss_curve else None,
+            "loss": loss, "accuracy": accuracy, "macro_f1": macro_f1, "loss_curve": loss_curve, "seconds": time.perf_counter() - t0, "pid": os.getpid()}
+
+def summarize_folds(folds):
+    # Metrik başına (ortalama, standart sapma); metrik hiçbir katta yoksa None. Eğitim kaybı eğrisi epoch başına ortalama/std.
+    summary = {}
+    for key in CV_METRICS:
+        values = [fold[key] for fold in folds if fold[key] is not None]
+        summary[key] = (statistics.fmean(values), statistics.stdev(values) if len(values) > 1 else 0.0) if values else None
+    curves = list(zip(*(fold["loss_curve"] for fold in folds)))
+    summary["loss_curve_mean"] = [statistics.fmean(c) for c in curves]
+    summary["loss_curve_std"] = [statistics.stdev(c) if len(c) > 1 else 0.0 for c in curves]
+    return summary
+
+def run_cross_validation(X, Y, input_size, layer_configs, k=DEFAULT_FOLDS, epochs=10, learning_rate=0.1, optimizer_params=None, loss_function_name="mean_squared_error",
+                         seed=0, precision=DEFAULT_PRECISION, keep_master_weights=False, fast_math=False, use_compiled=True, processes=None, callback=None, normalization="none"):
+    # processes: işçi süreç sayısı (None: min(k, CPU)); 1 ise katlar bu süreçte sırayla eğitilir.
+    # normalization: "none", "standard" veya "minmax"; istatistikler her katın eğitim satırlarından hesaplanır.
+    # callback(kat_sonucu) her kat bittiğinde (bitiş sırasıyla) ana süreçte çağrılır.
+    if len(X) != len(Y): raise ValueError("X ve Y örnek sayıları eşleşmelidir.")
+    layer_configs = [tuple(cfg) for cfg in layer_configs]
+    n_out = layer_configs[-1][0]
+    if any(len(x) != input_size for x in X) or any(len(y) != n_out for y in Y): raise ValueError(f"Veri boyutları ağla uyuşmuyor (giriş {input_size}, çıkış {n_out}).")
+    if epochs < 1: raise ValueError("Epoch sayısı en az 1 olmalı.")
+    if normalization not in NORMALIZATION_MODES: raise ValueError(f"Geçersiz normalizasyon türü: {normalization}")
+    bounds = fold_bounds(len(X), k)
+    order = list(range(len(X))); random.Random(seed).shuffle(order)
+    processes = min(k, os.cpu_count() or 1) if processes is None else max(1, min(processes, k))
+    config = {"input_size": input_size, "layer_configs": layer_configs, "loss_function_name": loss_function_name, "optimizer_params": optimizer_params or {"type": "sgd"},
+              "learning_rate": learning_rate, "epochs": epochs, "seed": seed, "precision": precision, "keep_master_weights": keep_master_weights,
+              "fast_math": fast_math, "use_compiled": use_compiled}
+    t0, n, n_in = time.perf_counter(), len(X), input_size
+    shm = shared_memory.SharedMemory(create=True, size=max(8, 8 * n * (n_in + n_out)))
+    folds = []
+    try:
+        view = shm.buf.cast("d")
+        try:
+            for pos, idx in enumerate(order):
+                view[pos * n_in:(pos + 1) * n_in] = array("d", X[idx]); view[n * n_in + pos * n_out:n * n_in + (pos + 1) * n_out] = array("d", Y[idx])
+        finally: view.release()
+        tasks = [{"fold": f, "fold_range": (bounds[f], bounds[f + 1]), "n_samples": n, "shm_name": shm.name, "config": config} for f in range(k)]
+        if normalization != "none":
+            fold_stats = [FeatureNormalizer(normalization, n_in).update_rows(X[idx] for idx in order[bounds[f]:bounds[f + 1]]) for f in range(k)]
+            for f, task in enumerate(tasks):
+                merged = FeatureNormalizer(normalization, n_in)
+                for g, stats in enumerate(fold_stats):
+                    if g != f: merged.merge(stats)
+                task["normalizer"] = merged.state_dict()
+        if processes == 1: results = map(_train_fold, tasks)
+        else: pool = multiprocessing.get_context("spawn").Pool(processes); results = pool.imap_unordered(_train_fold, tasks)  # spawn: Tk içeren süreç çatallanmaz
+        try:
+            for result in results:
+                folds.append(result)
+                if callback is not None: callback(result)
+        finally:
+            if processes > 1: pool.terminate(); pool.join()
+    finally: shm.close(); shm.unlink()
+    folds.sort(key=lambda fold: fold["fold"])
+    return {"k": k, "samples": n, "epochs": epochs, "processes": processes, "seconds": time.perf_counter() - t0, "folds": folds, "summary": summarize_folds(folds), "normalization": normalization}
+
+def format_cv_report(result):
+    lines = [f"{result['k']} katlı çapraz doğrulama: {result['samples']} örnek, {result['epochs']} epoch, {result['processes']} süreç, {result['seconds']:.2f} s"
+             + (f", girdi normalizasyonu: {NORMALIZATION_DISPLAY_NAMES[result['normalization']]} (kat başına eğitim verisinden)" if result.get("normalization", "none") != "none" else "")]
+    for fold in result["folds"]:
+        lines.append(f"  Kat {fold['fold'] + 1}: eğitim {fold['train_samples']} / test {fold['test_samples']} örnek, eğitim kaybı {fold['train_loss']:.6f}, test kaybı {fold['loss']:.6f}"
+                     + (f", doğruluk {fold['accuracy']:.4f}" if fold["accuracy"] is not None else "") + (f", makro F1 {fold['macro_f1']:.4f}" if fold["macro_f1"] is not None else "")
+                     + f" ({fold['seconds']:.2f} s)")
+    for key in CV_METRICS:
+        stat = result["summary"][key]
+        if stat is not None: lines.append(f"{CV_METRIC_DISPLAY_NAMES[key]:<14}: {stat[0]:.4f} ± {stat[1]:.4f}")
+    return lines
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaydedilmiş ağın mimarisiyle CSV üzerinde paralel k katlı çapraz doğrulama")
+    parser.add_argument("model", help="'Ağı Kaydet' ile kaydedilmiş JSON dosyası (mimari, kayıp, optimizer ve hassasiyet buradan alınır; ağırlıklar yeniden başlatılır)")
+    parser.add_argument("data", help="CSV (başlıklı; ilk giriş_boyutu sütunu X, kalanlar Y)")
+    parser.add_argument("--folds", type=int, default=DEFAULT_FOLDS, help="Kat sayısı (k)")
+    parser.add_argument("--epochs", type=int, default=10, help="Kat başına epoch")
+    parser.add_argument("--lr", type=float, default=None, help="Öğrenme oranı (varsayılan: kayıttaki, yoksa 0.1)")
+    parser.add_argument("--optimizer", choices=["sgd", "momentum", "adam"], default=None, help="Optimizer (varsayılan: kayıttaki)")
+    parser.add_argument("--processes", type=int, default=None, help="İşçi süreç sayısı (varsayılan: min(k, CPU))")
+    parser.add_argument("--seed", type=int, default=0, help="Kat bölme ve ağırlık başlatma tohumu")
+    parser.add_argument("--fast-math", action="store_true", help="Yaklaşık (hızlı) sigmoid kullan")
+    parser.add_argument("--normalize", choices=NORMALIZATION_MODES, default=None, help="Girdi normalizasyonu (varsayılan: kayıttaki, yoksa none)")
+    args = parser.parse_args(argv)
+    data = load_checkpoint(args.model)
+    if is_quantized_artifact(data): parser.error("Nicemlenmiş model eğitilemez; float ağ kaydı verin")
+    layer_configs = [tuple(cfg) for cfg in data.get("layer_configs_full", data.get("layer_configs"))]
+    loss_name, (dtype, master) = data.get("loss_function", "mean_squared_error"), get_checkpoint_precision(data)
+    optimizer = args.optimizer or (get_checkpoint_optimizer_state(data) or {}).get("type") or "sgd"
+    lr = args.lr if args.lr is not None else get_checkpoint_training_state(data).get("learning_rate", 0.1)
+    normalization = args.normalize or (data.get("input_normalization") or {}).get("mode", "none")
+    try:
+        X, Y, _ = read_csv_dataset(args.data, data["input_size"], layer_configs[-1][0], loss_name == "cross_entropy", warn=lambda msg: print(msg, file=sys.stderr))
+        result = run_cross_validation(X, Y, data["input_size"], layer_configs, args.folds, args.epochs, lr, {"type": optimizer, "beta": 0.9, "beta1": 0.9, "beta2": 0.999, "epsilon": 1e-8},
+                                      loss_name, args.seed, dtype, master, args.fast_math, processes=args.processes, normalization=normalization)
+    except ValueError as e: print(f"Hata: {e}", file=sys.stderr); return 1
+    for line in format_cv_report(result): print(line)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+# CSV veri setlerini okuma ve ağ/eğitim durumunu JSON olarak kaydetme-yükleme
+# işlemlerini arayüzden bağımsız olarak içerir (GUI, benchmark ve komut satırı
+# araçları ortak kullanır).
+
+import csv
+import json
+from neural_network import NeuralNetwork
+from precision import DEFAULT_PRECISION, copy_vector, to_plain
+from training import rng_state_to_json
+from normalization import normalizer_from_checkpoint
+
+def parse_target_row(y_raw, num_outputs, one_hot_targets, row_label=""):
+    if one_hot_targets:
+        if num_outputs <= 0: raise ValueError("CE için çıkış sınıf sayısı > 0 olmalı.")
+        if len(y_raw) == 1 and 0 <= y_raw[0] < num_outputs and y_raw[0] == int(y_raw[0]):
+            one_hot = [0.0] * num_outputs; one_hot[int(y_raw[0])] = 1.0; return one_hot
+        if len(y_raw) == num_outputs: return y_raw
+        raise ValueError(f"{row_label}CE için {num_outputs} elemanlı one-hot veya tek sınıf indeksi beklenir.")
+    if len(y_raw) != num_outputs: raise ValueError(f"MSE vb. için Y formatı ({len(y_raw)}) çıkış nöron sayısıyla ({num_outputs}) eşleşmiyor.")
+    return y_raw
+
+def read_csv_dataset(file_path, num_inputs, num_outputs, one_hot_targets=False, warn=None, precision=DEFAULT_PRECISION):
+    # İlk satır başlık kabul edilir; ilk num_inputs sütun X, kalanlar Y olur.
+    # Hatalı satırlar atlanır ve (verildiyse) warn(mesaj) ile bildirilir.
+    # precision="float32" ise satırlar array('f') olarak paketlenir.
+    X, Y = [], []
+    with open(file_path, 'r', newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        for idx, row in enumerate(reader):
+            if not row or len(row) < num_inputs + 1:
+                if warn: warn(f"Uyarı: Satır {idx+1} yetersiz/boş, atlanıyor.")
+                continue
+            try:
+                x_v = [float(v.strip()) for v in row[:num_inputs]]; y_raw = [float(v.strip()) for v in row[num_inputs:]]
+                y_parsed = parse_target_row(y_raw, num_outputs, one_hot_targets, f"Satır {idx+1} (Hedef): ")
+            except ValueError as ve:
+                if warn: warn(f"Uyarı: Satır {idx+1} hatalı değer içeriyor, atlanıyor: {ve}")
+                continue
+            X.append(copy_vector(x_v, precision)); Y.append(copy_vector(y_parsed, precision))
+    return X, Y, header
+
+def build_checkpoint(network, input_size, loss_function, optimizer_type, epoch_losses, epoch_accuracies, total_epochs_completed, sampler_state=None, learning_rate=None):
+    # Optimizer durumu yalnızca "optimizer_state" altında ve sadece ayrılmış tensörlerle yazılır.
+    # Ağırlıklar, varsa float64 ana kopyadan yazılır; hassasiyet ayarı "precision" altında saklanır.
+    # Birebir devam için örnekleyici konumu, öğrenme oranı ve Python RNG durumu "training_state" altına eklenir.
+    training_state = {"epoch_losses": list(epoch_losses), "epoch_accuracies": list(epoch_accuracies), "total_epochs_completed": total_epochs_completed,
+                      "python_rng_state": rng_state_to_json()}
+    if sampler_state is not None: training_state["sampler"] = sampler_state
+    if learning_rate is not None: training_state["learning_rate"] = learning_rate
+    optimizer_state = {"type": optimizer_type}
+    optimizer_state.update(to_plain(network.get_optimizer_state()))
+    # Budanmış katmanların indeksleri "pruning" altında saklanır; maskeler yüklemede sıfır ağırlıklardan yeniden kurulur.
+    weights, biases = network.get_full_precision_params()
+    data = {"input_size": input_size, "layer_configs_full": network.layer_configs, "weights": to_plain(weights), "biases": to_plain(biases),
+            "precision": {"dtype": network.precision, "master_weights": network.keep_master_weights},
+            "loss_function": loss_function, "training_state": training_state, "optimizer_state": optimizer_state}
+    pruned_layers = [l for l, sparse in enumerate(network.sparse_layers) if sparse is not None]
+    if pruned_layers: data["pruning"] = {"layers": pruned_layers}
+    # Girdi normalizasyonu istatistikleri (tam Welford durumu) "input_normalization" altında; dışa aktarılan modeller aynı ölçeklemeyi uygular.
+    if network.input_normalizer is not None: data["input_normalization"] = network.input_normalizer.state_dict()
+    return data
+
+def save_checkpoint(file_path, state_data):
+    with open(file_path, 'w') as f: json.dump(state_data, f, indent=2)
+
+def load_checkpoint(file_path):
+    with open(file_path, 'r') as f: return json.load(f)
+
+def get_checkpoint_optimizer_state(data):
+    opt_state = data.get("optimizer_state")
+    training_state = data.get("training_state")
+    if not opt_state and training_state: opt_state = {key.replace("optimizer_", ""): val for key, val in training_state.items() if key.startswith("optimizer_")}
+    return opt_state
+
+def get_checkpoint_training_state(data):
+    # Eksik alanlar varsayılanlarla doldurulur. Eski kayıtlar "total_epochs_completed" alanına istenen epoch
+    # sayısını yazıyordu; RNG durumu olmayan (eski) kayıtlarda tamamlanan epoch sayısı kayıp geçmişinin uzunluğudur.
+    state = dict(data.get("training_state") or {})
+    state.setdefault("epoch_losses", []); state.setdefault("epoch_accuracies", [])
+    if "python_rng_state" not in state or "total_epochs_completed" not in state: state["total_epochs_completed"] = len(state["epoch_losses"])
+    return state
+
+def apply_optimizer_state(network, opt_state):
+    # Kayıtlı optimizer durumunu, katman sayısı uyuşuyorsa ağa aktarır (eski kayıtlarla uyumlu).
+    if opt_state: network.load_optimizer_state(opt_state)
+
+def get_checkpoint_precision(data):
+    # (dtype, master_weights); hassasiyet kaydı olmayan eski dosyalar float64 kabul edilir.
+    precision = data.get("precision") or {}
+    return precision.get("dtype", DEFAULT_PRECISION), bool(precision.get("master_weights", False))
+
+def network_from_checkpoint(data):
+    layer_configs = [tuple(cfg) for cfg in data.get("layer_configs_full", data.get("layer_configs"))]
+    network = NeuralNetwork(data.get("loss_function", "mean_squared_error"))
+    dtype, master_weights = get_checkpoint_precision(data)
+    network.configure_network(data["input_size"], layer_configs, data["weights"], data["biases"], precision=dtype, keep_master_weights=master_weights)
+    apply_optimizer_state(network, get_checkpoint_optimizer_state(data))
+    apply_checkpoint_pruning(network, data)
+    network.set_input_normalizer(normalizer_from_checkpoint(data))
+    return network
+
+def apply_checkpoint_pruning(network, data):
+    # Kayıtta budanmış olarak işaretlenen katmanlarda tam 0 olan ağırlıklar budanmış kabul edilir.
+    for l in (data.get("pruning") or {}).get("layers", []):
+        if 0 <= l < len(network.weights): network.set_layer_mask(l, [[w != 0.0 for w in row] for row in network.get_full_precision_params()[0][l]])
@@ -0,0 +1,180 @@
+# Ağ diyagramını Tk olmadan SVG veya PNG (matplotlib Agg) olarak dışa aktarır.
+# Yerleşim (nöron konumları) katman boyutlarından hesaplanır ve önbelleğe
+# alınır; bağlantılar doğrudan network.weights'ten çizilir. Renk ve kalınlık
+# kodlaması arayüzdeki çizimle aynıdır (GUI de aynı yardımcıları kullanır):
+# negatif ağırlık koyu kırmızı, pozitif koyu yeşil, sıfır gri; kalınlık
+# min(5, max(0.5, 1 + 1.5·|w|)). Budanmış bağlantılar çizilmez. SVG bağımlılık
+# gerektirmez; PNG için matplotlib gerekir (pencere açılmaz).
+#
+# Kullanım (her kayıt için bir diyagram):
+#   python diagram_export.py model.json --format svg
+#   python diagram_export.py kayitlar/ --format png --out-dir diyagramlar --weights
+
+import argparse
+import math
+import os
+import sys
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from data_io import load_checkpoint, network_from_checkpoint
+from quantization import is_quantized_artifact
+
+EXPORT_FORMATS = ("svg", "png")
+NEURON_RADIUS = 20
+INPUT_FILL, HIDDEN_FILL, OUTPUT_FILL = "lightblue", "lightgreen", "lightcoral"
+DEFAULT_WIDTH, DEFAULT_HEIGHT, MARGIN = 800, 600, 40
+ARROW_SHAPE = (8, 10, 3)  # Tk arrowshape: uçtan boyna, uçtan kanatlara, kanat yarı genişliği
+
+def connection_style(w):
+    # (çizgi kalınlığı, renk); arayüzdeki tuval çizimiyle aynı kodlama.
+    return min(5, max(0.5, 1 + abs(w) * 1.5)), "darkred" if w < 0 else ("darkgreen" if w > 0 else "grey")
+
+@lru_cache(maxsize=64)
+def network_layout(layer_sizes, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT):
+    # layer_sizes: (giriş, gizli..., çıkış) nöron sayıları. Katman başına nöron merkezleri (x, y) demetleri.
+    nr, n_layers = NEURON_RADIUS, len(layer_sizes)
+    layer_spacing = (width - 120) / max(1, n_layers - 1) if n_layers > 1 else width / 2
+    max_n = max(layer_sizes) if layer_sizes else 1
+    vertical_spacing = max(3 * nr, (height - 2 * 80) / max(1, max_n - 1 if max_n > 1 else 1))
+    layout, x = [], 60
+    for idx, n in enumerate(layer_sizes):
+        if idx > 0: x += layer_spacing
+        top = height / 2 if n == 1 else (height - (n - 1) * vertical_spacing) / 2
+        layout.append(tuple((x, top + i * vertical_spacing) for i in range(n)))
+    return tuple(layout)
+
+def neuron_display_name(layer_idx, neuron_idx, n_layers):
+    # layer_idx: 0 = giriş, n_layers-1 = çıkış (yerleşimdeki katman sırası).
+    if layer_idx == 0: return f"Giriş N{neuron_idx + 1}"
+    if layer_idx == n_layers - 1: return f"Çıkış N{neuron_idx + 1}"
+    return f"Gizli L{layer_idx} N{neuron_idx + 1}"
+
+def weight_label_position(px, py, x, y):
+    # Bağlantı ortasında, çizgiyle çakışmayacak şekilde kaydırılmış (x, y, açı) (arayüzdekiyle aynı).
+    nr = NEURON_RADIUS
+    mid_x, mid_y = (px + nr + x - nr) / 2, (py + y) / 2; angle = math.atan2(y - py, x - nr - (px + nr)) * 180 / math.pi
+    if -20 < angle < 20 or angle > 160 or angle < -160: mid_y -= 8
+    else: mid_x += 8 * (-1 if 0 < angle < 160 else 1)
+    return mid_x, mid_y, angle
+
+def arrow_head(x1, y1, x2, y2):
+    # (x2, y2) ucundaki ok başının köşeleri (Tk'nin arrowshape geometrisi).
+    length = math.hypot(x2 - x1, y2 - y1)
+    if length == 0: return ()
+    d1, d2, d3 = ARROW_SHAPE; ux, uy = (x2 - x1) / length, (y2 - y1) / length
+    return ((x2, y2), (x2 - d2 * ux - d3 * uy, y2 - d2 * uy + d3 * ux), (x2 - d1 * ux, y2 - d1 * uy), (x2 - d2 * ux + d3 * uy, y2 - d2 * uy - d3 * ux))
+
+def build_scene(network, show_weights=False, show_biases=False, show_values=False, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT):
+    # Çizim ilkelleri: {"lines": [(x1, y1, x2, y2, renk, kalınlık)], "arrows": [(köşeler, renk)], "circles": [(x, y, dolgu)],
+    # "texts": [(x, y, metin, boyut, renk, stil, açı)], "bbox": (x0, y0, x1, y1)}. stil: "bold", "italic" veya "".
+    if not network.weights: raise ValueError("Dışa aktarılacak ağ yok.")
+    sizes = (len(network.weights[0]),) + tuple(n for n, _ in network.layer_configs)
+    layout, nr = network_layout(sizes, width, height), NEURON_RADIUS
+    values = network.neuron_outputs_a if show_values and len(network.neuron_outputs_a) == len(sizes) and None not in network.neuron_outputs_a else None
+    lines, arrows, circles, texts = [], [], [], []
+    for i, (x, y) in enumerate(layout[0]):
+        circles.append((x, y, INPUT_FILL)); texts.append((x, y - nr - 12, neuron_display_name(0, i, len(sizes)), 8, "black", "bold", 0))
+        if values: texts.append((x, y + nr + 10, f"a={values[0][i]:.2f}", 7, "black", "", 0))
+    for l, (n_out, activation) in enumerate(network.layer_configs):
+        W, b, sparse = network.weights[l], network.biases[l], network.sparse_layers[l] if l < len(network.sparse_layers) else None
+        keep = sparse.keep_mask() if sparse is not None else None
+        fill = OUTPUT_FILL if l == len(network.layer_configs) - 1 else HIDDEN_FILL
+        for j, (x, y) in enumerate(layout[l + 1]):
+            circles.append((x, y, fill))
+            texts.append((x, y - nr - 24, neuron_display_name(l + 1, j, len(sizes)), 7, "black", "bold", 0)); texts.append((x, y - nr - 12, f"Akt:{activation[:5]}.", 7, "black", "italic", 0))
+            if show_biases: texts.append((x, y + nr + 26, f"b={b[j]:.2f}", 7, "teal", "", 0))
+            if values: texts.append((x, y + nr + 8, f"a={values[l + 1][j]:.2f}", 7, "black", "", 0))
+            for i, (px, py) in enumerate(layout[l]):
+                if keep is not None and not keep[i][j]: continue  # budanmış bağlantı çizilmez
+                w = W[i][j]; lw, color = connection_style(w)
+                lines.append((px + nr, py, x - nr, y, color, lw)); arrows.append((arrow_head(px + nr, py, x - nr, y), color))
+                if show_weights:
+                    mx, my, angle = weight_label_position(px, py, x, y)
+                    texts.append((mx, my, f"{w:.2f}", 7, "purple", "bold", angle))
+    xs, ys = [p[0] for layer in layout for p in layer], [p[1] for layer in layout for p in layer]
+    bbox = (min(xs) - nr - MARGIN, min(ys) - nr - 24 - MARGIN, max(xs) + nr + MARGIN, max(ys) + nr + 26 + MARGIN)
+    return {"lines": lines, "arrows": arrows, "circles": circles, "texts": texts, "bbox": bbox}
+
+def render_svg(scene):
+    x0, y0, x1, y1 = scene["bbox"]; w, h = x1 - x0, y1 - y0
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{w:.0f}" height="{h:.0f}" viewBox="{x0:.1f} {y0:.1f} {w:.1f} {h:.1f}">',
+             f'<rect x="{x0:.1f}" y="{y0:.1f}" width="{w:.1f}" height="{h:.1f}" fill="white"/>', '<g stroke-linecap="round">']
+    parts.extend(f'<line x1="{a:.1f}" y1="{b:.1f}" x2="{c:.1f}" y2="{d:.1f}" stroke="{color}" stroke-width="{lw:.2f}"/>' for a, b, c, d, color, lw in scene["lines"])
+    parts.extend(f'<polygon points="{" ".join(f"{px:.1f},{py:.1f}" for px, py in points)}" fill="{color}"/>' for points, color in scene["arrows"] if points)
+    parts.append('</g><g stroke="black" stroke-width="1.5">')
+    parts.extend(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{NEURON_RADIUS}" fill="{fill}"/>' for x, y, fill in scene["circles"])
+    # Tk yazı boyutları punto (96 dpi'de 4/3 piksel); açı Tk'deki gibi saat yönünün tersine.
+    parts.append('</g><g font-family="Helvetica, Arial, sans-serif" text-anchor="middle" dominant-baseline="middle">')
+    for x, y, text, size, color, style, angle in scene["texts"]:
+        attrs = (' font-weight="bold"' if style == "bold" else ' font-style="italic"' if style == "italic" else "") + (f' transform="rotate({-angle:.1f} {x:.1f} {y:.1f})"' if angle else "")
+        parts.append(f'<text x="{x:.1f}" y="{y:.1f}" font-size="{size * 4 / 3:.1f}" fill="{color}"{attrs}>{escape(text)}</text>')
+    parts.append('</g></svg>')
+    return "\n".join(parts) + "\n"
+
+def render_png(scene, file_path, dpi=100):
+    # Tek tek çizim yerine koleksiyonlar (LineCollection, PolyCollection, EllipseCollection) kullanılır; büyük ağlarda da hızlıdır.
+    try:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import EllipseCollection, LineCollection, PolyCollection
+    except ImportError as e: raise ImportError("PNG dışa aktarımı için matplotlib gerekli (SVG bağımlılık gerektirmez).") from e
+    x0, y0, x1, y1 = scene["bbox"]; w, h = x1 - x0, y1 - y0
+    fig = Figure(figsize=(w / dpi, h / dpi), dpi=dpi); FigureCanvasAgg(fig)
+    ax = fig.add_axes((0, 0, 1, 1)); ax.set_xlim(x0, x1); ax.set_ylim(y1, y0); ax.set_axis_off()
+    px_to_pt = 72.0 / dpi  # tuval pikselleri -> matplotlib punto
+    lines = scene["lines"]
+    ax.add_collection(LineCollection([((a, b), (c, d)) for a, b, c, d, _, _ in lines], colors=[line[4] for line in lines], linewidths=[line[5] * px_to_pt for line in lines], capstyle="round", zorder=1))
+    arrows = [(points, color) for points, color in scene["arrows"] if points]
+    ax.add_collection(PolyCollection([points for points, _ in arrows], facecolors=[color for _, color in arrows], edgecolors="none", zorder=1))
+    circles = scene["circles"]; diameter = 2 * NEURON_RADIUS
+    ax.add_collection(EllipseCollection([diameter] * len(circles), [diameter] * len(circles), [0] * len(circles), units="xy", offsets=[(x, y) for x, y, _ in circles],
+                                        offset_transform=ax.transData, facecolors=[c[2] for c in circles], edgecolors="black", linewidths=1.5 * px_to_pt, zorder=2))
+    for x, y, text, size, color, style, angle in scene["texts"]:
+        ax.text(x, y, text, fontsize=size * 4 / 3 * px_to_pt, color=color, ha="center", va="center", rotation=angle, rotation_mode="anchor",
+                fontweight="bold" if style == "bold" else "normal", fontstyle="italic" if style == "italic" else "normal", zorder=3)
+    fig.savefig(file_path, dpi=dpi, facecolor="white")
+
+def export_diagram(network, file_path, fmt=None, show_weights=False, show_biases=False, show_values=False, dpi=100):
+    # Biçim verilmezse dosya uzantısından alınır (.svg / .png).
+    fmt = (fmt or os.path.splitext(file_path)[1].lstrip(".")).lower()
+    if fmt not in EXPORT_FORMATS: raise ValueError(f"Desteklenmeyen diyagram biçimi: {fmt or '-'} (geçerli: {', '.join(EXPORT_FORMATS)})")
+    scene = build_scene(network, show_weights, show_biases, show_values)
+    if fmt == "svg":
+        with open(file_path, "w", encoding="utf-8") as f: f.write(render_svg(scene))
+    else: render_png(scene, file_path, dpi)
+    return {"format": fmt, "connections": len(scene["lines"]), "neurons": len(scene["circles"])}
+
+def checkpoint_paths(paths):
+    # Dosyalar olduğu gibi, klasörlerdeki *.json dosyaları ad sırasıyla.
+    result = []
+    for path in paths:
+        if os.path.isdir(path): result.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.lower().endswith(".json"))
+        else: result.append(path)
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaydedilmiş ağların diyagramlarını pencere açmadan SVG/PNG olarak dışa aktar")
+    parser.add_argument("checkpoints", nargs="+", help="'Ağı Kaydet' ile kaydedilmiş JSON dosyaları veya bunları içeren klasörler")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="svg", help="Çıktı biçimi")
+    parser.add_argument("--out-dir", default=None, help="Çıktı klasörü (varsayılan: her kaydın yanı)")
+    parser.add_argument("--weights", action="store_true", help="Ağırlık değerlerini bağlantıların üzerine yaz")
+    parser.add_argument("--biases", action="store_true", help="Bias değerlerini nöronların altına yaz")
+    parser.add_argument("--dpi", type=int, default=100, help="PNG çözünürlüğü")
+    args = parser.parse_args(argv)
+    if args.out_dir: os.makedirs(args.out_dir, exist_ok=True)
+    failures = 0
+    for path in checkpoint_paths(args.checkpoints):
+        try:
+            data = load_checkpoint(path)
+            if is_quantized_artifact(data): print(f"Atlandı (int8 model, ağırlık kaydı değil): {path}", file=sys.stderr); continue
+            if not isinstance(data, dict) or "weights" not in data: print(f"Atlandı (ağ kaydı değil): {path}", file=sys.stderr); continue
+            stem = os.path.splitext(os.path.basename(path))[0]
+            out_path = os.path.join(args.out_dir or os.path.dirname(path), f"{stem}.{args.format}")
+            info = export_diagram(network_from_checkpoint(data), out_path, args.format, args.weights, args.biases, dpi=args.dpi)
+            print(f"{path} -> {out_path} ({info['neurons']} nöron, {info['connections']} bağlantı)")
+        except (OSError, ValueError, KeyError) as e: print(f"Hata ({path}): {e}", file=sys.stderr); failures += 1
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
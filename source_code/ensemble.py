@@ -0,0 +1,171 @@
+# Topluluk (ensemble) eğitimi: aynı mimarinin farklı tohumlarla başlatılmış K
+# kopyası aynı veri akışı (aynı karıştırma sırası) üzerinde birlikte eğitilir.
+# Kopyaların ağırlıkları tek bir yığın (Ws[k] = k. kopyanın katman ağırlıkları)
+# halinde tutulur; küçük float64 ağlarda K kopyanın ileri yayılımı, deltaları ve
+# optimizer güncellemesi tek bir derlenmiş adımda açılır (girdi/hedef bir kez
+# açılır, tek çağrıda K kopya güncellenir). Sonuçlar kopyaları ayrı ayrı
+# train_sample ile eğitmekle birebir aynıdır.
+# Epoch başına kopya kayıplarının ortalama/standart sapma eğrisi ve kopya
+# çıktılarının ortalamasıyla tahmin yapan topluluğun başarısı raporlanır.
+
+import copy
+import random
+import statistics
+
+from compiler import MAX_UNROLLED_WEIGHTS, network_signature, can_compile, unrolled_weight_count, get_compiled_ensemble_group
+from neural_network import NeuralNetwork, ALL_OPTIMIZER_STATE_ATTRS
+from precision import DEFAULT_PRECISION
+from utils import predicted_class
+
+# Tek fonksiyonda açılacak toplam ağırlık sınırı; kopyalar bu sınıra göre gruplanır.
+MAX_GROUP_UNROLLED_WEIGHTS = 2 * MAX_UNROLLED_WEIGHTS
+
+def _adam_inverses(t, beta1, beta2):
+    # NeuralNetwork._apply_optimizer_update ile aynı bias düzeltme çarpanları.
+    denom_beta1, denom_beta2 = (1 - beta1**t), (1 - beta2**t)
+    if denom_beta1 == 0: denom_beta1 = 1e-8
+    if denom_beta2 == 0: denom_beta2 = 1e-8
+    return 1 / denom_beta1, 1 / denom_beta2
+
+def _optimizer_stacks(members, optimizer_type):
+    if optimizer_type == "momentum": return [(net.velocity_W, net.velocity_b) for net in members]
+    if optimizer_type == "adam": return [(net.m_W, net.v_W, net.m_b, net.v_b) for net in members]
+    return None
+
+def _run_group_step(step, members, Ws, Bs, S, x, y, learning_rate, hyperparams, is_adam):
+    C = None
+    for net in members: net.mark_all_layers_changed()  # parametreler derlenmiş adımda yerinde güncellenir
+    if is_adam:
+        for net in members: net.adam_t += 1
+        C = [_adam_inverses(net.adam_t, hyperparams[1], hyperparams[2]) for net in members]
+    return step(x, y, Ws, Bs, S, C, learning_rate, hyperparams)
+
+def _clone_replica(net):
+    clone = NeuralNetwork(net.loss_function_name); clone.fast_math = net.fast_math
+    clone.configure_network(len(net.weights[0]), net.layer_configs, net.weights, net.biases, precision=net.precision)
+    clone.load_optimizer_state(copy.deepcopy(net.get_optimizer_state()))
+    return clone
+
+def verify_train_step(group, members, optimizer_type, optimizer_params, learning_rate=0.05, n_steps=2, seed=0):
+    # Derlenmiş topluluk adımını geçici kopyalar üzerinde tekil train_sample (derlenmiş yol, o da referans
+    # üreteçlerle doğrulanmıştır) ile karşılaştırır; çıkışlar, parametreler ve optimizer durumu birebir eşit olmalıdır.
+    rng, hyperparams = random.Random(seed), NeuralNetwork._optimizer_hyperparams(optimizer_params)
+    ours, refs = [_clone_replica(net) for net in members], [_clone_replica(net) for net in members]
+    for net in ours: net._ensure_optimizer_state(optimizer_type, learning_rate, optimizer_params)
+    Ws, Bs, S = [net.weights for net in ours], [net.biases for net in ours], _optimizer_stacks(ours, optimizer_type)
+    input_size, n_out = group.signature[0], group.signature[1][-1][0]
+    for _ in range(n_steps):
+        x, y = [rng.uniform(-2.0, 2.0) for _ in range(input_size)], [rng.random() for _ in range(n_out)]
+        outputs = _run_group_step(group.train_step(optimizer_type), ours, Ws, Bs, S, x, y, learning_rate, hyperparams, optimizer_type == "adam")
+        for out, ref in zip(outputs, refs):
+            if out != list(ref.train_sample(x, y, learning_rate, optimizer_params)): return False
+    for net, ref in zip(ours, refs):
+        if net.weights != ref.weights or net.biases != ref.biases or net.adam_t != ref.adam_t: return False
+        if any(getattr(net, attr) != getattr(ref, attr) for attr in ALL_OPTIMIZER_STATE_ATTRS): return False
+    outputs = group.forward(x, Ws, Bs)
+    for out, ref in zip(outputs, refs):
+        if out != list(ref.forward(x)): return False
+    return True
+
+class EnsembleTrainer:
+    def __init__(self, input_size, layer_configs, n_replicas, loss_function_name="mean_squared_error", seed=0, fast_math=False, precision=DEFAULT_PRECISION, use_compiled=True):
+        if n_replicas < 1: raise ValueError("Topluluk en az 1 kopya içermeli.")
+        self.input_size, self.layer_configs, self.n_replicas, self.seed = input_size, [tuple(cfg) for cfg in layer_configs], n_replicas, seed
+        self.replicas, saved_state = [], random.getstate()
+        try:
+            for r in range(n_replicas):
+                random.seed(seed + r)
+                net = NeuralNetwork(loss_function_name); net.fast_math = fast_math
+                net.configure_network(input_size, self.layer_configs, precision=precision)
+                self.replicas.append(net)
+        finally: random.setstate(saved_state)
+        self.loss_func = self.replicas[0].loss_func
+        self.rng = random.Random(seed)  # tüm kopyalar için ortak karıştırma sırası
+        self.loss_history = []  # epoch başına kopya kayıpları
+        self.groups, self.status, self._verified = None, "", {}
+        signature = network_signature(input_size, self.layer_configs, loss_function_name, fast_math)
+        if not use_compiled: self.status = "Topluluk: derleme kapalı, kopyalar sırayla (referans yol) eğitiliyor."
+        elif precision != "float64": self.status = f"Topluluk: derlenmiş yol yalnızca float64 için; kopyalar sırayla eğitiliyor ({precision})."
+        elif not can_compile(signature): self.status = f"Topluluk: ağ derlenemeyecek kadar büyük ({unrolled_weight_count(signature)} ağırlık), kopyalar sırayla eğitiliyor."
+        else:
+            per_group = max(1, MAX_GROUP_UNROLLED_WEIGHTS // unrolled_weight_count(signature))
+            self.groups = [(get_compiled_ensemble_group(signature, len(self.replicas[s:s + per_group])), s, self.replicas[s:s + per_group]) for s in range(0, n_replicas, per_group)]
+            self.status = f"Topluluk: {n_replicas} kopya, {len(self.groups)} derlenmiş grupta birlikte eğitiliyor."
+
+    def _compiled_groups_for(self, optimizer_type, learning_rate, optimizer_params):
+        # Her optimizer için derlenmiş adım ilk kullanımda doğrulanır; doğrulanamazsa kopyalar sırayla eğitilir.
+        if self.groups is None: return None
+        if optimizer_type not in self._verified:
+            self._verified[optimizer_type] = all(verify_train_step(group, members, optimizer_type, optimizer_params, learning_rate or 0.05) for group, _, members in self.groups)
+            if not self._verified[optimizer_type]: self.status = f"Topluluk: derlenmiş {optimizer_type} adımı doğrulanamadı, kopyalar sırayla eğitiliyor."
+        return self.groups if self._verified[optimizer_type] else None
+
+    def train_epoch(self, X, Y, learning_rate, optimizer_params=None, shuffle=True):
+        # Tüm kopyaları aynı sırayla bir epoch eğitir; kopya başına ortalama kayıp listesini döndürür.
+        optimizer_params = optimizer_params or {}; optimizer_type = optimizer_params.get("type", "sgd")
+        data = list(zip(X, Y))
+        if shuffle: self.rng.shuffle(data)
+        loss_sums, loss_func = [0.0] * self.n_replicas, self.loss_func
+        groups = self._compiled_groups_for(optimizer_type, learning_rate, optimizer_params)
+        if groups is None:
+            for x, y in data:
+                for r, net in enumerate(self.replicas): loss_sums[r] += loss_func(y, net.train_sample(x, y, learning_rate, optimizer_params))
+        else:
+            hyperparams, is_adam = NeuralNetwork._optimizer_hyperparams(optimizer_params), optimizer_type == "adam"
+            for net in self.replicas: net._ensure_optimizer_state(optimizer_type, learning_rate, optimizer_params)
+            stacks = [(group.train_step(optimizer_type), start, members, [net.weights for net in members], [net.biases for net in members], _optimizer_stacks(members, optimizer_type))
+                      for group, start, members in groups]
+            for x, y in data:
+                for step, start, members, Ws, Bs, S in stacks:
+                    for r, out in enumerate(_run_group_step(step, members, Ws, Bs, S, x, y, learning_rate, hyperparams, is_adam), start): loss_sums[r] += loss_func(y, out)
+        losses = [s / len(data) if data else 0.0 for s in loss_sums]
+        self.loss_history.append(losses)
+        return losses
+
+    def train(self, X, Y, epochs, learning_rate, optimizer_params=None, shuffle=True, callback=None):
+        # callback(epoch_no, kopya_kayıpları) her epoch sonunda çağrılır; False döndürürse eğitim durur.
+        for epoch in range(epochs):
+            losses = self.train_epoch(X, Y, learning_rate, optimizer_params, shuffle)
+            if callback is not None and callback(epoch + 1, losses) is False: break
+        return self.loss_curve()
+
+    def loss_curve(self):
+        # (ortalama, standart sapma) eğrileri; tek kopyada sapma 0'dır.
+        means = [statistics.fmean(losses) for losses in self.loss_history]
+        stds = [statistics.stdev(losses) if len(losses) > 1 else 0.0 for losses in self.loss_history]
+        return means, stds
+
+    def replica_outputs(self, x):
+        if self.groups is None: return [list(net.forward(x)) for net in self.replicas]
+        return [out for group, _, members in self.groups for out in group.forward(x, [net.weights for net in members], [net.biases for net in members])]
+
+    def predict(self, x):
+        # Topluluk tahmini: kopya çıktılarının ortalaması.
+        outputs = self.replica_outputs(x)
+        return [sum(col) / len(outputs) for col in zip(*outputs)]
+
+    def evaluate(self, X, Y):
+        # Topluluk (ortalama tahmin) ve tek tek kopyalar için ortalama kayıp ve (sınıflandırmada) doğruluk.
+        n_out, out_activation = self.layer_configs[-1]
+        classify = n_out > 1 or out_activation == "sigmoid"
+        replica_losses, replica_correct = [0.0] * self.n_replicas, [0] * self.n_replicas
+        ensemble_loss, ensemble_correct = 0.0, 0
+        for x, y in zip(X, Y):
+            outputs = self.replica_outputs(x)
+            mean_out = [sum(col) / len(outputs) for col in zip(*outputs)]
+            ensemble_loss += self.loss_func(y, mean_out)
+            true_cls = predicted_class(y) if classify else None
+            if classify and predicted_class(mean_out) == true_cls: ensemble_correct += 1
+            for r, out in enumerate(outputs):
+                replica_losses[r] += self.loss_func(y, out)
+                if classify and predicted_class(out) == true_cls: replica_correct[r] += 1
+        n = len(X) or 1
+        result = {"ensemble_loss": ensemble_loss / n, "replica_losses": [v / n for v in replica_losses], "ensemble_accuracy": None, "replica_accuracies": None}
+        if classify: result["ensemble_accuracy"], result["replica_accuracies"] = ensemble_correct / n, [c / n for c in replica_correct]
+        return result
+
+    def best_replica(self):
+        # Son epoch kaybı en düşük kopyanın indeksi.
+        if not self.loss_history: return 0
+        last = self.loss_history[-1]
+        return min(range(len(last)), key=last.__getitem__)
@@ -0,0 +1,77 @@
+# İleri/geri yayılım olayları için seçici abonelik. Tüketiciler (GUI izleme
+# modu, kayıt araçları) yalnızca istedikleri olay türlerine, katmanlara ve
+# nöronlara abone olur. Ağ her olay noktasında wants(tür, katman) ile sorar ve
+# kimsenin istemediği olayın sözlüğünü hiç oluşturmaz; ayrıntılı (ağırlık
+# başına) adımlar da yalnızca o katman için istenmişse yürütülür.
+
+FORWARD_EVENT_TYPES = ("input_layer", "weight_multiplication", "bias_addition", "layer_activation", "forward_pass_complete")
+BACKWARD_EVENT_TYPES = ("output_delta_calculation", "hidden_delta_calculation", "gradient_calculation", "weight_update", "backward_pass_complete")
+EVENT_TYPES = FORWARD_EVENT_TYPES + BACKWARD_EVENT_TYPES + ("error",)
+
+class Subscription:
+    __slots__ = ("callback", "event_types", "layers", "neurons")
+
+    def __init__(self, callback, event_types=None, layers=None, neurons=None):
+        # None = hepsi. Katman filtresi layer_index taşıyan olaylara, nöron filtresi neuron_index taşıyanlara uygulanır.
+        self.callback = callback
+        self.event_types = frozenset(EVENT_TYPES if event_types is None else event_types)
+        self.layers = None if layers is None else frozenset(layers)
+        self.neurons = None if neurons is None else frozenset(neurons)
+        unknown = self.event_types - set(EVENT_TYPES)
+        if unknown: raise ValueError(f"Bilinmeyen olay türü: {', '.join(sorted(unknown))} (geçerli: {', '.join(EVENT_TYPES)})")
+
+    def matches(self, event):
+        if event["type"] not in self.event_types: return False
+        if self.layers is not None and "layer_index" in event and event["layer_index"] not in self.layers: return False
+        return self.neurons is None or "neuron_index" not in event or event["neuron_index"] in self.neurons
+
+class EventBus:
+    def __init__(self):
+        self._subscriptions = []
+        self._filter = {}  # olay türü -> None (tüm katmanlar) veya katman kümesi
+
+    def subscribe(self, callback, event_types=None, layers=None, neurons=None):
+        subscription = Subscription(callback, event_types, layers, neurons)
+        self._subscriptions.append(subscription); self._rebuild()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        if subscription in self._subscriptions: self._subscriptions.remove(subscription); self._rebuild()
+
+    def clear(self):
+        self._subscriptions = []; self._filter = {}
+
+    def _rebuild(self):
+        wanted = {}
+        for sub in self._subscriptions:
+            for event_type in sub.event_types:
+                if event_type in wanted and wanted[event_type] is None: continue
+                wanted[event_type] = None if sub.layers is None else wanted.get(event_type, frozenset()) | sub.layers
+        self._filter = wanted
+
+    def wants(self, event_type, layer=None):
+        if event_type not in self._filter: return False
+        layers = self._filter[event_type]
+        return layers is None or layer is None or layer in layers
+
+    def dispatch(self, event):
+        for sub in self._subscriptions:
+            if sub.matches(event): sub.callback(event)
+
+    def __bool__(self):
+        return bool(self._subscriptions)
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+class _AllEvents:
+    # Adım üreteçlerinin (forward_pass_generator/backward_pass_generator) tüm olayları üretmesi için.
+    @staticmethod
+    def wants(event_type, layer=None): return True
+
+class _NoEvents:
+    # Olay üretmeden yalnızca hesaplama (predict vb.).
+    @staticmethod
+    def wants(event_type, layer=None): return False
+
+ALL_EVENTS, NO_EVENTS = _AllEvents(), _NoEvents()
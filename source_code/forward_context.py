@@ -0,0 +1,98 @@
+# Paylaşılan ağ durumuna yazmayan (durumsuz) ileri/geri yayılım. NeuralNetwork
+# ileri yayılımda ara sonuçları kendi üzerinde (neuron_outputs_z/a) tutar; bu
+# yüzden aynı nesnede eşzamanlı iki tahmin veya eğitim sırasında tahmin
+# birbirini bozar. Burada:
+#  - ForwardContext: çağrı başına çalışma alanı (girdi, katman z/a değerleri, δ'lar),
+#  - ParameterSnapshot: ağırlık/biasların salt okunur (demet) kopyası; forward(x, ctx)
+#    ve backward(ctx, y) yalnızca bağlama yazar, görüntü hiç değişmez.
+# Bir görüntü birden çok iş parçacığı veya asyncio görevi tarafından aynı anda
+# kullanılabilir; eğiticinin canlı ağı güncellemesi görüntüyü etkilemez. Yeni
+# görüntü önceki görüntünün değişmemiş katmanlarını (layer_versions) paylaşır,
+# yalnızca değişen katmanlar kopyalanır. Sonuçlar NeuralNetwork'ün referans
+# ileri/geri yayılımıyla bit düzeyinde aynıdır.
+
+from utils import (
+    ACTIVATION_VECTOR_FUNCTIONS, FAST_ACTIVATION_VECTOR_FUNCTIONS,
+    multiply_row_vector_matrix, add_vectors, subtract_vectors,
+    elementwise_multiply_vectors, transpose_matrix
+)
+from precision import cast_vector, copy_vector
+from pruning import SparseLayer
+
+class ForwardContext:
+    # Tek bir ileri (ve isteğe bağlı geri) yayılımın ara sonuçları; iş parçacıkları arasında paylaşılmamalıdır.
+    __slots__ = ("inputs", "z_layers", "a_layers", "deltas", "version")
+
+    def __init__(self):
+        self.inputs, self.z_layers, self.a_layers, self.deltas, self.version = None, [], [], None, None
+
+    @property
+    def outputs(self):
+        return self.a_layers[-1] if len(self.a_layers) > 1 else None
+
+class ParameterSnapshot:
+    def __init__(self, network, previous=None):
+        # Canlı ağın iş parçacığında (güncellemeler arasında) oluşturulmalıdır; sonrasında her yerden okunabilir.
+        if not network.weights: raise ValueError("Görüntüsü alınacak ağ yok.")
+        self.version, self.layer_versions = network.param_version, tuple(network.layer_versions)
+        self.input_size, self.layer_configs = len(network.weights[0]), tuple(tuple(cfg) for cfg in network.layer_configs)
+        self.output_size, self.output_activation = self.layer_configs[-1]
+        self.precision, self.fast_math, self.loss_function_name = network.precision, network.fast_math, network.loss_function_name
+        self._loss_derivative = network.loss_derivative_func
+        self.input_normalizer = network.input_normalizer  # değiştirilmez; set_input_normalizer yeni nesne atar
+        reuse = previous is not None and previous.layer_configs == self.layer_configs and previous.input_size == self.input_size and previous.precision == self.precision
+        weights, biases, sparse_layers = [], [], []
+        for l, (W, b, sparse) in enumerate(zip(network.weights, network.biases, network.sparse_layers)):
+            if reuse and previous.layer_versions[l] == self.layer_versions[l]:
+                weights.append(previous.weights[l]); biases.append(previous.biases[l]); sparse_layers.append(previous.sparse_layers[l]); continue
+            weights.append(tuple(tuple(row) for row in W)); biases.append(tuple(b))
+            sparse_layers.append(None if sparse is None else SparseLayer(sparse.n_in, sparse.n_out, tuple(sparse.indptr), tuple(sparse.indices), tuple(sparse.values)))
+        self.weights, self.biases, self.sparse_layers = tuple(weights), tuple(biases), tuple(sparse_layers)
+        table = FAST_ACTIVATION_VECTOR_FUNCTIONS if self.fast_math else ACTIVATION_VECTOR_FUNCTIONS
+        self._activations = tuple(table[act] for _, act in self.layer_configs)
+        self._transposed = [None] * len(self.weights)  # geri yayılım için gerektiğinde hesaplanır
+
+    def forward(self, inputs, ctx=None):
+        # Çıkış aktivasyonlarını döndürür; ara sonuçlar ctx'e (verilmezse yeni bir bağlama) yazılır.
+        if len(inputs) != self.input_size: raise ValueError(f"Girdi boyutu ({len(inputs)}) ağ giriş boyutuyla ({self.input_size}) eşleşmiyor.")
+        ctx = ForwardContext() if ctx is None else ctx
+        precision = self.precision
+        a = copy_vector(inputs if self.input_normalizer is None else self.input_normalizer.transform(inputs), precision); z_layers, a_layers = [], [a]
+        for W, b, sparse, (activation, _) in zip(self.weights, self.biases, self.sparse_layers, self._activations):
+            z = add_vectors(multiply_row_vector_matrix(a, W) if sparse is None else sparse.matvec(a), b)
+            a = cast_vector(activation(z), precision)
+            z_layers.append(cast_vector(z, precision)); a_layers.append(a)
+        ctx.inputs, ctx.z_layers, ctx.a_layers, ctx.deltas, ctx.version = list(inputs), z_layers, a_layers, None, self.version
+        return list(a)
+
+    def backward(self, ctx, targets):
+        # ctx'teki ileri yayılımdan katman başına δ = ∂L/∂z (ctx.deltas'a da yazılır). Parametreler değişmez;
+        # güncelleme için NeuralNetwork.apply_gradients(ctx, ...) kullanılır.
+        if ctx.version != self.version or len(ctx.a_layers) != len(self.weights) + 1: raise ValueError("Bağlam bu görüntüyle yapılmış bir ileri yayılım içermiyor.")
+        a_L = ctx.a_layers[-1]
+        if self.loss_function_name == "cross_entropy" and self.output_activation == "softmax": delta = self._loss_derivative(targets, a_L)
+        else:
+            dL_daL = subtract_vectors(a_L, targets) if self.loss_function_name == "mean_squared_error" else self._loss_derivative(targets, a_L)
+            delta = elementwise_multiply_vectors(dL_daL, self._activations[-1][1](a_L))
+        deltas = [delta]
+        for l in range(len(self.weights) - 2, -1, -1):
+            sparse = self.sparse_layers[l + 1]
+            if sparse is None:
+                W_T = self._transposed[l + 1]
+                if W_T is None: W_T = self._transposed[l + 1] = transpose_matrix(self.weights[l + 1])  # eşzamanlı ilk hesaplamalar aynı sonucu üretir
+                error = multiply_row_vector_matrix(deltas[0], W_T)
+            else: error = sparse.rmatvec(deltas[0])
+            deltas.insert(0, elementwise_multiply_vectors(error, self._activations[l][1](ctx.a_layers[l + 1])))
+        ctx.deltas = deltas
+        return deltas
+
+    def predict(self, inputs):
+        return self.forward(inputs)
+
+    def predict_batch(self, rows):
+        # inference.InferenceModel ile aynı arayüz (tahmin sunucusu görüntüleri doğrudan sunabilir).
+        forward = self.forward
+        return [forward(row) for row in rows]
+
+    def has_class_output(self):
+        return self.output_size > 1 or self.output_activation == "sigmoid"
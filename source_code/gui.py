@@ -3,23 +3,39 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, scrolledtext, filedialog
-import math
 import random
-import json
-import csv
+import tempfile
 import time
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from collections import OrderedDict
 
 from utils import ACTIVATION_FUNCTIONS, LOSS_FUNCTIONS
 from neural_network import NeuralNetwork
+from ensemble import EnsembleTrainer
+from metrics import classification_metrics, format_confusion_matrix
+from pruning import PRUNING_SCOPES, iterative_prune, sparsity_report
+from quantization import DEFAULT_CALIBRATION_SAMPLES, quantize_network, quantization_report, format_quantization_report, save_quantized_model
 from gui_components import ToolTip
+from profiler import Profiler, profiled_method
+from memory import predict_network_footprint, predict_dataset_footprint, network_memory_report, format_memory_report, format_bytes, TracemallocPeakTracker
+from data_io import read_csv_dataset, build_checkpoint, save_checkpoint, load_checkpoint, get_checkpoint_optimizer_state, get_checkpoint_precision, get_checkpoint_training_state, apply_optimizer_state, apply_checkpoint_pruning
+from training import EpochSampler, rng_state_from_json
+from snapshots import RESIDUAL_FORMATS, DEFAULT_RESIDUAL_FORMAT, SnapshotStore
+from events import FORWARD_EVENT_TYPES, BACKWARD_EVENT_TYPES
+from diagram_export import ARROW_SHAPE, NEURON_RADIUS, INPUT_FILL, HIDDEN_FILL, OUTPUT_FILL, connection_style, network_layout, weight_label_position, export_diagram
+from cross_validation import DEFAULT_FOLDS, run_cross_validation, format_cv_report
+from morphing import morph_network, format_morph_report
+from normalization import NORMALIZATION_DISPLAY_NAMES, fit_normalizer, normalizer_from_checkpoint, format_normalizer
+from checkpointing import CHECKPOINT_AUTO, checkpoint_plan, measure_checkpointing, format_checkpoint_report
+from telemetry import DEFAULT_SAMPLE_EVERY, TrainingTelemetry, format_telemetry, format_histogram
+from precision import PRECISIONS, DEFAULT_PRECISION, copy_vector, to_plain
 
 try:
     import sv_ttk
 except ImportError:
     sv_ttk = None
 
+PARSE_MEMO_SIZE = 8
+
 class DeepLearningSimulatorGUI:
     def __init__(self, master):
         self.master = master
@@ -27,11 +43,25 @@ class DeepLearningSimulatorGUI:
         master.geometry("1600x1000") 
         self.current_theme = "light" 
         if sv_ttk: sv_ttk.set_theme(self.current_theme) 
-        self.network = NeuralNetwork()
+        self.profiler = Profiler()
+        self.network = NeuralNetwork(profiler=self.profiler)
         self.forward_pass_gen, self.backward_pass_gen = None, None
         self.training_data_X, self.training_data_Y = [], []
         self.current_training_sample_idx, self.is_training_step_by_step_active = 0, False
         self.current_epoch_losses, self.current_epoch_accuracies = [], []
+        self.total_epochs_completed = 0  # ağın şimdiye kadar tamamladığı epoch sayısı (kayıtla birlikte saklanır)
+        self.epoch_sampler, self._pending_sampler_state = None, None  # örnek sırası; kayıttan gelen durum veri boyutu eşleşince kullanılır
+        self.last_checkpoint_path, self.autosave_every_var = None, tk.IntVar(value=0)
+        self._main_history = None  # topluluk eğitimi eğrileri gösterilirken ana ağın kayıp/doğruluk geçmişi
+        self.snapshot_every_var, self.snapshot_format_var = tk.IntVar(value=0), tk.StringVar(value=DEFAULT_RESIDUAL_FORMAT)
+        self.snapshot_store, self._snapshot_dir = None, None  # geçici dizinde anlık görüntü halkası (ilk kayıtta oluşturulur)
+        self._live_params = None  # zaman çizelgesinden görüntü yüklenince ağın o anki (en güncel) parametreleri
+        self.ensemble_loss_band = None  # topluluk eğitiminde epoch başına kayıp standart sapması
+        self.ensemble_size_var = tk.IntVar(value=10)
+        self.cv_folds_var = tk.IntVar(value=DEFAULT_FOLDS)
+        self._parse_memo = OrderedDict()  # metin kutusu ayrıştırma sonuçları (aynı metin tekrar ayrıştırılmaz)
+        self.prune_percent_var, self.prune_scope_var = tk.DoubleVar(value=50.0), tk.StringVar(value=PRUNING_SCOPES[0])
+        self.prune_steps_var, self.prune_finetune_epochs_var = tk.IntVar(value=1), tk.IntVar(value=0)
         self.current_training_X_sample, self.current_training_Y_sample = None, None 
         self.detailed_forward_steps = tk.BooleanVar(value=False) 
         self.auto_train_watch_steps_var = tk.BooleanVar(value=False) 
@@ -42,6 +72,20 @@ class DeepLearningSimulatorGUI:
         self.show_weights_on_canvas_var.trace_add("write", lambda *args: self.draw_network_on_canvas())
         self.show_biases_on_canvas_var.trace_add("write", lambda *args: self.draw_network_on_canvas())
         self.show_neuron_values_on_canvas_var.trace_add("write", lambda *args: self.draw_network_on_canvas())
+        self.profiling_enabled_var = tk.BooleanVar(value=False)
+        self.profiling_enabled_var.trace_add("write", lambda *args: self.profiler.set_enabled(self.profiling_enabled_var.get()))
+        self.memory_budget_mb_var = tk.DoubleVar(value=1024.0)
+        self.fast_math_var = tk.BooleanVar(value=False)
+        self.fast_math_var.trace_add("write", lambda *args: setattr(self.network, "fast_math", self.fast_math_var.get()))
+        self.compiled_path_var = tk.BooleanVar(value=True)
+        self.compiled_path_var.trace_add("write", lambda *args: setattr(self.network, "use_compiled", self.compiled_path_var.get()))
+        self.checkpoint_every_var = tk.StringVar(value="Kapalı")  # aktivasyon checkpoint aralığı: Kapalı, Otomatik (√L) veya k
+        self.checkpoint_every_var.trace_add("write", lambda *args: setattr(self.network, "checkpoint_every", self._checkpoint_every()))
+        self.normalization_var = tk.StringVar(value=NORMALIZATION_DISPLAY_NAMES["none"])  # girdi normalizasyonu türü (normalization.py)
+        self.normalization_var.trace_add("write", lambda *args: self._on_normalization_change())
+        self.track_tracemalloc_var = tk.BooleanVar(value=False)
+        self.telemetry_enabled_var, self.telemetry_every_var = tk.BooleanVar(value=False), tk.IntVar(value=DEFAULT_SAMPLE_EVERY)
+        self.telemetry_jsonl_path = None  # verilirse telemetri kayıtları bu JSONL dosyasına eklenir
 
         self.style = ttk.Style()
         self.main_frame = ttk.Frame(master, padding="10")
@@ -97,6 +141,9 @@ class DeepLearningSimulatorGUI:
         self.load_network_button.pack(side=tk.LEFT, padx=2, expand=True, fill=tk.X)
         self.save_network_button = ttk.Button(file_ops_frame, text="Ağı Kaydet", command=self.save_network_with_state, state=tk.DISABLED)
         self.save_network_button.pack(side=tk.LEFT, padx=2, expand=True, fill=tk.X)
+        self.export_int8_button = ttk.Button(file_ops_frame, text="Int8 Dışa Aktar", command=self.export_quantized_model, state=tk.DISABLED)
+        self.export_int8_button.pack(side=tk.LEFT, padx=2, expand=True, fill=tk.X)
+        ToolTip(self.export_int8_button, f"Ağı int8'e nicemleyip kompakt bir çıkarım dosyası olarak kaydeder (quantization.py).\nGirdi ölçekleri yüklü veriden en fazla {DEFAULT_CALIBRATION_SAMPLES} örnekle kalibre edilir; float ağa karşı doğruluk raporu günlüğe yazılır.\nDosya inference.py ve prediction_server.py ile doğrudan kullanılabilir.")
 
         ttk.Label(controls_panel, text="Gizli Katman Sayısı:").grid(row=1, column=0, sticky=tk.W, pady=2)
         self.num_hidden_layers_var = tk.IntVar(value=1)
@@ -112,12 +159,23 @@ class DeepLearningSimulatorGUI:
         self.output_activation_var = tk.StringVar(value="sigmoid")
         self.output_activation_combo = ttk.Combobox(controls_panel, textvariable=self.output_activation_var, values=list(ACTIVATION_FUNCTIONS.keys()), state="readonly", width=10)
         self.output_activation_combo.grid(row=4, column=1, sticky=tk.EW, pady=2)
+        ttk.Label(controls_panel, text="Sayısal Hassasiyet:").grid(row=5, column=0, sticky=tk.W, pady=2)
+        precision_frame = ttk.Frame(controls_panel); precision_frame.grid(row=5, column=1, sticky=tk.EW, pady=2)
+        self.precision_var = tk.StringVar(value=DEFAULT_PRECISION)
+        precision_combo = ttk.Combobox(precision_frame, textvariable=self.precision_var, values=list(PRECISIONS.keys()), state="readonly", width=8); precision_combo.pack(side=tk.LEFT)
+        ToolTip(precision_combo, "Ağ kurulurken seçilir: ağırlıklar, biaslar, optimizer durumu, aktivasyonlar ve CSV veri seti bu hassasiyette saklanır.\nfloat32 bellek kullanımını belirgin şekilde azaltır; hesaplar yine double ile yapılır.")
+        self.master_weights_var = tk.BooleanVar(value=False)
+        cb_master = ttk.Checkbutton(precision_frame, text="float64 Ana Ağırlık", variable=self.master_weights_var); cb_master.pack(side=tk.LEFT, padx=4)
+        ToolTip(cb_master, "float32 modunda optimizer güncellemesini float64 ana ağırlık kopyasına uygular (küçük güncellemeler yuvarlamada kaybolmaz).")
         self.layer_config_frame = ttk.Frame(controls_panel)
-        self.layer_config_frame.grid(row=5, column=0, columnspan=2, sticky=tk.EW, pady=5)
+        self.layer_config_frame.grid(row=6, column=0, columnspan=2, sticky=tk.EW, pady=5)
         self.layer_entries = [] 
         self.update_layer_config_entries() 
         self.build_network_button = ttk.Button(controls_panel, text="Ağı Kur ve Çiz", command=self.build_and_draw_network)
-        self.build_network_button.grid(row=6, column=0, columnspan=2, pady=10, sticky=tk.EW)
+        self.build_network_button.grid(row=7, column=0, pady=10, sticky=tk.EW)
+        self.morph_button = ttk.Button(controls_panel, text="Ağı Dönüştür", command=self.morph_network_from_gui, state=tk.DISABLED)
+        self.morph_button.grid(row=7, column=1, pady=10, padx=(4,0), sticky=tk.EW)
+        ToolTip(self.morph_button, "Eğitilmiş ağı yukarıdaki mimariye ağırlıkları koruyarak taşır (Net2Net): gizli katmanlar genişletilir,\nyeni katmanlar birim (linear, relu sonrası relu) olarak eklenir. Çıktı değişmez; optimizer durumu ve\neğitim geçmişi korunur, eğitim kalınan yerden sürer. Çıkış katmanı değişemez, katman silinemez/daraltılamaz.")
 
         data_panel = ttk.LabelFrame(parent, text="Veri ve Eğitim Parametreleri", padding="10")
         data_panel.pack(fill=tk.X, pady=5, expand=False)
@@ -145,6 +203,29 @@ class DeepLearningSimulatorGUI:
         ttk.Label(data_panel, text="Öğrenme Oranı:").grid(row=8, column=0, sticky=tk.W, pady=2)
         self.lr_var = tk.DoubleVar(value=0.1)
         ttk.Entry(data_panel, textvariable=self.lr_var, width=7).grid(row=8, column=1, sticky=tk.EW, pady=2)
+        ttk.Label(data_panel, text="Otomatik Kayıt (epoch):").grid(row=11, column=0, sticky=tk.W, pady=2)
+        autosave_spin = ttk.Spinbox(data_panel, from_=0, to=100000, textvariable=self.autosave_every_var, width=7)
+        autosave_spin.grid(row=11, column=1, sticky=tk.EW, pady=2)
+        ToolTip(autosave_spin, "Otomatik eğitimde her N epoch'ta bir ağ ve eğitim durumu son kaydedilen/yüklenen dosyanın üzerine yazılır (0 = kapalı).\nKesilen eğitim bu dosyayı yükleyip yeniden başlatılarak kaldığı yerden birebir devam eder.")
+        ttk.Label(data_panel, text="Anlık Görüntü (epoch):").grid(row=12, column=0, sticky=tk.W, pady=2)
+        snapshot_frame = ttk.Frame(data_panel); snapshot_frame.grid(row=12, column=1, sticky=tk.EW, pady=2)
+        snapshot_spin = ttk.Spinbox(snapshot_frame, from_=0, to=100000, textvariable=self.snapshot_every_var, width=5); snapshot_spin.pack(side=tk.LEFT)
+        ttk.Combobox(snapshot_frame, textvariable=self.snapshot_format_var, values=list(RESIDUAL_FORMATS), state="readonly", width=7).pack(side=tk.LEFT, padx=(2,0))
+        ToolTip(snapshot_spin, "Otomatik eğitimde her N epoch'ta bir ağırlıkların anlık görüntüsü alınır (0 = kapalı).\nGörüntüler anahtar kareye göre fark olarak (seçilen biçimde) sınırlı boyutlu geçici bir disk halkasında tutulur;\n'Ağ Görselleştirmesi' sekmesindeki kaydırıcıyla herhangi bir epoch'un ağırlıkları yüklenir.")
+        ttk.Label(data_panel, text="Aktivasyon Checkpoint:").grid(row=13, column=0, sticky=tk.W, pady=2)
+        checkpoint_combo = ttk.Combobox(data_panel, textvariable=self.checkpoint_every_var, values=["Kapalı", "Otomatik (√L)", "2", "3", "4", "8"], state="readonly", width=12)
+        checkpoint_combo.grid(row=13, column=1, sticky=tk.EW, pady=2)
+        ToolTip(checkpoint_combo, "Eğitimde yalnızca her k'ıncı katmanın aktivasyonları saklanır; aradakiler geri yayılımda yeniden hesaplanır.\nOtomatik: k=⌈√katman⌉, aktivasyon belleği derinliğin kareköküyle büyür. Sonuçlar birebir aynıdır, ek süre ve\nkazanılan bellek 'Performans' sekmesindeki 'Checkpoint Ölçümü' ile görülür. Derlenmiş yol bu modda kullanılmaz.")
+        ttk.Label(data_panel, text="Girdi Normalizasyonu:").grid(row=14, column=0, sticky=tk.W, pady=2)
+        normalization_combo = ttk.Combobox(data_panel, textvariable=self.normalization_var, values=list(NORMALIZATION_DISPLAY_NAMES.values()), state="readonly", width=15)
+        normalization_combo.grid(row=14, column=1, sticky=tk.EW, pady=2)
+        ToolTip(normalization_combo, "Girdi özellikleri ağa girmeden önce ölçeklenir: z-skor (ortalama 0, std 1) veya min-maks ([0, 1]).\nİstatistikler yüklü veri üzerinden tek geçişte hesaplanır ve ağla birlikte kaydedilir; inference.py, tahmin sunucusu\nve int8 modeller aynı ölçeklemeyi uygular. Eğitilmiş ağda yeni CSV yüklemek mevcut istatistikleri değiştirmez.")
+        cb_fast_math = ttk.Checkbutton(data_panel, text="Hızlı Matematik (Yaklaşık Sigmoid)", variable=self.fast_math_var)
+        cb_fast_math.grid(row=9, column=0, columnspan=2, sticky=tk.W, pady=2)
+        cb_compiled = ttk.Checkbutton(data_panel, text="Derlenmiş Hızlı Yol (Küçük Ağlar)", variable=self.compiled_path_var)
+        cb_compiled.grid(row=10, column=0, columnspan=2, sticky=tk.W, pady=2)
+        ToolTip(cb_compiled, "İzlemesiz otomatik eğitimde, küçük float64 ağlar için döngüleri açılmış düz Python kodu üretilir\n(mimari değişince yeniden derlenir ve referans ileri/geri yayılımla doğrulanır).")
+        ToolTip(cb_fast_math, "Sigmoid'i σ(z)=0.5+0.5·tanh(z/2) özdeşliğiyle hesaplar (mutlak hata ≤ 1e-15).\nKapalıyken tam (exp tabanlı) hesaplama kullanılır.")
 
         run_panel = ttk.LabelFrame(parent, text="Çalıştırma ve İzleme", padding="10")
         run_panel.pack(fill=tk.BOTH, pady=5, expand=True)
@@ -166,20 +247,47 @@ class DeepLearningSimulatorGUI:
         ttk.Label(auto_train_options_frame, text="Gecikme(s):").pack(side=tk.LEFT)
         ttk.Entry(auto_train_options_frame, textvariable=self.auto_train_step_delay_var, width=5).pack(side=tk.LEFT)
         self.train_button = ttk.Button(run_panel, text="Eğitimi Başlat (Otomatik)", command=self.start_training_auto, state=tk.DISABLED); self.train_button.pack(fill=tk.X, pady=2)
+        ensemble_frame = ttk.Frame(run_panel); ensemble_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(ensemble_frame, text="Kopya (K):").pack(side=tk.LEFT)
+        ttk.Spinbox(ensemble_frame, from_=2, to=50, textvariable=self.ensemble_size_var, width=4).pack(side=tk.LEFT, padx=(2,5))
+        self.ensemble_button = ttk.Button(ensemble_frame, text="Topluluk Eğitimi", command=self.start_ensemble_training, state=tk.DISABLED); self.ensemble_button.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ToolTip(self.ensemble_button, "Mevcut mimarinin farklı tohumlarla başlatılmış K kopyasını aynı veri sırasıyla birlikte eğitir.\nKayıp eğrisinin ortalama ± std bandını ve kopya çıktılarının ortalamasıyla tahmin yapan topluluğun başarısını raporlar.\nAna ağın ağırlıkları değişmez.")
+        cv_frame = ttk.Frame(run_panel); cv_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(cv_frame, text="Kat (k):").pack(side=tk.LEFT)
+        ttk.Spinbox(cv_frame, from_=2, to=20, textvariable=self.cv_folds_var, width=4).pack(side=tk.LEFT, padx=(2,5))
+        self.cv_button = ttk.Button(cv_frame, text="Çapraz Doğrulama", command=self.start_cross_validation, state=tk.DISABLED); self.cv_button.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ToolTip(self.cv_button, "Eğitim verisini k kata böler; mevcut mimarinin aynı tohumla başlatılmış kopyaları her katı dışarıda bırakarak\nparalel işçi süreçlerde eğitilir (veri paylaşımlı bellekten okunur). Test kaybı, doğruluk ve makro F1 ortalama ± std olarak raporlanır.\nAna ağın ağırlıkları değişmez.")
+        prune_frame = ttk.LabelFrame(run_panel, text="Budama (Seyreltme)", padding="5"); prune_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(prune_frame, text="Seyreklik %:").grid(row=0, column=0, sticky=tk.W)
+        ttk.Spinbox(prune_frame, from_=0, to=99, increment=5, textvariable=self.prune_percent_var, width=5).grid(row=0, column=1, sticky=tk.W, padx=2)
+        ttk.Label(prune_frame, text="Kapsam:").grid(row=0, column=2, sticky=tk.W)
+        ttk.Combobox(prune_frame, textvariable=self.prune_scope_var, values=list(PRUNING_SCOPES), state="readonly", width=7).grid(row=0, column=3, sticky=tk.W, padx=2)
+        ttk.Label(prune_frame, text="Adım:").grid(row=1, column=0, sticky=tk.W)
+        ttk.Spinbox(prune_frame, from_=1, to=20, textvariable=self.prune_steps_var, width=5).grid(row=1, column=1, sticky=tk.W, padx=2)
+        ttk.Label(prune_frame, text="İnce ayar epoch:").grid(row=1, column=2, sticky=tk.W)
+        ttk.Spinbox(prune_frame, from_=0, to=1000, textvariable=self.prune_finetune_epochs_var, width=5).grid(row=1, column=3, sticky=tk.W, padx=2)
+        self.prune_button = ttk.Button(prune_frame, text="Ağı Buda", command=self.prune_network_from_gui, state=tk.DISABLED); self.prune_button.grid(row=2, column=0, columnspan=2, sticky=tk.EW, pady=(3,0))
+        self.unprune_button = ttk.Button(prune_frame, text="Budamayı Kaldır", command=self.clear_pruning_from_gui, state=tk.DISABLED); self.unprune_button.grid(row=2, column=2, columnspan=2, sticky=tk.EW, pady=(3,0))
+        ToolTip(self.prune_button, "En küçük |w| değerli bağlantıları budar (global: tüm ağ için tek eşik, layer: her katmanda ayrı eşik).\nAdım > 1 ise seyreklik hedefe kademeli çıkarılır; her adımdan sonra verilen epoch kadar ince ayar yapılır.\nBudanmış katmanlar seyrek (CSR) gösterimle hesaplanır; budanmış bağlantılar 0 kalır ve çizilmez.")
         self.progress_bar = ttk.Progressbar(run_panel, orient="horizontal", mode="determinate", length=200)
         self.progress_bar.pack(fill=tk.X, pady=(5,2))
         self.reset_button = ttk.Button(run_panel, text="Simülasyonu Sıfırla", command=self.reset_simulation); self.reset_button.pack(fill=tk.X, pady=(5,2))
 
     def _setup_right_panel_visualization_and_logs(self, parent_frame):
         vis_log_notebook = ttk.Notebook(parent_frame)
-        vis_log_notebook.pack(fill=tk.BOTH, expand=True)
+        vis_log_notebook.pack(fill=tk.BOTH, expand=True); self.vis_log_notebook = vis_log_notebook
         self.vis_frame = ttk.Frame(vis_log_notebook); vis_log_notebook.add(self.vis_frame, text='Ağ Görselleştirmesi')
         vis_toolbar_frame = ttk.Frame(self.vis_frame); vis_toolbar_frame.pack(fill=tk.X, pady=2)
-        self.save_canvas_button = ttk.Button(vis_toolbar_frame, text="Görseli Kaydet (.eps)", command=self.save_canvas_as_eps, state=tk.DISABLED)
+        self.save_canvas_button = ttk.Button(vis_toolbar_frame, text="Görseli Kaydet (.svg/.png/.eps)", command=self.save_canvas_as_eps, state=tk.DISABLED)
         self.save_canvas_button.pack(side=tk.LEFT, padx=5)
         ttk.Checkbutton(vis_toolbar_frame, text="Ağırlıklar", variable=self.show_weights_on_canvas_var).pack(side=tk.LEFT, padx=2)
         ttk.Checkbutton(vis_toolbar_frame, text="Biaslar", variable=self.show_biases_on_canvas_var).pack(side=tk.LEFT, padx=2)
         ttk.Checkbutton(vis_toolbar_frame, text="Nöron Değerleri", variable=self.show_neuron_values_on_canvas_var).pack(side=tk.LEFT, padx=2)
+        self.snapshot_live_button = ttk.Button(vis_toolbar_frame, text="Güncel", command=self.restore_live_params, state=tk.DISABLED); self.snapshot_live_button.pack(side=tk.RIGHT, padx=5)
+        self.snapshot_scale = tk.Scale(vis_toolbar_frame, from_=0, to=0, orient=tk.HORIZONTAL, length=220, showvalue=True, state=tk.DISABLED); self.snapshot_scale.pack(side=tk.RIGHT)
+        self.snapshot_scale.bind("<ButtonRelease-1>", lambda e: self.load_snapshot_epoch()); self.snapshot_scale.bind("<KeyRelease>", lambda e: self.load_snapshot_epoch())
+        self.snapshot_label = ttk.Label(vis_toolbar_frame, text="Zaman çizelgesi: -"); self.snapshot_label.pack(side=tk.RIGHT, padx=2)
+        ToolTip(self.snapshot_scale, "Eğitim sırasında alınan anlık görüntüler arasında gezinir; bırakınca seçilen epoch'un ağırlıkları ağa, tuvale ve editöre yüklenir.\n'Güncel' en son ağırlıklara geri döner.")
         self.canvas = tk.Canvas(self.vis_frame, bg='white', scrollregion=(0,0,1200,800)) 
         hbar = ttk.Scrollbar(self.vis_frame, orient=tk.HORIZONTAL, command=self.canvas.xview); hbar.pack(side=tk.BOTTOM, fill=tk.X)
         vbar = ttk.Scrollbar(self.vis_frame, orient=tk.VERTICAL, command=self.canvas.yview); vbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -192,24 +300,182 @@ class DeepLearningSimulatorGUI:
         self.log_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.weights_biases_editor_frame = ttk.Frame(vis_log_notebook); vis_log_notebook.add(self.weights_biases_editor_frame, text='Ağırlıklar & Biaslar (Düzenle)')
         self._setup_weights_biases_editor_tab() 
+        # Matplotlib grafikleri sekme ilk kez açıldığında yüklenir ve kurulur (açılış süresini kısaltır).
         self.loss_graph_tab_frame = ttk.Frame(vis_log_notebook); vis_log_notebook.add(self.loss_graph_tab_frame, text='Kayıp Grafiği')
-        self.fig_loss = Figure(figsize=(5, 3.5), dpi=100) 
-        self.ax_loss = self.fig_loss.add_subplot(111)
-        self.loss_canvas_widget = FigureCanvasTkAgg(self.fig_loss, master=self.loss_graph_tab_frame) 
-        toolbar_loss = NavigationToolbar2Tk(self.loss_canvas_widget, self.loss_graph_tab_frame); toolbar_loss.update()
-        self.loss_canvas_widget.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True); self.update_loss_graph() 
+        self.fig_loss, self.ax_loss, self.loss_canvas_widget = None, None, None
         self.accuracy_graph_tab_frame = ttk.Frame(vis_log_notebook); vis_log_notebook.add(self.accuracy_graph_tab_frame, text='Doğruluk Grafiği')
-        self.fig_accuracy = Figure(figsize=(5, 3.5), dpi=100)
-        self.ax_accuracy = self.fig_accuracy.add_subplot(111)
-        self.accuracy_canvas_widget = FigureCanvasTkAgg(self.fig_accuracy, master=self.accuracy_graph_tab_frame)
-        toolbar_acc = NavigationToolbar2Tk(self.accuracy_canvas_widget, self.accuracy_graph_tab_frame); toolbar_acc.update()
-        self.accuracy_canvas_widget.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True); self.update_accuracy_graph()
+        self.fig_accuracy, self.ax_accuracy, self.accuracy_canvas_widget = None, None, None
+        vis_log_notebook.bind("<<NotebookTabChanged>>", self._on_notebook_tab_changed)
         self.confusion_matrix_tab_frame = ttk.Frame(vis_log_notebook); vis_log_notebook.add(self.confusion_matrix_tab_frame, text='Karmaşıklık Matrisi')
         self.cm_text_area = scrolledtext.ScrolledText(self.confusion_matrix_tab_frame, height=10, state=tk.DISABLED, font=('Monospace', 10), wrap=tk.NONE)
         self.cm_text_area.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.metrics_frame = ttk.Frame(vis_log_notebook); vis_log_notebook.add(self.metrics_frame, text='Metrikler')
         self.metrics_text = scrolledtext.ScrolledText(self.metrics_frame, height=10, state=tk.DISABLED, font=('Monospace', 9))
         self.metrics_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.performance_frame = ttk.Frame(vis_log_notebook); vis_log_notebook.add(self.performance_frame, text='Performans')
+        self._setup_performance_tab()
+        self.telemetry_frame = ttk.Frame(vis_log_notebook); vis_log_notebook.add(self.telemetry_frame, text='Telemetri')
+        self._setup_telemetry_tab()
+
+    def _create_graph_canvas(self, parent_frame):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        fig = Figure(figsize=(5, 3.5), dpi=100); ax = fig.add_subplot(111)
+        canvas_widget = FigureCanvasTkAgg(fig, master=parent_frame)
+        toolbar = NavigationToolbar2Tk(canvas_widget, parent_frame); toolbar.update()
+        canvas_widget.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        return fig, ax, canvas_widget
+
+    def _on_notebook_tab_changed(self, event=None):
+        selected = self.vis_log_notebook.nametowidget(self.vis_log_notebook.select())
+        if selected is self.loss_graph_tab_frame and self.fig_loss is None:
+            self.fig_loss, self.ax_loss, self.loss_canvas_widget = self._create_graph_canvas(self.loss_graph_tab_frame); self.update_loss_graph()
+        elif selected is self.accuracy_graph_tab_frame and self.fig_accuracy is None:
+            self.fig_accuracy, self.ax_accuracy, self.accuracy_canvas_widget = self._create_graph_canvas(self.accuracy_graph_tab_frame); self.update_accuracy_graph()
+
+    def _setup_performance_tab(self):
+        perf_toolbar = ttk.Frame(self.performance_frame); perf_toolbar.pack(fill=tk.X, pady=2, padx=5)
+        cb_prof = ttk.Checkbutton(perf_toolbar, text="Profil Ölçümü Açık", variable=self.profiling_enabled_var); cb_prof.pack(side=tk.LEFT, padx=(0,5))
+        ToolTip(cb_prof, "Açıkken ileri yayılım, delta hesabı, gradyan, optimizer, kayıp/metrik ve arayüz güncellemeleri\nkatman ve epoch bazında ölçülür. Kapalıyken ek maliyet yok denecek kadar azdır.")
+        ttk.Button(perf_toolbar, text="Tabloyu Yenile", command=self.update_performance_display).pack(side=tk.LEFT, padx=2)
+        ttk.Button(perf_toolbar, text="Sıfırla", command=self.reset_profiler).pack(side=tk.LEFT, padx=2)
+        ttk.Button(perf_toolbar, text="Trace Dışa Aktar (.json)", command=self.export_profiler_trace).pack(side=tk.LEFT, padx=2)
+        columns = ("phase", "layer", "calls", "total_ms", "mean_us", "max_us", "pct")
+        self.perf_tree = ttk.Treeview(self.performance_frame, columns=columns, show="headings", height=12)
+        for col, title, width in zip(columns, ["Aşama", "Katman", "Çağrı", "Toplam (ms)", "Ort. (µs)", "Maks (µs)", "%"], [160, 60, 70, 100, 90, 90, 60]):
+            self.perf_tree.heading(col, text=title); self.perf_tree.column(col, width=width, anchor="w" if col == "phase" else "e")
+        self.perf_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        ttk.Label(self.performance_frame, text="Epoch Bazında Aşama Süreleri (ms):").pack(fill=tk.X, padx=5)
+        self.perf_epoch_text = scrolledtext.ScrolledText(self.performance_frame, height=8, state=tk.DISABLED, font=('Monospace', 9), wrap=tk.NONE)
+        self.perf_epoch_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        mem_toolbar = ttk.Frame(self.performance_frame); mem_toolbar.pack(fill=tk.X, pady=2, padx=5)
+        ttk.Label(mem_toolbar, text="Bellek Bütçesi (MB):").pack(side=tk.LEFT)
+        budget_entry = ttk.Entry(mem_toolbar, textvariable=self.memory_budget_mb_var, width=8); budget_entry.pack(side=tk.LEFT, padx=(2,5))
+        ToolTip(budget_entry, "Ağ kurulurken veya CSV yüklenirken tahmini bellek kullanımı bu değeri aşarsa onay istenir.\n0 girilirse kontrol yapılmaz.")
+        cb_trace = ttk.Checkbutton(mem_toolbar, text="Eğitimde tracemalloc Tepe Takibi", variable=self.track_tracemalloc_var); cb_trace.pack(side=tk.LEFT, padx=5)
+        ToolTip(cb_trace, "Otomatik eğitim sırasında Python bellek tahsislerinin tepe değerini epoch bazında ölçer.\nEğitimi belirgin şekilde yavaşlatır.")
+        ttk.Button(mem_toolbar, text="Bellek Raporu", command=self.update_memory_report_display).pack(side=tk.LEFT, padx=2)
+        btn_ckpt = ttk.Button(mem_toolbar, text="Checkpoint Ölçümü", command=self.show_checkpoint_measurement); btn_ckpt.pack(side=tk.LEFT, padx=2)
+        ToolTip(btn_ckpt, "Ağın kopyaları üzerinde eğitim verisinin ilk 200 örneğiyle aktivasyon checkpoint'li ve checkpoint'siz birer epoch çalıştırır;\nkazanılan aktivasyon belleği ile ek süreyi raporlar (checkpoint kapalıysa otomatik k kullanılır). Ağ değişmez.")
+        self.memory_report_text = scrolledtext.ScrolledText(self.performance_frame, height=10, state=tk.DISABLED, font=('Monospace', 9), wrap=tk.NONE)
+        self.memory_report_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+    def _setup_telemetry_tab(self):
+        tel_toolbar = ttk.Frame(self.telemetry_frame); tel_toolbar.pack(fill=tk.X, pady=2, padx=5)
+        cb_tel = ttk.Checkbutton(tel_toolbar, text="Otomatik Eğitimde Telemetri", variable=self.telemetry_enabled_var); cb_tel.pack(side=tk.LEFT, padx=(0,5))
+        ToolTip(cb_tel, "Her optimizer güncellemesinde katman bazında gradyan normu (‖a‖·‖δ‖, matris kurmadan) ve ölü ReLU oranı biriktirilir.\nGüncelleme/ağırlık oranı, ağırlık histogramı ve optimizer durumu yalnızca örnekleme adımlarında hesaplanır.")
+        ttk.Label(tel_toolbar, text="Örnekleme (adım):").pack(side=tk.LEFT)
+        ttk.Spinbox(tel_toolbar, from_=1, to=1000000, textvariable=self.telemetry_every_var, width=7).pack(side=tk.LEFT, padx=(2,5))
+        ttk.Button(tel_toolbar, text="JSONL Dosyası...", command=self.choose_telemetry_jsonl).pack(side=tk.LEFT, padx=2)
+        ttk.Button(tel_toolbar, text="Dosyayı Kaldır", command=lambda: self._set_telemetry_jsonl(None)).pack(side=tk.LEFT, padx=2)
+        self.telemetry_path_label = ttk.Label(tel_toolbar, text="JSONL: -"); self.telemetry_path_label.pack(side=tk.LEFT, padx=5)
+        columns = ("layer", "activation", "grad_mean", "grad_max", "bias_grad", "update_ratio", "dead_relu", "weight_norm", "opt_max")
+        self.telemetry_tree = ttk.Treeview(self.telemetry_frame, columns=columns, show="headings", height=8)
+        for col, title, width in zip(columns, ["Katman", "Aktivasyon", "‖∇W‖ Ort.", "‖∇W‖ Maks", "‖∇b‖ Ort.", "‖ΔW‖/‖W‖", "Ölü ReLU %", "‖W‖", "Optimizer Maks"], [60, 80, 90, 90, 90, 90, 80, 80, 200]):
+            self.telemetry_tree.heading(col, text=title); self.telemetry_tree.column(col, width=width, anchor="w" if col in ("activation", "opt_max") else "e")
+        self.telemetry_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        ttk.Label(self.telemetry_frame, text="Ağırlık Histogramları (son epoch sonu):").pack(fill=tk.X, padx=5)
+        self.telemetry_text = scrolledtext.ScrolledText(self.telemetry_frame, height=14, state=tk.DISABLED, font=('Monospace', 9), wrap=tk.NONE)
+        self.telemetry_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+    def choose_telemetry_jsonl(self):
+        fp=filedialog.asksaveasfilename(title="Telemetri JSONL Dosyası",defaultextension=".jsonl",initialfile="telemetry.jsonl",filetypes=(("JSON Lines","*.jsonl"),("Tüm Dosyalar","*.*")),parent=self.master)
+        if fp: self._set_telemetry_jsonl(fp)
+
+    def _set_telemetry_jsonl(self, path):
+        self.telemetry_jsonl_path = path; self.telemetry_path_label.config(text=f"JSONL: {path or '-'}")
+        if path: self.log_message(f"Telemetri kayıtları şu dosyaya eklenecek: {path}")
+
+    def update_telemetry_display(self, record):
+        self.telemetry_tree.delete(*self.telemetry_tree.get_children())
+        for layer in record["layers"]:
+            ratio, dead = layer["update_ratio"], layer["dead_relu_fraction"]
+            opt = ", ".join(f"{k}={v:.3g}" for k, v in layer["optimizer_state_max"].items()) or "-"
+            self.telemetry_tree.insert("", tk.END, values=(layer["layer"], layer["activation"], f"{layer['grad_norm_mean']:.3e}", f"{layer['grad_norm_max']:.3e}", f"{layer['bias_grad_norm_mean']:.3e}",
+                                                           "-" if ratio is None else f"{ratio:.2e}", "-" if dead is None else f"{100*dead:.1f}", f"{layer['weight_norm']:.4f}", opt))
+        self.telemetry_text.config(state=tk.NORMAL); self.telemetry_text.delete(1.0, tk.END)
+        self.telemetry_text.insert(tk.END, f"Epoch {record['epoch']} ({record['steps']} adım) — telemetri ek maliyeti {record['overhead_s']*1e3:.2f} ms, epoch süresinin %{record['overhead_pct']:.2f}'i\n")
+        for layer in record["layers"]:
+            self.telemetry_text.insert(tk.END, f"\nKatman {layer['layer']} ({layer['activation']}):\n" + "\n".join(format_histogram(layer["histogram"])) + "\n")
+        self.telemetry_text.config(state=tk.DISABLED)
+
+    def update_performance_display(self):
+        self.perf_tree.delete(*self.perf_tree.get_children())
+        for phase, layer, count, total, mean, max_d, pct in self.profiler.summary_rows():
+            self.perf_tree.insert("", tk.END, values=(phase, "-" if layer is None else layer, count, f"{total*1e3:.3f}", f"{mean*1e6:.1f}", f"{max_d*1e6:.1f}", f"{pct:.1f}"))
+        self.perf_epoch_text.config(state=tk.NORMAL); self.perf_epoch_text.delete(1.0, tk.END)
+        phases = sorted({phase for per_epoch in self.profiler.epoch_totals.values() for phase in per_epoch})
+        if phases:
+            self.perf_epoch_text.insert(tk.END, f"{'Epoch':>6} | " + " | ".join(f"{p:>16}" for p in phases) + "\n")
+            for epoch in sorted(self.profiler.epoch_totals):
+                per_epoch = self.profiler.epoch_totals[epoch]
+                self.perf_epoch_text.insert(tk.END, f"{epoch:>6} | " + " | ".join(f"{per_epoch.get(p, 0.0)*1e3:>16.3f}" for p in phases) + "\n")
+        else: self.perf_epoch_text.insert(tk.END, "Ölçüm yok. Profil ölçümünü açıp eğitim çalıştırın.")
+        cache = self.network.prediction_cache.stats()
+        self.perf_epoch_text.insert(tk.END, f"\n\nTahmin önbelleği: {cache['entries']}/{cache['max_entries']} kayıt, {cache['hits']} tam + {cache['partial_hits']} kısmi isabet ({cache['reused_layers']} katman yeniden kullanıldı) / {cache['misses']} ıska (isabet oranı {cache['hit_rate']:.2f})")
+        self.perf_epoch_text.config(state=tk.DISABLED)
+
+    def _checkpoint_every(self):
+        choice = self.checkpoint_every_var.get()
+        return {"Kapalı": 0, "Otomatik (√L)": CHECKPOINT_AUTO}.get(choice) if not choice.isdigit() else int(choice)
+
+    def _normalization_mode(self):
+        choice = self.normalization_var.get()
+        return next((mode for mode, name in NORMALIZATION_DISPLAY_NAMES.items() if name == choice), "none")
+
+    def _sync_input_normalizer(self, X=None, refit=False):
+        # Ağın girdi normalizasyonunu seçili türe getirir. Ağ aynı türde istatistik taşıyorsa (ör. kayıttan) korunur;
+        # değilse (veya refit) X (verilmezse eğitim verisi) üzerinden tek geçişte hesaplanır. Veri yoksa eğitim başında hesaplanır.
+        if not self.network.weights: return
+        mode, current = self._normalization_mode(), self.network.input_normalizer
+        if mode == "none":
+            if current is not None: self.network.set_input_normalizer(None); self.log_message("Girdi normalizasyonu kapatıldı.")
+            return
+        if current is not None and current.mode == mode and not refit: return
+        if X is None:
+            try: X, _ = self._get_training_data()
+            except ValueError: return
+        normalizer = fit_normalizer(X, mode); self.network.set_input_normalizer(normalizer); self.log_message(format_normalizer(normalizer))
+
+    def _on_normalization_change(self):
+        try: self._sync_input_normalizer()
+        except ValueError as e: messagebox.showerror("Giriş Hatası", f"Girdi normalizasyonu: {e}", parent=self.master)
+
+    def show_checkpoint_measurement(self):
+        if not self.network.weights: messagebox.showerror("Hata", "Önce ağ kurulmalı.", parent=self.master); return
+        X, Y = self.training_data_X[:200], self.training_data_Y[:200]
+        if not X: messagebox.showerror("Hata", "Ölçüm için eğitim verisi (CSV veya X/Y alanları) yüklenmeli.", parent=self.master); return
+        opt_params = {"type": self.optimizer_var.get(), "beta": 0.9, "beta1": 0.9, "beta2": 0.999, "epsilon": 1e-8}
+        try: report = measure_checkpointing(self.network, X, Y, self.lr_var.get(), opt_params, self.network.checkpoint_every or CHECKPOINT_AUTO, repeat=1)
+        except ValueError as e: messagebox.showerror("Hata", str(e), parent=self.master); return
+        lines = format_checkpoint_report(report)
+        for line in lines: self.log_message(line)
+        self.memory_report_text.config(state=tk.NORMAL); self.memory_report_text.delete(1.0, tk.END)
+        self.memory_report_text.insert(tk.END, "\n".join(lines)); self.memory_report_text.config(state=tk.DISABLED)
+
+    def update_memory_report_display(self):
+        report = network_memory_report(self.network, self.training_data_X, self.training_data_Y)
+        self.memory_report_text.config(state=tk.NORMAL); self.memory_report_text.delete(1.0, tk.END)
+        self.memory_report_text.insert(tk.END, format_memory_report(report, "Ölçülen Bellek Kullanımı (ağ + yüklü veri)"))
+        if getattr(self, "last_tracemalloc_peak", None): self.memory_report_text.insert(tk.END, f"\n\nSon eğitimde tracemalloc tepe değeri: {format_bytes(self.last_tracemalloc_peak)}")
+        self.memory_report_text.config(state=tk.DISABLED)
+
+    def _confirm_memory_budget(self, predicted_bytes, what, report_text=""):
+        budget_mb = self.memory_budget_mb_var.get()
+        if budget_mb <= 0 or predicted_bytes <= budget_mb * 1024 * 1024: return True
+        msg = f"{what} için tahmini bellek kullanımı {format_bytes(predicted_bytes)}, bütçe ise {budget_mb:.0f} MB.\n\n{report_text}\n\nYine de devam edilsin mi?"
+        self.log_message(f"Bellek uyarısı: {what} tahmini {format_bytes(predicted_bytes)} > bütçe {budget_mb:.0f} MB.")
+        return messagebox.askyesno("Bellek Bütçesi Aşılıyor", msg, parent=self.master)
+
+    def reset_profiler(self):
+        self.profiler.reset(); self.update_performance_display(); self.log_message("Profil ölçümleri sıfırlandı.")
+
+    def export_profiler_trace(self):
+        if not self.profiler.trace_events: messagebox.showinfo("Bilgi", "Dışa aktarılacak profil ölçümü yok.", parent=self.master); return
+        fp=filedialog.asksaveasfilename(title="Trace Dosyasını Kaydet",defaultextension=".json",filetypes=(("Chrome Trace JSON","*.json"),("Tüm Dosyalar","*.*")),parent=self.master)
+        if not fp: return
+        try: n_events=self.profiler.export_chrome_trace(fp); self.log_message(f"{n_events} profil olayı trace olarak kaydedildi (chrome://tracing veya Perfetto ile açılabilir): {fp}")
+        except Exception as e: messagebox.showerror("Kaydetme Hatası",f"Trace kaydedilirken: {e}",parent=self.master)
     
     def toggle_theme(self):
         if not sv_ttk: messagebox.showinfo("Tema", "Sun-Valley teması yüklü değil.", parent=self.master); return
@@ -338,22 +604,33 @@ class DeepLearningSimulatorGUI:
                 w_idx = int(selection_str.split("[W")[1].split("]")[0])
                 new_W = [[var.get() for var in r] for r in self.wb_entry_vars]
                 if len(new_W) != len(self.network.weights[w_idx]) or (new_W and len(new_W[0]) != len(self.network.weights[w_idx][0])): raise ValueError("Okunan ağırlık matrisi boyutları ağdakiyle uyuşmuyor.")
-                self.network.weights[w_idx] = new_W
+                self.network.set_layer_weights(w_idx, new_W)
                 self.log_message(f"Ağırlıklar ({self._get_source_layer_display_name_for_weights(w_idx)} → {self._get_layer_display_name(w_idx)}) güncellendi.")
             elif selection_str.startswith("Biaslar:"):
                 b_idx = int(selection_str.split("[B")[1].split("]")[0])
                 new_B = [var.get() for var in self.wb_entry_vars[0]]
                 if len(new_B) != len(self.network.biases[b_idx]): raise ValueError("Okunan bias vektörü boyutu ağdakiyle uyuşmuyor.")
-                self.network.biases[b_idx] = new_B
+                self.network.set_layer_biases(b_idx, new_B)
                 self.log_message(f"Biaslar ({self._get_layer_display_name(b_idx)}) güncellendi.")
-            self.network.velocity_W,self.network.velocity_b,self.network.m_W,self.network.v_W,self.network.m_b,self.network.v_b,self.network.adam_t = [],[],[],[],[],[],0
-            prev_n = self.input_size_var.get()
-            for i in range(len(self.network.weights)): num_curr = len(self.network.biases[i]); self.network._initialize_optimizer_params(prev_n, num_curr); prev_n = num_curr
+            self.network.reset_optimizer_state(w_idx if selection_str.startswith("Ağırlıklar:") else b_idx)
             self.draw_network_on_canvas(); self.current_epoch_losses, self.current_epoch_accuracies = [], []; self.update_loss_graph(); self.update_accuracy_graph(); self.update_metrics_display({})
-            messagebox.showinfo("Başarılı", "Değişiklikler ağa uygulandı ve optimizer sıfırlandı.", parent=self.master)
+            self._refresh_forward_after_edit()
+            messagebox.showinfo("Başarılı", "Değişiklikler ağa uygulandı; düzenlenen katmanın optimizer durumu sıfırlandı.", parent=self.master)
         except ValueError as e: messagebox.showerror("Değer Hatası", f"Geçersiz değer girildi: {e}\nLütfen sayısal değerler girin.", parent=self.master)
         except Exception as e: messagebox.showerror("Hata", f"Uygulama sırasında hata: {e}", parent=self.master); import traceback; traceback.print_exc()
             
+    def _refresh_forward_after_edit(self):
+        # Son ileri yayılımın girdisi için çıktıyı yeniler; önbellekteki değişmemiş katman çıktıları yeniden kullanılır,
+        # yalnızca düzenlenen katman ve sonrası hesaplanır.
+        x=self.network.current_input_for_forward
+        if not x or len(x)!=len(self.network.weights[0]) or self.forward_pass_gen is not None or self.is_training_step_by_step_active: return
+        t0=time.perf_counter(); events=list(self.network.forward_pass_generator(x,False,use_cache=True)); elapsed=time.perf_counter()-t0
+        self.reset_neuron_visuals_and_texts(True)
+        for res in events: self.handle_forward_step_result_and_visualize(res,True)
+        self.reset_neuron_visuals_and_texts(False); self.highlight_step_on_canvas(None)
+        n_layers,recomputed=len(self.network.weights),sum(1 for res in events if res["type"]=="layer_activation" and not res.get("cached"))
+        self.log_message(f"Çıktı yeniden hesaplandı: {recomputed}/{n_layers} katman ({elapsed*1000:.2f} ms). Sonuç: {[f'{o:.3f}' for o in events[-1]['final_output']]}")
+
     def initial_draw(self):
         self.canvas.update_idletasks(); self.draw_network_on_canvas()
 
@@ -366,11 +643,13 @@ class DeepLearningSimulatorGUI:
             messagebox.showerror("Hata", str(e));
             if self.network.loss_function_name: self.loss_function_var.set(self.network.loss_function_name)
 
+    @profiled_method("gui_log_message")
     def log_message(self, msg, clear_existing=False):
         self.log_text.config(state=tk.NORMAL)
         if clear_existing: self.log_text.delete(1.0, tk.END)
         self.log_text.insert(tk.END, str(msg) + "\n"); self.log_text.see(tk.END); self.log_text.config(state=tk.DISABLED)
 
+    @profiled_method("gui_update_metrics_display")
     def update_metrics_display(self, metrics_dict, final_predictions=None, final_targets=None):
         self.metrics_text.config(state=tk.NORMAL); self.metrics_text.delete(1.0, tk.END)
         if not metrics_dict and not final_predictions: self.metrics_text.insert(tk.END, "Hesaplanacak metrik yok veya eğitim yapılmadı.\n")
@@ -386,61 +665,29 @@ class DeepLearningSimulatorGUI:
                     self.metrics_text.insert(tk.END, f"  Çıktı {i+1}: Tahmin={pred_val_str}, Hedef={target_val_str}\n")
         self.metrics_text.config(state=tk.DISABLED)
 
-    def _calculate_classification_metrics(self, all_true_one_hot, all_pred_probs, num_classes):
-        if not all_true_one_hot or not all_pred_probs or num_classes == 0: return {}, None
-        all_true_classes = [row.index(max(row)) for row in all_true_one_hot if row and sum(row)>0] 
-        all_pred_classes = [row.index(max(row)) for row in all_pred_probs if row]
-
-        if not all_true_classes or len(all_true_classes) != len(all_pred_classes): return {}, None
-        
-        tp, fp, fn = [0] * num_classes, [0] * num_classes, [0] * num_classes
-        confusion_matrix = [[0 for _ in range(num_classes)] for _ in range(num_classes)]
-        for true_cls, pred_cls in zip(all_true_classes, all_pred_classes):
-            if 0 <= true_cls < num_classes and 0 <= pred_cls < num_classes:
-                confusion_matrix[true_cls][pred_cls] += 1
-                if true_cls == pred_cls: tp[true_cls] += 1
-                else: fp[pred_cls] += 1; fn[true_cls] += 1
-        
-        precision, recall, f1 = [0.0] * num_classes, [0.0] * num_classes, [0.0] * num_classes
-        for i in range(num_classes):
-            precision[i] = tp[i] / (tp[i] + fp[i]) if (tp[i] + fp[i]) > 0 else 0.0
-            recall[i] = tp[i] / (tp[i] + fn[i]) if (tp[i] + fn[i]) > 0 else 0.0
-            f1[i] = 2 * (precision[i] * recall[i]) / (precision[i] + recall[i]) if (precision[i] + recall[i]) > 0 else 0.0
-        
-        metrics = {
-            "Precision (Macro Avg)": sum(precision) / num_classes if num_classes > 0 else 0.0,
-            "Recall (Macro Avg)": sum(recall) / num_classes if num_classes > 0 else 0.0,
-            "F1-score (Macro Avg)": sum(f1) / num_classes if num_classes > 0 else 0.0,
-        }
-        for i in range(num_classes): metrics[f"F1_Sınıf{i}"] = f1[i]
-        return metrics, confusion_matrix
-    
     def _display_text_confusion_matrix(self, cm, class_names=None):
         self.cm_text_area.config(state=tk.NORMAL)
         self.cm_text_area.delete(1.0, tk.END)
         if cm is None or not cm:
             self.cm_text_area.insert(tk.END, "Karmaşıklık Matrisi (Sınıflandırma eğitimi sonrası görüntülenir)")
-        else:
-            num_classes = len(cm)
-            if class_names is None: class_names = [f"S{i}" for i in range(num_classes)]
-            header = "Gerçek\\Tahmin | " + " | ".join(f"{name:^5}" for name in class_names) + "\n"
-            separator = "-" * (len(header) -1) + "\n" 
-            cm_str = header + separator
-            for i in range(num_classes):
-                row_str = f"{class_names[i]:<12} | " + " | ".join(f"{cm[i][j]:^5d}" for j in range(num_classes)) + "\n"
-                cm_str += row_str
-            self.cm_text_area.insert(tk.END, cm_str)
+        else: self.cm_text_area.insert(tk.END, format_confusion_matrix(cm, class_names))
         self.cm_text_area.config(state=tk.DISABLED)
 
 
+    @profiled_method("gui_update_loss_graph")
     def update_loss_graph(self):
+        if self.fig_loss is None: return
         self.ax_loss.clear()
         if self.current_epoch_losses: self.ax_loss.plot(range(1, len(self.current_epoch_losses) + 1), self.current_epoch_losses, marker='.', linestyle='-', markersize=4, linewidth=1.5, label="Kayıp")
+        if self.ensemble_loss_band and len(self.ensemble_loss_band) == len(self.current_epoch_losses):
+            self.ax_loss.fill_between(range(1, len(self.current_epoch_losses) + 1), [m - s for m, s in zip(self.current_epoch_losses, self.ensemble_loss_band)], [m + s for m, s in zip(self.current_epoch_losses, self.ensemble_loss_band)], alpha=0.25, label="± std (kopyalar)")
         self.ax_loss.set_title("Eğitim Kaybı / Epoch", fontsize=10); self.ax_loss.set_xlabel("Epoch", fontsize=9); self.ax_loss.set_ylabel("Ortalama Kayıp", fontsize=9)
         self.ax_loss.grid(True, linestyle='--', alpha=0.7); self.ax_loss.tick_params(axis='both', which='major', labelsize=8); self.ax_loss.legend(fontsize=8)
         self.fig_loss.tight_layout(); self.loss_canvas_widget.draw()
         
+    @profiled_method("gui_update_accuracy_graph")
     def update_accuracy_graph(self):
+        if self.fig_accuracy is None: return
         self.ax_accuracy.clear()
         if self.current_epoch_accuracies: self.ax_accuracy.plot(range(1, len(self.current_epoch_accuracies) + 1), self.current_epoch_accuracies, marker='.', linestyle='-', color='green', markersize=4, linewidth=1.5, label="Doğruluk")
         self.ax_accuracy.set_title("Eğitim Doğruluğu / Epoch", fontsize=10); self.ax_accuracy.set_xlabel("Epoch", fontsize=9); self.ax_accuracy.set_ylabel("Doğruluk", fontsize=9)
@@ -480,81 +727,94 @@ class DeepLearningSimulatorGUI:
                     layer_configs_for_nn.append((num_n, act))
                 layer_configs_for_nn.append((output_size, output_act)) 
             if input_size <=0 or layer_configs_for_nn[-1][0] <= 0: raise ValueError("Giriş ve çıkış nöron sayıları pozitif olmalı.")
+            precision, keep_master = self.precision_var.get(), self.master_weights_var.get()
+            predicted = predict_network_footprint(input_size, layer_configs_for_nn, self.optimizer_var.get(), precision, keep_master)
+            data_bytes = predict_dataset_footprint(len(self.training_data_X), input_size, layer_configs_for_nn[-1][0], precision)["total"] if self.training_data_X else 0
+            if not self._confirm_memory_budget(predicted["total"] + data_bytes, "Ağ", format_memory_report(predicted, "Tahmini Ağ Ayak İzi")): self.log_message("Ağ kurulumu bellek bütçesi nedeniyle iptal edildi."); return
             self.network.set_loss_function(self.loss_function_var.get())
-            self.network.configure_network(input_size, layer_configs_for_nn, custom_weights, custom_biases)
-            self.log_message("Ağ yapısı oluşturuldu/yüklendi.", True)
+            self.network.configure_network(input_size, layer_configs_for_nn, custom_weights, custom_biases, precision, keep_master)
+            self.log_message(f"Ağ yapısı oluşturuldu/yüklendi ({precision}{', float64 ana ağırlık' if self.network.keep_master_weights else ''}).", True)
+            self.network.set_input_normalizer(None)  # yüklemede kayıttaki istatistikler sonra atanır
+            if not custom_weights:
+                try: self._sync_input_normalizer()
+                except ValueError as e: self.log_message(f"Uyarı: girdi normalizasyonu hesaplanamadı: {e}")
+            if self.training_data_X and isinstance(self.training_data_X[0], list) != (precision == DEFAULT_PRECISION):
+                self.training_data_X, self.training_data_Y = [copy_vector(row, precision) for row in self.training_data_X], [copy_vector(row, precision) for row in self.training_data_Y]
+                self.log_message(f"Yüklü veri seti {precision} hassasiyetine dönüştürüldü.")
             if not custom_weights: self.log_message("Ağırlıklar/biaslar rastgele/varsayılan yöntemle atandı.")
+            self.epoch_sampler, self._pending_sampler_state, self._main_history = None, None, None
+            self._clear_snapshots()
             if training_state:
-                self.current_epoch_losses = training_state.get("epoch_losses", [])
-                self.current_epoch_accuracies = training_state.get("epoch_accuracies", [])
-                self.epochs_var.set(training_state.get("total_epochs_completed", self.epochs_var.get()))
-                self.network.adam_t = training_state.get("optimizer_adam_t", 0)
-                for attr_name in ["velocity_W", "velocity_b", "m_W", "v_W", "m_b", "v_b"]:
-                    saved_val = training_state.get(f"optimizer_{attr_name}")
-                    if saved_val is not None and hasattr(self.network, attr_name) and len(saved_val) == len(getattr(self.network, attr_name)):
-                        setattr(self.network, attr_name, saved_val)
-                self.log_message("Kaydedilmiş eğitim durumu yüklendi.")
+                self.current_epoch_losses = list(training_state.get("epoch_losses", []))
+                self.current_epoch_accuracies = list(training_state.get("epoch_accuracies", []))
+                self.total_epochs_completed = training_state.get("total_epochs_completed", len(self.current_epoch_losses))
+                self._pending_sampler_state = training_state.get("sampler")
+                self.log_message(f"Kaydedilmiş eğitim durumu yüklendi ({self.total_epochs_completed} epoch tamamlanmış).")
+            else: self.total_epochs_completed = 0
 
             self._populate_wb_combo(); self.draw_network_on_canvas(); self.save_canvas_button.config(state=tk.NORMAL)
-            for btn_name in ["forward_step_button", "forward_all_button", "train_button", "train_step_by_step_button", "save_network_button"]: getattr(self,btn_name).config(state=tk.NORMAL)
+            for btn_name in ["forward_step_button", "forward_all_button", "train_button", "ensemble_button", "cv_button", "prune_button", "unprune_button", "morph_button", "train_step_by_step_button", "save_network_button", "export_int8_button"]: getattr(self,btn_name).config(state=tk.NORMAL)
             for btn_name in ["backward_step_button", "train_next_step_button"]: getattr(self,btn_name).config(state=tk.DISABLED)
             self.current_training_phase_label.config(text="Aşama: -"); self.forward_pass_gen, self.backward_pass_gen = None, None; self.is_training_step_by_step_active = False
             if not training_state: self.current_epoch_losses, self.current_epoch_accuracies = [], []
-            self.update_loss_graph(); self.update_accuracy_graph(); self._display_text_confusion_matrix(None); self.update_metrics_display({})
+            self.ensemble_loss_band = None; self.update_loss_graph(); self.update_accuracy_graph(); self._display_text_confusion_matrix(None); self.update_metrics_display({})
         except ValueError as e: messagebox.showerror("Giriş Hatası", str(e))
         except Exception as e: messagebox.showerror("Hata", f"Ağ oluşturulurken/yüklenirken: {e}"); import traceback; traceback.print_exc()
 
+    @profiled_method("gui_draw_network_on_canvas")
     def draw_network_on_canvas(self):
         self.canvas.delete("all")
         for store in [self.neuron_canvas_objects,self.neuron_value_texts,self.neuron_z_value_texts,self.connection_canvas_objects,self.connection_weight_value_texts,self.neuron_bias_value_texts]: store.clear()
         if not self.network or not self.network.layer_configs:
             cw,ch = self.canvas.winfo_width(),self.canvas.winfo_height(); cw,ch = (800,600) if cw<=1 or ch<=1 else (cw,ch)
             self.canvas.create_text(cw/2,ch/2,text="Ağ kurulmadı.",font=('Helvetica',16),fill="grey"); self.canvas.config(scrollregion=(0,0,cw,ch)); return
-        cw,ch,nr,nl = max(800,self.canvas.winfo_width()),max(600,self.canvas.winfo_height()),20,len(self.network.layer_configs)+1
-        ls = (cw-120)/max(1,nl-1) if nl>1 else cw/2; yp=80; all_nc=[self.input_size_var.get()]+[lc[0] for lc in self.network.layer_configs]; max_n=max(all_nc) if all_nc else 1
-        nvs = max(3*nr,(ch-2*yp)/max(1,max_n-1 if max_n>1 else 1 )); n_pos_by_l=[]
-        lx,ni = 60,self.input_size_var.get(); curr_l_pos=[]; th_in=(ni-1)*nvs; lys_in=(ch-th_in)/2
-        if ni==1: lys_in=ch/2
-        for i in range(ni):
-            y=lys_in+i*nvs; k,name = ("input",i),self._get_neuron_display_name("Giriş",i)
-            oid=self.canvas.create_oval(lx-nr,y-nr,lx+nr,y+nr,fill="lightblue",outline="black",width=1.5,tags=("neuron",f"input_{i}"))
+        cw,ch,nr = max(800,self.canvas.winfo_width()),max(600,self.canvas.winfo_height()),NEURON_RADIUS
+        all_nc=(self.input_size_var.get(),)+tuple(lc[0] for lc in self.network.layer_configs); layout=network_layout(all_nc,cw,ch)  # diagram_export ile ortak yerleşim
+        for i,(lx,y) in enumerate(layout[0]):
+            k,name = ("input",i),self._get_neuron_display_name("Giriş",i)
+            oid=self.canvas.create_oval(lx-nr,y-nr,lx+nr,y+nr,fill=INPUT_FILL,outline="black",width=1.5,tags=("neuron",f"input_{i}"))
             self.canvas.create_text(lx,y-nr-12,text=name,font=('Helvetica',8,'bold'),tags=("neuron_label",f"input_{i}_label"))
-            curr_l_pos.append((lx,y)); self.neuron_canvas_objects[k]=oid
+            self.neuron_canvas_objects[k]=oid
             if self.show_neuron_values_on_canvas_var.get(): self.neuron_value_texts[k]=self.canvas.create_text(lx,y+nr+10,text="",font=('Helvetica',7),tags=("neuron_value",f"input_{i}_value_a"))
-        n_pos_by_l.append(curr_l_pos)
         for l_cfg_idx,(num_n,act_s) in enumerate(self.network.layer_configs):
-            lx+=ls; prev_l_pos=n_pos_by_l[-1]; curr_l_pos=[]; th_l=(num_n-1)*nvs; lys_l=(ch-th_l)/2
-            if num_n==1: lys_l=ch/2
+            prev_l_pos=layout[l_cfg_idx]
+            sparse=self.network.sparse_layers[l_cfg_idx] if l_cfg_idx<len(self.network.sparse_layers) else None; keep=sparse.keep_mask() if sparse is not None else None
             l_disp_name,l_type=self._get_layer_display_name(l_cfg_idx),"Çıkış" if "Çıkış" in self._get_layer_display_name(l_cfg_idx) else "Gizli"
             l_num_h=int(l_disp_name.split(" ")[-1]) if "Gizli" in l_disp_name else None
-            for n_idx in range(num_n):
-                y=lys_l+n_idx*nvs; k,name=(l_cfg_idx,n_idx),self._get_neuron_display_name(l_type,n_idx,l_num_h)
-                fill_c="lightcoral" if (l_type=="Çıkış") else "lightgreen"
+            for n_idx,(lx,y) in enumerate(layout[l_cfg_idx+1]):
+                k,name=(l_cfg_idx,n_idx),self._get_neuron_display_name(l_type,n_idx,l_num_h)
+                fill_c=OUTPUT_FILL if (l_type=="Çıkış") else HIDDEN_FILL
                 oid=self.canvas.create_oval(lx-nr,y-nr,lx+nr,y+nr,fill=fill_c,outline="black",width=1.5,tags=("neuron",f"layer{l_cfg_idx}_neuron{n_idx}"))
                 self.canvas.create_text(lx,y-nr-24,text=name,font=('Helvetica',7,'bold')); self.canvas.create_text(lx,y-nr-12,text=f"Akt:{act_s[:5]}.",font=('Helvetica',7,'italic'))
-                curr_l_pos.append((lx,y)); self.neuron_canvas_objects[k]=oid
+                self.neuron_canvas_objects[k]=oid
                 if self.show_biases_on_canvas_var.get(): self.neuron_bias_value_texts[k]=self.canvas.create_text(lx,y+nr+26,text=f"b={self.network.biases[l_cfg_idx][n_idx]:.2f}",font=('Helvetica',7),fill="teal",tags=("bias_text"))
                 if self.show_neuron_values_on_canvas_var.get():
                     self.neuron_value_texts[k]=self.canvas.create_text(lx,y+nr+8,text="",font=('Helvetica',7),tags=("neuron_value"))
                     self.neuron_z_value_texts[k]=self.canvas.create_text(lx,y+nr+17,text="",font=('Helvetica',7),fill="darkblue",tags=("neuron_value_z"))
                 for prev_n_idx,(px,py) in enumerate(prev_l_pos):
+                    if keep is not None and not keep[prev_n_idx][n_idx]: continue  # budanmış bağlantı çizilmez
                     w=self.network.weights[l_cfg_idx][prev_n_idx][n_idx]
-                    lw,lc=min(5,max(0.5,1+abs(w)*1.5)),"darkred" if w<0 else ("darkgreen" if w>0 else "grey")
-                    conn_id=self.canvas.create_line(px+nr,py,lx-nr,y,fill=lc,width=lw,arrow=tk.LAST,arrowshape=(8,10,3),tags=("connection"))
+                    lw,lc=connection_style(w)
+                    conn_id=self.canvas.create_line(px+nr,py,lx-nr,y,fill=lc,width=lw,arrow=tk.LAST,arrowshape=ARROW_SHAPE,tags=("connection"))
                     self.canvas.tag_lower(conn_id); self.connection_canvas_objects[(l_cfg_idx,n_idx,prev_n_idx)]=(conn_id,lc,lw) 
                     if self.show_weights_on_canvas_var.get():
-                        mid_x,mid_y=(px+nr+lx-nr)/2,(py+y)/2; ang=math.atan2(y-py,lx-nr-(px+nr))*180/math.pi
-                        dyo,dxo=-8,8
-                        if -20<ang<20 or ang>160 or ang<-160: mid_y+=dyo
-                        else: mid_x+=dxo*(-1 if (0<ang<160) else 1)
+                        mid_x,mid_y,ang=weight_label_position(px,py,lx,y)
                         self.connection_weight_value_texts[(l_cfg_idx,n_idx,prev_n_idx)]=self.canvas.create_text(mid_x,mid_y,text=f"{w:.2f}",fill="purple",font=('Helvetica',7,'bold'),angle=ang,tags="weight_text")
-            n_pos_by_l.append(curr_l_pos)
         bbox=self.canvas.bbox("all")
         if bbox: self.canvas.config(scrollregion=(bbox[0]-30,bbox[1]-30,bbox[2]+30,bbox[3]+50)) 
         else: self.canvas.config(scrollregion=(0,0,cw,ch))
         self.master.update_idletasks()
 
     def _parse_input_data(self, text_data_str, num_features, is_target=False, num_output_for_one_hot=0):
+        # Son PARSE_MEMO_SIZE ayrıştırma saklanır; çağıranlar her zaman kendi kopyalarını alır.
+        key=(text_data_str,num_features,is_target,num_output_for_one_hot,self.loss_function_var.get()); memo=self._parse_memo
+        if key in memo: memo.move_to_end(key); samples=memo[key]
+        else:
+            samples=self._parse_input_text(text_data_str,num_features,is_target,num_output_for_one_hot); memo[key]=samples
+            if len(memo)>PARSE_MEMO_SIZE: memo.popitem(last=False)
+        return [list(sample) for sample in samples]
+
+    def _parse_input_text(self, text_data_str, num_features, is_target=False, num_output_for_one_hot=0):
         samples=[]
         for line_idx,line_raw in enumerate(text_data_str.strip().split(';')):
             line=line_raw.strip()
@@ -589,7 +849,7 @@ class DeepLearningSimulatorGUI:
                 if x is None: return
                 self.log_message(f"\nİleri Yayılım Adımı Başlatılıyor. Giriş: {[f'{v:.3f}' for v in x]}",True)
                 self.current_training_phase_label.config(text="Aşama: İleri (Adım)")
-                self.network.current_input_for_forward=x; self.forward_pass_gen=self.network.forward_pass_generator(x,self.detailed_forward_steps.get())
+                self.network.current_input_for_forward=x; self.forward_pass_gen=self.network.forward_pass_generator(x,self.detailed_forward_steps.get(),use_cache=True)
                 self.reset_neuron_visuals_and_texts(True); self.highlight_step_on_canvas(None) 
                 self.backward_step_button.config(state=tk.DISABLED); self.backward_pass_gen=None
             res=next(self.forward_pass_gen,None)
@@ -603,11 +863,11 @@ class DeepLearningSimulatorGUI:
             self.log_message(f"\nTüm İleri Yayılım. Giriş: {[f'{v:.3f}' for v in x]}",True)
             self.current_training_phase_label.config(text="Aşama: İleri (Tümü)")
             self.reset_neuron_visuals_and_texts(True); self.highlight_step_on_canvas(None)
-            self.network.current_input_for_forward=x; gen=self.network.forward_pass_generator(x,False); final_out=None
+            self.network.current_input_for_forward=x; gen=self.network.forward_pass_generator(x,False,use_cache=True); final_out,from_cache=None,False
             for res in gen: 
                 self.handle_forward_step_result_and_visualize(res,True,"İleri");
-                if res["type"]=="forward_pass_complete": final_out=res["final_output"]
-            self.log_message(f"İleri yayılım tamamlandı. Sonuç: {[f'{o:.3f}' for o in final_out]}" if final_out else "İleri yayılım sonucu yok.")
+                if res["type"]=="forward_pass_complete": final_out,from_cache=res["final_output"],res.get("cached",False)
+            self.log_message(f"İleri yayılım tamamlandı{' (önbellekten)' if from_cache else ''}. Sonuç: {[f'{o:.3f}' for o in final_out]}" if final_out else "İleri yayılım sonucu yok.")
             self.forward_pass_gen=None; self.reset_neuron_visuals_and_texts(False); self.highlight_step_on_canvas(None) 
             _,y=self._get_first_training_sample_for_step_ops()
             if y and self.network.neuron_outputs_a: self.backward_step_button.config(state=tk.NORMAL)
@@ -693,13 +953,15 @@ class DeepLearningSimulatorGUI:
         self.is_training_step_by_step_active=True; self.forward_pass_gen,self.backward_pass_gen=None,None 
         x,y=self._get_first_training_sample_for_step_ops()
         if x is None or y is None: self.is_training_step_by_step_active=False; messagebox.showinfo("Bilgi","Adım adım eğitim için X ve Y verisi gerekli."); self.current_training_phase_label.config(text="Aşama: -"); return
+        try: self._sync_input_normalizer()
+        except ValueError as e: self.is_training_step_by_step_active=False; messagebox.showerror("Giriş Hatası",f"Girdi normalizasyonu: {e}"); return
         self.current_training_X_sample,self.current_training_Y_sample=x,y
         self.log_message(f"\nAdım Adım Eğitim (1 Örnek) Başlatılıyor.",True); self.log_message(f"  Giriş (X): {[f'{v:.3f}' for v in x]}"); self.log_message(f"  Hedef (Y): {[f'{v:.3f}' for v in y]}"); self.log_message("  İlk adım: İleri Yayılım. 'Eğitimde Sonraki Adım >>' butonuna basın.")
         self.current_training_phase_label.config(text="Aşama: İleri (Bekliyor)")
         for btn in [self.train_next_step_button]: btn.config(state=tk.NORMAL)
         for btn in [self.train_step_by_step_button,self.train_button,self.forward_step_button,self.backward_step_button,self.forward_all_button]: btn.config(state=tk.DISABLED)
         self.network.current_input_for_forward=self.current_training_X_sample
-        self.forward_pass_gen=self.network.forward_pass_generator(self.current_training_X_sample,self.detailed_forward_steps.get())
+        self.forward_pass_gen=self.network.forward_pass_generator(self.current_training_X_sample,self.detailed_forward_steps.get(),use_cache=True)
         self.reset_neuron_visuals_and_texts(True); self.highlight_step_on_canvas(None)
 
     def execute_next_training_step(self):
@@ -731,7 +993,7 @@ class DeepLearningSimulatorGUI:
             self.train_next_step_button.config(state=tk.DISABLED); self.reset_neuron_visuals_and_texts(); self.highlight_step_on_canvas(None); self.current_training_phase_label.config(text="Aşama: Hata")
 
     def start_training_auto(self):
-        orig_btn_states={} 
+        orig_btn_states={}; mem_tracker=None
         try:
             n_epochs,lr=self.epochs_var.get(),self.lr_var.get(); in_f,out_f=self.input_size_var.get(),self.output_size_var.get()
             if not self.training_data_X or not self.training_data_Y: 
@@ -740,58 +1002,86 @@ class DeepLearningSimulatorGUI:
             else: X_train,Y_train=self.training_data_X,self.training_data_Y
             if not X_train or not Y_train: raise ValueError("Eğitim için X ve Y verileri sağlanmalıdır.")
             if len(X_train)!=len(Y_train): raise ValueError("X ve Y veri örnek sayıları eşleşmelidir.")
-            self.log_message(f"\nOtomatik Eğitim başlatılıyor... Epoch: {n_epochs}, LR: {lr}",True); self.current_training_phase_label.config(text="Aşama: Otomatik Eğitim")
-            self.current_epoch_losses,self.current_epoch_accuracies=[],[]; self.update_loss_graph(); self.update_accuracy_graph(); self.progress_bar["value"]=0; self.progress_bar["maximum"]=n_epochs
+            self._sync_input_normalizer(X_train)
+            sampler=self._get_epoch_sampler(len(X_train)); first_epoch=self.total_epochs_completed; last_epoch=first_epoch+n_epochs
+            self.log_message(f"\nOtomatik Eğitim başlatılıyor... Epoch: {first_epoch+1}-{last_epoch}, LR: {lr}"+(f" (epoch içi {sampler.position}. örnekten devam)" if sampler.position else ""),True); self.current_training_phase_label.config(text="Aşama: Otomatik Eğitim")
+            self._restore_main_history(); self.update_loss_graph(); self.update_accuracy_graph(); self.progress_bar["value"]=0; self.progress_bar["maximum"]=n_epochs
+            autosave_every=self.autosave_every_var.get()
+            if autosave_every>0 and not self.last_checkpoint_path: self.log_message("Otomatik kayıt için önce ağı bir dosyaya kaydedin veya dosyadan yükleyin; bu eğitimde kayıt yapılmayacak.")
+            snapshots=self._get_snapshot_store()
+            if self._live_params is not None: self.log_message("Eğitim, zaman çizelgesinden yüklenen ağırlıklardan devam ediyor."); self._live_params=None; self.snapshot_live_button.config(state=tk.DISABLED)
             opt_params={"type":self.optimizer_var.get(),"beta":0.9,"beta1":0.9,"beta2":0.999,"epsilon":1e-8}
-            btns_disable=[self.build_network_button,self.load_network_button,self.load_csv_button,self.forward_step_button,self.forward_all_button,self.backward_step_button,self.train_step_by_step_button,self.train_next_step_button,self.train_button,self.wb_apply_button]
+            btns_disable=[self.build_network_button,self.load_network_button,self.load_csv_button,self.forward_step_button,self.forward_all_button,self.backward_step_button,self.train_step_by_step_button,self.train_next_step_button,self.train_button,self.ensemble_button,self.cv_button,self.prune_button,self.unprune_button,self.morph_button,self.wb_apply_button]
             for btn in btns_disable:
                 if hasattr(self,btn.winfo_name()): orig_btn_states[btn]=btn.cget('state'); btn.config(state=tk.DISABLED)
             self.master.update()
             watch,delay=self.auto_train_watch_steps_var.get(),self.auto_train_step_delay_var.get() if self.auto_train_watch_steps_var.get() else 0
+            if watch: self._subscribe_watch_events(delay)
+            else: self.network.get_compiled(); self.log_message(self.network.compile_status)
+            if self.network.checkpoint_every:
+                for line in format_checkpoint_report(checkpoint_plan(len(self.network.weights[0]),self.network.layer_configs,self.network.checkpoint_every,self.network.precision)): self.log_message(line)
             all_true_for_cm, all_pred_for_cm = [], []
+            telemetry=TrainingTelemetry(self.telemetry_every_var.get(),jsonl_path=self.telemetry_jsonl_path) if self.telemetry_enabled_var.get() else None; self.network.telemetry=telemetry
 
-            for epoch in range(n_epochs):
-                self.progress_bar["value"]=epoch+1
+            prof=self.profiler; mem_tracker=TracemallocPeakTracker() if self.track_tracemalloc_var.get() else None
+            if mem_tracker: mem_tracker.start()
+            for run_epoch in range(n_epochs):
+                epoch=first_epoch+run_epoch  # ağın toplam epoch sayacı (kayıttan devam edildiyse kaldığı yerden)
+                self.progress_bar["value"]=run_epoch+1; prof.current_epoch=epoch+1
+                epoch_t0=prof.now() if prof.enabled else None
                 loss_sum,n_correct,epoch_true_cm,epoch_pred_cm=0.0,0,[],[]
-                data=list(zip(X_train,Y_train)); random.shuffle(data); X_shuff,Y_shuff=zip(*data)
-                for i in range(len(X_shuff)):
-                    x,y=X_shuff[i],Y_shuff[i]
+                if telemetry: telemetry.begin_epoch(epoch+1)
+                order=sampler.epoch_indices()
+                for i,idx in enumerate(order):
+                    x,y=X_train[idx],Y_train[idx]
                     if watch:
                         self.log_message(f"[E{epoch+1},Ö{i+1}] İleri...",True if i==0 else False); self.current_training_phase_label.config(text=f"Oto:E{epoch+1} Ö{i+1} İleri")
-                        fwd_gen=self.network.forward_pass_generator(x,self.detailed_forward_steps.get())
-                        for res in fwd_gen: 
-                            self.handle_forward_step_result_and_visualize(res,not self.detailed_forward_steps.get(),f"Oto.E{epoch+1} Ö{i+1} İleri Adım");
-                            if delay>0: time.sleep(delay); self.master.update()
-                    else: list(self.network.forward_pass_generator(x,False))
+                        self._watch_phase=f"Oto.E{epoch+1} Ö{i+1}"; self.network.forward(x,self.detailed_forward_steps.get())
+                    else: self.network.train_sample(x,y,lr,opt_params)
+                    if prof.enabled: metrics_t0=prof.now()
                     preds=self.network.neuron_outputs_a[-1]; loss_sum+=self.network.loss_func(y,preds)
                     if self.loss_function_var.get()=="cross_entropy" and self.network.layer_configs[-1][1]=="softmax":
                         if preds and y and sum(y)>0: 
                             pred_cls,true_cls=preds.index(max(preds)),y.index(max(y)) 
                             epoch_true_cm.append(true_cls); epoch_pred_cm.append(pred_cls)
                             if pred_cls==true_cls: n_correct+=1
+                    if prof.enabled: prof.record("loss_metrics",metrics_t0)
                     if watch:
                         self.log_message(f"[E{epoch+1},Ö{i+1}] Geri..."); self.current_training_phase_label.config(text=f"Oto:E{epoch+1} Ö{i+1} Geri")
-                        bwd_gen=self.network.backward_pass_generator(y,lr,opt_params)
-                        for res in bwd_gen: 
-                            self.handle_backward_step_result_and_visualize(res,current_phase_override=f"Oto.E{epoch+1} Ö{i+1} Geri Adım");
-                            if delay>0: time.sleep(delay); self.master.update()
-                        if i%(len(X_shuff)//5+1)==0: self.draw_network_on_canvas()
-                    else: list(self.network.backward_pass_generator(y,lr,opt_params))
+                        self.network.backward(y,lr,opt_params)
+                        if i%(len(order)//5+1)==0: self.draw_network_on_canvas()
+                    sampler.advance()
+                self.total_epochs_completed=epoch+1
+                telemetry_record=telemetry.end_epoch(self.network) if telemetry else None
                 
-                if epoch == n_epochs -1 : 
+                if run_epoch == n_epochs -1 : 
                     all_true_for_cm.extend(epoch_true_cm)
                     all_pred_for_cm.extend(epoch_pred_cm)
 
-                avg_loss=loss_sum/len(X_shuff); self.current_epoch_losses.append(avg_loss); metrics={"Ort. Kayıp":avg_loss}
+                avg_loss=loss_sum/len(order); self.current_epoch_losses.append(avg_loss); metrics={"Ort. Kayıp":avg_loss}
                 if self.loss_function_var.get()=="cross_entropy" and self.network.layer_configs[-1][1]=="softmax":
-                    acc=n_correct/len(X_shuff) if X_shuff else 0; self.current_epoch_accuracies.append(acc); metrics["Doğruluk"]=acc
+                    acc=n_correct/len(order) if order else 0; self.current_epoch_accuracies.append(acc); metrics["Doğruluk"]=acc
                 log_int=max(1,n_epochs//20 if n_epochs>=20 else 1) 
-                if (epoch+1)%log_int==0 or epoch==n_epochs-1: 
-                    log_s=f"Epoch {epoch+1}/{n_epochs}, Ort.Kayıp: {avg_loss:.6f}"; 
+                if (run_epoch+1)%log_int==0 or run_epoch==n_epochs-1: 
+                    log_s=f"Epoch {epoch+1}/{last_epoch}, Ort.Kayıp: {avg_loss:.6f}"; 
                     if "Doğruluk" in metrics: log_s+=f", Doğruluk: {metrics['Doğruluk']:.4f}"
                     self.log_message(log_s); self.update_metrics_display(metrics); self.update_loss_graph(); self.update_accuracy_graph()
+                    if telemetry_record: self.update_telemetry_display(telemetry_record)
                     if not watch: self.master.update_idletasks()
+                if epoch_t0 is not None: prof.record("epoch",epoch_t0,category="epoch")
+                if mem_tracker: mem_tracker.mark_epoch()
+                if autosave_every>0 and self.last_checkpoint_path and (epoch+1)%autosave_every==0: self._autosave_checkpoint()
+                if snapshots and snapshots.should_record(epoch+1): snapshots.record(self.network,epoch+1,{"loss":avg_loss})
+            prof.current_epoch=None
+            if mem_tracker: self.last_tracemalloc_peak=mem_tracker.stop(); mem_tracker=None; self.log_message(f"tracemalloc tepe bellek kullanımı: {format_bytes(self.last_tracemalloc_peak)}")
             self.log_message("Eğitim tamamlandı.")
+            if snapshots:
+                self._update_snapshot_slider(); st=snapshots.stats(); evicted=f", {st['evicted_groups']} eski grup silindi" if st["evicted_groups"] else ""
+                self.log_message(f"Anlık görüntüler: {st['snapshots']} ({st['keyframes']} anahtar kare, {st['deltas']} fark, {format_bytes(st['bytes'])}{evicted})")
+            if telemetry and telemetry.last_epoch_record:
+                for line in format_telemetry(telemetry.last_epoch_record): self.log_message(line)
+                self.log_message(f"Telemetri toplam ek maliyeti: {telemetry.total_overhead_s*1e3:.2f} ms")
+            if prof.enabled: self.update_performance_display()
             final_preds, final_targets = None, None
             if X_train: final_preds = self.network.neuron_outputs_a[-1] if self.network.neuron_outputs_a else []; final_targets = Y_train[0]
             
@@ -800,7 +1090,7 @@ class DeepLearningSimulatorGUI:
 
             if self.loss_function_var.get() == "cross_entropy" and all_true_for_cm:
                 num_classes_cm = self.output_size_var.get()
-                cls_metrics, conf_matrix = self._calculate_classification_metrics(all_true_for_cm, all_pred_for_cm, num_classes_cm)
+                cls_metrics, conf_matrix = classification_metrics(all_true_for_cm, all_pred_for_cm, num_classes_cm)
                 final_metrics_for_display.update(cls_metrics)
                 self._display_text_confusion_matrix(conf_matrix, [f"S{i}" for i in range(num_classes_cm)])
             self.update_metrics_display(final_metrics_for_display, final_preds, final_targets)
@@ -809,16 +1099,178 @@ class DeepLearningSimulatorGUI:
             self.current_training_phase_label.config(text="Aşama: - (Oto. Eğitim Bitti)"); self._populate_wb_combo(); self.draw_network_on_canvas() 
             if X_train: 
                 self.x_input_text.delete(1.0,tk.END); self.x_input_text.insert(tk.END,",".join(map(str,X_train[0])))
-                self.y_input_text.delete(1.0,tk.END); y_d=Y_train[0]
+                self.y_input_text.delete(1.0,tk.END); y_d=to_plain(Y_train[0])
                 y_s=str(y_d.index(1.0)) if self.loss_function_var.get()=="cross_entropy" and isinstance(y_d,list) and 1.0 in y_d else (",".join(map(str,y_d)) if isinstance(y_d,list) else str(y_d))
                 self.y_input_text.insert(tk.END,y_s); self.execute_forward_all() 
         except ValueError as e: messagebox.showerror("Giriş Hatası",f"Veri/Eğitim: {str(e)}")
         except Exception as e: messagebox.showerror("Hata",f"Eğitim: {e}"); import traceback; traceback.print_exc()
         finally: 
+            self.profiler.current_epoch=None
+            if mem_tracker: mem_tracker.stop()
+            if self.network.telemetry: self.network.telemetry.close(); self.network.telemetry=None
+            self._unsubscribe_watch_events()
             for btn,state in orig_btn_states.items():
                 if btn.winfo_exists(): btn.config(state=state)
             self.master.update()
 
+    def _subscribe_watch_events(self, delay):
+        # İzleme modu yalnızca gösterdiği olaylara abone olur: ayrıntısız modda ileri yayılımdan yalnızca giriş ve katman
+        # aktivasyonları istenir (ağırlık başına olaylar ve tamamlanma olayı hiç oluşturulmaz).
+        detailed=self.detailed_forward_steps.get(); self._watch_phase=""
+        def on_forward(res):
+            self.handle_forward_step_result_and_visualize(res,not detailed,f"{self._watch_phase} İleri Adım")
+            if delay>0: time.sleep(delay); self.master.update()
+        def on_backward(res):
+            self.handle_backward_step_result_and_visualize(res,current_phase_override=f"{self._watch_phase} Geri Adım")
+            if delay>0: time.sleep(delay); self.master.update()
+        forward_types=FORWARD_EVENT_TYPES if detailed else ["input_layer","layer_activation"]
+        self._watch_subscriptions=[self.network.subscribe(on_forward,forward_types),self.network.subscribe(on_backward,BACKWARD_EVENT_TYPES)]
+
+    def _unsubscribe_watch_events(self):
+        for sub in getattr(self,"_watch_subscriptions",[]): self.network.unsubscribe(sub)
+        self._watch_subscriptions=[]
+
+    def _get_training_data(self):
+        # Yüklü CSV verisi, yoksa metin kutularındaki örnekler.
+        if self.training_data_X and self.training_data_Y: X_train,Y_train=self.training_data_X,self.training_data_Y
+        else:
+            in_f,out_f=self.input_size_var.get(),self.output_size_var.get()
+            X_train,Y_train=self._parse_input_data(self.x_input_text.get(1.0,tk.END),in_f),self._parse_input_data(self.y_input_text.get(1.0,tk.END),out_f,True,out_f)
+        if not X_train or not Y_train: raise ValueError("Eğitim için X ve Y verileri sağlanmalıdır.")
+        if len(X_train)!=len(Y_train): raise ValueError("X ve Y veri örnek sayıları eşleşmelidir.")
+        return X_train,Y_train
+
+    def start_ensemble_training(self):
+        # Mevcut mimarinin K kopyası (tohum = 0..K-1) aynı veri akışıyla birlikte eğitilir; ana ağ değişmez.
+        orig_btn_states={}
+        try:
+            if not self.network.layer_configs: raise ValueError("Önce ağı kurun.")
+            n_epochs,lr,k,in_f=self.epochs_var.get(),self.lr_var.get(),self.ensemble_size_var.get(),self.input_size_var.get()
+            if k<2: raise ValueError("Topluluk için en az 2 kopya gerekli.")
+            X_train,Y_train=self._get_training_data()
+            self._sync_input_normalizer(X_train)
+            if self.network.input_normalizer is not None: X_train=self.network.input_normalizer.transform_rows(X_train)  # kopyalar ölçeklenmiş veriyi bir kez alır
+            opt_params={"type":self.optimizer_var.get(),"beta":0.9,"beta1":0.9,"beta2":0.999,"epsilon":1e-8}
+            for btn in [self.build_network_button,self.load_network_button,self.load_csv_button,self.train_button,self.ensemble_button,self.cv_button,self.morph_button,self.train_step_by_step_button,self.wb_apply_button]:
+                orig_btn_states[btn]=btn.cget('state'); btn.config(state=tk.DISABLED)
+            self.log_message(f"\nTopluluk eğitimi başlatılıyor... K: {k}, Epoch: {n_epochs}, LR: {lr}",True); self.current_training_phase_label.config(text=f"Aşama: Topluluk Eğitimi (K={k})")
+            self.progress_bar["value"]=0; self.progress_bar["maximum"]=n_epochs; self.master.update()
+            t0=time.perf_counter()
+            trainer=EnsembleTrainer(in_f,self.network.layer_configs,k,self.loss_function_var.get(),seed=0,fast_math=self.network.fast_math,precision=self.network.precision,use_compiled=self.network.use_compiled)
+            self.log_message(trainer.status)
+            log_int=max(1,n_epochs//20 if n_epochs>=20 else 1)
+            def on_epoch(epoch,losses):
+                self.progress_bar["value"]=epoch
+                if epoch%log_int==0 or epoch==n_epochs:
+                    means,stds=trainer.loss_curve(); self.log_message(f"Epoch {epoch}/{n_epochs}, Ort.Kayıp: {means[-1]:.6f} ± {stds[-1]:.6f} (min {min(losses):.6f}, maks {max(losses):.6f})")
+                    self.master.update()
+            means,stds=trainer.train(X_train,Y_train,n_epochs,lr,opt_params,callback=on_epoch)
+            elapsed=time.perf_counter()-t0; result=trainer.evaluate(X_train,Y_train); best=trainer.best_replica()
+            if self.ensemble_loss_band is None: self._main_history=(self.current_epoch_losses,self.current_epoch_accuracies)
+            self.current_epoch_losses,self.ensemble_loss_band,self.current_epoch_accuracies=means,stds,[]; self.update_loss_graph(); self.update_accuracy_graph()
+            metrics={"Kopya Sayısı":k,"Son Ort. Kayıp (kopyalar)":means[-1] if means else 0.0,"Son Kayıp Std (kopyalar)":stds[-1] if stds else 0.0,
+                     "Topluluk Kaybı (ort. tahmin)":result["ensemble_loss"],"En İyi Kopya":f"#{best+1} ({result['replica_losses'][best]:.4f})","Süre (s)":elapsed}
+            if result["ensemble_accuracy"] is not None:
+                metrics["Topluluk Doğruluğu"]=result["ensemble_accuracy"]; metrics["Kopya Doğruluğu (ort.)"]=sum(result["replica_accuracies"])/k
+                metrics["Kopya Doğruluğu (min-maks)"]=f"{min(result['replica_accuracies']):.4f} - {max(result['replica_accuracies']):.4f}"
+            self.update_metrics_display(metrics)
+            self.log_message(f"Topluluk eğitimi tamamlandı ({elapsed:.2f} s). Topluluk kaybı: {result['ensemble_loss']:.6f}, kopya kayıpları ort.: {sum(result['replica_losses'])/k:.6f}")
+            self.current_training_phase_label.config(text="Aşama: - (Topluluk Eğitimi Bitti)")
+        except ValueError as e: messagebox.showerror("Giriş Hatası",f"Topluluk Eğitimi: {str(e)}")
+        except Exception as e: messagebox.showerror("Hata",f"Topluluk Eğitimi: {e}"); import traceback; traceback.print_exc()
+        finally:
+            for btn,state in orig_btn_states.items():
+                if btn.winfo_exists(): btn.config(state=state)
+            self.master.update()
+
+    def start_cross_validation(self):
+        # Mevcut mimariyle k katlı çapraz doğrulama (cross_validation.py); katlar paralel süreçlerde eğitilir, ana ağ değişmez.
+        orig_btn_states={}
+        try:
+            if not self.network.layer_configs: raise ValueError("Önce ağı kurun.")
+            n_epochs,lr,k=self.epochs_var.get(),self.lr_var.get(),self.cv_folds_var.get()
+            X_train,Y_train=self._get_training_data()
+            opt_params={"type":self.optimizer_var.get(),"beta":0.9,"beta1":0.9,"beta2":0.999,"epsilon":1e-8}
+            for btn in [self.build_network_button,self.load_network_button,self.load_csv_button,self.train_button,self.ensemble_button,self.cv_button,self.morph_button,self.train_step_by_step_button,self.wb_apply_button]:
+                orig_btn_states[btn]=btn.cget('state'); btn.config(state=tk.DISABLED)
+            self.log_message(f"\nÇapraz doğrulama başlatılıyor... k: {k}, Epoch: {n_epochs}, LR: {lr}, örnek: {len(X_train)}",True); self.current_training_phase_label.config(text=f"Aşama: Çapraz Doğrulama (k={k})")
+            self.progress_bar["value"]=0; self.progress_bar["maximum"]=k; self.master.update()
+            def on_fold(fold):
+                self.progress_bar["value"]+=1
+                self.log_message(f"Kat {fold['fold']+1}/{k} bitti: test kaybı {fold['loss']:.6f}"+(f", doğruluk {fold['accuracy']:.4f}" if fold["accuracy"] is not None else "")+f" ({fold['seconds']:.2f} s)"); self.master.update()
+            result=run_cross_validation(X_train,Y_train,len(self.network.weights[0]),self.network.layer_configs,k,n_epochs,lr,opt_params,self.loss_function_var.get(),seed=0,
+                                        precision=self.network.precision,keep_master_weights=self.network.keep_master_weights,fast_math=self.network.fast_math,use_compiled=self.network.use_compiled,callback=on_fold,normalization=self._normalization_mode())
+            for line in format_cv_report(result): self.log_message(line)
+            summary=result["summary"]
+            if self.ensemble_loss_band is None: self._main_history=(self.current_epoch_losses,self.current_epoch_accuracies)
+            self.current_epoch_losses,self.ensemble_loss_band,self.current_epoch_accuracies=summary["loss_curve_mean"],summary["loss_curve_std"],[]; self.update_loss_graph(); self.update_accuracy_graph()
+            metrics={"Kat Sayısı":k,"Süre (s)":result["seconds"],"İşçi Süreç":result["processes"]}
+            for key,name in [("loss","Test Kaybı"),("accuracy","Doğruluk"),("macro_f1","Makro F1"),("train_loss","Eğitim Kaybı")]:
+                if summary[key] is not None: metrics[f"{name} (ort. ± std)"]=f"{summary[key][0]:.4f} ± {summary[key][1]:.4f}"
+            self.update_metrics_display(metrics)
+            self.current_training_phase_label.config(text="Aşama: - (Çapraz Doğrulama Bitti)")
+        except ValueError as e: messagebox.showerror("Giriş Hatası",f"Çapraz Doğrulama: {str(e)}")
+        except Exception as e: messagebox.showerror("Hata",f"Çapraz Doğrulama: {e}"); import traceback; traceback.print_exc()
+        finally:
+            for btn,state in orig_btn_states.items():
+                if btn.winfo_exists(): btn.config(state=state)
+            self.master.update()
+
+    def prune_network_from_gui(self):
+        # Büyüklüğe göre budama (isteğe bağlı kademeli + ince ayar); kayıp/doğruluk değişimi ve ileri yayılım hızı raporlanır.
+        orig_btn_states={}
+        try:
+            if not self.network.weights: raise ValueError("Önce ağı kurun.")
+            sparsity,steps,ft_epochs=self.prune_percent_var.get()/100.0,self.prune_steps_var.get(),self.prune_finetune_epochs_var.get()
+            X_train,Y_train=self._get_training_data()
+            self._sync_input_normalizer(X_train)
+            opt_params={"type":self.optimizer_var.get(),"beta":0.9,"beta1":0.9,"beta2":0.999,"epsilon":1e-8}
+            for btn in [self.build_network_button,self.load_network_button,self.train_button,self.ensemble_button,self.cv_button,self.prune_button,self.unprune_button,self.morph_button,self.wb_apply_button]:
+                orig_btn_states[btn]=btn.cget('state'); btn.config(state=tk.DISABLED)
+            self.log_message(f"\nBudama: hedef seyreklik %{sparsity*100:.1f} ({self.prune_scope_var.get()}), {steps} adım, adım başına {ft_epochs} epoch ince ayar",True)
+            self.master.update()
+            def on_step(step,step_sparsity,ev):
+                self.log_message(f"Adım {step}/{steps}: seyreklik %{step_sparsity*100:.1f}, kayıp {ev['loss']:.6f}"+(f", doğruluk {ev['accuracy']:.4f}" if ev["accuracy"] is not None else "")); self.master.update()
+            result=iterative_prune(self.network,X_train,Y_train,sparsity,steps,ft_epochs,self.lr_var.get(),opt_params,self.prune_scope_var.get(),on_step)
+            for layer in result["layers"]: self.log_message(f"  {self._get_layer_display_name(layer['layer'])}: {layer['kept']}/{layer['total']} bağlantı kaldı (yoğunluk {layer['density']:.3f})")
+            before,after,timing=result["before"],result["after"],result["timing"]
+            self.log_message(f"Kayıp: {before['loss']:.6f} -> {after['loss']:.6f}"+(f", Doğruluk: {before['accuracy']:.4f} -> {after['accuracy']:.4f}" if after["accuracy"] is not None else ""))
+            self.log_message(f"İleri yayılım ({len(X_train)} örnek): yoğun {timing['dense_s']*1000:.2f} ms, seyrek {timing['sparse_s']*1000:.2f} ms (x{timing['speedup']:.2f})")
+            kept,total=sum(l["kept"] for l in result["layers"]),sum(l["total"] for l in result["layers"])
+            metrics={"Kalan Bağlantı":f"{kept}/{total}","Kayıp (önce)":before["loss"],"Kayıp (sonra)":after["loss"],"İleri Yayılım Hızlanması":f"x{timing['speedup']:.2f}"}
+            if after["accuracy"] is not None: metrics["Doğruluk (önce)"]=before["accuracy"]; metrics["Doğruluk (sonra)"]=after["accuracy"]
+            self.update_metrics_display(metrics); self._populate_wb_combo(); self.draw_network_on_canvas()
+        except ValueError as e: messagebox.showerror("Giriş Hatası",f"Budama: {str(e)}")
+        except Exception as e: messagebox.showerror("Hata",f"Budama: {e}"); import traceback; traceback.print_exc()
+        finally:
+            for btn,state in orig_btn_states.items():
+                if btn.winfo_exists(): btn.config(state=state)
+            self.master.update()
+
+    def clear_pruning_from_gui(self):
+        if not any(sparse is not None for sparse in self.network.sparse_layers): self.log_message("Ağda budanmış katman yok."); return
+        self.network.clear_pruning(); self.draw_network_on_canvas()
+        self.log_message("Budama kaldırıldı: tüm bağlantılar yeniden eğitilebilir (budanmış ağırlıklar 0'dan başlar).")
+
+    def morph_network_from_gui(self):
+        # Ağırlık, optimizer durumu ve eğitim geçmişi korunarak katman girişlerindeki mimariye geçilir.
+        try:
+            if not self.network.weights: raise ValueError("Önce ağı kurun.")
+            target=[(entry[4].get(),entry[5].get()) for entry in self.layer_entries]+[(self.output_size_var.get(),self.output_activation_var.get())]
+            if self.input_size_var.get()!=len(self.network.weights[0]): raise ValueError("Giriş boyutu değiştirilemez.")
+            if any(n<=0 for n,_ in target): raise ValueError("Gizli katman nöron sayısı pozitif olmalı.")
+            check=self.training_data_X[:64] if self.training_data_X else [[random.uniform(-1,1) for _ in range(len(self.network.weights[0]))] for _ in range(16)]
+            predicted=predict_network_footprint(len(self.network.weights[0]),target,self.optimizer_var.get(),self.network.precision,self.network.keep_master_weights)
+            if not self._confirm_memory_budget(predicted["total"],"Ağ",format_memory_report(predicted,"Tahmini Ağ Ayak İzi")): self.log_message("Dönüştürme bellek bütçesi nedeniyle iptal edildi."); return
+            report=morph_network(self.network,target,check_inputs=check)
+            for i,line in enumerate(format_morph_report(report)): self.log_message(line,i==0)
+            self._clear_snapshots()  # eski görüntüler yeni mimariye uygulanamaz
+            self.forward_pass_gen,self.backward_pass_gen,self.is_training_step_by_step_active=None,None,False
+            self.backward_step_button.config(state=tk.DISABLED); self.train_next_step_button.config(state=tk.DISABLED); self.current_training_phase_label.config(text="Aşama: -")
+            self._populate_wb_combo(); self.draw_network_on_canvas()
+        except ValueError as e: messagebox.showerror("Giriş Hatası",f"Ağ dönüştürme: {str(e)}")
+        except Exception as e: messagebox.showerror("Hata",f"Ağ dönüştürme: {e}"); import traceback; traceback.print_exc()
+
     def highlight_step_on_canvas(self, step_res):
         self.reset_neuron_visuals_and_texts(False,True) 
         for k,(conn_id,oc,ow) in self.connection_canvas_objects.items():
@@ -882,10 +1334,11 @@ class DeepLearningSimulatorGUI:
             info_str=f"Nöron: {neuron_name}\nKatman: {disp_l_name}\n"
             if is_input:
                 if self.network.current_input_for_forward and n_idx < len(self.network.current_input_for_forward): info_str+=f"Değer (a): {self.network.current_input_for_forward[n_idx]:.4f}\n"
+                if self.network.input_normalizer is not None and self.network.neuron_outputs_a and n_idx<len(self.network.neuron_outputs_a[0]): info_str+=f"Normalize Değer: {self.network.neuron_outputs_a[0][n_idx]:.4f}\n"
             else: 
                 l_cfg=int(l_key); info_str+=f"Aktivasyon Fonk: {self.network.layer_configs[l_cfg][1]}\n"
-                if self.network.neuron_outputs_z and l_cfg<len(self.network.neuron_outputs_z) and n_idx<len(self.network.neuron_outputs_z[l_cfg]): info_str+=f"Z Değeri: {self.network.neuron_outputs_z[l_cfg][n_idx]:.4f}\n"
-                if self.network.neuron_outputs_a and (l_cfg+1)<len(self.network.neuron_outputs_a) and n_idx<len(self.network.neuron_outputs_a[l_cfg+1]): info_str+=f"Aktivasyon (a): {self.network.neuron_outputs_a[l_cfg+1][n_idx]:.4f}\n"
+                if self.network.neuron_outputs_z and l_cfg<len(self.network.neuron_outputs_z) and self.network.neuron_outputs_z[l_cfg] is not None and n_idx<len(self.network.neuron_outputs_z[l_cfg]): info_str+=f"Z Değeri: {self.network.neuron_outputs_z[l_cfg][n_idx]:.4f}\n"
+                if self.network.neuron_outputs_a and (l_cfg+1)<len(self.network.neuron_outputs_a) and self.network.neuron_outputs_a[l_cfg+1] is not None and n_idx<len(self.network.neuron_outputs_a[l_cfg+1]): info_str+=f"Aktivasyon (a): {self.network.neuron_outputs_a[l_cfg+1][n_idx]:.4f}\n"
                 if self.network.biases and l_cfg<len(self.network.biases) and n_idx<len(self.network.biases[l_cfg]): info_str+=f"Bias (b): {self.network.biases[l_cfg][n_idx]:.4f}\n"
                 info_str+="Gelen Ağırlıklar (Kaynak → Bu Nöron):\n"
                 num_prev_n,src_l_name=(self.input_size_var.get() if l_cfg==0 else self.network.layer_configs[l_cfg-1][0]),self._get_source_layer_display_name_for_weights(l_cfg)
@@ -908,13 +1361,14 @@ class DeepLearningSimulatorGUI:
         else: self.reset_neuron_visuals_and_texts(False,True) 
 
     def reset_simulation(self):
-        self.log_message("Simülasyon sıfırlanıyor...",True); self.network=NeuralNetwork(self.loss_function_var.get())
+        self.log_message("Simülasyon sıfırlanıyor...",True); self.network=NeuralNetwork(self.loss_function_var.get(),profiler=self.profiler); self.network.fast_math=self.fast_math_var.get(); self.network.use_compiled=self.compiled_path_var.get(); self.network.checkpoint_every=self._checkpoint_every()
         self.forward_pass_gen,self.backward_pass_gen,self.is_training_step_by_step_active=None,None,False
         self.training_data_X,self.training_data_Y,self.current_training_X_sample,self.current_training_Y_sample=[],[],None,None
         self.update_layer_config_entries(); self.reset_neuron_visuals_and_texts(True); self.draw_network_on_canvas(); self._populate_wb_combo() 
-        self.current_epoch_losses,self.current_epoch_accuracies=[],[]; self.update_loss_graph(); self.update_accuracy_graph(); self._display_text_confusion_matrix(None); self.update_metrics_display({})
+        self.current_epoch_losses,self.current_epoch_accuracies,self.ensemble_loss_band=[],[],None; self.update_loss_graph(); self.update_accuracy_graph(); self._display_text_confusion_matrix(None); self.update_metrics_display({})
+        self.total_epochs_completed,self.epoch_sampler,self._pending_sampler_state,self._main_history,self.last_checkpoint_path=0,None,None,None,None; self._clear_snapshots()
         self.current_training_phase_label.config(text="Aşama: -"); self.progress_bar["value"]=0
-        for btn_name in ["forward_step_button","forward_all_button","train_button","backward_step_button","train_step_by_step_button","train_next_step_button","save_network_button","save_canvas_button"]:
+        for btn_name in ["forward_step_button","forward_all_button","train_button","ensemble_button","cv_button","prune_button","unprune_button","morph_button","backward_step_button","train_step_by_step_button","train_next_step_button","save_network_button","export_int8_button","save_canvas_button"]:
             if hasattr(self,btn_name): getattr(self,btn_name).config(state=tk.DISABLED)
         for btn_name in ["build_network_button","load_network_button","load_csv_button"]: getattr(self,btn_name).config(state=tk.NORMAL)
         self.log_message("Simülatör sıfırlandı. Yeni ağ kurun/yükleyin.\nİşlemleri buradan ve grafik sekmelerinden canlı izleyebilirsiniz.")
@@ -923,70 +1377,153 @@ class DeepLearningSimulatorGUI:
         fp=filedialog.askopenfilename(title="CSV Veri Dosyasını Seç",filetypes=(("CSV","*.csv"),("Tüm Dosyalar","*.*")),parent=self.master)
         if not fp: return
         try:
-            X,Y=[],[]; num_in,num_out_user=self.input_size_var.get(),self.output_size_var.get() 
-            with open(fp,'r',newline='',encoding='utf-8-sig') as f: 
-                r,h=csv.reader(f),next(csv.reader(f),None) 
-                if h: self.log_message(f"CSV başlığı: {h}")
-                for idx,row in enumerate(r):
-                    if not row or len(row)<num_in+1: self.log_message(f"Uyarı: Satır {idx+1} yetersiz/boş, atlanıyor."); continue
-                    try:
-                        x_v=[float(v.strip()) for v in row[:num_in]]; y_raw_f=[float(v.strip()) for v in row[num_in:]]; y_parsed=[]
-                        if self.loss_function_var.get()=="cross_entropy":
-                            if num_out_user<=0: raise ValueError("CE için çıkış sınıf sayısı > 0 olmalı.")
-                            if len(y_raw_f)==1 and 0<=y_raw_f[0]<num_out_user and y_raw_f[0]==int(y_raw_f[0]): oh=[0.0]*num_out_user; oh[int(y_raw_f[0])]=1.0; y_parsed=oh
-                            elif len(y_raw_f)==num_out_user: y_parsed=y_raw_f
-                            else: raise ValueError(f"Satır {idx+1} (Hedef): CE için {num_out_user} elemanlı one-hot veya tek sınıf indeksi beklenir.")
-                        else: 
-                            if len(y_raw_f)!=num_out_user: raise ValueError(f"MSE vb. için Y formatı ({len(y_raw_f)}) çıkış nöron sayısıyla ({num_out_user}) eşleşmiyor.")
-                            y_parsed=y_raw_f
-                        X.append(x_v); Y.append(y_parsed)
-                    except ValueError as ve: self.log_message(f"Uyarı: Satır {idx+1} hatalı değer içeriyor, atlanıyor: {ve}"); continue
-            self.training_data_X,self.training_data_Y=X,Y; self.x_input_text.delete(1.0,tk.END); self.y_input_text.delete(1.0,tk.END)
+            num_in,num_out_user=self.input_size_var.get(),self.output_size_var.get() 
+            with open(fp,'rb') as f: n_rows=max(0,sum(1 for _ in f)-1)
+            precision=self.network.precision if self.network.weights else self.precision_var.get()
+            predicted=predict_dataset_footprint(n_rows,num_in,num_out_user,precision); net_bytes=network_memory_report(self.network)["total"]
+            if not self._confirm_memory_budget(predicted["total"]+net_bytes,f"CSV ({n_rows} satır)",format_memory_report(predicted,"Tahmini Veri Ayak İzi")): self.log_message("CSV yükleme bellek bütçesi nedeniyle iptal edildi."); return
+            X,Y,h=read_csv_dataset(fp,num_in,num_out_user,self.loss_function_var.get()=="cross_entropy",warn=self.log_message,precision=precision)
+            if h: self.log_message(f"CSV başlığı: {h}")
+            self.training_data_X,self.training_data_Y=X,Y; self.epoch_sampler=None; self.x_input_text.delete(1.0,tk.END); self.y_input_text.delete(1.0,tk.END)
             for i in range(min(5,len(X))): 
                 self.x_input_text.insert(tk.END,",".join(map(str,X[i]))+ (";\n" if i<min(4,len(X)-1) else ""))
-                y_d=Y[i]; y_s=str(y_d.index(1.0)) if self.loss_function_var.get()=="cross_entropy" and isinstance(y_d,list) and 1.0 in y_d else (",".join(map(str,y_d)) if isinstance(y_d,list) else str(y_d))
+                y_d=to_plain(Y[i]); y_s=str(y_d.index(1.0)) if self.loss_function_var.get()=="cross_entropy" and isinstance(y_d,list) and 1.0 in y_d else (",".join(map(str,y_d)) if isinstance(y_d,list) else str(y_d))
                 self.y_input_text.insert(tk.END,y_s + (";\n" if i<min(4,len(Y)-1) else ""))
             self.log_message(f"{len(X)} örnek CSV'den yüklendi: {fp}")
+            if X and self.network.weights and self._normalization_mode()!="none":
+                if self.total_epochs_completed==0: self._sync_input_normalizer(X,refit=True)
+                elif self.network.input_normalizer is not None: self.log_message("Ağ eğitilmiş; girdi normalizasyonu istatistikleri korunuyor (yeni veri için ağı yeniden kurun).")
             if not X: messagebox.showwarning("Veri Yükleme","CSV'den geçerli örnek yüklenemedi.",parent=self.master)
         except Exception as e: messagebox.showerror("CSV Okuma Hatası",f"CSV okunurken: {e}",parent=self.master); self.training_data_X,self.training_data_Y=[],[]; import traceback; traceback.print_exc()
 
     def save_canvas_as_eps(self):
+        # .svg/.png ağırlıklardan doğrudan (Tk tuvali olmadan) çizilir; .eps tuvalin o anki görüntüsüdür.
         if not self.network or not self.network.weights: messagebox.showinfo("Bilgi","Kaydedilecek ağ görseli yok.",parent=self.master); return
-        fp=filedialog.asksaveasfilename(title="Ağ Görselini Kaydet",defaultextension=".eps",filetypes=(("Encapsulated PostScript","*.eps"),("Tüm Dosyalar","*.*")),parent=self.master)
+        fp=filedialog.asksaveasfilename(title="Ağ Görselini Kaydet",defaultextension=".svg",filetypes=(("SVG","*.svg"),("PNG (matplotlib)","*.png"),("Encapsulated PostScript","*.eps"),("Tüm Dosyalar","*.*")),parent=self.master)
         if not fp: return
-        try: self.canvas.postscript(colormode='color',file=fp); self.log_message(f"Ağ görseli EPS olarak kaydedildi: {fp}"); messagebox.showinfo("Başarılı",f"Ağ görseli {fp} adresine kaydedildi.\nEPS'yi PNG'ye dönüştürmek için Ghostscript veya online araçlar kullanabilirsiniz.",parent=self.master)
+        try:
+            if fp.lower().endswith(".eps"): self.canvas.postscript(colormode='color',file=fp); self.log_message(f"Ağ görseli EPS olarak kaydedildi: {fp}"); messagebox.showinfo("Başarılı",f"Ağ görseli {fp} adresine kaydedildi.\nEPS'yi PNG'ye dönüştürmek için Ghostscript veya online araçlar kullanabilirsiniz.",parent=self.master); return
+            t0=time.perf_counter(); info=export_diagram(self.network,fp,show_weights=self.show_weights_on_canvas_var.get(),show_biases=self.show_biases_on_canvas_var.get(),show_values=self.show_neuron_values_on_canvas_var.get())
+            self.log_message(f"Ağ görseli {info['format'].upper()} olarak kaydedildi: {fp} ({info['neurons']} nöron, {info['connections']} bağlantı, {(time.perf_counter()-t0)*1e3:.1f} ms)")
         except Exception as e: messagebox.showerror("Kaydetme Hatası",f"Görsel kaydedilirken: {e}",parent=self.master)
 
     def save_network_with_state(self):
         if not self.network or not self.network.weights: messagebox.showinfo("Bilgi","Kaydedilecek ağ yok.",parent=self.master); return
         fp=filedialog.asksaveasfilename(title="Ağı ve Eğitim Durumunu Kaydet",defaultextension=".json",filetypes=(("JSON Dosyaları","*.json"),("Tüm Dosyalar","*.*")),parent=self.master)
         if not fp: return
-        state_data={"input_size":self.input_size_var.get(),"layer_configs_full":self.network.layer_configs,"weights":self.network.weights,"biases":self.network.biases,"loss_function":self.loss_function_var.get(),
-            "training_state":{"epoch_losses":self.current_epoch_losses,"epoch_accuracies":self.current_epoch_accuracies,"total_epochs_completed":self.epochs_var.get(),
-                              "optimizer_adam_t":self.network.adam_t, "optimizer_velocity_W": self.network.velocity_W, "optimizer_velocity_b":self.network.velocity_b,
-                              "optimizer_m_W":self.network.m_W, "optimizer_v_W":self.network.v_W, "optimizer_m_b":self.network.m_b, "optimizer_v_b":self.network.v_b},
-            "optimizer_state":{"type":self.optimizer_var.get(),"adam_t":self.network.adam_t,"velocity_W":self.network.velocity_W,"velocity_b":self.network.velocity_b,"m_W":self.network.m_W,"v_W":self.network.v_W,"m_b":self.network.m_b,"v_b":self.network.v_b}}
         try: 
-            with open(fp,'w') as f: json.dump(state_data,f,indent=2); self.log_message(f"Ağ ve eğitim durumu kaydedildi: {fp}")
+            save_checkpoint(fp,self._build_current_checkpoint()); self.last_checkpoint_path=fp; self.log_message(f"Ağ ve eğitim durumu kaydedildi: {fp} ({self.total_epochs_completed} epoch)")
         except Exception as e: 
             messagebox.showerror("Kaydetme Hatası",f"Ağ kaydedilirken: {e}",parent=self.master)
 
+    def _build_current_checkpoint(self):
+        # Topluluk eğrileri gösteriliyorsa ana ağın kendi geçmişi yazılır; örnekleyici henüz kullanılmadıysa yüklenen durum korunur.
+        losses,accuracies=self._main_history if self.ensemble_loss_band is not None and self._main_history else (self.current_epoch_losses,self.current_epoch_accuracies)
+        sampler_state=self.epoch_sampler.state_dict() if self.epoch_sampler else self._pending_sampler_state
+        return build_checkpoint(self.network,self.input_size_var.get(),self.loss_function_var.get(),self.optimizer_var.get(),losses,accuracies,self.total_epochs_completed,sampler_state,self.lr_var.get())
+
+    def _autosave_checkpoint(self):
+        try: save_checkpoint(self.last_checkpoint_path,self._build_current_checkpoint()); self.log_message(f"Otomatik kayıt: {self.last_checkpoint_path} ({self.total_epochs_completed} epoch)")
+        except Exception as e: self.log_message(f"Otomatik kayıt başarısız: {e}")
+
+    def _get_epoch_sampler(self, n_samples):
+        # Veri boyutu değişmedikçe aynı örnekleyici sürdürülür; kayıttan gelen durum yalnızca örnek sayısı eşleşirse kullanılır.
+        if self.epoch_sampler is not None and self.epoch_sampler.n_samples==n_samples: return self.epoch_sampler
+        if self._pending_sampler_state:
+            try: self.epoch_sampler=EpochSampler.from_state(self._pending_sampler_state,n_samples); self.log_message(f"Örnek sırası kayıttan sürdürülüyor (epoch {self.epoch_sampler.epoch}, konum {self.epoch_sampler.position}).")
+            except ValueError as e: self.log_message(f"Uyarı: {e} Yeni örnek sırası kullanılacak."); self.epoch_sampler=None
+            self._pending_sampler_state=None
+            if self.epoch_sampler is not None: return self.epoch_sampler
+        self.epoch_sampler=EpochSampler(n_samples); return self.epoch_sampler
+
+    def _restore_main_history(self):
+        # Topluluk eğitiminin ortalama eğrileri gösteriliyorsa ana ağın geçmişine dönülür (yeni epoch'lar ona eklenir).
+        if self.ensemble_loss_band is not None:
+            self.current_epoch_losses,self.current_epoch_accuracies=self._main_history or ([],[]); self.ensemble_loss_band,self._main_history=None,None
+
+    def _get_snapshot_store(self):
+        # Aralık 0 ise None; ayarlar her eğitimde güncellenir (biçim görüntü başına kaydedildiği için karışık olabilir).
+        every=self.snapshot_every_var.get()
+        if every<=0: return None
+        if self.snapshot_store is None:
+            self._snapshot_dir=tempfile.TemporaryDirectory(prefix="ag_goruntuleri_"); self.snapshot_store=SnapshotStore(self._snapshot_dir.name,every,residual_format=self.snapshot_format_var.get())
+        self.snapshot_store.every,self.snapshot_store.residual_format=every,self.snapshot_format_var.get()
+        return self.snapshot_store
+
+    def _clear_snapshots(self):
+        if self.snapshot_store is not None: self.snapshot_store.clear()
+        self._live_params=None; self._update_snapshot_slider()
+
+    def _update_snapshot_slider(self):
+        epochs=self.snapshot_store.epochs() if self.snapshot_store else []
+        if hasattr(self,"snapshot_live_button"): self.snapshot_live_button.config(state=tk.NORMAL if self._live_params is not None else tk.DISABLED)
+        if not hasattr(self,"snapshot_scale"): return
+        if not epochs: self.snapshot_scale.config(from_=0,to=0,state=tk.DISABLED); self.snapshot_label.config(text="Zaman çizelgesi: -"); return
+        self.snapshot_scale.config(state=tk.NORMAL,from_=epochs[0],to=epochs[-1],resolution=self.snapshot_store.every); self.snapshot_scale.set(epochs[-1])
+        self.snapshot_label.config(text=f"Zaman çizelgesi ({len(epochs)} görüntü):")
+
+    def load_snapshot_epoch(self, epoch=None):
+        # Kaydırıcıdaki (veya verilen) epoch'a en yakın görüntü ağa yüklenir; güncel parametreler ilk yüklemede saklanır.
+        store=self.snapshot_store
+        if not store or not store.entries or not self.network.weights: return
+        target=self.snapshot_scale.get() if epoch is None else epoch; epoch=min(store.epochs(),key=lambda e: abs(e-target))
+        try:
+            if self._live_params is None: weights,biases=self.network.get_full_precision_params(); self._live_params=(to_plain(weights),to_plain(biases))
+            t0=time.perf_counter(); entry=store.apply(self.network,epoch); elapsed=(time.perf_counter()-t0)*1e3
+        except (OSError,ValueError) as e: messagebox.showerror("Zaman Çizelgesi",f"Epoch {epoch} yüklenemedi: {e}",parent=self.master); return
+        self.snapshot_scale.set(epoch); self.snapshot_live_button.config(state=tk.NORMAL)
+        kind="anahtar kare" if entry["kind"]=="key" else f"{entry['format']} fark"
+        self.snapshot_label.config(text=f"Epoch {epoch} ({kind}):"); self.log_message(f"Epoch {epoch} ağırlıkları yüklendi ({kind}, {elapsed:.1f} ms)"+(f", o epoch'taki kayıp {entry['info']['loss']:.6f}" if "loss" in entry["info"] else ""))
+        self._populate_weights_biases_editor(); self.draw_network_on_canvas()
+
+    def restore_live_params(self):
+        if self._live_params is None: return
+        for l,(W,b) in enumerate(zip(*self._live_params)): self.network.set_layer_biases(l,b); self.network.set_layer_weights(l,W)
+        self._live_params=None; self._update_snapshot_slider(); self.log_message("Güncel ağırlıklara dönüldü.")
+        self._populate_weights_biases_editor(); self.draw_network_on_canvas()
+
+    def export_quantized_model(self):
+        # Eğitim sonrası int8 nicemleme: yüklü veri setinden kalibrasyon, kaydetme ve float ağa karşı rapor.
+        if not self.network or not self.network.weights: messagebox.showinfo("Bilgi","Dışa aktarılacak ağ yok.",parent=self.master); return
+        try: X_data,Y_data=self._get_training_data()
+        except ValueError as e: messagebox.showerror("Giriş Hatası",f"Kalibrasyon verisi: {e}",parent=self.master); return
+        fp=filedialog.asksaveasfilename(title="Int8 Nicemlenmiş Modeli Kaydet",defaultextension=".json",initialfile="model_int8.json",filetypes=(("JSON Dosyaları","*.json"),("Tüm Dosyalar","*.*")),parent=self.master)
+        if not fp: return
+        try:
+            model=quantize_network(self.network,X_data,DEFAULT_CALIBRATION_SAMPLES)
+            report=quantization_report(self.network,model,X_data,Y_data); save_quantized_model(fp,model)
+            self.log_message(f"\nInt8 model kaydedildi: {fp} ({model.calibration['samples']} örnekle kalibre edildi)",True)
+            for line in format_quantization_report(report): self.log_message(line)
+            metrics={"Int8 Çıktı Farkı (Ort.)":report["mean_abs_error"],"Int8 Çıktı Farkı (En Büyük)":report["max_abs_error"],"Float Kayıp":report["float_loss"],"Int8 Kayıp":report["int8_loss"]}
+            if report["agreement"] is not None: metrics["Int8 Sınıf Uyumu"]=report["agreement"]
+            if report["int8_accuracy"] is not None: metrics["Float Doğruluk"]=report["float_accuracy"]; metrics["Int8 Doğruluk"]=report["int8_accuracy"]
+            metrics.update({f"Int8 {key}":value for key,value in report["int8_metrics"].items() if "Macro" in key})
+            self.update_metrics_display(metrics)
+            if report["int8_confusion"] is not None: self._display_text_confusion_matrix(report["int8_confusion"],[f"S{i}" for i in range(model.output_size)])
+        except Exception as e: messagebox.showerror("Dışa Aktarma Hatası",f"Int8 model: {e}",parent=self.master); import traceback; traceback.print_exc()
+
     def load_network_with_state(self):
         fp=filedialog.askopenfilename(title="Ağ ve Eğitim Durumunu Yükle (.json)",filetypes=(("JSON","*.json"),("Tüm Dosyalar","*.*")),parent=self.master)
         if not fp: return
         try:
-            with open(fp,'r') as f: data=json.load(f)
+            data=load_checkpoint(fp)
             self.input_size_var.set(data["input_size"]); self.loss_function_var.set(data.get("loss_function","mean_squared_error"))
-            training_state_loaded=data.get("training_state")
+            dtype,master_weights=get_checkpoint_precision(data); self.precision_var.set(dtype); self.master_weights_var.set(master_weights)
+            training_state_loaded=get_checkpoint_training_state(data) if data.get("training_state") else None
             self.build_and_draw_network(data["weights"],data["biases"],data.get("layer_configs_full",data.get("layer_configs")),training_state=training_state_loaded)
-            opt_state=data.get("optimizer_state") 
-            if not opt_state and training_state_loaded : opt_state={key.replace("optimizer_",""):val for key,val in training_state_loaded.items() if key.startswith("optimizer_")}
-            
+            if training_state_loaded:
+                if "learning_rate" in training_state_loaded: self.lr_var.set(training_state_loaded["learning_rate"])
+                if "python_rng_state" in training_state_loaded: random.setstate(rng_state_from_json(training_state_loaded["python_rng_state"]))
+            opt_state=get_checkpoint_optimizer_state(data)
             if opt_state and self.network: 
-                self.optimizer_var.set(opt_state.get("type","sgd")); self.network.adam_t=opt_state.get("adam_t",0)
-                for attr in ["velocity_W","velocity_b","m_W","v_W","m_b","v_b"]:
-                    val=opt_state.get(attr)
-                    if val is not None and hasattr(self.network,attr) and len(val)==len(getattr(self.network,attr)): setattr(self.network,attr,val)
+                self.optimizer_var.set(opt_state.get("type","sgd")); apply_optimizer_state(self.network,opt_state)
                 self.log_message("Optimizer durumu da yüklendi.")
-            self.log_message(f"Ağ ve eğitim durumu yüklendi: {fp}")
+            normalizer=normalizer_from_checkpoint(data); self.network.set_input_normalizer(normalizer)
+            self.normalization_var.set(NORMALIZATION_DISPLAY_NAMES[normalizer.mode if normalizer else "none"])
+            if normalizer: self.log_message(format_normalizer(normalizer))
+            if data.get("pruning") and self.network:
+                apply_checkpoint_pruning(self.network,data); self.draw_network_on_canvas()
+                report=sparsity_report(self.network); kept,total=sum(l["kept"] for l in report),sum(l["total"] for l in report)
+                self.log_message(f"Budama maskeleri de yüklendi: {kept}/{total} bağlantı.")
+            self.last_checkpoint_path=fp; self.log_message(f"Ağ ve eğitim durumu yüklendi: {fp}")
         except Exception as e: messagebox.showerror("Yükleme Hatası",f"Ağ yüklenirken: {e}",parent=self.master); import traceback; traceback.print_exc()
\ No newline at end of file
@@ -0,0 +1,142 @@
+# Eğitilmiş ağlar için arayüzsüz çıkarım çalışma zamanı. "Ağı Kaydet" ile
+# yazılan JSON kaydını yükler, girdi CSV'sini parçalar halinde okuyup toplu
+# ileri yayılımdan geçirir ve tahminleri (ham çıktılar, argmax sınıfı, softmax
+# olasılıkları) çıktı CSV'sine yazar. quantization.py ile üretilmiş int8
+# modeller de aynı şekilde kullanılabilir. Kayıtta girdi normalizasyonu
+# istatistikleri varsa ham girdi aynı şekilde ölçeklenir. Tk/Matplotlib içe aktarmaz.
+#
+# Kullanım:
+#   python inference.py model.json girdi.csv tahmin.csv --chunk-size 2048
+
+import argparse
+import csv
+import sys
+import time
+from operator import mul
+
+from utils import ACTIVATION_VECTOR_FUNCTIONS, FAST_ACTIVATION_VECTOR_FUNCTIONS, predicted_class
+from data_io import load_checkpoint
+from pruning import SPARSE_DENSITY_THRESHOLD, make_gather
+from quantization import QuantizedModel, is_quantized_artifact
+from normalization import normalizer_from_checkpoint
+
+class InferenceModel:
+    # Durumsuz model: ağırlıklar sütun bazında (nöron başına gelen ağırlıklar) tutulur,
+    # böylece her nöronun z değeri tek bir sum(map(mul, ...)) ile hesaplanır. Seyrek
+    # katmanlarda sütun yalnızca sıfır olmayan ağırlıkları ve girdi indekslerini içerir.
+    # normalizer verilirse (kayıttaki "input_normalization") ham girdi önce ölçeklenir.
+    def __init__(self, input_size, layer_configs, weights, biases, fast_math=False, normalizer=None):
+        if len(weights) != len(layer_configs) or len(biases) != len(layer_configs): raise ValueError("Ağırlık/bias katman sayısı yapılandırmayla eşleşmiyor.")
+        self.input_size, self.layer_configs = input_size, [tuple(cfg) for cfg in layer_configs]
+        if normalizer is not None and normalizer.n_features != input_size: raise ValueError(f"Normalizasyon {normalizer.n_features} özellik için; ağ girişi {input_size}.")
+        self.normalizer = normalizer
+        table = FAST_ACTIVATION_VECTOR_FUNCTIONS if fast_math else ACTIVATION_VECTOR_FUNCTIONS
+        self.layers, prev = [], input_size
+        for i, ((num_neurons, activation_name), layer_weights, layer_biases) in enumerate(zip(self.layer_configs, weights, biases)):
+            if len(layer_weights) != prev or len(layer_biases) != num_neurons or any(len(row) != num_neurons for row in layer_weights):
+                raise ValueError(f"Katman {i+1} ağırlık boyutları ({len(layer_weights)}x{len(layer_weights[0]) if layer_weights else 0}) != beklenen ({prev}x{num_neurons}).")
+            columns = [tuple(float(row[j]) for row in layer_weights) for j in range(num_neurons)]
+            nonzero = sum(1 for col in columns for w in col if w != 0.0)
+            gathers = None
+            if prev and num_neurons and nonzero < SPARSE_DENSITY_THRESHOLD * prev * num_neurons:
+                kept = [[k for k, w in enumerate(col) if w != 0.0] for col in columns]
+                gathers, columns = [make_gather(idx) for idx in kept], [tuple(col[k] for k in idx) for col, idx in zip(columns, kept)]
+            self.layers.append((columns, [float(b) for b in layer_biases], table[activation_name][0], gathers))
+            prev = num_neurons
+        self.output_size, self.output_activation = prev, self.layer_configs[-1][1]
+
+    @classmethod
+    def from_checkpoint(cls, data, fast_math=False):
+        layer_configs = data.get("layer_configs_full", data.get("layer_configs"))
+        return cls(data["input_size"], layer_configs, data["weights"], data["biases"], fast_math, normalizer_from_checkpoint(data))
+
+    def _forward_row(self, row, return_logits=False):
+        a, z = row if self.normalizer is None else self.normalizer.transform(row), None
+        for columns, layer_biases, activation, gathers in self.layers:
+            if gathers is None: z = [sum(map(mul, a, col)) + b for col, b in zip(columns, layer_biases)]
+            else: z = [sum(map(mul, gather(a), col)) + b for gather, col, b in zip(gathers, columns, layer_biases)]
+            a = activation(z)
+        return (a, z) if return_logits else a
+
+    def predict_batch(self, rows):
+        # rows: girdi vektörleri listesi; her biri için son katman aktivasyonları döner.
+        for row in rows:
+            if len(row) != self.input_size: raise ValueError(f"Girdi boyutu ({len(row)}) ağ giriş boyutuyla ({self.input_size}) eşleşmiyor.")
+        return [self._forward_row(row) for row in rows]
+
+    def predict_batch_with_logits(self, rows):
+        # Softmax çıkışlı ağlarda ham çıktı olarak softmax öncesi z değerleri (logit) de döndürülür.
+        for row in rows:
+            if len(row) != self.input_size: raise ValueError(f"Girdi boyutu ({len(row)}) ağ giriş boyutuyla ({self.input_size}) eşleşmiyor.")
+        return [self._forward_row(row, True) for row in rows]
+
+    def has_class_output(self):
+        return self.output_size > 1 or self.output_activation == "sigmoid"
+
+def load_model(file_path, fast_math=False):
+    # quantization.py ile üretilmiş int8 dosyaları QuantizedModel olarak (aynı arayüzle) yüklenir.
+    data = load_checkpoint(file_path)
+    return QuantizedModel.from_artifact(data, fast_math) if is_quantized_artifact(data) else InferenceModel.from_checkpoint(data, fast_math)
+
+def iter_csv_chunks(file_path, num_inputs, chunk_size=1024, has_header=True, warn=None):
+    # (satır_no, x) çiftlerinden oluşan parçalar üretir; fazladan sütunlar (ör. hedef) yok sayılır.
+    # Hatalı satırlar atlanır ve (verildiyse) warn(mesaj) ile bildirilir.
+    with open(file_path, 'r', newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        if has_header: next(reader, None)
+        chunk = []
+        for idx, row in enumerate(reader):
+            try:
+                if len(row) < num_inputs: raise ValueError(f"{len(row)} sütun, {num_inputs} giriş bekleniyor")
+                chunk.append((idx + 1, [float(v) for v in row[:num_inputs]]))
+            except ValueError as ve:
+                if warn: warn(f"Uyarı: Satır {idx+1} atlanıyor: {ve}")
+                continue
+            if len(chunk) >= chunk_size: yield chunk; chunk = []
+        if chunk: yield chunk
+
+def prediction_header(model):
+    header = ["row"]
+    if model.output_activation == "softmax":
+        header += [f"logit_{j}" for j in range(model.output_size)] + [f"prob_{j}" for j in range(model.output_size)]
+    else: header += [f"out_{j}" for j in range(model.output_size)]
+    if model.has_class_output(): header.append("class")
+    return header
+
+def predict_csv(model, input_path, output_path, chunk_size=1024, has_header=True, warn=None, float_format="{:.8g}"):
+    # Girdi CSV'sini parça parça işler; bellek kullanımı veri boyutundan bağımsızdır.
+    # {"rows", "chunks", "seconds", "rows_per_second"} döndürür.
+    start, n_rows, n_chunks = time.perf_counter(), 0, 0
+    is_softmax, with_class, fmt = model.output_activation == "softmax", model.has_class_output(), float_format.format
+    with open(output_path, 'w', newline='', encoding='utf-8') as f_out:
+        writer = csv.writer(f_out)
+        writer.writerow(prediction_header(model))
+        for chunk in iter_csv_chunks(input_path, model.input_size, chunk_size, has_header, warn):
+            row_ids, rows = zip(*chunk)
+            if is_softmax:
+                for row_id, (probs, logits) in zip(row_ids, model.predict_batch_with_logits(rows)):
+                    writer.writerow([row_id] + [fmt(v) for v in logits] + [fmt(v) for v in probs] + [predicted_class(probs)])
+            else:
+                for row_id, outputs in zip(row_ids, model.predict_batch(rows)):
+                    writer.writerow([row_id] + [fmt(v) for v in outputs] + ([predicted_class(outputs)] if with_class else []))
+            n_rows += len(rows); n_chunks += 1
+    seconds = time.perf_counter() - start
+    return {"rows": n_rows, "chunks": n_chunks, "seconds": seconds, "rows_per_second": n_rows / seconds if seconds > 0 else 0.0}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaydedilmiş ağ ile toplu CSV tahmini")
+    parser.add_argument("model", help="'Ağı Kaydet' ile kaydedilmiş JSON dosyası veya int8 nicemlenmiş model")
+    parser.add_argument("input", help="Girdi CSV (ilk giriş_boyutu sütunu X olarak okunur)")
+    parser.add_argument("output", help="Tahminlerin yazılacağı CSV")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="Tek seferde işlenecek satır sayısı")
+    parser.add_argument("--no-header", action="store_true", help="Girdi CSV'sinde başlık satırı yok")
+    parser.add_argument("--fast-math", action="store_true", help="Yaklaşık (hızlı) sigmoid kullan")
+    args = parser.parse_args(argv)
+    if args.chunk_size <= 0: parser.error("--chunk-size pozitif olmalı")
+    model = load_model(args.model, args.fast_math)
+    stats = predict_csv(model, args.input, args.output, args.chunk_size, not args.no_header, warn=lambda msg: print(msg, file=sys.stderr))
+    print(f"{stats['rows']} satır {stats['seconds']:.3f} s içinde tahmin edildi ({stats['rows_per_second']:.0f} satır/s): {args.output}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+# prediction_server.py için yerel yük üreticisi. Belirtilen eşzamanlılıkta
+# kalıcı (keep-alive) bağlantılarla rastgele girdiler gönderir; istemci
+# tarafı verim ve gecikme yüzdeliklerini, ardından sunucunun /stats
+# sayaçlarını (ortalama mikro-toplama boyutu dahil) yazdırır.
+#
+# Kullanım:
+#   python load_generator.py --model iris --concurrency 16 --requests 5000
+#   python load_generator.py --unix /tmp/nn.sock --model iris --duration 10
+
+import argparse
+import http.client
+import json
+import random
+import socket
+import sys
+import threading
+import time
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=30):
+        super().__init__("localhost", timeout=timeout); self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM); self.sock.settimeout(self.timeout); self.sock.connect(self.socket_path)
+
+def open_connection(host, port, unix_socket=None, timeout=30):
+    return UnixHTTPConnection(unix_socket, timeout) if unix_socket else http.client.HTTPConnection(host, port, timeout=timeout)
+
+def request_json(conn, method, path, payload=None):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else None
+    conn.request(method, path, body=body, headers={"Content-Type": "application/json"} if body else {})
+    response = conn.getresponse(); data = response.read()
+    return response.status, json.loads(data) if data else None
+
+def percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))] if sorted_values else 0.0
+
+def run_load(host, port, model, unix_socket=None, concurrency=8, total_requests=1000, duration=None, rows_per_request=1, seed=0):
+    # total_requests istek (veya duration saniye) boyunca concurrency iş parçacığıyla yük üretir.
+    conn = open_connection(host, port, unix_socket)
+    status, models = request_json(conn, "GET", "/models"); conn.close()
+    if status != 200 or model not in models: raise ValueError(f"Model sunucuda bulunamadı: {model} (mevcut: {', '.join(models or [])})")
+    input_size = models[model]["input_size"]
+    latencies, errors, lock = [], [0], threading.Lock()
+    counter = iter(range(total_requests)) if duration is None else None
+    deadline = time.perf_counter() + duration if duration is not None else None
+
+    def worker(worker_idx):
+        rng = random.Random(seed + worker_idx); local_latencies, local_errors = [], 0
+        conn = open_connection(host, port, unix_socket)
+        try:
+            while True:
+                if deadline is not None:
+                    if time.perf_counter() >= deadline: break
+                else:
+                    with lock:
+                        if next(counter, None) is None: break
+                payload = {"inputs": [[rng.uniform(-1.0, 1.0) for _ in range(input_size)] for _ in range(rows_per_request)]}
+                t0 = time.perf_counter()
+                try:
+                    status, _ = request_json(conn, "POST", f"/predict/{model}", payload)
+                    if status != 200: local_errors += 1
+                except (OSError, http.client.HTTPException):
+                    local_errors += 1; conn.close(); conn = open_connection(host, port, unix_socket)
+                local_latencies.append(time.perf_counter() - t0)
+        finally: conn.close()
+        with lock: latencies.extend(local_latencies); errors[0] += local_errors
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    conn = open_connection(host, port, unix_socket)
+    try: _, server_stats = request_json(conn, "GET", "/stats")
+    finally: conn.close()
+    return {"requests": len(latencies), "errors": errors[0], "seconds": elapsed, "rows_per_request": rows_per_request, "concurrency": concurrency,
+            "requests_per_second": len(latencies) / elapsed if elapsed > 0 else 0.0,
+            "rows_per_second": len(latencies) * rows_per_request / elapsed if elapsed > 0 else 0.0,
+            "latency_p50_ms": percentile(latencies, 0.50) * 1000.0, "latency_p95_ms": percentile(latencies, 0.95) * 1000.0,
+            "latency_p99_ms": percentile(latencies, 0.99) * 1000.0, "server": (server_stats or {}).get(model, {})}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tahmin sunucusu için yerel yük üreticisi")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="TCP yerine bu Unix soketine bağlan")
+    parser.add_argument("--model", required=True, help="Sunucudaki model adı")
+    parser.add_argument("--concurrency", "-c", type=int, default=8, help="Eşzamanlı istemci sayısı")
+    parser.add_argument("--requests", "-n", type=int, default=1000, help="Toplam istek sayısı")
+    parser.add_argument("--duration", type=float, help="İstek sayısı yerine bu kadar saniye çalış")
+    parser.add_argument("--rows-per-request", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="Sonucu JSON olarak yazdır")
+    args = parser.parse_args(argv)
+    if args.concurrency <= 0 or args.requests <= 0 or args.rows_per_request <= 0: parser.error("Sayısal parametreler pozitif olmalı")
+    try: result = run_load(args.host, args.port, args.model, args.unix, args.concurrency, args.requests, args.duration, args.rows_per_request)
+    except (ValueError, OSError) as e: print(f"Hata: {e}", file=sys.stderr); return 1
+    if args.json: print(json.dumps(result, indent=2)); return 0
+    print(f"{result['requests']} istek ({result['errors']} hata), {result['seconds']:.2f} s, eşzamanlılık {result['concurrency']}")
+    print(f"Verim: {result['requests_per_second']:.0f} istek/s, {result['rows_per_second']:.0f} satır/s")
+    print(f"Gecikme (istemci): p50 {result['latency_p50_ms']:.2f} ms, p95 {result['latency_p95_ms']:.2f} ms, p99 {result['latency_p99_ms']:.2f} ms")
+    server = result["server"]
+    if server: print(f"Sunucu: {server['batches']} mikro-toplama, ortalama {server['mean_batch_rows']:.1f} satır/toplama, p99 {server['latency_p99_ms']:.2f} ms")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+# Ağ parametreleri, optimizer durumu, saklanan aktivasyonlar ve yüklü veri seti
+# için bellek hesabı. Kurulum/yükleme öncesi tahmini ayak izi, mevcut nesnelerin
+# ölçülen boyutu ve isteğe bağlı tracemalloc tepe takibi içerir.
+
+import struct
+import sys
+import tracemalloc
+from array import array
+from precision import PRECISIONS, DEFAULT_PRECISION
+
+FLOAT_BYTES = sys.getsizeof(0.0)
+POINTER_BYTES = struct.calcsize("P")
+LIST_HEADER_BYTES = sys.getsizeof([])
+INT_BYTES = sys.getsizeof(1 << 20)
+ARRAY_HEADER_BYTES = {precision: sys.getsizeof(array(typecode)) for precision, typecode in PRECISIONS.items() if typecode}
+
+MEMORY_CATEGORIES = ["weights", "biases", "master_weights", "velocity", "adam_m", "adam_v", "activations"]
+CATEGORY_DISPLAY_NAMES = {"weights": "Ağırlıklar", "biases": "Biaslar", "master_weights": "Ana kopya (float64)", "velocity": "Momentum hızı", "adam_m": "Adam m", "adam_v": "Adam v",
+                          "activations": "Aktivasyonlar (z,a)", "dataset": "Veri seti (X,Y)", "sampler_order": "Örnekleyici indeks sırası"}
+
+def vector_bytes(n, precision=DEFAULT_PRECISION):
+    # float64: Python float listesi, liste başlığı + işaretçiler + her eleman için ayrı float nesnesi (en kötü durum).
+    # float32: array('f') başlığı + eleman başına 4 bayt.
+    typecode = PRECISIONS[precision]
+    if typecode: return ARRAY_HEADER_BYTES[precision] + n * array(typecode).itemsize
+    return LIST_HEADER_BYTES + n * (POINTER_BYTES + FLOAT_BYTES)
+
+def matrix_bytes(rows, cols, precision=DEFAULT_PRECISION):
+    return LIST_HEADER_BYTES + rows * POINTER_BYTES + rows * vector_bytes(cols, precision)
+
+def optimizer_state_categories(optimizer_type=None):
+    # NeuralNetwork yalnızca seçili optimizer'ın durum tensörlerini ayırır.
+    return {"momentum": ["velocity"], "adam": ["adam_m", "adam_v"]}.get(optimizer_type, [])
+
+def predict_network_footprint(input_size, layer_configs, optimizer_type=None, precision=DEFAULT_PRECISION, keep_master_weights=False):
+    layers, totals = [], {cat: 0 for cat in MEMORY_CATEGORIES}
+    state_categories = optimizer_state_categories(optimizer_type)
+    keep_master_weights = keep_master_weights and precision != DEFAULT_PRECISION
+    prev = input_size; totals["activations"] += vector_bytes(input_size, precision)
+    for i, (num_neurons, _) in enumerate(layer_configs):
+        entry = {"layer": i, "shape": (prev, num_neurons), "weights": matrix_bytes(prev, num_neurons, precision), "biases": vector_bytes(num_neurons, precision),
+                 "master_weights": matrix_bytes(prev, num_neurons) + vector_bytes(num_neurons) if keep_master_weights else 0,
+                 "activations": 2 * vector_bytes(num_neurons, precision)}
+        for cat in ["velocity", "adam_m", "adam_v"]: entry[cat] = (matrix_bytes(prev, num_neurons, precision) + vector_bytes(num_neurons, precision)) if cat in state_categories else 0
+        for cat in MEMORY_CATEGORIES: totals[cat] += entry[cat]
+        layers.append(entry); prev = num_neurons
+    return {"layers": layers, "totals": totals, "total": sum(totals.values())}
+
+def predict_dataset_footprint(n_samples, n_inputs, n_outputs, precision=DEFAULT_PRECISION):
+    # GUI'deki X/Y listeleri ve EpochSampler'ın epoch sırası (indeks permütasyonu; veri kopyalanmaz). 256'dan büyük int'ler ayrı nesnedir.
+    dataset = 2 * (LIST_HEADER_BYTES + n_samples * POINTER_BYTES) + n_samples * (vector_bytes(n_inputs, precision) + vector_bytes(n_outputs, precision))
+    sampler_order = LIST_HEADER_BYTES + n_samples * (POINTER_BYTES + INT_BYTES)
+    return {"totals": {"dataset": dataset, "sampler_order": sampler_order}, "total": dataset + sampler_order}
+
+def measure_nested_bytes(obj, seen=None):
+    # İç içe liste/tuple yapılarının gerçek boyutu; paylaşılan nesneler bir kez sayılır.
+    if seen is None: seen = set()
+    if id(obj) in seen: return 0
+    seen.add(id(obj)); size = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple)):
+        for item in obj: size += measure_nested_bytes(item, seen)
+    return size
+
+def network_memory_report(network, dataset_X=None, dataset_Y=None):
+    # Mevcut ağ ve veri setinin ölçülen boyutları, katman ve kategori bazında.
+    seen, layers, totals = set(), [], {cat: 0 for cat in MEMORY_CATEGORIES}
+    sources = {"weights": [network.weights], "biases": [network.biases], "master_weights": [network.master_weights, network.master_biases],
+               "velocity": [network.velocity_W, network.velocity_b],
+               "adam_m": [network.m_W, network.m_b], "adam_v": [network.v_W, network.v_b]}
+    for i in range(len(network.weights)):
+        entry = {"layer": i, "shape": (len(network.weights[i]), len(network.biases[i]))}
+        for cat, containers in sources.items(): entry[cat] = sum(measure_nested_bytes(c[i], seen) for c in containers if i < len(c))
+        entry["activations"] = sum(measure_nested_bytes(c[idx], seen) for c, idx in ((network.neuron_outputs_z, i), (network.neuron_outputs_a, i + 1)) if idx < len(c) and c[idx] is not None)
+        for cat in MEMORY_CATEGORIES: totals[cat] += entry[cat]
+        layers.append(entry)
+    if network.neuron_outputs_a: totals["activations"] += measure_nested_bytes(network.neuron_outputs_a[0], seen)
+    report = {"layers": layers, "totals": totals}
+    if dataset_X is not None or dataset_Y is not None:
+        totals["dataset"] = measure_nested_bytes(dataset_X or [], seen) + measure_nested_bytes(dataset_Y or [], seen)
+    report["total"] = sum(totals.values())
+    return report
+
+def format_bytes(n_bytes):
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(n_bytes) < 1024 or unit == "GB": return f"{n_bytes:.0f} {unit}" if unit == "B" else f"{n_bytes:.2f} {unit}"
+        n_bytes /= 1024.0
+
+def format_memory_report(report, title="Bellek Raporu"):
+    lines = [title, "-" * len(title)]
+    if report.get("layers"):
+        header = f"{'Katman':<8} {'Boyut':<12} " + " ".join(f"{CATEGORY_DISPLAY_NAMES[c]:>20}" for c in MEMORY_CATEGORIES)
+        lines.append(header)
+        for entry in report["layers"]:
+            shape = f"{entry['shape'][0]}x{entry['shape'][1]}"
+            lines.append(f"{'L'+str(entry['layer']):<8} {shape:<12} " + " ".join(f"{format_bytes(entry[c]):>20}" for c in MEMORY_CATEGORIES))
+        lines.append("")
+    for cat, value in report["totals"].items(): lines.append(f"{CATEGORY_DISPLAY_NAMES.get(cat, cat):<28}: {format_bytes(value)}")
+    lines.append(f"{'TOPLAM':<28}: {format_bytes(report['total'])}")
+    return "\n".join(lines)
+
+class TracemallocPeakTracker:
+    # Eğitim sırasında Python bellek tahsislerinin tepe değerini izler (tracemalloc yavaşlatır, isteğe bağlıdır).
+    def __init__(self):
+        self.peak_bytes, self.epoch_peaks, self._started_here = 0, [], False
+
+    def start(self):
+        if not tracemalloc.is_tracing(): tracemalloc.start(); self._started_here = True
+        tracemalloc.reset_peak()
+
+    def mark_epoch(self):
+        _, peak = tracemalloc.get_traced_memory(); self.epoch_peaks.append(peak)
+        self.peak_bytes = max(self.peak_bytes, peak); tracemalloc.reset_peak()
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory(); self.peak_bytes = max(self.peak_bytes, peak)
+            if self._started_here: tracemalloc.stop()
+        self._started_here = False
+        return self.peak_bytes
@@ -0,0 +1,44 @@
+# Sınıflandırma metrikleri (karmaşıklık matrisi, sınıf bazında ve makro
+# ortalama precision/recall/F1) ve matrisin metin gösterimi. Arayüzden
+# bağımsızdır; GUI, nicemleme raporu ve komut satırı araçları ortak kullanır.
+
+def classification_metrics(all_true_one_hot, all_pred_probs, num_classes):
+    # (metrik sözlüğü, karmaşıklık matrisi) döndürür; satır = gerçek sınıf, sütun = tahmin.
+    if not all_true_one_hot or not all_pred_probs or num_classes == 0: return {}, None
+    all_true_classes = [row.index(max(row)) for row in all_true_one_hot if row and sum(row)>0]
+    all_pred_classes = [row.index(max(row)) for row in all_pred_probs if row]
+
+    if not all_true_classes or len(all_true_classes) != len(all_pred_classes): return {}, None
+
+    tp, fp, fn = [0] * num_classes, [0] * num_classes, [0] * num_classes
+    confusion_matrix = [[0 for _ in range(num_classes)] for _ in range(num_classes)]
+    for true_cls, pred_cls in zip(all_true_classes, all_pred_classes):
+        if 0 <= true_cls < num_classes and 0 <= pred_cls < num_classes:
+            confusion_matrix[true_cls][pred_cls] += 1
+            if true_cls == pred_cls: tp[true_cls] += 1
+            else: fp[pred_cls] += 1; fn[true_cls] += 1
+
+    precision, recall, f1 = [0.0] * num_classes, [0.0] * num_classes, [0.0] * num_classes
+    for i in range(num_classes):
+        precision[i] = tp[i] / (tp[i] + fp[i]) if (tp[i] + fp[i]) > 0 else 0.0
+        recall[i] = tp[i] / (tp[i] + fn[i]) if (tp[i] + fn[i]) > 0 else 0.0
+        f1[i] = 2 * (precision[i] * recall[i]) / (precision[i] + recall[i]) if (precision[i] + recall[i]) > 0 else 0.0
+
+    metrics = {
+        "Precision (Macro Avg)": sum(precision) / num_classes if num_classes > 0 else 0.0,
+        "Recall (Macro Avg)": sum(recall) / num_classes if num_classes > 0 else 0.0,
+        "F1-score (Macro Avg)": sum(f1) / num_classes if num_classes > 0 else 0.0,
+    }
+    for i in range(num_classes): metrics[f"F1_Sınıf{i}"] = f1[i]
+    return metrics, confusion_matrix
+
+def format_confusion_matrix(cm, class_names=None):
+    num_classes = len(cm)
+    if class_names is None: class_names = [f"S{i}" for i in range(num_classes)]
+    header = "Gerçek\\Tahmin | " + " | ".join(f"{name:^5}" for name in class_names) + "\n"
+    separator = "-" * (len(header) -1) + "\n"
+    cm_str = header + separator
+    for i in range(num_classes):
+        row_str = f"{class_names[i]:<12} | " + " | ".join(f"{cm[i][j]:^5d}" for j in range(num_classes)) + "\n"
+        cm_str += row_str
+    return cm_str
@@ -0,0 +1,126 @@
+# Ağırlıkları koruyarak mimari dönüştürme (Net2Net tarzı). Eğitilmiş bir ağı
+# büyütmek için baştan eğitmek yerine ağ, çıktısını değiştirmeyen işlemlerle
+# yeni mimariye taşınır ve eğitime kalınan yerden devam edilir:
+#  - Genişletme (widen): gizli katmana yeni nöronlar eklenir; her yeni nöron
+#    var olan bir nöronun gelen ağırlıklarını ve biasını kopyalar. Kopyaların
+#    sonraki katmana giden ağırlıkları, toplamı 1 olan rastgele pozitif
+#    paylarla bölünür; çıktı aynı kalır, farklı paylar simetriyi kırar.
+#  - Derinleştirme (deepen): gizli katmandan sonra birim (W = I, b = 0) katman
+#    eklenir. "linear" her yerde, "relu" yalnızca negatif olmayan çıktılı
+#    (relu/sigmoid) katmandan sonra fonksiyonu korur.
+# Optimizer durumu (momentum/Adam) taşınır: giden satırların gradyanı değişmez,
+# bölünen nöronun gelen gradyanı payı (α) ile ölçeklenir (m, velocity × α;
+# v × α²); yeni birim katmanın durumu sıfırdır. adam_t korunur.
+
+import random
+
+from neural_network import OPTIMIZER_STATE_ATTRS
+from precision import to_plain
+
+MORPH_DEEPEN_ACTIVATIONS = ("linear", "relu")
+NONNEGATIVE_ACTIVATIONS = ("relu", "sigmoid")
+
+def _extract(network):
+    # Ağın float64 düz kopyası: mimari, parametreler ve optimizer durumu.
+    if not network.weights: raise ValueError("Dönüştürülecek ağ yok.")
+    if any(sparse is not None for sparse in network.sparse_layers): raise ValueError("Budanmış ağ dönüştürülemez; önce budamayı kaldırın.")
+    weights, biases = network.get_full_precision_params()
+    opt = network.get_optimizer_state()
+    state = {"input_size": len(network.weights[0]), "configs": [tuple(cfg) for cfg in network.layer_configs],
+             "weights": [[[float(w) for w in row] for row in W] for W in weights], "biases": [[float(v) for v in b] for b in biases],
+             "state_type": network.optimizer_state_type, "adam_t": opt.get("adam_t", 0)}
+    state["opt"] = {attr: to_plain(opt[attr]) for attr in OPTIMIZER_STATE_ATTRS.get(network.optimizer_state_type) or []}
+    return state
+
+def _apply(network, state):
+    network.configure_network(state["input_size"], [tuple(cfg) for cfg in state["configs"]], state["weights"], state["biases"],
+                              precision=network.precision, keep_master_weights=network.keep_master_weights)
+    if state["opt"]: network.load_optimizer_state(dict(state["opt"], state_type=state["state_type"], adam_t=state["adam_t"]))
+
+def _widen(state, layer, new_width, rng):
+    configs = state["configs"]
+    if not 0 <= layer < len(configs) - 1: raise ValueError(f"Yalnızca gizli katmanlar genişletilebilir (katman {layer + 1}).")
+    n = configs[layer][0]
+    if new_width <= n: raise ValueError(f"Yeni genişlik ({new_width}) mevcut genişlikten ({n}) büyük olmalı.")
+    mapping = list(range(n)) + [rng.randrange(n) for _ in range(new_width - n)]
+    shares = [1.0] * new_width
+    for source in set(mapping[n:]):
+        copies = [j for j, g in enumerate(mapping) if g == source]
+        raw = [rng.uniform(0.5, 1.5) for _ in copies]; total = sum(raw)
+        for j, r in zip(copies, raw): shares[j] = r / total
+    extend = lambda row: row + [row[g] for g in mapping[n:]]  # gelen sütunlar / bias
+    state["weights"][layer] = [extend(row) for row in state["weights"][layer]]
+    state["biases"][layer] = extend(state["biases"][layer])
+    state["weights"][layer + 1] = [[w * shares[j] for w in state["weights"][layer + 1][g]] for j, g in enumerate(mapping)]
+    for attr, tensors in state["opt"].items():
+        scale = [s * s for s in shares] if attr.startswith("v_") else shares  # v ikinci moment: α²
+        if attr.endswith("_W"):
+            tensors[layer] = [[v * f for v, f in zip(extend(row), scale)] for row in tensors[layer]]
+            tensors[layer + 1] = [list(tensors[layer + 1][g]) for g in mapping]
+        else: tensors[layer] = [v * f for v, f in zip(extend(tensors[layer]), scale)]
+    configs[layer] = (new_width, configs[layer][1])
+
+def _deepen(state, after, activation):
+    # after: yeni katmanın ardından geleceği gizli katman indisi (-1 = girişten hemen sonra).
+    configs = state["configs"]
+    if not -1 <= after < len(configs) - 1: raise ValueError(f"Geçersiz ekleme konumu: {after + 1}")
+    if activation not in MORPH_DEEPEN_ACTIVATIONS: raise ValueError(f"Birim katman '{activation}' aktivasyonuyla fonksiyonu korumaz (desteklenen: {', '.join(MORPH_DEEPEN_ACTIVATIONS)}).")
+    if activation == "relu" and (after < 0 or configs[after][1] not in NONNEGATIVE_ACTIVATIONS):
+        raise ValueError("relu birim katman yalnızca relu/sigmoid katmandan sonra eklenebilir (negatif girdiler kırpılır).")
+    n = state["input_size"] if after < 0 else configs[after][0]
+    identity = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    state["weights"].insert(after + 1, identity); state["biases"].insert(after + 1, [0.0] * n)
+    for attr, tensors in state["opt"].items():
+        tensors.insert(after + 1, [[0.0] * n for _ in range(n)] if attr.endswith("_W") else [0.0] * n)
+    configs.insert(after + 1, (n, activation))
+
+def plan_morph(input_size, current_configs, target_configs):
+    # Hedef gizli katmanları mevcutlarla sırayla eşleştirir (aynı aktivasyon, genişlik ≥). Eşleşmeyen hedef katmanı
+    # birim katman (+ gerekirse genişletme) olarak eklenir. İşlemler: ("deepen", sonrasına eklenecek katman, aktivasyon)
+    # ve ("widen", katman, genişlik); katman indisleri o işlem anındaki ağa göredir. Aktivasyon kısıtları uygulamada denetlenir.
+    current, target = [tuple(c) for c in current_configs], [tuple(c) for c in target_configs]
+    if not current or not target: raise ValueError("Katman yapılandırması boş.")
+    if current[-1] != target[-1]: raise ValueError(f"Çıkış katmanı değişemez: {current[-1]} → {target[-1]}")
+    hidden, ops, width, i = current[:-1], [], input_size, 0  # width: son yerleşen katmanın genişliği
+    for l, (size, act) in enumerate(target[:-1]):
+        if i < len(hidden) and hidden[i][1] == act:
+            if hidden[i][0] > size: raise ValueError(f"Katman {l + 1} daraltılamaz: {hidden[i][0]} → {size} nöron")
+            if hidden[i][0] < size: ops.append(("widen", l, size))
+            i += 1
+        else:
+            if size < width: raise ValueError(f"Eklenen katman {l + 1} önceki katmandan ({width} nöron) dar olamaz: {size} nöron")
+            ops.append(("deepen", l - 1, act))
+            if size > width: ops.append(("widen", l, size))
+        width = size
+    if i < len(hidden): raise ValueError(f"Katman kaldırılamaz: {len(hidden)} gizli katmandan yalnızca {i} tanesi hedefte eşleşti.")
+    return ops
+
+def widen_layer(network, layer, new_width, rng=None):
+    # Gizli katmanı new_width nörona genişletir (ağ yerinde değişir).
+    state = _extract(network); _widen(state, layer, new_width, rng or random.Random(0)); _apply(network, state)
+
+def deepen_network(network, after, activation="linear"):
+    # after. gizli katmandan sonra (-1: girişten sonra) birim katman ekler (ağ yerinde değişir).
+    state = _extract(network); _deepen(state, after, activation); _apply(network, state)
+
+def morph_network(network, target_configs, rng=None, check_inputs=None):
+    # Ağı target_configs mimarisine taşır. Tüm işlemler önce kopya üzerinde denenir; hata olursa ağ değişmez.
+    # check_inputs verilirse dönüşüm öncesi/sonrası çıktıların en büyük mutlak farkı raporlanır.
+    state, rng = _extract(network), rng or random.Random(0)
+    before_params = sum(len(W) * len(W[0]) + len(b) for W, b in zip(state["weights"], state["biases"]))
+    ops = plan_morph(state["input_size"], state["configs"], target_configs)
+    for op, layer, arg in ops:
+        if op == "widen": _widen(state, layer, arg, rng)
+        else: _deepen(state, layer, arg)
+    before = [network.predict(x) for x in check_inputs or []]
+    _apply(network, state)
+    after = [network.predict(x) for x in check_inputs or []]
+    return {"ops": ops, "params_before": before_params, "params_after": sum(len(W) * len(W[0]) + len(b) for W, b in zip(state["weights"], state["biases"])),
+            "max_output_diff": max((abs(p - q) for ra, rb in zip(before, after) for p, q in zip(ra, rb)), default=0.0), "checked": len(before)}
+
+def format_morph_report(report):
+    names = {"widen": lambda l, n: f"katman {l + 1} genişletildi → {n} nöron", "deepen": lambda l, act: f"katman {l + 1} sonrasına birim {act} katman eklendi" if l >= 0 else f"girişten sonra birim {act} katman eklendi"}
+    lines = [f"Ağ dönüştürüldü: {report['params_before']} → {report['params_after']} parametre (ağırlıklar ve optimizer durumu korundu)"]
+    lines += [f"  {names[op](layer, arg)}" for op, layer, arg in report["ops"]] or ["  Mimari zaten aynı; değişiklik yok."]
+    if report["checked"]: lines.append(f"  {report['checked']} örnekte en büyük çıktı farkı: {report['max_output_diff']:.3g}")
+    return lines
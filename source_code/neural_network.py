@@ -6,14 +6,26 @@ import math
 import random
 from utils import (
     ACTIVATION_FUNCTIONS, LOSS_FUNCTIONS,
+    ACTIVATION_VECTOR_FUNCTIONS, FAST_ACTIVATION_VECTOR_FUNCTIONS,
     multiply_row_vector_matrix, add_vectors, subtract_vectors,
     elementwise_multiply_vectors, transpose_matrix,
-    multiply_scalar_vector, multiply_scalar_matrix,
-    add_matrices, subtract_matrices
+    multiply_scalar_vector, multiply_scalar_matrix
 )
+from profiler import Profiler
+from precision import DEFAULT_PRECISION, validate_precision, cast_vector, cast_matrix, copy_vector
+from compiler import network_signature, can_compile, get_compiled_network, verify_against_reference
+from pruning import SparseLayer
+from prediction_cache import PredictionCache
+from events import ALL_EVENTS, NO_EVENTS, EventBus
+from forward_context import ParameterSnapshot
+from checkpointing import checkpoint_interval
+
+# Her optimizer'ın ihtiyaç duyduğu durum tensörleri; yalnızca bunlar ayrılır.
+OPTIMIZER_STATE_ATTRS = {"sgd": [], "momentum": ["velocity_W", "velocity_b"], "adam": ["m_W", "v_W", "m_b", "v_b"]}
+ALL_OPTIMIZER_STATE_ATTRS = ["velocity_W", "velocity_b", "m_W", "v_W", "m_b", "v_b"]
 
 class NeuralNetwork:
-    def __init__(self, loss_function_name="mean_squared_error"):
+    def __init__(self, loss_function_name="mean_squared_error", profiler=None):
         self.layer_configs = [] 
         self.weights = [] 
         self.biases = []  
@@ -25,6 +37,24 @@ class NeuralNetwork:
         self.velocity_W, self.velocity_b = [], []
         self.m_W, self.v_W, self.m_b, self.v_b = [], [], [], []
         self.adam_t = 0 
+        self.optimizer_state_type = None
+        self.fast_math = False
+        self.precision = DEFAULT_PRECISION
+        self.keep_master_weights = False
+        self.master_weights, self.master_biases = [], []
+        self.sparse_layers = []  # katman başına budanmış seyrek (CSR) gösterim veya None (yoğun)
+        self.param_version = 0  # ağırlık/bias her değiştiğinde artar; tahmin önbelleğinin anahtarı
+        self.layer_versions = []  # katman başına son değişikliğin param_version değeri (kirli katman takibi)
+        self.prediction_cache = PredictionCache()
+        self.events = EventBus()  # seçici olay aboneleri (subscribe/unsubscribe)
+        self.telemetry = None  # TrainingTelemetry; verilirse her optimizer güncellemesinde katman istatistikleri biriktirilir
+        self._snapshot = None  # son salt okunur parametre görüntüsü (snapshot())
+        self.checkpoint_every = 0  # aktivasyon checkpoint aralığı k (checkpointing.py); 0 kapalı, CHECKPOINT_AUTO ⌈√katman⌉
+        self.input_normalizer = None  # normalization.FeatureNormalizer; ayarlıysa ham girdi ileri yayılımdan önce ölçeklenir
+        self.use_compiled = True
+        self._compiled, self._compiled_signature, self._compiled_quick_key = None, None, None
+        self.compile_status = ""
+        self.profiler = profiler if profiler is not None else Profiler()
 
     def set_loss_function(self, loss_name):
         if loss_name in LOSS_FUNCTIONS:
@@ -32,20 +62,92 @@ class NeuralNetwork:
             self.loss_func, self.loss_derivative_func = LOSS_FUNCTIONS[loss_name]
         else: raise ValueError(f"Bilinmeyen kayıp fonksiyonu: {loss_name}")
 
-    def _initialize_optimizer_params(self, prev_layer_neuron_count, num_neurons):
-        self.velocity_W.append([[0.0 for _ in range(num_neurons)] for _ in range(prev_layer_neuron_count)])
-        self.velocity_b.append([0.0 for _ in range(num_neurons)])
-        self.m_W.append([[0.0 for _ in range(num_neurons)] for _ in range(prev_layer_neuron_count)])
-        self.v_W.append([[0.0 for _ in range(num_neurons)] for _ in range(prev_layer_neuron_count)])
-        self.m_b.append([0.0 for _ in range(num_neurons)])
-        self.v_b.append([0.0 for _ in range(num_neurons)])
+    def _zero_state_for_layer(self, attr, layer_idx):
+        if attr.endswith("_W"): return cast_matrix([[0.0 for _ in row] for row in self.weights[layer_idx]], self.precision)
+        return cast_vector([0.0 for _ in self.biases[layer_idx]], self.precision)
 
-    def configure_network(self, input_size, layer_configs_from_gui, custom_weights=None, custom_biases=None):
-        self.layer_configs = layer_configs_from_gui
-        self.weights, self.biases = [], []
+    def _cast_state(self, attr, value):
+        return cast_matrix(value, self.precision) if attr.endswith("_W") else cast_vector(value, self.precision)
+
+    def free_optimizer_state(self):
         self.velocity_W, self.velocity_b = [], []
         self.m_W, self.v_W, self.m_b, self.v_b = [], [], [], []
-        self.adam_t = 0
+        self.adam_t = 0; self.optimizer_state_type = None
+
+    def _allocate_optimizer_state(self, optimizer_type):
+        self.free_optimizer_state()
+        for attr in OPTIMIZER_STATE_ATTRS[optimizer_type]: setattr(self, attr, [self._zero_state_for_layer(attr, l) for l in range(len(self.weights))])
+        self.optimizer_state_type = optimizer_type
+
+    def _ensure_optimizer_state(self, optimizer_type, learning_rate, optimizer_params):
+        # Durum ilk adımda, seçili optimizer için ayrılır. Optimizer değiştiyse mevcut durum
+        # yaklaşık olarak dönüştürülür: momentum hızı v ≈ lr*g/(1-β) olduğundan Adam m ≈ v(1-β)/lr alınır,
+        # tersi için bias düzeltmeli m kullanılır. SGD durum tutmaz.
+        if optimizer_type not in OPTIMIZER_STATE_ATTRS: raise ValueError(f"Bilinmeyen optimizer: {optimizer_type}")
+        if optimizer_type == self.optimizer_state_type: return
+        previous_type, beta_momentum = self.optimizer_state_type, optimizer_params.get("beta", 0.9)
+        beta1_adam, beta2_adam = optimizer_params.get("beta1", 0.9), optimizer_params.get("beta2", 0.999)
+        if optimizer_type == "sgd" or previous_type in (None, "sgd") or learning_rate == 0:
+            if optimizer_type == "sgd": self.free_optimizer_state(); self.optimizer_state_type = "sgd"
+            else: self._allocate_optimizer_state(optimizer_type)
+            return
+        if previous_type == "momentum" and optimizer_type == "adam":
+            m_W = [multiply_scalar_matrix((1 - beta_momentum) / learning_rate, v) for v in self.velocity_W]
+            m_b = [multiply_scalar_vector((1 - beta_momentum) / learning_rate, v) for v in self.velocity_b]
+            self.free_optimizer_state()
+            self.m_W, self.m_b = [cast_matrix(m, self.precision) for m in m_W], [cast_vector(m, self.precision) for m in m_b]
+            self.v_W, self.v_b = [cast_matrix([[g**2 for g in row] for row in m], self.precision) for m in m_W], [cast_vector([g**2 for g in m], self.precision) for m in m_b]
+            # Dönüştürülen momentler kararlı durum tahmini olduğundan bias düzeltmesi ~1 olacak adım sayısı kullanılır.
+            self.adam_t = int(math.ceil(math.log(0.01) / math.log(beta2_adam))) if 0 < beta2_adam < 1 else 0
+        elif previous_type == "adam" and optimizer_type == "momentum":
+            correction = 1 - beta1_adam**self.adam_t if self.adam_t > 0 else 1.0
+            scale = learning_rate / ((correction or 1e-8) * (1 - beta_momentum)) if beta_momentum < 1 else learning_rate
+            velocity_W, velocity_b = [multiply_scalar_matrix(scale, m) for m in self.m_W], [multiply_scalar_vector(scale, m) for m in self.m_b]
+            self.free_optimizer_state()
+            self.velocity_W, self.velocity_b = [cast_matrix(v, self.precision) for v in velocity_W], [cast_vector(v, self.precision) for v in velocity_b]
+        self.optimizer_state_type = optimizer_type
+
+    def reset_optimizer_state(self, layer_idx=None):
+        # layer_idx verilirse yalnızca o katmanın durumu sıfırlanır (diğer katmanlar ve adam_t korunur).
+        if layer_idx is None: self.free_optimizer_state(); return
+        for attr in ALL_OPTIMIZER_STATE_ATTRS:
+            state = getattr(self, attr)
+            if layer_idx < len(state): state[layer_idx] = self._zero_state_for_layer(attr, layer_idx)
+
+    def get_optimizer_state(self):
+        # Yalnızca ayrılmış durum tensörleri döndürülür.
+        state = {"state_type": self.optimizer_state_type, "adam_t": self.adam_t}
+        for attr in ALL_OPTIMIZER_STATE_ATTRS:
+            if getattr(self, attr): state[attr] = getattr(self, attr)
+        return state
+
+    def load_optimizer_state(self, opt_state):
+        # Eski kayıtlar tüm tensörleri içerir; "type"/"state_type" alanına göre yalnızca gerekenler alınır.
+        self.free_optimizer_state()
+        if not opt_state: return
+        state_type = opt_state.get("state_type", opt_state.get("type"))
+        if state_type not in OPTIMIZER_STATE_ATTRS:
+            state_type = "adam" if opt_state.get("m_W") else ("momentum" if opt_state.get("velocity_W") else None)
+        if state_type is None: return
+        attrs = OPTIMIZER_STATE_ATTRS[state_type]
+        if not all(opt_state.get(attr) is not None and len(opt_state[attr]) == len(self.weights) for attr in attrs): return
+        for attr in attrs: setattr(self, attr, [self._cast_state(attr, layer_state) for layer_state in opt_state[attr]])
+        self.adam_t = opt_state.get("adam_t", 0) if state_type == "adam" else 0
+        self.optimizer_state_type = state_type
+
+    def configure_network(self, input_size, layer_configs_from_gui, custom_weights=None, custom_biases=None, precision=DEFAULT_PRECISION, keep_master_weights=False):
+        # precision parametreler, optimizer durumu ve saklanan aktivasyonlar için geçerlidir.
+        # keep_master_weights (yalnızca float32): optimizer güncellemesi float64 ana kopyaya uygulanır,
+        # ileri/geri yayılım yuvarlanmış float32 ağırlıkları kullanır.
+        self.precision = validate_precision(precision)
+        self.keep_master_weights = bool(keep_master_weights) and precision != "float64"
+        self.layer_configs = layer_configs_from_gui
+        self.weights, self.biases = [], []
+        self.master_weights, self.master_biases = [], []
+        self.sparse_layers = [None] * len(layer_configs_from_gui)
+        self._compiled_quick_key = None
+        self.param_version += 1; self.layer_versions = [self.param_version] * len(layer_configs_from_gui)
+        self.free_optimizer_state()
         prev_layer_neuron_count = input_size
         for i, (num_neurons, _) in enumerate(self.layer_configs):
             if custom_weights and i < len(custom_weights):
@@ -60,11 +162,73 @@ class NeuralNetwork:
                 if len(layer_biases) != num_neurons:
                      raise ValueError(f"Katman {i+1} özel B boyutu ({len(layer_biases)}) != beklenen ({num_neurons}).")
             else: layer_biases = [random.uniform(-0.1, 0.1) for _ in range(num_neurons)]
-            self.weights.append(layer_weights)
-            self.biases.append(layer_biases)
-            self._initialize_optimizer_params(prev_layer_neuron_count, num_neurons)
+            self.weights.append(cast_matrix(layer_weights, self.precision))
+            self.biases.append(cast_vector(layer_biases, self.precision))
+            if self.keep_master_weights: self.master_weights.append(layer_weights); self.master_biases.append(layer_biases)
             prev_layer_neuron_count = num_neurons
 
+    def set_input_normalizer(self, normalizer):
+        # Girdi ölçeklemesi tüm katman çıktılarını değiştirir: önbellek ve görüntüler için tüm katmanlar değişmiş sayılır.
+        if normalizer is not None and self.weights and normalizer.n_features != len(self.weights[0]):
+            raise ValueError(f"Normalizasyon {normalizer.n_features} özellik için; ağ girişi {len(self.weights[0])}.")
+        self.input_normalizer = normalizer; self.mark_all_layers_changed()
+
+    def normalize_input(self, inputs):
+        return inputs if self.input_normalizer is None else self.input_normalizer.transform(inputs)
+
+    def mark_layer_changed(self, layer_idx):
+        # Katman parametreleri değişti: önbellekteki çıktılar yalnızca bu katmandan önceki katmanlar için geçerli kalır.
+        self.param_version += 1; self.layer_versions[layer_idx] = self.param_version
+
+    def mark_all_layers_changed(self):
+        self.param_version += 1; self.layer_versions = [self.param_version] * len(self.weights)
+
+    def _store_layer_params(self, layer_idx, layer_weights, layer_biases):
+        self.mark_layer_changed(layer_idx)
+        if self.keep_master_weights: self.master_weights[layer_idx], self.master_biases[layer_idx] = layer_weights, layer_biases
+        self.weights[layer_idx], self.biases[layer_idx] = cast_matrix(layer_weights, self.precision), cast_vector(layer_biases, self.precision)
+
+    def set_layer_weights(self, layer_idx, layer_weights):
+        layer_weights = [[float(w_val) for w_val in w_row] for w_row in layer_weights]
+        current = self.weights[layer_idx]
+        if len(layer_weights) != len(current) or (layer_weights and len(layer_weights[0]) != len(current[0])): raise ValueError("Okunan ağırlık matrisi boyutları ağdakiyle uyuşmuyor.")
+        self._store_layer_params(layer_idx, layer_weights, self.master_biases[layer_idx] if self.keep_master_weights else self.biases[layer_idx])
+        if self.sparse_layers[layer_idx] is not None: self.set_layer_mask(layer_idx, self.sparse_layers[layer_idx].keep_mask())
+
+    def set_layer_biases(self, layer_idx, layer_biases):
+        layer_biases = [float(b_val) for b_val in layer_biases]
+        if len(layer_biases) != len(self.biases[layer_idx]): raise ValueError("Okunan bias vektörü boyutu ağdakiyle uyuşmuyor.")
+        self._store_layer_params(layer_idx, self.master_weights[layer_idx] if self.keep_master_weights else self.weights[layer_idx], layer_biases)
+
+    def set_layer_mask(self, layer_idx, keep):
+        # keep[i][j] yanlışsa bağlantı budanır: ağırlık ve optimizer durumu 0'a çekilir, katman seyrek gösterime geçer.
+        # Tüm bağlantılar korunuyorsa (veya keep None ise) katman yoğun kalır.
+        W = self.weights[layer_idx]
+        if keep is None or all(all(row) for row in keep): self.sparse_layers[layer_idx] = None
+        else:
+            if len(keep) != len(W) or any(len(k_row) != len(W_row) for k_row, W_row in zip(keep, W)): raise ValueError("Budama maskesi boyutları ağırlık matrisiyle uyuşmuyor.")
+            matrices = [W] + ([self.master_weights[layer_idx]] if self.keep_master_weights else [])
+            matrices += [getattr(self, attr)[layer_idx] for attr in ("velocity_W", "m_W", "v_W") if getattr(self, attr)]
+            for matrix in matrices:
+                for k_row, row in zip(keep, matrix):
+                    for j, kept in enumerate(k_row):
+                        if not kept: row[j] = 0.0
+            self.sparse_layers[layer_idx] = SparseLayer.from_dense(W, keep)
+        self._compiled_quick_key = None; self.mark_layer_changed(layer_idx)
+
+    def clear_pruning(self):
+        # Seyrek gösterim kaldırılır; budanmış ağırlıklar 0 olarak kalır ama yeniden eğitilebilir.
+        self.sparse_layers = [None] * len(self.weights); self._compiled_quick_key = None; self.mark_all_layers_changed()
+
+    def sparsity_signature(self):
+        if not any(sparse is not None for sparse in self.sparse_layers): return None
+        return tuple(sparse.signature() if sparse is not None else None for sparse in self.sparse_layers)
+
+    def get_full_precision_params(self):
+        # Kayıt için en yüksek hassasiyetli parametreler (varsa float64 ana kopya).
+        if self.keep_master_weights: return self.master_weights, self.master_biases
+        return self.weights, self.biases
+
     def get_activation_func_obj(self, layer_idx): 
         _, activation_str = self.layer_configs[layer_idx]
         return ACTIVATION_FUNCTIONS[activation_str][0]
@@ -75,90 +239,363 @@ class NeuralNetwork:
             return lambda x: [1.0] * len(x) if isinstance(x, list) else 1.0 
         return ACTIVATION_FUNCTIONS[activation_str][1]
 
-    def forward_pass_generator(self, inputs, detailed_steps=False):
+    def get_activation_vector_funcs(self, layer_idx):
+        # (z vektörü -> a vektörü, a vektörü -> f'(z) vektörü) çekirdek çifti.
+        return (FAST_ACTIVATION_VECTOR_FUNCTIONS if self.fast_math else ACTIVATION_VECTOR_FUNCTIONS)[self.layer_configs[layer_idx][1]]
+
+    def forward_pass_generator(self, inputs, detailed_steps=False, use_cache=False):
+        # Tüm adım olaylarını üreten arayüz (GUI adım düğmeleri). use_cache: aynı girdi için önbellekteki katman
+        # çıktılarının, kayıttan beri değişmemiş katmanlara ait olan kısmı kullanılır (olayları yeniden üretilir);
+        # yalnızca ilk değişen katmandan itibaren yeniden hesaplanır. Ayrıntılı adım modunda her zaman baştan
+        # hesaplanır. Eğitim döngüleri önbelleği kullanmaz.
+        return self._forward_events(inputs, detailed_steps, use_cache, ALL_EVENTS)
+
+    def forward(self, inputs, detailed_steps=False, use_cache=False):
+        # Olaylar yalnızca abonelere ve yalnızca abone olunan tür/katmanlar için üretilir; abone yoksa hiçbir olay
+        # sözlüğü oluşturulmaz. Çıkış aktivasyonlarını döndürür.
+        bus = self.events
+        for event in self._forward_events(inputs, detailed_steps, use_cache, bus): bus.dispatch(event)
+        return self.neuron_outputs_a[-1]
+
+    def subscribe(self, callback, event_types=None, layers=None, neurons=None):
+        # callback(olay) yalnızca eşleşen olaylar için çağrılır (ör. event_types=["layer_activation"], layers=[2]).
+        # Abonelik varken train_sample derlenmiş yolu kullanmaz (olaylar referans yoldan üretilir).
+        return self.events.subscribe(callback, event_types, layers, neurons)
+
+    def unsubscribe(self, subscription):
+        self.events.unsubscribe(subscription)
+
+    def _forward_events(self, inputs, detailed_steps, use_cache, want):
+        # want.wants(tür, katman) yanlışsa o olayın sözlüğü oluşturulmaz; ağırlık başına adımlar yalnızca
+        # weight_multiplication veya bias_addition o katman için isteniyorsa yürütülür.
         self.current_input_for_forward = list(inputs)
-        self.neuron_outputs_z, self.neuron_outputs_a = [], [list(inputs)] 
-        current_activations = list(inputs)
-        yield {"type": "input_layer", "layer_index": -1, "outputs": list(current_activations), "num_neurons": len(current_activations)}
-        for i in range(len(self.weights)): 
-            layer_weights, layer_biases = self.weights[i], self.biases[i]   
+        cached = self.prediction_cache.lookup(self, inputs) if use_cache and not detailed_steps else None
+        if cached is not None:
+            z_layers, a_layers, start = cached
+            yield from self._replay_cached_forward(z_layers[:start], a_layers[:start + 1], want)
+            if start == len(self.weights):
+                if want.wants("forward_pass_complete"): yield {"type": "forward_pass_complete", "final_output": list(a_layers[-1]), "cached": True}
+                return
+            current_activations = list(a_layers[start])
+        else:
+            start = 0
+            self.neuron_outputs_z, self.neuron_outputs_a = [], [copy_vector(self.normalize_input(inputs), self.precision)] 
+            current_activations = list(self.neuron_outputs_a[0])
+        prof = self.profiler if self.profiler.enabled else None
+        every, last = checkpoint_interval(len(self.weights), self.checkpoint_every) if self.checkpoint_every and not use_cache else 0, len(self.weights) - 1
+        if cached is None and want.wants("input_layer", -1): yield {"type": "input_layer", "layer_index": -1, "outputs": list(current_activations), "num_neurons": len(current_activations)}
+        for i in range(start, len(self.weights)): 
+            if prof: t0 = prof.now()
+            layer_weights, layer_biases, sparse = self.weights[i], self.biases[i], self.sparse_layers[i]
             num_current_neurons, num_prev_neurons = len(layer_biases), len(current_activations)
             activation_name = self.layer_configs[i][1]
             z_values = [0.0] * num_current_neurons
-            if detailed_steps:
+            want_products, want_bias = detailed_steps and want.wants("weight_multiplication", i), detailed_steps and want.wants("bias_addition", i)
+            if want_products or want_bias:
                 for j in range(num_current_neurons): 
                     neuron_z_unbiased = 0.0
-                    for k in range(num_prev_neurons): 
+                    for k in (range(num_prev_neurons) if sparse is None else sparse.row_indices(j)): 
                         weight, activation_prev = layer_weights[k][j], current_activations[k]
                         product = activation_prev * weight; neuron_z_unbiased += product
-                        yield {"type": "weight_multiplication", "layer_index": i, "neuron_index": j, "prev_neuron_index": k, "weight": weight, "prev_activation": activation_prev, "product": product, "current_sum_for_neuron_z": neuron_z_unbiased}
+                        if want_products:
+                            if prof: prof.record("forward", t0, i)
+                            yield {"type": "weight_multiplication", "layer_index": i, "neuron_index": j, "prev_neuron_index": k, "weight": weight, "prev_activation": activation_prev, "product": product, "current_sum_for_neuron_z": neuron_z_unbiased}
+                            if prof: t0 = prof.now()
                     z_values[j] = neuron_z_unbiased + layer_biases[j]
-                    yield {"type": "bias_addition", "layer_index": i, "neuron_index": j, "z_unbiased": neuron_z_unbiased, "bias": layer_biases[j], "z_final": z_values[j]}
-            else: z_values_unbiased = multiply_row_vector_matrix(current_activations, layer_weights); z_values = add_vectors(z_values_unbiased, layer_biases)
-            activation_func_obj = self.get_activation_func_obj(i)
-            a_values = activation_func_obj(z_values) if activation_name == "softmax" else [activation_func_obj(z) for z in z_values]
-            self.neuron_outputs_z.append(list(z_values)); self.neuron_outputs_a.append(list(a_values))
-            yield {"type": "layer_activation", "layer_index": i, "inputs_to_layer": list(current_activations), "z_values": list(z_values), "a_values": list(a_values), "activation_function": activation_name, "num_neurons": num_current_neurons}
-            current_activations = list(a_values)
-        yield {"type": "forward_pass_complete", "final_output": list(current_activations)}
+                    if want_bias:
+                        if prof: prof.record("forward", t0, i)
+                        yield {"type": "bias_addition", "layer_index": i, "neuron_index": j, "z_unbiased": neuron_z_unbiased, "bias": layer_biases[j], "z_final": z_values[j]}
+                        if prof: t0 = prof.now()
+            else:
+                z_values_unbiased = multiply_row_vector_matrix(current_activations, layer_weights) if sparse is None else sparse.matvec(current_activations)
+                z_values = add_vectors(z_values_unbiased, layer_biases)
+            a_values = self.get_activation_vector_funcs(i)[0](z_values)
+            a_stored = copy_vector(a_values, self.precision)
+            if every and (i + 1) % every and i != last: self.neuron_outputs_z.append(None); self.neuron_outputs_a.append(None)  # checkpoint dışı: geri yayılımda yeniden hesaplanır
+            else: self.neuron_outputs_z.append(copy_vector(z_values, self.precision)); self.neuron_outputs_a.append(a_stored)
+            if prof: prof.record("forward", t0, i)
+            if want.wants("layer_activation", i): yield {"type": "layer_activation", "layer_index": i, "inputs_to_layer": list(current_activations), "z_values": list(z_values), "a_values": list(a_values), "activation_function": activation_name, "num_neurons": num_current_neurons}
+            current_activations = list(a_stored)
+        if use_cache: self.prediction_cache.store(self, inputs, self.neuron_outputs_z, self.neuron_outputs_a)
+        if want.wants("forward_pass_complete"): yield {"type": "forward_pass_complete", "final_output": list(current_activations)}
+
+    def _replay_cached_forward(self, z_layers, a_layers, want=ALL_EVENTS):
+        # Önbellekteki (geçerli) katman çıktılarıyla ileri yayılımın ayrıntısız olaylarını üretir.
+        self.neuron_outputs_z, self.neuron_outputs_a = list(z_layers), list(a_layers)
+        if want.wants("input_layer", -1): yield {"type": "input_layer", "layer_index": -1, "outputs": list(a_layers[0]), "num_neurons": len(a_layers[0]), "cached": True}
+        for i, z_values in enumerate(z_layers):
+            if want.wants("layer_activation", i): yield {"type": "layer_activation", "layer_index": i, "inputs_to_layer": list(a_layers[i]), "z_values": list(z_values), "a_values": list(a_layers[i + 1]), "activation_function": self.layer_configs[i][1], "num_neurons": len(z_values), "cached": True}
+
+    def predict(self, inputs):
+        # Güncel parametrelerle çıkış aktivasyonları; aynı girdi tekrar sorulursa yalnızca değişen katmanlardan itibaren hesaplanır.
+        for _ in self._forward_events(inputs, False, True, NO_EVENTS): pass
+        return list(self.neuron_outputs_a[-1])
+
+    def predict_batch(self, X):
+        return [self.predict(x) for x in X]
+
+    def snapshot(self):
+        # Eşzamanlı çıkarım için salt okunur parametre görüntüsü (forward_context.ParameterSnapshot). predict ve
+        # forward ağın kendi ara sonuçlarına yazar; görüntünün forward(x, ctx)/backward(ctx, y) çağrıları yalnızca bağlama
+        # yazar. Parametreler değişmedikçe aynı görüntü döner; değiştiyse yalnızca değişen katmanlar kopyalanır.
+        # Canlı ağın güncellendiği iş parçacığında çağrılmalıdır.
+        snap = self._snapshot
+        if snap is None or snap.version != self.param_version or snap.fast_math != self.fast_math or snap.loss_function_name != self.loss_function_name:
+            snap = self._snapshot = ParameterSnapshot(self, snap)
+        return snap
+
+    def apply_gradients(self, ctx, learning_rate, optimizer_params=None):
+        # Bir görüntünün forward + backward çağrılarıyla doldurulmuş bağlamdaki δ'larla canlı parametreleri günceller
+        # (backward_pass_generator'ın güncelleme adımıyla aynı). Görüntü daha eski parametrelerden alınmış olabilir.
+        if ctx.deltas is None or len(ctx.deltas) != len(self.weights): raise ValueError("Bağlamda bu ağa uygun geri yayılım sonucu (δ) yok.")
+        optimizer_params = optimizer_params or {}; optimizer_type = optimizer_params.get("type", "sgd")
+        self._ensure_optimizer_state(optimizer_type, learning_rate, optimizer_params)
+        if optimizer_type == "adam": self.adam_t += 1
+        hyperparams, telemetry = self._optimizer_hyperparams(optimizer_params), self.telemetry
+        if telemetry is not None: telemetry.begin_step(self)
+        for l in range(len(self.weights)): self._apply_optimizer_update(l, ctx.a_layers[l], ctx.deltas[l], ctx.z_layers[l], optimizer_type, learning_rate, hyperparams)
+        if telemetry is not None: telemetry.end_step()
 
     def backward_pass_generator(self, targets, learning_rate, optimizer_params=None):
-        if not self.neuron_outputs_a or len(self.neuron_outputs_a) <= 1: yield {"type": "error", "message": "İleri yayılım çalıştırılmadı."}; return
+        return self._backward_events(targets, learning_rate, optimizer_params, ALL_EVENTS)
+
+    def backward(self, targets, learning_rate, optimizer_params=None):
+        # forward() gibi: olaylar yalnızca abonelere üretilir.
+        bus = self.events
+        for event in self._backward_events(targets, learning_rate, optimizer_params, bus): bus.dispatch(event)
+
+    def _backward_events(self, targets, learning_rate, optimizer_params, want):
+        if not self.neuron_outputs_a or len(self.neuron_outputs_a) <= 1:
+            if want.wants("error"): yield {"type": "error", "message": "İleri yayılım çalıştırılmadı."}
+            return
         optimizer_params = optimizer_params or {}; optimizer_type = optimizer_params.get("type", "sgd")
-        beta_momentum, beta1_adam, beta2_adam, epsilon_adam = optimizer_params.get("beta", 0.9), optimizer_params.get("beta1", 0.9), optimizer_params.get("beta2", 0.999), optimizer_params.get("epsilon", 1e-8)
+        self._ensure_optimizer_state(optimizer_type, learning_rate, optimizer_params)
         if optimizer_type == "adam": self.adam_t += 1
-        output_layer_idx, a_L, z_L, delta_L = len(self.weights) - 1, self.neuron_outputs_a[-1], self.neuron_outputs_z[-1], []
+        prof = self.profiler if self.profiler.enabled else None
+        if prof: t0 = prof.now()
+        output_layer_idx, a_L, delta_L = len(self.weights) - 1, self.neuron_outputs_a[-1], []
         if self.loss_function_name == "cross_entropy" and self.layer_configs[output_layer_idx][1] == "softmax":
             delta_L = self.loss_derivative_func(targets, a_L) 
-            yield {"type": "output_delta_calculation", "layer_index": output_layer_idx, "method": "cross_entropy_with_softmax (dL/dz_L)", "a_L": list(a_L), "targets": list(targets), "delta_L": list(delta_L), "num_neurons": len(delta_L)}
+            if prof: prof.record("backward_delta", t0, output_layer_idx)
+            if want.wants("output_delta_calculation", output_layer_idx): yield {"type": "output_delta_calculation", "layer_index": output_layer_idx, "method": "cross_entropy_with_softmax (dL/dz_L)", "a_L": list(a_L), "targets": list(targets), "delta_L": list(delta_L), "num_neurons": len(delta_L)}
         else: 
             dL_daL = subtract_vectors(a_L, targets) if self.loss_function_name == "mean_squared_error" else self.loss_derivative_func(targets, a_L)
-            activation_derivative_func_obj = self.get_activation_derivative_func_obj(output_layer_idx)
-            f_prime_z_L = [activation_derivative_func_obj(z) for z in z_L]
+            f_prime_z_L = self.get_activation_vector_funcs(output_layer_idx)[1](a_L)
             delta_L = elementwise_multiply_vectors(dL_daL, f_prime_z_L) 
-            yield {"type": "output_delta_calculation", "layer_index": output_layer_idx, "method": "elementwise_error_times_derivative (dL/dz_L)", "dL_daL": list(dL_daL), "f_prime_z_L": list(f_prime_z_L), "delta_L": list(delta_L), "num_neurons": len(delta_L)}
+            if prof: prof.record("backward_delta", t0, output_layer_idx)
+            if want.wants("output_delta_calculation", output_layer_idx): yield {"type": "output_delta_calculation", "layer_index": output_layer_idx, "method": "elementwise_error_times_derivative (dL/dz_L)", "dL_daL": list(dL_daL), "f_prime_z_L": list(f_prime_z_L), "delta_L": list(delta_L), "num_neurons": len(delta_L)}
+        if None in self.neuron_outputs_a:  # ileri yayılım aktivasyon checkpoint'iyle yapıldı
+            yield from self._checkpointed_backward_events(delta_L, optimizer_type, learning_rate, optimizer_params, want); return
         deltas = [delta_L] 
         for l in range(len(self.weights) - 2, -1, -1): 
-            delta_next_layer, weights_next_layer = deltas[0], self.weights[l+1] 
-            error_propagated = multiply_row_vector_matrix(delta_next_layer, transpose_matrix(weights_next_layer))
-            z_l, activation_derivative_func_l_obj = self.neuron_outputs_z[l], self.get_activation_derivative_func_obj(l)
-            f_prime_z_l = [activation_derivative_func_l_obj(z_val) for z_val in z_l]
+            if prof: t0 = prof.now()
+            delta_next_layer, weights_next_layer, sparse_next = deltas[0], self.weights[l+1], self.sparse_layers[l+1]
+            error_propagated = multiply_row_vector_matrix(delta_next_layer, transpose_matrix(weights_next_layer)) if sparse_next is None else sparse_next.rmatvec(delta_next_layer)
+            f_prime_z_l = self.get_activation_vector_funcs(l)[1](self.neuron_outputs_a[l+1])
             delta_l = elementwise_multiply_vectors(error_propagated, f_prime_z_l)
             deltas.insert(0, delta_l) 
-            yield {"type": "hidden_delta_calculation", "layer_index": l, "delta_next_layer": list(delta_next_layer), "error_propagated": list(error_propagated), "f_prime_z_l": list(f_prime_z_l), "delta_l": list(delta_l), "num_neurons": len(delta_l)}
+            if prof: prof.record("backward_delta", t0, l)
+            if want.wants("hidden_delta_calculation", l): yield {"type": "hidden_delta_calculation", "layer_index": l, "delta_next_layer": list(delta_next_layer), "error_propagated": list(error_propagated), "f_prime_z_l": list(f_prime_z_l), "delta_l": list(delta_l), "num_neurons": len(delta_l)}
+        hyperparams, telemetry = self._optimizer_hyperparams(optimizer_params), self.telemetry
+        if telemetry is not None: telemetry.begin_step(self)
         for l in range(len(self.weights)):
-            a_prev_layer, delta_curr_layer = self.neuron_outputs_a[l], deltas[l] 
-            grad_W_l, grad_b_l = [[a_prev * d_curr for d_curr in delta_curr_layer] for a_prev in a_prev_layer], delta_curr_layer 
-            yield {"type": "gradient_calculation", "layer_index": l, "grad_W_l_dims": (len(grad_W_l), len(grad_W_l[0]) if grad_W_l else 0), "grad_b_l_dims": len(grad_b_l)}
-            if optimizer_type == "sgd":
-                self.weights[l] = subtract_matrices(self.weights[l], multiply_scalar_matrix(learning_rate, grad_W_l))
-                self.biases[l] = subtract_vectors(self.biases[l], multiply_scalar_vector(learning_rate, grad_b_l))
-            elif optimizer_type == "momentum":
-                self.velocity_W[l] = add_matrices(multiply_scalar_matrix(beta_momentum, self.velocity_W[l]), multiply_scalar_matrix(learning_rate, grad_W_l))
-                self.velocity_b[l] = add_vectors(multiply_scalar_vector(beta_momentum, self.velocity_b[l]), multiply_scalar_vector(learning_rate, grad_b_l))
-                self.weights[l] = subtract_matrices(self.weights[l], self.velocity_W[l])
-                self.biases[l] = subtract_vectors(self.biases[l], self.velocity_b[l])
-            elif optimizer_type == "adam":
-                self.m_W[l] = add_matrices(multiply_scalar_matrix(beta1_adam, self.m_W[l]), multiply_scalar_matrix(1 - beta1_adam, grad_W_l))
-                self.m_b[l] = add_vectors(multiply_scalar_vector(beta1_adam, self.m_b[l]), multiply_scalar_vector(1 - beta1_adam, grad_b_l))
-                grad_W_l_sq, grad_b_l_sq = [[g**2 for g in row] for row in grad_W_l], [g**2 for g in grad_b_l]
-                self.v_W[l] = add_matrices(multiply_scalar_matrix(beta2_adam, self.v_W[l]), multiply_scalar_matrix(1 - beta2_adam, grad_W_l_sq))
-                self.v_b[l] = add_vectors(multiply_scalar_vector(beta2_adam, self.v_b[l]), multiply_scalar_vector(1 - beta2_adam, grad_b_l_sq))
-                
-                # 0'a bölme hatasını önlemek için küçük bir kontrol
-                denom_beta1 = (1 - beta1_adam**self.adam_t)
-                denom_beta2 = (1 - beta2_adam**self.adam_t)
-                if denom_beta1 == 0: denom_beta1 = 1e-8 
-                if denom_beta2 == 0: denom_beta2 = 1e-8
-
-                m_W_hat = multiply_scalar_matrix(1 / denom_beta1, self.m_W[l])
-                m_b_hat = multiply_scalar_vector(1 / denom_beta1, self.m_b[l])
-                v_W_hat = multiply_scalar_matrix(1 / denom_beta2, self.v_W[l])
-                v_b_hat = multiply_scalar_vector(1 / denom_beta2, self.v_b[l])
-                
-                update_term_W = [[ (learning_rate * m_w_h) / (math.sqrt(v_w_h) + epsilon_adam) for m_w_h, v_w_h in zip(m_row, v_row)] for m_row, v_row in zip(m_W_hat, v_W_hat)]
-                update_term_b = [ (learning_rate * m_b_h) / (math.sqrt(v_b_h) + epsilon_adam) for m_b_h, v_b_h in zip(m_b_hat, v_b_hat)]
-                self.weights[l] = subtract_matrices(self.weights[l], update_term_W)
-                self.biases[l] = subtract_vectors(self.biases[l], update_term_b)
-            yield {"type": "weight_update", "layer_index": l, "optimizer_used": optimizer_type}
-        yield {"type": "backward_pass_complete"}
\ No newline at end of file
+            n_prev, n_curr = len(self.neuron_outputs_a[l]), len(deltas[l])
+            if want.wants("gradient_calculation", l): yield {"type": "gradient_calculation", "layer_index": l, "grad_W_l_dims": (n_prev, n_curr if n_prev else 0), "grad_b_l_dims": n_curr}
+            if prof: t0 = prof.now()
+            self._apply_optimizer_update(l, self.neuron_outputs_a[l], deltas[l], self.neuron_outputs_z[l], optimizer_type, learning_rate, hyperparams)
+            if prof: prof.record("optimizer", t0, l)
+            if want.wants("weight_update", l): yield {"type": "weight_update", "layer_index": l, "optimizer_used": optimizer_type}
+        if telemetry is not None: telemetry.end_step()
+        if want.wants("backward_pass_complete"): yield {"type": "backward_pass_complete"}
+
+    def _checkpointed_backward_events(self, delta_L, optimizer_type, learning_rate, optimizer_params, want):
+        # Segmentler üstten alta işlenir: segmentin ara z/a değerleri alttaki checkpoint'ten yeniden hesaplanır, alt katmana
+        # geçecek hata güncellemeden önce (eski ağırlıklarla) bulunur, katman güncellenir; segment bitince ara değerler
+        # bırakılır. Her katmanın δ'sı ve güncellemesi referans yolla aynıdır, yalnızca güncelleme sırası üstten alta döner.
+        prof = self.profiler if self.profiler.enabled else None
+        z_layers, a_layers = self.neuron_outputs_z, self.neuron_outputs_a
+        kept = [i for i, a in enumerate(a_layers) if a is not None]
+        hyperparams, telemetry = self._optimizer_hyperparams(optimizer_params), self.telemetry
+        if telemetry is not None: telemetry.begin_step(self)
+        delta_l, error_propagated = delta_L, None
+        for start, end in zip(reversed(kept[:-1]), reversed(kept[1:])):
+            if prof: t0 = prof.now()
+            current_activations = list(a_layers[start])
+            for i in range(start, end - 1):
+                sparse = self.sparse_layers[i]
+                z_values = add_vectors(multiply_row_vector_matrix(current_activations, self.weights[i]) if sparse is None else sparse.matvec(current_activations), self.biases[i])
+                a_stored = copy_vector(self.get_activation_vector_funcs(i)[0](z_values), self.precision)
+                z_layers[i], a_layers[i + 1] = copy_vector(z_values, self.precision), a_stored
+                current_activations = list(a_stored)
+            if prof: prof.record("recompute", t0, start)
+            for l in range(end - 1, start - 1, -1):
+                if error_propagated is not None:
+                    if prof: t0 = prof.now()
+                    delta_next_layer = delta_l
+                    f_prime_z_l = self.get_activation_vector_funcs(l)[1](a_layers[l + 1])
+                    delta_l = elementwise_multiply_vectors(error_propagated, f_prime_z_l)
+                    if prof: prof.record("backward_delta", t0, l)
+                    if want.wants("hidden_delta_calculation", l): yield {"type": "hidden_delta_calculation", "layer_index": l, "delta_next_layer": list(delta_next_layer), "error_propagated": list(error_propagated), "f_prime_z_l": list(f_prime_z_l), "delta_l": list(delta_l), "num_neurons": len(delta_l)}
+                if l > 0:
+                    if prof: t0 = prof.now()
+                    sparse = self.sparse_layers[l]
+                    error_propagated = multiply_row_vector_matrix(delta_l, transpose_matrix(self.weights[l])) if sparse is None else sparse.rmatvec(delta_l)
+                    if prof: prof.record("backward_delta", t0, l - 1)
+                n_prev, n_curr = len(a_layers[l]), len(delta_l)
+                if want.wants("gradient_calculation", l): yield {"type": "gradient_calculation", "layer_index": l, "grad_W_l_dims": (n_prev, n_curr if n_prev else 0), "grad_b_l_dims": n_curr}
+                if prof: t0 = prof.now()
+                self._apply_optimizer_update(l, a_layers[l], delta_l, z_layers[l], optimizer_type, learning_rate, hyperparams)
+                if prof: prof.record("optimizer", t0, l)
+                if want.wants("weight_update", l): yield {"type": "weight_update", "layer_index": l, "optimizer_used": optimizer_type}
+            for i in range(start + 1, end): z_layers[i - 1] = a_layers[i] = None
+        if telemetry is not None: telemetry.end_step()
+        if want.wants("backward_pass_complete"): yield {"type": "backward_pass_complete"}
+
+    def get_compiled(self):
+        # Küçük float64 ağlar için derlenmiş düz kod (compiler.py); uygun değilse None.
+        # Mimari, kayıp fonksiyonu veya hızlı matematik değiştiğinde imza değişir ve yeniden derlenir.
+        quick_key = (id(self.layer_configs), len(self.layer_configs), len(self.weights), self.loss_function_name, self.fast_math, self.precision, self.use_compiled, self.checkpoint_every)
+        if quick_key == self._compiled_quick_key: return self._compiled
+        self._compiled_quick_key, self._compiled = quick_key, None
+        if not self.use_compiled or not self.weights or self.precision != DEFAULT_PRECISION:
+            self.compile_status = "Derlenmiş yol kapalı (kapatıldı veya float64 dışı hassasiyet)."; return None
+        if self.checkpoint_every:
+            self.compile_status = "Aktivasyon checkpoint açık; genel (yeniden hesaplamalı) yol kullanılıyor."; return None
+        signature = network_signature(len(self.weights[0]), self.layer_configs, self.loss_function_name, self.fast_math, self.sparsity_signature())
+        if not can_compile(signature):
+            self.compile_status = "Ağ, derlenmiş yol için çok büyük; genel yol kullanılıyor."; return None
+        compiled = get_compiled_network(signature)
+        if signature != self._compiled_signature:
+            ok, max_error = verify_against_reference(self, compiled)
+            if not ok: self.compile_status = f"Derlenmiş kod referansla eşleşmedi (fark {max_error:.3g}); genel yol kullanılıyor."; return None
+            self._compiled_signature = signature
+        self._compiled, self.compile_status = compiled, "Derlenmiş düz kod yolu kullanılıyor (referans üreteçle doğrulandı)."
+        return compiled
+
+    def train_sample(self, inputs, targets, learning_rate, optimizer_params=None):
+        # Tek örnek için ileri + geri yayılım + güncelleme. Güncelleme öncesi çıkış aktivasyonlarını döndürür.
+        # Derlenmiş yol yoksa (veya olay abonesi varsa) referans yol çalışır; olaylar yalnızca abonelere üretilir.
+        compiled = self.get_compiled() if not self.events else None
+        if compiled is None:
+            outputs = self.forward(inputs)
+            self.backward(targets, learning_rate, optimizer_params)
+            return outputs
+        optimizer_params = optimizer_params or {}; optimizer_type = optimizer_params.get("type", "sgd")
+        prof = self.profiler if self.profiler.enabled else None
+        if prof: t0 = prof.now()
+        self.current_input_for_forward = list(inputs)
+        self.neuron_outputs_z, self.neuron_outputs_a, deltas = compiled.forward_backward(self.normalize_input(inputs), targets, self.weights, self.biases)
+        if prof: prof.record("compiled_forward_backward", t0)
+        self._ensure_optimizer_state(optimizer_type, learning_rate, optimizer_params)
+        if optimizer_type == "adam": self.adam_t += 1
+        hyperparams, telemetry = self._optimizer_hyperparams(optimizer_params), self.telemetry
+        if telemetry is not None: telemetry.begin_step(self)
+        for l in range(len(self.weights)):
+            if prof: t0 = prof.now()
+            self._apply_optimizer_update(l, self.neuron_outputs_a[l], deltas[l], self.neuron_outputs_z[l], optimizer_type, learning_rate, hyperparams)
+            if prof: prof.record("optimizer", t0, l)
+        if telemetry is not None: telemetry.end_step()
+        return self.neuron_outputs_a[-1]
+
+    def train_epoch(self, X, Y, learning_rate, optimizer_params=None, shuffle=True):
+        # Otomatik eğitimin (izleme kapalı) bir epoch'u; ortalama kaybı döndürür.
+        data = list(zip(X, Y))
+        if shuffle: random.shuffle(data)
+        loss_sum = 0.0
+        for x, y in data: loss_sum += self.loss_func(y, self.train_sample(x, y, learning_rate, optimizer_params))
+        return loss_sum / len(data) if data else 0.0
+
+    @staticmethod
+    def _optimizer_hyperparams(optimizer_params):
+        return (optimizer_params.get("beta", 0.9), optimizer_params.get("beta1", 0.9), optimizer_params.get("beta2", 0.999), optimizer_params.get("epsilon", 1e-8))
+
+    def _apply_optimizer_update(self, l, a_prev_layer, delta_curr_layer, z_curr_layer, optimizer_type, learning_rate, hyperparams):
+        # Referans üreteç ve derlenmiş yolun ortak güncelleme noktası; telemetri kapalıyken tek bir None kontrolü eklenir.
+        # z_curr_layer: δ'yı üreten ileri yayılımın z'si (bağlam yolunda ctx.z_layers; ağın kendi ara sonuçları değil).
+        telemetry = self.telemetry
+        sampled = telemetry is not None and telemetry.before_update(self, l, a_prev_layer, delta_curr_layer, z_curr_layer)
+        if self.sparse_layers[l] is not None: self._apply_sparse_optimizer_update(l, a_prev_layer, delta_curr_layer, optimizer_type, learning_rate, hyperparams)
+        else: self._apply_dense_optimizer_update(l, a_prev_layer, delta_curr_layer, optimizer_type, learning_rate, hyperparams)
+        if sampled: telemetry.after_update(self, l)
+
+    def _apply_dense_optimizer_update(self, l, a_prev_layer, delta_curr_layer, optimizer_type, learning_rate, hyperparams):
+        # Gradyan (grad_W = a_prev ⊗ delta, grad_b = delta) ayrı bir matris olarak oluşturulmadan, güncellemeyle
+        # birlikte satır satır hesaplanır. İşlem sırası ayrı matris yardımcılarıyla aynıdır; sonuçlar birebir eşittir.
+        beta_momentum, beta1_adam, beta2_adam, epsilon_adam = hyperparams
+        p = self.precision
+        W_l, b_l = (self.master_weights[l], self.master_biases[l]) if self.keep_master_weights else (self.weights[l], self.biases[l])
+        if optimizer_type == "sgd":
+            new_W = [[w - learning_rate * (a_i * d) for w, d in zip(W_row, delta_curr_layer)] for W_row, a_i in zip(W_l, a_prev_layer)]
+            new_b = [b - learning_rate * d for b, d in zip(b_l, delta_curr_layer)]
+        elif optimizer_type == "momentum":
+            self.velocity_W[l] = [cast_vector([beta_momentum * v + learning_rate * (a_i * d) for v, d in zip(v_row, delta_curr_layer)], p) for v_row, a_i in zip(self.velocity_W[l], a_prev_layer)]
+            self.velocity_b[l] = cast_vector([beta_momentum * v + learning_rate * d for v, d in zip(self.velocity_b[l], delta_curr_layer)], p)
+            new_W = [[w - v for w, v in zip(W_row, v_row)] for W_row, v_row in zip(W_l, self.velocity_W[l])]
+            new_b = [b - v for b, v in zip(b_l, self.velocity_b[l])]
+        elif optimizer_type == "adam":
+            c1, c2 = 1 - beta1_adam, 1 - beta2_adam
+            # 0'a bölme hatasını önlemek için küçük bir kontrol
+            denom_beta1 = (1 - beta1_adam**self.adam_t)
+            denom_beta2 = (1 - beta2_adam**self.adam_t)
+            if denom_beta1 == 0: denom_beta1 = 1e-8 
+            if denom_beta2 == 0: denom_beta2 = 1e-8
+            inv1, inv2, sqrt = 1 / denom_beta1, 1 / denom_beta2, math.sqrt
+            m_W, v_W, new_W = [], [], []
+            for W_row, m_row, v_row, a_i in zip(W_l, self.m_W[l], self.v_W[l], a_prev_layer):
+                g_row = [a_i * d for d in delta_curr_layer]
+                m_row = cast_vector([beta1_adam * m + c1 * g for m, g in zip(m_row, g_row)], p)
+                v_row = cast_vector([beta2_adam * v + c2 * g**2 for v, g in zip(v_row, g_row)], p)
+                m_W.append(m_row); v_W.append(v_row)
+                new_W.append([w - (learning_rate * (inv1 * m)) / (sqrt(inv2 * v) + epsilon_adam) for w, m, v in zip(W_row, m_row, v_row)])
+            self.m_W[l], self.v_W[l] = m_W, v_W
+            self.m_b[l] = cast_vector([beta1_adam * m + c1 * g for m, g in zip(self.m_b[l], delta_curr_layer)], p)
+            self.v_b[l] = cast_vector([beta2_adam * v + c2 * g**2 for v, g in zip(self.v_b[l], delta_curr_layer)], p)
+            new_b = [b - (learning_rate * (inv1 * m)) / (sqrt(inv2 * v) + epsilon_adam) for b, m, v in zip(b_l, self.m_b[l], self.v_b[l])]
+        else: raise ValueError(f"Bilinmeyen optimizer: {optimizer_type}")
+        self._store_layer_params(l, new_W, new_b)
+
+    def _apply_sparse_optimizer_update(self, l, a_prev_layer, delta_curr_layer, optimizer_type, learning_rate, hyperparams):
+        # Budanmış katman: yalnızca kalan bağlantıların ağırlıkları ve optimizer durumu yerinde güncellenir
+        # (budanmışlar 0 kalır). Her bağlantı için ifadeler yoğun güncellemeyle aynıdır.
+        beta_momentum, beta1_adam, beta2_adam, epsilon_adam = hyperparams
+        sparse = self.sparse_layers[l]
+        W_l, b_l = (self.master_weights[l], self.master_biases[l]) if self.keep_master_weights else (self.weights[l], self.biases[l])
+        stored, values, full_precision = self.weights[l], sparse.values, self.precision == DEFAULT_PRECISION
+        if optimizer_type == "sgd":
+            for W_row, stored_row, a_i, row in zip(W_l, stored, a_prev_layer, sparse.in_rows):
+                for j, pos in row:
+                    W_row[j] = w = W_row[j] - learning_rate * (a_i * delta_curr_layer[j])
+                    if W_row is not stored_row: stored_row[j] = w
+                    values[pos] = w if full_precision else stored_row[j]
+            new_b = [b - learning_rate * d for b, d in zip(b_l, delta_curr_layer)]
+        elif optimizer_type == "momentum":
+            for W_row, stored_row, v_row, a_i, row in zip(W_l, stored, self.velocity_W[l], a_prev_layer, sparse.in_rows):
+                for j, pos in row:
+                    v_row[j] = beta_momentum * v_row[j] + learning_rate * (a_i * delta_curr_layer[j])
+                    W_row[j] = w = W_row[j] - v_row[j]
+                    if W_row is not stored_row: stored_row[j] = w
+                    values[pos] = w if full_precision else stored_row[j]
+            self.velocity_b[l] = cast_vector([beta_momentum * v + learning_rate * d for v, d in zip(self.velocity_b[l], delta_curr_layer)], self.precision)
+            new_b = [b - v for b, v in zip(b_l, self.velocity_b[l])]
+        elif optimizer_type == "adam":
+            c1, c2 = 1 - beta1_adam, 1 - beta2_adam
+            denom_beta1 = (1 - beta1_adam**self.adam_t)
+            denom_beta2 = (1 - beta2_adam**self.adam_t)
+            if denom_beta1 == 0: denom_beta1 = 1e-8
+            if denom_beta2 == 0: denom_beta2 = 1e-8
+            inv1, inv2, sqrt = 1 / denom_beta1, 1 / denom_beta2, math.sqrt
+            for W_row, stored_row, m_row, v_row, a_i, row in zip(W_l, stored, self.m_W[l], self.v_W[l], a_prev_layer, sparse.in_rows):
+                for j, pos in row:
+                    g = a_i * delta_curr_layer[j]
+                    m_row[j] = beta1_adam * m_row[j] + c1 * g
+                    v_row[j] = beta2_adam * v_row[j] + c2 * g**2
+                    W_row[j] = w = W_row[j] - (learning_rate * (inv1 * m_row[j])) / (sqrt(inv2 * v_row[j]) + epsilon_adam)
+                    if W_row is not stored_row: stored_row[j] = w
+                    values[pos] = w if full_precision else stored_row[j]
+            self.m_b[l] = cast_vector([beta1_adam * m + c1 * g for m, g in zip(self.m_b[l], delta_curr_layer)], self.precision)
+            self.v_b[l] = cast_vector([beta2_adam * v + c2 * g**2 for v, g in zip(self.v_b[l], delta_curr_layer)], self.precision)
+            new_b = [b - (learning_rate * (inv1 * m)) / (sqrt(inv2 * v) + epsilon_adam) for b, m, v in zip(b_l, self.m_b[l], self.v_b[l])]
+        else: raise ValueError(f"Bilinmeyen optimizer: {optimizer_type}")
+        self.mark_layer_changed(l)  # yoğun yol bunu _store_layer_params içinde yapar
+        if self.keep_master_weights: self.master_biases[l] = new_b
+        self.biases[l] = cast_vector(new_b, self.precision)
@@ -0,0 +1,126 @@
+# Girdi özelliklerinin ölçeklenmesi. Ham CSV sütunları çok farklı aralıklarda
+# olabilir; sigmoid/tanh ağlarda bu doygunluğa ve yavaş yakınsamaya yol açar.
+# FeatureNormalizer özellik başına istatistikleri veri üzerinden tek geçişte
+# toplar: tek satır için Welford güncellemesi, parça (chunk) için parçanın
+# kendi ortalama/M2 değeri hesaplanıp Chan birleştirmesiyle eklenir. Böylece
+# veri parça parça okunabilir ve ayrı parçaların istatistikleri birleştirilebilir
+# (ör. çapraz doğrulamada eğitim katları). Dönüşüm x' = (x - kaydırma) / ölçek:
+#  - "standard": kaydırma = ortalama, ölçek = standart sapma (z-skor),
+#  - "minmax":   kaydırma = en küçük, ölçek = en büyük - en küçük ([0, 1]).
+# Sabit sütunlarda ölçek 1 alınır. NeuralNetwork.input_normalizer ayarlıysa
+# ileri yayılım ham girdiyi bu dönüşümden geçirir; istatistikler kayıt
+# dosyasına ("input_normalization") yazılır, böylece inference.py, tahmin
+# sunucusu ve int8 modeller aynı ölçeklemeyi uygular.
+
+import math
+from operator import mul, sub
+
+NORMALIZATION_MODES = ("none", "standard", "minmax")
+NORMALIZATION_DISPLAY_NAMES = {"none": "Yok", "standard": "Standart (z-skor)", "minmax": "Min-Maks [0, 1]"}
+
+class FeatureNormalizer:
+    def __init__(self, mode="standard", n_features=0):
+        if mode not in NORMALIZATION_MODES or mode == "none": raise ValueError(f"Geçersiz normalizasyon türü: {mode} (desteklenen: standard, minmax)")
+        self.mode = mode
+        self._reset(n_features)
+
+    def _reset(self, n_features):
+        self.n_features, self.count = n_features, 0
+        self.mean, self.m2 = [0.0] * n_features, [0.0] * n_features  # Welford: ortalama ve karesel sapma toplamı
+        self.minimum, self.maximum = [math.inf] * n_features, [-math.inf] * n_features
+        self._params = None  # (kaydırma, 1/ölçek); istatistik değişince yeniden hesaplanır
+
+    def _check_width(self, width):
+        # Boş normalizasyon ilk veriden boyutunu alır.
+        if self.count == 0 and width != self.n_features: self._reset(width)
+        elif width != self.n_features: raise ValueError(f"Satır {width} özellik içeriyor; normalizasyon {self.n_features} özellik için.")
+
+    def update(self, row):
+        # Tek satır (Welford).
+        self._check_width(len(row)); self.count += 1; self._params = None
+        n, mean, m2, lo, hi = self.count, self.mean, self.m2, self.minimum, self.maximum
+        for i, x in enumerate(row):
+            d = x - mean[i]; mean[i] += d / n; m2[i] += d * (x - mean[i])
+            if x < lo[i]: lo[i] = x
+            if x > hi[i]: hi[i] = x
+
+    def update_rows(self, rows):
+        # Bir parça satır: parçanın istatistikleri sütun bazında hesaplanıp birleştirilir.
+        rows = list(rows)
+        if not rows: return self
+        width = len(rows[0])
+        if any(len(row) != width for row in rows): raise ValueError("Parçadaki satırların özellik sayıları farklı.")
+        part = FeatureNormalizer(self.mode, width); part.count = len(rows)
+        for i, col in enumerate(zip(*rows)):
+            mean = math.fsum(col) / part.count
+            part.mean[i], part.m2[i], part.minimum[i], part.maximum[i] = mean, math.fsum((x - mean) ** 2 for x in col), min(col), max(col)
+        return self.merge(part)
+
+    def merge(self, other):
+        # Chan vd. paralel birleştirme; other değişmez.
+        if other.count == 0: return self
+        self._check_width(other.n_features); self._params = None
+        n_a, n_b = self.count, other.count; n = n_a + n_b
+        for i in range(self.n_features):
+            d = other.mean[i] - self.mean[i]
+            self.mean[i] += d * n_b / n; self.m2[i] += other.m2[i] + d * d * n_a * n_b / n
+            self.minimum[i], self.maximum[i] = min(self.minimum[i], other.minimum[i]), max(self.maximum[i], other.maximum[i])
+        self.count = n
+        return self
+
+    def std(self):
+        # Popülasyon standart sapması (ölçek olarak kullanılan).
+        return [math.sqrt(m2 / self.count) if self.count else 0.0 for m2 in self.m2]
+
+    def params(self):
+        if self._params is None:
+            if self.count == 0: raise ValueError("Normalizasyon istatistikleri boş; önce veri ile hesaplayın.")
+            if self.mode == "standard": shift, scale = self.mean, self.std()
+            else: shift, scale = self.minimum, [hi - lo for lo, hi in zip(self.minimum, self.maximum)]
+            self._params = (tuple(shift), tuple(1.0 / s if s > 0 else 1.0 for s in scale))
+        return self._params
+
+    def transform(self, row):
+        shift, inv_scale = self.params()
+        if len(row) != len(shift): raise ValueError(f"Girdi boyutu ({len(row)}) normalizasyon boyutuyla ({len(shift)}) eşleşmiyor.")
+        return list(map(mul, map(sub, row, shift), inv_scale))
+
+    def transform_rows(self, rows):
+        shift, inv_scale = self.params()
+        return [list(map(mul, map(sub, row, shift), inv_scale)) for row in rows]
+
+    def state_dict(self):
+        return {"mode": self.mode, "count": self.count, "mean": list(self.mean), "m2": list(self.m2), "min": list(self.minimum), "max": list(self.maximum)}
+
+    @classmethod
+    def from_state(cls, state):
+        try:
+            normalizer = cls(state["mode"], len(state["mean"]))
+            normalizer.count = int(state["count"])
+            normalizer.mean, normalizer.m2 = [float(v) for v in state["mean"]], [float(v) for v in state["m2"]]
+            normalizer.minimum, normalizer.maximum = [float(v) for v in state["min"]], [float(v) for v in state["max"]]
+        except (KeyError, TypeError) as e: raise ValueError(f"Geçersiz normalizasyon kaydı: {e}")
+        if not len(normalizer.m2) == len(normalizer.minimum) == len(normalizer.maximum) == normalizer.n_features: raise ValueError("Normalizasyon kaydındaki vektör boyutları farklı.")
+        return normalizer
+
+def fit_normalizer(rows, mode="standard", chunk_size=4096):
+    # rows herhangi bir yinelenebilir (ör. CSV okuyucusu) olabilir; chunk_size satırlık parçalar halinde tek geçiş.
+    normalizer, chunk = FeatureNormalizer(mode), []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size: normalizer.update_rows(chunk); chunk = []
+    normalizer.update_rows(chunk)
+    if normalizer.count == 0: raise ValueError("Normalizasyon için veri yok.")
+    return normalizer
+
+def normalizer_from_checkpoint(data):
+    # Kayıt veya int8 model sözlüğündeki istatistikler (yoksa None).
+    state = data.get("input_normalization")
+    return FeatureNormalizer.from_state(state) if state else None
+
+def format_normalizer(normalizer, max_features=8):
+    shift, inv_scale = normalizer.params()
+    name = NORMALIZATION_DISPLAY_NAMES[normalizer.mode]
+    shown = ", ".join(f"x{i}: kaydırma {s:.4g}, ölçek {1.0 / k:.4g}" for i, (s, k) in enumerate(zip(shift[:max_features], inv_scale[:max_features])))
+    more = f", … (+{normalizer.n_features - max_features})" if normalizer.n_features > max_features else ""
+    return f"Girdi normalizasyonu: {name}, {normalizer.n_features} özellik, {normalizer.count} örnekten ({shown}{more})"
@@ -0,0 +1,34 @@
+# Sayısal hassasiyet ayarı. "float64" değerleri düz Python float listelerinde
+# tutar; "float32" ise her vektörü array('f') içinde paketler (eleman başına
+# 4 bayt, ayrı float nesnesi yok). Hesaplar her iki durumda da Python float
+# (double) ile yapılır, yalnızca saklanan değerler float32'ye yuvarlanır.
+
+from array import array
+
+PRECISIONS = {"float64": None, "float32": "f"}
+PRECISION_ITEM_BYTES = {"float64": 8, "float32": 4}
+DEFAULT_PRECISION = "float64"
+
+def validate_precision(precision):
+    if precision not in PRECISIONS: raise ValueError(f"Bilinmeyen hassasiyet: {precision} (geçerli: {', '.join(PRECISIONS)})")
+    return precision
+
+def cast_vector(values, precision):
+    # float64 için girdi olduğu gibi döner (kopya yok); float32 için paketlenmiş kopya oluşturulur.
+    typecode = PRECISIONS[precision]
+    return values if typecode is None else array(typecode, values)
+
+def cast_matrix(rows, precision):
+    typecode = PRECISIONS[precision]
+    return rows if typecode is None else [array(typecode, row) for row in rows]
+
+def copy_vector(values, precision):
+    typecode = PRECISIONS[precision]
+    return list(values) if typecode is None else array(typecode, values)
+
+def to_plain(obj):
+    # JSON'a yazmak için array'leri ve iç içe yapıları düz listelere çevirir.
+    if isinstance(obj, array): return obj.tolist()
+    if isinstance(obj, (list, tuple)): return [to_plain(item) for item in obj]
+    if isinstance(obj, dict): return {key: to_plain(val) for key, val in obj.items()}
+    return obj
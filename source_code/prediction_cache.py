@@ -0,0 +1,63 @@
+# Tekrarlanan ileri yayılımlar için sınırlı boyutlu LRU önbellek. Anahtar,
+# girdi vektörünün kendisidir (demet olarak hash'lenir, eşitlikle
+# karşılaştırılır); her kayıt katman başına z ve a değerlerini ve hesaplandığı
+# andaki katman sürümlerini (layer_versions) tutar. Katman sürümü optimizer
+# güncellemesi, editörden uygulama, yükleme ve budama ile artar. Aramada ilk
+# değişmiş katmana kadar olan çıktılar geçerlidir; ağ yalnızca o katmandan
+# itibaren yeniden hesaplar. Eski ağırlıklarla hesaplanmış bir katman çıktısı
+# asla döndürülmez. Hızlı matematik, hassasiyet veya girdi normalizasyonu
+# değişirse önbellek boşaltılır.
+
+from collections import OrderedDict
+
+class PredictionCache:
+    def __init__(self, max_entries=1024):
+        if max_entries < 1: raise ValueError("Önbellek boyutu en az 1 olmalı.")
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._state_key = None
+        self.hits = self.partial_hits = self.misses = self.evictions = 0
+        self.reused_layers = 0  # kısmi isabetlerde yeniden hesaplanmayan katman sayısı
+
+    def _sync(self, network):
+        # Hesaplamayı tüm katmanlarda etkileyen ayarlar değiştiyse tüm kayıtlar geçersizdir.
+        state_key = (network.fast_math, network.precision, id(network.input_normalizer))
+        if state_key != self._state_key: self._entries.clear(); self._state_key = state_key
+
+    def lookup(self, network, inputs):
+        # (z katmanları, a katmanları, geçerli katman sayısı) veya None. Geçerli katman sayısı k ise ilk k katmanın
+        # çıktıları (a_layers[:k+1], z_layers[:k]) güncel parametrelerle aynıdır.
+        self._sync(network)
+        key = tuple(inputs)
+        entry = self._entries.get(key)
+        if entry is None: self.misses += 1; return None
+        versions, z_layers, a_layers = entry
+        current = network.layer_versions
+        valid = 0
+        if len(versions) == len(current):
+            for old, new in zip(versions, current):
+                if old != new: break
+                valid += 1
+        if valid == 0: del self._entries[key]; self.misses += 1; return None
+        self._entries.move_to_end(key)
+        if valid == len(current): self.hits += 1
+        else: self.partial_hits += 1; self.reused_layers += valid
+        return z_layers, a_layers, valid
+
+    def store(self, network, inputs, z_layers, a_layers):
+        self._sync(network)
+        key = tuple(inputs)
+        self._entries[key] = (tuple(network.layer_versions), z_layers, a_layers); self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries: self._entries.popitem(last=False); self.evictions += 1
+
+    def clear(self):
+        self._entries.clear(); self._state_key = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        lookups = self.hits + self.partial_hits + self.misses
+        return {"entries": len(self._entries), "max_entries": self.max_entries, "hits": self.hits, "partial_hits": self.partial_hits,
+                "misses": self.misses, "evictions": self.evictions, "reused_layers": self.reused_layers,
+                "hit_rate": (self.hits + self.partial_hits) / lookups if lookups else 0.0}
@@ -0,0 +1,228 @@
+# Aynı makinedeki diğer servislerin kaydedilmiş ağlardan tahmin alabilmesi için
+# yerel HTTP (veya Unix soketi) tahmin sunucusu. Bir veya daha fazla JSON
+# kaydını yükler; eşzamanlı istekleri model başına bir mikro-toplayıcıda
+# (en fazla max_latency_ms bekleyerek, en fazla max_batch_size satır) birleştirip
+# tek bir toplu ileri yayılımla işler. Yalnızca standart kütüphane ve motor kullanılır.
+# Aynı süreçte eğitilen bir ağ da publish(ad, ağ) ile sunulabilir: sunucu ağın
+# salt okunur parametre görüntüsünü (NeuralNetwork.snapshot) kullanır, eğitim
+# canlı ağı güncellerken istekler etkilenmez; her publish görüntüyü atomik olarak değiştirir.
+#
+# Kullanım:
+#   python prediction_server.py iris=model.json diger.json --port 8765 --max-latency-ms 5
+#   POST /predict/<model>   {"inputs": [[...], ...]}  veya  {"input": [...]}
+#   GET  /models, /stats, /health
+
+import argparse
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from inference import load_model, predicted_class
+
+class _PendingRequest:
+    __slots__ = ("rows", "enqueued", "done", "outputs", "error")
+
+    def __init__(self, rows):
+        self.rows, self.enqueued, self.done, self.outputs, self.error = rows, time.perf_counter(), threading.Event(), None, None
+
+class MicroBatcher:
+    # Bekleyen istekleri ilk istekten itibaren en fazla max_latency_ms boyunca toplar ve
+    # tek predict_batch çağrısıyla işler. Sayaçlar /stats ile raporlanır.
+    def __init__(self, model, max_batch_size=64, max_latency_ms=5.0, latency_window=10000):
+        if max_batch_size <= 0 or max_latency_ms < 0: raise ValueError("max_batch_size pozitif, max_latency_ms negatif olmayan bir değer olmalı.")
+        self.model, self.max_batch_size, self.max_latency_s = model, max_batch_size, max_latency_ms / 1000.0
+        self._queue, self._lock = queue.Queue(), threading.Lock()
+        self._latencies, self._batch_sizes = deque(maxlen=latency_window), deque(maxlen=latency_window)
+        self.started = time.perf_counter()
+        self.requests = self.rows = self.batches = self.errors = self.model_swaps = 0
+        self.compute_seconds = 0.0
+        self._running = True
+        self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True); self._worker.start()
+
+    def swap_model(self, model):
+        # Sonraki toplamalar yeni modeli kullanır; işlenmekte olan toplama eski modelle tamamlanır.
+        if model.input_size != self.model.input_size: raise ValueError(f"Yeni modelin giriş boyutu ({model.input_size}) mevcut modelle ({self.model.input_size}) eşleşmiyor.")
+        self.model = model
+        with self._lock: self.model_swaps += 1
+
+    def submit(self, rows, timeout=30.0):
+        model = self.model
+        for row in rows:
+            if len(row) != model.input_size: raise ValueError(f"Girdi boyutu ({len(row)}) ağ giriş boyutuyla ({model.input_size}) eşleşmiyor.")
+        pending = _PendingRequest(rows); self._queue.put(pending)
+        if not pending.done.wait(timeout): raise TimeoutError("Tahmin zaman aşımına uğradı.")
+        if pending.error is not None: raise pending.error
+        return pending.outputs
+
+    def _collect(self, first):
+        batch, n_rows = [first], len(first.rows)
+        deadline = first.enqueued + self.max_latency_s
+        while n_rows < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try: pending = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty: break
+            if pending is None: self._running = False; break
+            batch.append(pending); n_rows += len(pending.rows)
+        return batch, n_rows
+
+    def _run(self):
+        while self._running:
+            first = self._queue.get()
+            if first is None: break
+            batch, n_rows = self._collect(first)
+            t0 = time.perf_counter()
+            try:
+                model = self.model  # toplama boyunca tek model (swap_model arada değiştirebilir)
+                outputs = model.predict_batch([row for pending in batch for row in pending.rows]); offset = 0
+                for pending in batch: pending.outputs = outputs[offset:offset + len(pending.rows)]; offset += len(pending.rows)
+            except Exception as e:
+                for pending in batch: pending.error = e
+            finished = time.perf_counter()
+            with self._lock:
+                self.batches += 1; self.rows += n_rows; self.requests += len(batch); self.compute_seconds += finished - t0
+                self._batch_sizes.append(n_rows)
+                for pending in batch:
+                    self._latencies.append(finished - pending.enqueued)
+                    if pending.error is not None: self.errors += 1
+            for pending in batch: pending.done.set()
+
+    def stop(self):
+        self._running = False; self._queue.put(None); self._worker.join(timeout=5)
+
+    def stats(self):
+        with self._lock:
+            latencies, batch_sizes = sorted(self._latencies), list(self._batch_sizes)
+            elapsed = time.perf_counter() - self.started
+            result = {"requests": self.requests, "rows": self.rows, "batches": self.batches, "errors": self.errors, "model_swaps": self.model_swaps,
+                      "queue_depth": self._queue.qsize(), "uptime_s": elapsed,
+                      "rows_per_second": self.rows / elapsed if elapsed > 0 else 0.0,
+                      "requests_per_second": self.requests / elapsed if elapsed > 0 else 0.0,
+                      "compute_seconds": self.compute_seconds,
+                      "mean_batch_rows": sum(batch_sizes) / len(batch_sizes) if batch_sizes else 0.0,
+                      "max_batch_size": self.max_batch_size, "max_latency_ms": self.max_latency_s * 1000.0}
+        for name, q in [("p50", 0.50), ("p95", 0.95), ("p99", 0.99)]:
+            result[f"latency_{name}_ms"] = latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000.0 if latencies else 0.0
+        return result
+
+class PredictionRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # bağlantılar yeniden kullanılabilir (keep-alive)
+    wbufsize = 1 << 16  # başlık ve gövde tek send() ile gider (Nagle + gecikmeli ACK beklemesini önler)
+
+    def address_string(self):
+        return self.client_address[0] if isinstance(self.client_address, tuple) and self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose: super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status); self.send_header("Content-Type", "application/json"); self.send_header("Content-Length", str(len(body))); self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        if self.path == "/health": self._send_json(200, {"status": "ok"})
+        elif self.path == "/models":
+            self._send_json(200, {name: {"input_size": b.model.input_size, "output_size": b.model.output_size, "layer_configs": b.model.layer_configs, "path": server.model_paths[name]}
+                                  for name, b in server.batchers.items()})
+        elif self.path == "/stats": self._send_json(200, {name: b.stats() for name, b in server.batchers.items()})
+        else: self._send_json(404, {"error": f"Bilinmeyen yol: {self.path}"})
+
+    def do_POST(self):
+        if not self.path.startswith("/predict/"): self._send_json(404, {"error": f"Bilinmeyen yol: {self.path}"}); return
+        name = self.path[len("/predict/"):]
+        batcher = self.server.batchers.get(name)
+        length = int(self.headers.get("Content-Length") or 0); raw = self.rfile.read(length) if length else b""
+        if batcher is None: self._send_json(404, {"error": f"Bilinmeyen model: {name}"}); return
+        try:
+            payload = json.loads(raw or b"{}")
+            single = "input" in payload
+            rows = [payload["input"]] if single else payload.get("inputs")
+            if not isinstance(rows, list) or not rows: raise ValueError("'input' veya boş olmayan 'inputs' alanı gerekli.")
+            rows = [[float(v) for v in row] for row in rows]
+            outputs = batcher.submit(rows)
+        except (ValueError, TypeError, KeyError) as e: self._send_json(400, {"error": str(e)}); return
+        except TimeoutError as e: self._send_json(503, {"error": str(e)}); return
+        except Exception as e: self._send_json(500, {"error": str(e)}); return
+        response = {"model": name, "outputs": outputs}
+        if batcher.model.has_class_output(): response["classes"] = [predicted_class(out) for out in outputs]
+        if single: response = {"model": name, "output": outputs[0], **({"class": response["classes"][0]} if "classes" in response else {})}
+        self._send_json(200, response)
+
+class _ModelHostMixin:
+    daemon_threads = True
+    request_queue_size = 128  # çok sayıda eşzamanlı istemci aynı anda bağlanabilir
+    verbose = False
+
+    def attach_models(self, batchers, model_paths, verbose=False):
+        self.batchers, self.model_paths, self.verbose = batchers, model_paths, verbose
+
+    def publish(self, name, network, max_batch_size=64, max_latency_ms=5.0):
+        # Canlı NeuralNetwork'ün görüntüsünü (veya hazır bir ParameterSnapshot'ı) 'name' adıyla sunar; ad varsa modeli değiştirir.
+        # Ağ eğitiliyorsa eğiticinin iş parçacığında (güncellemeler arasında, ör. her epoch sonunda) çağrılmalıdır.
+        model = network.snapshot() if hasattr(network, "snapshot") else network
+        batcher = self.batchers.get(name)
+        if batcher is None: self.batchers[name] = MicroBatcher(model, max_batch_size, max_latency_ms); self.model_paths[name] = "<canlı ağ>"
+        else: batcher.swap_model(model)
+        return model
+
+    def stop_batchers(self):
+        for batcher in self.batchers.values(): batcher.stop()
+
+class PredictionHTTPServer(_ModelHostMixin, ThreadingHTTPServer):
+    pass
+
+if hasattr(socket, "AF_UNIX"):
+    class PredictionUnixServer(_ModelHostMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        pass
+
+def parse_model_specs(specs):
+    # "ad=yol.json" veya "yol.json" (ad = dosya adı) biçimlerini {ad: yol} sözlüğüne çevirir.
+    models = {}
+    for spec in specs:
+        name, _, path = spec.partition("=") if "=" in spec else (os.path.splitext(os.path.basename(spec))[0], "", spec)
+        if not name or name in models: raise ValueError(f"Geçersiz veya tekrarlanan model adı: {spec}")
+        models[name] = path
+    return models
+
+def create_server(model_paths, host="127.0.0.1", port=8765, unix_socket=None, max_batch_size=64, max_latency_ms=5.0, fast_math=False, verbose=False):
+    batchers = {name: MicroBatcher(load_model(path, fast_math), max_batch_size, max_latency_ms) for name, path in model_paths.items()}
+    if unix_socket:
+        if not hasattr(socket, "AF_UNIX"): raise ValueError("Bu platform Unix soketlerini desteklemiyor.")
+        if os.path.exists(unix_socket): os.unlink(unix_socket)
+        server = PredictionUnixServer(unix_socket, PredictionRequestHandler)
+    else: server = PredictionHTTPServer((host, port), PredictionRequestHandler)
+    server.attach_models(batchers, model_paths, verbose)
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaydedilmiş ağlar için yerel tahmin sunucusu (mikro-toplamalı)")
+    parser.add_argument("models", nargs="+", help="Model kayıtları: ad=yol.json veya yol.json")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="TCP yerine bu yoldaki Unix soketini dinle")
+    parser.add_argument("--max-batch-size", type=int, default=64, help="Bir mikro-toplamadaki en fazla satır")
+    parser.add_argument("--max-latency-ms", type=float, default=5.0, help="İlk istekten sonra toplama için beklenecek en uzun süre")
+    parser.add_argument("--fast-math", action="store_true", help="Yaklaşık (hızlı) sigmoid kullan")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Her isteği günlüğe yaz")
+    args = parser.parse_args(argv)
+    try: server = create_server(parse_model_specs(args.models), args.host, args.port, args.unix, args.max_batch_size, args.max_latency_ms, args.fast_math, args.verbose)
+    except ValueError as e: parser.error(str(e))
+    where = args.unix if args.unix else f"http://{args.host}:{server.server_address[1]}"
+    print(f"{len(server.batchers)} model yüklendi ({', '.join(server.batchers)}); dinleniyor: {where}")
+    try: server.serve_forever()
+    except KeyboardInterrupt: pass
+    finally:
+        server.stop_batchers(); server.server_close()
+        if args.unix and os.path.exists(args.unix): os.unlink(args.unix)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+# Eğitim döngüsünün aşamalarını (ileri yayılım, delta hesabı, optimizer,
+# kayıp/metrik hesabı, arayüz güncellemeleri) katman ve epoch bazında ölçen
+# hafif profil aracı. Kapalıyken yalnızca bir bayrak kontrolü maliyeti vardır.
+
+import os
+import threading
+import time
+from functools import wraps
+
+class Profiler:
+    def __init__(self, enabled=False, max_trace_events=200000):
+        self.enabled = enabled
+        self.max_trace_events = max_trace_events
+        self.current_epoch = None
+        self.reset()
+
+    def reset(self):
+        self.stats = {}
+        self.epoch_totals = {}
+        self.trace_events = []
+        self.dropped_trace_events = 0
+        self._origin = time.perf_counter()
+
+    def set_enabled(self, enabled):
+        self.enabled = bool(enabled)
+
+    now = staticmethod(time.perf_counter)
+
+    def record(self, phase, start, layer=None, category="nn", end=None):
+        # start/end perf_counter değerleridir; end verilmezse şu an kullanılır.
+        if end is None: end = time.perf_counter()
+        duration = end - start
+        key = (phase, layer)
+        entry = self.stats.get(key)
+        if entry is None: self.stats[key] = [1, duration, duration, category]
+        else:
+            entry[0] += 1; entry[1] += duration
+            if duration > entry[2]: entry[2] = duration
+        if self.current_epoch is not None:
+            per_epoch = self.epoch_totals.setdefault(self.current_epoch, {})
+            per_epoch[phase] = per_epoch.get(phase, 0.0) + duration
+        if len(self.trace_events) < self.max_trace_events:
+            args = {}
+            if layer is not None: args["layer"] = layer
+            if self.current_epoch is not None: args["epoch"] = self.current_epoch
+            self.trace_events.append({"name": phase if layer is None else f"{phase}[L{layer}]", "cat": category, "ph": "X",
+                                      "ts": (start - self._origin) * 1e6, "dur": duration * 1e6,
+                                      "pid": os.getpid(), "tid": threading.get_ident(), "args": args})
+        else: self.dropped_trace_events += 1
+
+    def summary_rows(self):
+        # (aşama, katman, çağrı, toplam_s, ortalama_s, maks_s, yüzde) satırları, toplam süreye göre azalan.
+        # Yüzdeler, diğer aşamaları kapsayan "epoch" ölçümleri hariç tutularak hesaplanır.
+        grand_total = sum(entry[1] for entry in self.stats.values() if entry[3] != "epoch") or 1.0
+        rows = [(phase, layer, count, total, total / count, max_d, 100.0 * total / grand_total if category != "epoch" else 100.0)
+                for (phase, layer), (count, total, max_d, category) in self.stats.items()]
+        rows.sort(key=lambda r: r[3], reverse=True)
+        return rows
+
+    def export_chrome_trace(self, file_path):
+        # chrome://tracing ve Perfetto'nun okuyabildiği trace-event JSON formatı.
+        import json  # motorun içe aktarma süresini kısa tutmak için yalnızca dışa aktarımda yüklenir
+        data = {"traceEvents": self.trace_events, "displayTimeUnit": "ms",
+                "otherData": {"dropped_events": self.dropped_trace_events}}
+        with open(file_path, 'w') as f: json.dump(data, f)
+        return len(self.trace_events)
+
+def profiled_method(phase, category="gui"):
+    # self.profiler özniteliği olan sınıfların metotlarını ölçer; profil kapalıyken doğrudan çağırır.
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            prof = self.profiler
+            if not prof.enabled: return func(self, *args, **kwargs)
+            start = prof.now()
+            try: return func(self, *args, **kwargs)
+            finally: prof.record(phase, start, category=category)
+        return wrapper
+    return decorator
@@ -0,0 +1,159 @@
+# Büyüklüğe (|w|) göre budama. Eşik tüm ağ için (global) veya her katman için
+# ayrı hesaplanır; budanan bağlantılar 0'a çekilir ve katman CSR biçiminde
+# seyrek bir gösterime (SparseLayer) çevrilir. İleri/geri yayılım, optimizer
+# güncellemesi, derlenmiş yol ve çizim yalnızca kalan bağlantıları işler;
+# budanmış bağlantılar ince ayar sırasında da 0 kalır. İsteğe bağlı olarak
+# hedef seyreklik birkaç adımda, aralarda ince ayar (fine-tuning) yapılarak
+# uygulanır. Yoğun ağırlık listeleri (editör, kayıt, çizim için) korunur.
+
+import math
+import time
+from operator import itemgetter, mul
+
+from utils import predicted_class
+
+PRUNING_SCOPES = ("global", "layer")
+# Sıfır olmayan ağırlık oranı bu değerin altındaki katmanlar (ör. budanmış ağlar) çıkarım çalışma zamanlarında seyrek sütunlarla hesaplanır.
+SPARSE_DENSITY_THRESHOLD = 0.6
+
+def make_gather(indices):
+    # a -> (a[i] for i in indices) demeti; itemgetter tek indekste demet döndürmediği için özel durumlar ayrılır.
+    if not indices: return lambda seq: ()
+    if len(indices) == 1:
+        i = indices[0]
+        return lambda seq: (seq[i],)
+    return itemgetter(*indices)
+
+class SparseLayer:
+    # CSR: satır j = bu katmanın j. nöronu; indices[indptr[j]:indptr[j+1]] kalan girdi nöronları,
+    # values aynı sıradaki ağırlıklar. Geri yayılım için girdi sıralı görünüm (in_rows: i -> [(j, konum)]) de tutulur.
+    def __init__(self, n_in, n_out, indptr, indices, values):
+        if len(indptr) != n_out + 1 or len(indices) != len(values) or indptr[-1] != len(indices): raise ValueError("Geçersiz CSR yapısı.")
+        self.n_in, self.n_out, self.indptr, self.indices, self.values = n_in, n_out, indptr, indices, values
+        self.in_rows = [[] for _ in range(n_in)]
+        for j in range(n_out):
+            for p in range(indptr[j], indptr[j + 1]): self.in_rows[indices[p]].append((j, p))
+        self._row_gathers = [make_gather(indices[indptr[j]:indptr[j + 1]]) for j in range(n_out)]
+        self._col_gathers = [(make_gather([j for j, _ in row]), make_gather([p for _, p in row])) for row in self.in_rows]
+
+    @classmethod
+    def from_dense(cls, W, keep):
+        # W: n_in x n_out yoğun matris; keep[i][j] doğruysa bağlantı korunur.
+        n_in, n_out = len(W), len(W[0]) if W else 0
+        indptr, indices, values = [0], [], []
+        for j in range(n_out):
+            for i in range(n_in):
+                if keep[i][j]: indices.append(i); values.append(W[i][j])
+            indptr.append(len(indices))
+        return cls(n_in, n_out, indptr, indices, values)
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    @property
+    def density(self):
+        return self.nnz / (self.n_in * self.n_out) if self.n_in * self.n_out else 0.0
+
+    def row_indices(self, j):
+        return self.indices[self.indptr[j]:self.indptr[j + 1]]
+
+    def keep_mask(self):
+        keep = [[False] * self.n_out for _ in range(self.n_in)]
+        for j in range(self.n_out):
+            for i in self.row_indices(j): keep[i][j] = True
+        return keep
+
+    def refresh_values(self, W):
+        # Yoğun matristeki (ör. float32'ye yuvarlanmış) değerleri kopyalar.
+        indices, indptr = self.indices, self.indptr
+        self.values = [W[indices[p]][j] for j in range(self.n_out) for p in range(indptr[j], indptr[j + 1])]
+
+    def matvec(self, a):
+        # z_j = Σ_i a_i · W[i][j] (yalnızca kalan bağlantılar); yoğun çarpımla aynı toplama sırası.
+        values, indptr = self.values, self.indptr
+        return [sum(map(mul, gather(a), values[indptr[j]:indptr[j + 1]]), 0.0) for j, gather in enumerate(self._row_gathers)]
+
+    def rmatvec(self, delta):
+        # e_i = Σ_j δ_j · W[i][j] (geri yayılımda önceki katmana taşınan hata).
+        values = self.values
+        return [sum(map(mul, gather_delta(delta), gather_values(values)), 0.0) for gather_delta, gather_values in self._col_gathers]
+
+    def signature(self):
+        return tuple(tuple(self.row_indices(j)) for j in range(self.n_out))
+
+def magnitude_keep_masks(weights, sparsity, scope="global", current=None):
+    # En küçük |w| değerli bağlantılar, (global kapsamda tüm ağın, katman kapsamında her katmanın) 'sparsity'
+    # oranı budanmış olacak şekilde keep maskeleri döndürür. current (katman başına keep maskesi veya None)
+    # verilirse önceden budanmış bağlantılar budanmış kalır ve sayıma dahildir; hedef kümülatiftir.
+    if not 0.0 <= sparsity < 1.0: raise ValueError("Seyreklik oranı [0, 1) aralığında olmalı.")
+    if scope not in PRUNING_SCOPES: raise ValueError(f"Bilinmeyen budama kapsamı: {scope} (geçerli: {', '.join(PRUNING_SCOPES)})")
+    current = current or [None] * len(weights)
+    masks = [[list(keep[i]) if keep is not None else [True] * len(row) for i, row in enumerate(W)] for W, keep in zip(weights, current)]
+    groups = [list(range(len(weights)))] if scope == "global" else [[l] for l in range(len(weights))]
+    for group in groups:
+        total = sum(len(weights[l]) * len(weights[l][0]) for l in group if weights[l])
+        candidates = [(abs(w), l, i, j) for l in group for i, row in enumerate(weights[l]) for j, w in enumerate(row) if masks[l][i][j]]
+        n_prune = int(math.floor(sparsity * total)) - (total - len(candidates))
+        for _, l, i, j in sorted(candidates)[:max(0, n_prune)]: masks[l][i][j] = False
+    return masks
+
+def prune_network(network, sparsity, scope="global"):
+    # Ağı yerinde budar; katman başına {"layer", "kept", "total", "density"} listesi döndürür.
+    current = [sparse.keep_mask() if sparse is not None else None for sparse in network.sparse_layers]
+    masks = magnitude_keep_masks(network.get_full_precision_params()[0], sparsity, scope, current)
+    for l, mask in enumerate(masks): network.set_layer_mask(l, mask)
+    return sparsity_report(network)
+
+def sparsity_report(network):
+    report = []
+    for l, W in enumerate(network.weights):
+        total = len(W) * (len(W[0]) if W else 0); sparse = network.sparse_layers[l]
+        kept = sparse.nnz if sparse is not None else total
+        report.append({"layer": l, "kept": kept, "total": total, "density": kept / total if total else 0.0})
+    return report
+
+def evaluate_network(network, X, Y):
+    # Ortalama kayıp ve (sınıflandırma çıkışında) doğruluk; ağın eğitim durumunu değiştirmez.
+    n_out, out_activation = network.layer_configs[-1]
+    classify = n_out > 1 or out_activation == "sigmoid"
+    loss_sum, correct = 0.0, 0
+    for x, y in zip(X, Y):
+        outputs = network.predict(x)
+        loss_sum += network.loss_func(y, outputs)
+        if classify and predicted_class(list(outputs)) == predicted_class(list(y)): correct += 1
+    n = len(X) or 1
+    return {"loss": loss_sum / n, "accuracy": correct / n if classify else None}
+
+def time_forward(network, X, repeat=3):
+    # Veri kümesi üzerinde ileri yayılımın en iyi süresi (saniye).
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for x in X: network.forward(x)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def measure_speedup(network, X, repeat=3):
+    # Aynı ağırlıklarla seyrek ve yoğun (budanmış bağlantılar 0 olarak hesaplanır) ileri yayılım süreleri.
+    profiler_enabled, network.profiler.enabled = network.profiler.enabled, False
+    sparse_layers = list(network.sparse_layers)
+    try:
+        sparse_s = time_forward(network, X, repeat)
+        network.sparse_layers = [None] * len(sparse_layers)
+        dense_s = time_forward(network, X, repeat)
+    finally: network.sparse_layers, network.profiler.enabled = sparse_layers, profiler_enabled
+    return {"sparse_s": sparse_s, "dense_s": dense_s, "speedup": dense_s / sparse_s if sparse_s > 0 else 0.0}
+
+def iterative_prune(network, X, Y, target_sparsity, steps=1, finetune_epochs=0, learning_rate=0.01, optimizer_params=None, scope="global", callback=None):
+    # Seyreklik steps adımda doğrusal olarak hedefe çıkarılır; her budamadan sonra finetune_epochs epoch ince ayar yapılır.
+    # callback(adım, seyreklik, değerlendirme) her adım sonunda çağrılır. Önce/sonra değerlendirme ve hız ölçümünü döndürür.
+    if steps < 1: raise ValueError("Budama adım sayısı en az 1 olmalı.")
+    before = evaluate_network(network, X, Y)
+    for step in range(1, steps + 1):
+        sparsity = target_sparsity * step / steps
+        prune_network(network, sparsity, scope)
+        for _ in range(finetune_epochs): network.train_epoch(X, Y, learning_rate, optimizer_params)
+        if callback is not None: callback(step, sparsity, evaluate_network(network, X, Y))
+    after = evaluate_network(network, X, Y)
+    return {"before": before, "after": after, "layers": sparsity_report(network), "timing": measure_speedup(network, X)}
@@ -0,0 +1,213 @@
+# Eğitim sonrası int8 nicemleme (post-training quantization). Eğitilmiş ağın
+# ağırlıkları katman başına simetrik bir ölçekle int8'e yuvarlanır; her
+# katmanın girdi ölçeği, yüklenen veri setinden alınan bir kalibrasyon
+# örneğinde gözlenen en büyük |a| değerinden belirlenir. Nicemlenmiş ileri
+# yayılımda girdi int8'e çevrilir, çarpımlar tamsayı olarak toplanır (bias
+# tamsayı toplama dahil edilir), sonuç float'a geri çevrilip aktivasyon float
+# olarak uygulanır. Model, int8 ağırlıkları base64 ile saklayan kompakt bir
+# JSON dosyasına yazılır ve inference.py / prediction_server.py tarafından
+# doğrudan yüklenebilir. Ağın girdi normalizasyonu varsa istatistikleri modele
+# yazılır ve nicemlenmiş ileri yayılım ham girdiyi aynı şekilde ölçekler. Float ağa karşı doğruluk raporu (çıktı hatası, kayıp,
+# doğruluk, karmaşıklık matrisi metrikleri) üretilir.
+#
+# Kullanım:
+#   python quantization.py model.json veri.csv model_int8.json --calibration-samples 256
+
+import argparse
+import base64
+import json
+import random
+import sys
+from array import array
+from operator import mul
+
+from utils import ACTIVATION_VECTOR_FUNCTIONS, FAST_ACTIVATION_VECTOR_FUNCTIONS, predicted_class
+from data_io import read_csv_dataset, load_checkpoint, network_from_checkpoint
+from metrics import classification_metrics, format_confusion_matrix
+from pruning import SPARSE_DENSITY_THRESHOLD, make_gather
+from normalization import normalizer_from_checkpoint
+from forward_context import ForwardContext
+
+QUANTIZED_FORMAT = "int8-v1"
+INT8_MAX = 127
+DEFAULT_CALIBRATION_SAMPLES = 256
+
+def symmetric_scale(max_abs):
+    # [-max_abs, max_abs] aralığı [-127, 127] tamsayılarına eşlenir.
+    return max_abs / INT8_MAX if max_abs > 0 else 1.0
+
+def quantize_values(values, scale):
+    inv_scale = 1.0 / scale
+    return [max(-INT8_MAX, min(INT8_MAX, round(v * inv_scale))) for v in values]
+
+def logit_error_bound(inputs, weight_column, input_scale, weight_scale):
+    # Girdiler kalibrasyon aralığındaysa (|a| ≤ 127·s_a) bir nöronun int8 z'sinin float z'ye göre hata üst sınırı:
+    # |Δa| ≤ s_a/2, |Δw| ≤ s_w/2 ve bias yuvarlaması ≤ s_a·s_w/2 için Σ(|Δa||w| + |a||Δw| + |Δa||Δw|) + s_a·s_w/2.
+    e_a, e_w = input_scale / 2, weight_scale / 2
+    return sum(e_a * abs(w) + e_w * abs(x) + e_a * e_w for x, w in zip(inputs, weight_column)) + input_scale * weight_scale / 2
+
+def calibrate_input_ranges(network, X, max_samples=DEFAULT_CALIBRATION_SAMPLES, seed=0):
+    # Her katmanın girdisi (ilk katmanda (normalize edilmiş) veri, sonrakilerde önceki katmanın aktivasyonu) için gözlenen en büyük |a|.
+    sample = list(X) if len(X) <= max_samples else random.Random(seed).sample(list(X), max_samples)
+    # Canlı ileri yayılım durumuna (neuron_outputs_*, current_input_for_forward, tahmin önbelleği) dokunmamak için görüntü + bağlam.
+    ranges, snap, ctx = [0.0] * len(network.weights), network.snapshot(), ForwardContext()
+    for x in sample:
+        snap.forward(x, ctx)
+        for l, a in enumerate(ctx.a_layers[:-1]): ranges[l] = max(ranges[l], max(map(abs, a), default=0.0))
+    return ranges, len(sample)
+
+class QuantizedModel:
+    # InferenceModel ile aynı arayüze sahip durumsuz int8 model. Katman l için:
+    # q_a = yuvarla(a / s_a), z_j = (Σ_i q_a[i]·q_w[i][j] + q_b[j]) · s_a·s_w, a' = aktivasyon(z).
+    # Budanmış (çoğu sıfır) katmanlarda sütunlar yalnızca sıfır olmayan ağırlıkları içerir.
+    def __init__(self, input_size, layer_configs, layers, fast_math=False, calibration=None, normalizer=None):
+        if len(layers) != len(layer_configs): raise ValueError("Nicemlenmiş katman sayısı yapılandırmayla eşleşmiyor.")
+        if normalizer is not None and normalizer.n_features != input_size: raise ValueError(f"Normalizasyon {normalizer.n_features} özellik için; ağ girişi {input_size}.")
+        self.input_size, self.layer_configs, self.quantized_layers = input_size, [tuple(cfg) for cfg in layer_configs], layers
+        self.normalizer = normalizer
+        self.calibration = calibration or {}
+        table = FAST_ACTIVATION_VECTOR_FUNCTIONS if fast_math else ACTIVATION_VECTOR_FUNCTIONS
+        self.layers, prev = [], input_size
+        for i, ((num_neurons, activation_name), layer) in enumerate(zip(self.layer_configs, layers)):
+            columns = [tuple(col) for col in layer["columns"]]
+            if len(columns) != num_neurons or len(layer["biases"]) != num_neurons or any(len(col) != prev for col in columns):
+                raise ValueError(f"Katman {i+1} nicemlenmiş ağırlık boyutları beklenen ({prev}x{num_neurons}) ile eşleşmiyor.")
+            out_scale = layer["input_scale"] * layer["weight_scale"]
+            bias_q = [round(b / out_scale) for b in layer["biases"]]  # bias, tamsayı toplamla aynı ölçekte
+            gathers = None
+            if prev and num_neurons and sum(1 for col in columns for w in col if w) < SPARSE_DENSITY_THRESHOLD * prev * num_neurons:
+                kept = [[k for k, w in enumerate(col) if w] for col in columns]
+                gathers, columns = [make_gather(idx) for idx in kept], [tuple(col[k] for k in idx) for col, idx in zip(columns, kept)]
+            self.layers.append((1.0 / layer["input_scale"], out_scale, columns, bias_q, table[activation_name][0], gathers))
+            prev = num_neurons
+        self.output_size, self.output_activation = prev, self.layer_configs[-1][1]
+
+    @classmethod
+    def from_artifact(cls, data, fast_math=False):
+        if data.get("format") != QUANTIZED_FORMAT: raise ValueError(f"Desteklenmeyen nicemlenmiş model biçimi: {data.get('format')}")
+        layers = []
+        for layer in data["layers"]:
+            n_in, n_out = layer["shape"]
+            flat = array("b", base64.b64decode(layer["weights"]))
+            if len(flat) != n_in * n_out: raise ValueError("Nicemlenmiş ağırlık verisi katman boyutuyla eşleşmiyor.")
+            columns = [flat[j * n_in:(j + 1) * n_in].tolist() for j in range(n_out)]
+            layers.append({"input_scale": layer["input_scale"], "weight_scale": layer["weight_scale"], "columns": columns, "biases": layer["biases"]})
+        return cls(data["input_size"], data["layer_configs"], layers, fast_math, data.get("calibration"), normalizer_from_checkpoint(data))
+
+    def to_artifact(self):
+        # Ağırlıklar sütun sırasıyla (nöron başına gelen ağırlıklar) int8 bayt dizisi olarak base64 ile yazılır.
+        layers = [{"shape": [len(layer["columns"][0]) if layer["columns"] else 0, len(layer["columns"])],
+                   "input_scale": layer["input_scale"], "weight_scale": layer["weight_scale"],
+                   "weights": base64.b64encode(array("b", [w for col in layer["columns"] for w in col]).tobytes()).decode("ascii"),
+                   "biases": list(layer["biases"])} for layer in self.quantized_layers]
+        artifact = {"format": QUANTIZED_FORMAT, "input_size": self.input_size, "layer_configs": [list(cfg) for cfg in self.layer_configs],
+                    "layers": layers, "calibration": self.calibration}
+        if self.normalizer is not None: artifact["input_normalization"] = self.normalizer.state_dict()
+        return artifact
+
+    def _forward_row(self, row, return_logits=False, trace=None):
+        # trace (liste) verilirse her katman için (float girdi, z) eklenir; hata sınırı kontrolünde kullanılır.
+        a, z = row if self.normalizer is None else self.normalizer.transform(row), None
+        for inv_in_scale, out_scale, columns, bias_q, activation, gathers in self.layers:
+            q = list(map(round, map(inv_in_scale.__mul__, a)))
+            if q and (max(q) > INT8_MAX or min(q) < -INT8_MAX): q = [max(-INT8_MAX, min(INT8_MAX, v)) for v in q]  # kalibrasyon aralığı dışı
+            if gathers is None: acc = [sum(map(mul, q, col)) + b for col, b in zip(columns, bias_q)]
+            else: acc = [sum(map(mul, gather(q), col)) + b for gather, col, b in zip(gathers, columns, bias_q)]
+            z = list(map(out_scale.__mul__, acc))
+            if trace is not None: trace.append((a, z))
+            a = activation(z)
+        return (a, z) if return_logits else a
+
+    def predict_batch(self, rows):
+        for row in rows:
+            if len(row) != self.input_size: raise ValueError(f"Girdi boyutu ({len(row)}) ağ giriş boyutuyla ({self.input_size}) eşleşmiyor.")
+        return [self._forward_row(row) for row in rows]
+
+    def predict_batch_with_logits(self, rows):
+        for row in rows:
+            if len(row) != self.input_size: raise ValueError(f"Girdi boyutu ({len(row)}) ağ giriş boyutuyla ({self.input_size}) eşleşmiyor.")
+        return [self._forward_row(row, True) for row in rows]
+
+    def has_class_output(self):
+        return self.output_size > 1 or self.output_activation == "sigmoid"
+
+    def weight_count(self):
+        return sum(len(layer["columns"]) * (len(layer["columns"][0]) if layer["columns"] else 0) for layer in self.quantized_layers)
+
+def quantize_network(network, X_calibration, max_samples=DEFAULT_CALIBRATION_SAMPLES, seed=0, fast_math=False):
+    # Eğitilmiş ağı (varsa float64 ana ağırlıklarından) nicemler; kalibrasyon örneği X'ten rastgele seçilir.
+    if not network.weights: raise ValueError("Nicemlenecek ağ yok.")
+    if not X_calibration: raise ValueError("Kalibrasyon için veri gerekli.")
+    ranges, n_samples = calibrate_input_ranges(network, X_calibration, max_samples, seed)
+    weights, biases = network.get_full_precision_params()
+    layers = []
+    for W, b, max_abs_in in zip(weights, biases, ranges):
+        weight_scale = symmetric_scale(max((abs(w) for row in W for w in row), default=0.0))
+        layers.append({"input_scale": symmetric_scale(max_abs_in), "weight_scale": weight_scale,
+                       "columns": [quantize_values([row[j] for row in W], weight_scale) for j in range(len(b))], "biases": [float(v) for v in b]})
+    return QuantizedModel(len(weights[0]), network.layer_configs, layers, fast_math, {"samples": n_samples, "input_ranges": ranges}, network.input_normalizer)
+
+def is_quantized_artifact(data):
+    return isinstance(data, dict) and data.get("format") == QUANTIZED_FORMAT
+
+def save_quantized_model(file_path, model):
+    with open(file_path, 'w') as f: json.dump(model.to_artifact(), f, separators=(",", ":"))
+
+def load_quantized_model(file_path, fast_math=False):
+    return QuantizedModel.from_artifact(load_checkpoint(file_path), fast_math)
+
+def quantization_report(network, model, X, Y=None):
+    # Aynı girdilerde float ağ ile int8 modelin karşılaştırması. Y verilirse kayıp, doğruluk ve
+    # (çok sınıflı çıkışta) karmaşıklık matrisi metrikleri her iki model için hesaplanır.
+    float_outputs = [network.predict(x) for x in X]
+    int8_outputs = model.predict_batch(X)
+    errors = [abs(f - q) for f_row, q_row in zip(float_outputs, int8_outputs) for f, q in zip(f_row, q_row)]
+    n = len(X) or 1
+    report = {"samples": len(X), "max_abs_error": max(errors, default=0.0), "mean_abs_error": sum(errors) / len(errors) if errors else 0.0,
+              "agreement": None, "weight_count": model.weight_count()}
+    classify = model.has_class_output()
+    if classify: report["agreement"] = sum(predicted_class(f) == predicted_class(q) for f, q in zip(float_outputs, int8_outputs)) / n
+    if Y is not None:
+        Y = [list(y) for y in Y]
+        for name, outputs in [("float", float_outputs), ("int8", int8_outputs)]:
+            report[f"{name}_loss"] = sum(network.loss_func(y, out) for y, out in zip(Y, outputs)) / n
+            report[f"{name}_accuracy"] = sum(predicted_class(out) == predicted_class(y) for y, out in zip(Y, outputs)) / n if classify else None
+            report[f"{name}_metrics"], report[f"{name}_confusion"] = classification_metrics(Y, outputs, model.output_size) if model.output_size > 1 else ({}, None)
+    return report
+
+def format_quantization_report(report):
+    lines = [f"Ağırlıklar: {report['weight_count']} (float64 {report['weight_count'] * 8} bayt -> int8 {report['weight_count']} bayt)",
+             f"Çıktı farkı ({report['samples']} örnek): en büyük {report['max_abs_error']:.6f}, ortalama {report['mean_abs_error']:.6f}"]
+    if report["agreement"] is not None: lines.append(f"Sınıf tahmini uyumu (float ile): {report['agreement']:.4f}")
+    if "float_loss" in report:
+        lines.append(f"Kayıp: float {report['float_loss']:.6f}, int8 {report['int8_loss']:.6f}")
+        if report["float_accuracy"] is not None: lines.append(f"Doğruluk: float {report['float_accuracy']:.4f}, int8 {report['int8_accuracy']:.4f}")
+        for key in report["float_metrics"]:
+            if "Macro" in key: lines.append(f"{key}: float {report['float_metrics'][key]:.4f}, int8 {report['int8_metrics'][key]:.4f}")
+        if report["int8_confusion"] is not None: lines.append("int8 karmaşıklık matrisi:\n" + format_confusion_matrix(report["int8_confusion"]).rstrip("\n"))
+    return lines
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaydedilmiş ağı int8'e nicemle ve float ağa karşı doğruluk raporu üret")
+    parser.add_argument("model", help="'Ağı Kaydet' ile kaydedilmiş JSON dosyası")
+    parser.add_argument("data", help="Kalibrasyon ve rapor için CSV (başlıklı; ilk giriş_boyutu sütunu X, kalanlar Y)")
+    parser.add_argument("output", help="Nicemlenmiş modelin yazılacağı JSON dosyası")
+    parser.add_argument("--calibration-samples", type=int, default=DEFAULT_CALIBRATION_SAMPLES, help="Kalibrasyonda kullanılacak en fazla örnek")
+    parser.add_argument("--seed", type=int, default=0, help="Kalibrasyon örneği seçimi için tohum")
+    args = parser.parse_args(argv)
+    if args.calibration_samples <= 0: parser.error("--calibration-samples pozitif olmalı")
+    data = load_checkpoint(args.model)
+    if is_quantized_artifact(data): parser.error("Girdi zaten nicemlenmiş bir model")
+    network = network_from_checkpoint(data)
+    n_out = network.layer_configs[-1][0]
+    try: X, Y, _ = read_csv_dataset(args.data, data["input_size"], n_out, network.loss_function_name == "cross_entropy", warn=lambda msg: print(msg, file=sys.stderr))
+    except ValueError as e: print(f"Hata: {e}", file=sys.stderr); return 1
+    if not X: print("Hata: CSV'de geçerli satır yok.", file=sys.stderr); return 1
+    model = quantize_network(network, X, args.calibration_samples, args.seed)
+    save_quantized_model(args.output, model)
+    print(f"Nicemlenmiş model yazıldı: {args.output} ({model.calibration['samples']} örnekle kalibre edildi)")
+    for line in format_quantization_report(quantization_report(network, model, X, Y)): print(line)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+# Eğitim boyunca ağırlıkların epoch epoch izlenebilmesi için diskte sınırlı
+# boyutlu anlık görüntü (snapshot) halkası. Parametreler (katman başına
+# ağırlıklar satır satır, ardından biaslar) tek bir düz vektör olarak ele
+# alınır. Her grup bir anahtar kare (keyframe, float64, kayıpsız) ile başlar;
+# sonraki görüntüler yalnızca anahtar kareye göre farkı (residual) saklar:
+# float64, float32, float16 veya katman başına simetrik ölçekli int8. Fark her
+# zaman anahtar kareye göre alındığı için kayıplı biçimlerde hata birikmez;
+# bir epoch'u yüklemek bir anahtar kare + bir fark okumaktır (eğitim yeniden
+# oynatılmaz). Toplam boyut max_bytes'ı aşarsa en eski grup (anahtar kare ve
+# farkları) silinir. Dizin içeriği index.json'da tutulur, yeniden açılabilir.
+
+import json
+import os
+import struct
+from operator import add, sub
+
+from quantization import quantize_values, symmetric_scale
+
+RESIDUAL_FORMATS = ("float64", "float32", "float16", "int8")
+DEFAULT_RESIDUAL_FORMAT = "float32"
+DEFAULT_KEYFRAME_INTERVAL = 10  # grup başına görüntü sayısı (anahtar kare dahil)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+INDEX_FILE = "index.json"
+_STRUCT_CODES = {"float64": "d", "float32": "f", "float16": "e", "int8": "b"}
+
+def flatten_params(network):
+    # (düz parametre listesi, [[n_in, n_out], ...]); float64 ana kopya varsa o kullanılır.
+    weights, biases = network.get_full_precision_params()
+    flat, shapes = [], []
+    for W, b in zip(weights, biases):
+        for row in W: flat.extend(row)
+        flat.extend(b); shapes.append([len(W), len(b)])
+    return flat, shapes
+
+def unflatten_params(flat, shapes):
+    weights, biases, pos = [], [], 0
+    for n_in, n_out in shapes:
+        weights.append([list(flat[pos + i * n_out:pos + (i + 1) * n_out]) for i in range(n_in)]); pos += n_in * n_out
+        biases.append(list(flat[pos:pos + n_out])); pos += n_out
+    return weights, biases
+
+def _layer_spans(shapes):
+    pos = 0
+    for n_in, n_out in shapes:
+        size = (n_in + 1) * n_out; yield pos, pos + size; pos += size
+
+def encode_residual(residual, fmt, shapes):
+    # (bayt dizisi, katman ölçekleri veya None). float16 aralığını aşan fark OverflowError verir.
+    if fmt == "int8":
+        scales, quantized = [], []
+        for start, end in _layer_spans(shapes):
+            part = residual[start:end]; scale = symmetric_scale(max(map(abs, part), default=0.0))
+            scales.append(scale); quantized.extend(quantize_values(part, scale))
+        return struct.pack(f"<{len(quantized)}b", *quantized), scales
+    try: return struct.pack(f"<{len(residual)}{_STRUCT_CODES[fmt]}", *residual), None
+    except (OverflowError, struct.error) as e: raise OverflowError(f"Fark {fmt} aralığını aşıyor: {e}") from e
+
+def decode_residual(payload, fmt, count, shapes, scales=None):
+    values = struct.unpack(f"<{count}{_STRUCT_CODES[fmt]}", payload)
+    if fmt != "int8": return values
+    result = []
+    for (start, end), scale in zip(_layer_spans(shapes), scales): result.extend(q * scale for q in values[start:end])
+    return result
+
+class SnapshotStore:
+    def __init__(self, directory, every=1, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL, residual_format=DEFAULT_RESIDUAL_FORMAT, max_bytes=DEFAULT_MAX_BYTES):
+        if every < 1: raise ValueError("Anlık görüntü aralığı en az 1 epoch olmalı.")
+        if keyframe_interval < 1: raise ValueError("Anahtar kare aralığı en az 1 olmalı.")
+        if residual_format not in RESIDUAL_FORMATS: raise ValueError(f"Bilinmeyen fark biçimi: {residual_format} (geçerli: {', '.join(RESIDUAL_FORMATS)})")
+        self.directory, self.every, self.keyframe_interval = directory, every, keyframe_interval
+        self.residual_format, self.max_bytes = residual_format, max_bytes
+        self.entries = []  # epoch sırasıyla: {"epoch", "file", "kind": "key"/"delta", "keyframe", "bytes", "format", "scales", "shapes", "info"}
+        self.evicted = 0
+        self._keyframe_cache = None  # (dosya adı, değerler): son kullanılan anahtar kare bellekte tutulur
+        os.makedirs(directory, exist_ok=True)
+        index_path = os.path.join(directory, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as f: self.entries = json.load(f).get("entries", [])
+
+    def should_record(self, epoch):
+        return epoch % self.every == 0
+
+    def epochs(self):
+        return [entry["epoch"] for entry in self.entries]
+
+    @property
+    def total_bytes(self):
+        return sum(entry["bytes"] for entry in self.entries)
+
+    def _path(self, entry):
+        return os.path.join(self.directory, entry["file"])
+
+    def _entry(self, epoch):
+        for entry in self.entries:
+            if entry["epoch"] == epoch: return entry
+        raise ValueError(f"Epoch {epoch} için anlık görüntü yok (kayıtlı: {', '.join(map(str, self.epochs())) or '-'}).")
+
+    def _keyframe_values(self, key_entry):
+        if self._keyframe_cache is None or self._keyframe_cache[0] != key_entry["file"]:
+            with open(self._path(key_entry), "rb") as f: payload = f.read()
+            self._keyframe_cache = (key_entry["file"], struct.unpack(f"<{len(payload) // 8}d", payload))
+        return self._keyframe_cache[1]
+
+    def _write(self, entry, payload):
+        with open(self._path(entry), "wb") as f: f.write(payload)
+        entry["bytes"] = len(payload); self.entries.append(entry)
+
+    def record(self, network, epoch, info=None):
+        # Aynı veya daha önceki bir epoch kaydedilirse (sıfırlanıp yeniden eğitim) sonraki görüntüler geçersizdir ve silinir.
+        flat, shapes = flatten_params(network)
+        self._drop([entry for entry in self.entries if entry["epoch"] >= epoch])
+        key_entry = next((entry for entry in reversed(self.entries) if entry["kind"] == "key"), None)
+        if key_entry is not None and (key_entry["shapes"] != shapes or sum(1 for e in self.entries if e["keyframe"] == key_entry["epoch"]) >= self.keyframe_interval): key_entry = None
+        entry = {"epoch": epoch, "info": info or {}}
+        if key_entry is not None:
+            try:
+                payload, scales = encode_residual(list(map(sub, flat, self._keyframe_values(key_entry))), self.residual_format, shapes)
+                entry.update(kind="delta", keyframe=key_entry["epoch"], file=f"epoch_{epoch:07d}.delta", format=self.residual_format, scales=scales); self._write(entry, payload)
+            except OverflowError: key_entry = None  # fark seçilen biçime sığmıyor: yeni anahtar kare
+        if key_entry is None:
+            entry.update(kind="key", keyframe=epoch, file=f"epoch_{epoch:07d}.key", format="float64", scales=None, shapes=shapes)
+            self._write(entry, struct.pack(f"<{len(flat)}d", *flat)); self._keyframe_cache = (entry["file"], tuple(flat))
+        self._evict(); self._save_index()
+        return entry
+
+    def load(self, epoch):
+        # (ağırlıklar, biaslar) düz listeler olarak.
+        entry = self._entry(epoch)
+        key_entry = self._entry(entry["keyframe"]); shapes = key_entry["shapes"]
+        values = self._keyframe_values(key_entry)
+        if entry["kind"] == "delta":
+            with open(self._path(entry), "rb") as f: payload = f.read()
+            values = list(map(add, values, decode_residual(payload, entry["format"], len(values), shapes, entry["scales"])))
+        return unflatten_params(values, shapes)
+
+    def apply(self, network, epoch):
+        # Görüntüyü ağa yükler (budama maskeleri korunur, tahmin önbelleği katman sürümleriyle geçersizleşir).
+        weights, biases = self.load(epoch)
+        if [[len(W), len(b)] for W, b in zip(weights, biases)] != [[len(W), len(b)] for W, b in zip(network.weights, network.biases)]:
+            raise ValueError(f"Epoch {epoch} görüntüsünün katman boyutları mevcut ağla uyuşmuyor.")
+        for l, (W, b) in enumerate(zip(weights, biases)): network.set_layer_biases(l, b); network.set_layer_weights(l, W)
+        return self._entry(epoch)
+
+    def _drop(self, entries):
+        for entry in entries:
+            try: os.remove(self._path(entry))
+            except FileNotFoundError: pass
+            self.entries.remove(entry)
+            if self._keyframe_cache is not None and self._keyframe_cache[0] == entry["file"]: self._keyframe_cache = None
+
+    def _evict(self):
+        # Halka: boyut aşılırsa en eski grup bütün olarak silinir (farklar anahtar karesiz okunamaz); son grup her zaman kalır.
+        while self.max_bytes and self.total_bytes > self.max_bytes:
+            oldest_key = self.entries[0]["keyframe"]
+            if oldest_key == self.entries[-1]["keyframe"]: break
+            self._drop([entry for entry in self.entries if entry["keyframe"] == oldest_key]); self.evicted += 1
+
+    def _save_index(self):
+        path = os.path.join(self.directory, INDEX_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f: json.dump({"entries": self.entries}, f)
+        os.replace(path + ".tmp", path)
+
+    def clear(self):
+        self._drop(list(self.entries)); self.evicted = 0; self._save_index()
+
+    def stats(self):
+        keyframes = sum(1 for entry in self.entries if entry["kind"] == "key")
+        return {"snapshots": len(self.entries), "keyframes": keyframes, "deltas": len(self.entries) - keyframes, "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes, "evicted_groups": self.evicted, "residual_format": self.residual_format}
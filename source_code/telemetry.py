@@ -0,0 +1,162 @@
+# Eğitim döngüsü içinde katman bazında ucuz telemetri. Ağ her adımı
+# begin_step/end_step ile sarar; optimizer güncellemesinden (her katman, her
+# örnek) çağrılır ve şunları biriktirir:
+#  - gradyan L2 normu: grad_W = a_prev ⊗ delta olduğundan ‖grad_W‖ = ‖a_prev‖·‖delta‖
+#    (matris oluşturmadan O(n_in + n_out)); bias gradyanı için ‖delta‖,
+#  - ölü ReLU oranı: epoch boyunca z > 0 olmamış ReLU nöronlarının oranı
+#    (güncellemeyi yapan ileri yayılımın z'sinden: canlı ağda neuron_outputs_z,
+#    görüntü/bağlam yolunda ctx.z_layers; O(nöron)),
+#  - her sample_every adımda bir: güncelleme/ağırlık oranı ‖ΔW‖/‖W‖, ağırlık
+#    normu, ağırlık histogramı ve optimizer durumunun (hız, m, v) en büyük
+#    mutlak değeri. Bunlar O(ağırlık) olduğu için yalnızca örneklenen adımlarda
+#    hesaplanır.
+# Kayıtlar (örnek ve epoch özeti) isteğe bağlı olarak JSONL dosyasına satır
+# satır yazılır. Kancaların kendi süresi ölçülür ve epoch süresine oranı raporlanır.
+
+import json
+import math
+import time
+from operator import or_, sub
+
+DEFAULT_SAMPLE_EVERY = 100
+DEFAULT_HISTOGRAM_BINS = 20
+OPTIMIZER_WEIGHT_STATE_ATTRS = ("velocity_W", "m_W", "v_W")
+_POSITIVE = (0.0).__lt__  # z -> z > 0
+
+def histogram(values, bins=DEFAULT_HISTOGRAM_BINS):
+    # [min, maks] aralığında eşit genişlikli kutular; {"edges": bins+1 sınır, "counts": bins sayı}.
+    if bins < 1: raise ValueError("Histogram kutu sayısı en az 1 olmalı.")
+    if not values: return {"edges": [], "counts": []}
+    lo, hi = min(values), max(values)
+    if hi == lo: return {"edges": [lo, hi], "counts": [len(values)]}
+    width = (hi - lo) / bins; counts = [0] * bins
+    for v in values: counts[min(bins - 1, int((v - lo) / width))] += 1
+    return {"edges": [lo + k * width for k in range(bins)] + [hi], "counts": counts}
+
+def _layer_weight_values(network, l):
+    # Budanmış katmanda yalnızca kalan bağlantılar; float64 ana kopya varsa o kullanılır.
+    sparse = network.sparse_layers[l]
+    if sparse is not None: return list(sparse.values)
+    W = network.master_weights[l] if network.keep_master_weights else network.weights[l]
+    return [w for row in W for w in row]
+
+class TrainingTelemetry:
+    def __init__(self, sample_every=DEFAULT_SAMPLE_EVERY, histogram_bins=DEFAULT_HISTOGRAM_BINS, jsonl_path=None):
+        if sample_every < 1: raise ValueError("Telemetri örnekleme aralığı en az 1 adım olmalı.")
+        self.sample_every, self.histogram_bins, self.jsonl_path = sample_every, histogram_bins, jsonl_path
+        self._file = None
+        self.step, self.epoch = 0, None
+        self.total_overhead_s = 0.0
+        self.last_sample, self.last_epoch_record = None, None
+        self._layers, self._sampling, self._before = None, False, None
+        self.begin_epoch(None)
+
+    def begin_epoch(self, epoch):
+        self.epoch, self._epoch_t0, self._epoch_steps, self._overhead = epoch, time.perf_counter(), 0, 0.0
+        self._layers = None
+
+    def _ensure_layers(self, network):
+        # Katman başına [grad norm toplamı, grad norm maks, bias grad norm toplamı, oran toplamı, oran sayısı,
+        #                pasif nöron toplamı, aktif bayrakları (ReLU değilse None)]
+        if self._layers is None or len(self._layers) != len(network.weights):
+            self._layers = [[0.0, 0.0, 0.0, 0.0, 0, 0, [False] * n if act == "relu" else None] for n, act in network.layer_configs]
+        return self._layers
+
+    def begin_step(self, network):
+        # Ağ, bir adımın katman güncellemelerinden önce çağırır (katman sırası önemsizdir; checkpoint'li geri yayılım üstten alta günceller).
+        t0 = time.perf_counter()
+        if self._layers is None or len(self._layers) != len(network.weights): self._ensure_layers(network)
+        self.step += 1; self._epoch_steps += 1
+        self._sampling = self.step % self.sample_every == 0
+        if self._sampling: self._sample_layers = []
+        self._overhead += time.perf_counter() - t0
+
+    def before_update(self, network, l, a_prev, delta, z=None):
+        # Örneklenen adımda True döner; yalnızca o zaman güncellemeden sonra after_update çağrılmalıdır.
+        # z: δ ile aynı ileri yayılımdan katmanın z değerleri (None ise ölü ReLU sayımı atlanır).
+        t0 = time.perf_counter()
+        acc = self._layers[l]
+        if acc[6] is not None and z is not None:
+            flags = list(map(_POSITIVE, z))
+            acc[6] = list(map(or_, acc[6], flags)); acc[5] += len(flags) - sum(flags)
+        delta_norm = math.hypot(*delta); grad_norm = math.hypot(*a_prev) * delta_norm
+        acc[0] += grad_norm; acc[2] += delta_norm
+        if grad_norm > acc[1]: acc[1] = grad_norm
+        sampling = self._sampling
+        if sampling: self._before = _layer_weight_values(network, l)
+        self._overhead += time.perf_counter() - t0
+        return sampling
+
+    def after_update(self, network, l):
+        t0 = time.perf_counter()
+        before, after = self._before, _layer_weight_values(network, l)
+        old_norm = math.hypot(*before)
+        ratio = math.hypot(*map(sub, after, before)) / old_norm if old_norm > 0 else 0.0
+        acc = self._layers[l]; acc[3] += ratio; acc[4] += 1
+        self._sample_layers.append({"layer": l, "update_ratio": ratio, "weight_norm": math.hypot(*after),
+                                    "optimizer_state_max": self._optimizer_state_max(network, l), "histogram": histogram(after, self.histogram_bins)})
+        self._before = None
+        self._overhead += time.perf_counter() - t0
+
+    def end_step(self):
+        if not self._sampling: return
+        t0 = time.perf_counter()
+        self.last_sample = {"type": "sample", "epoch": self.epoch, "step": self.step, "layers": sorted(self._sample_layers, key=lambda layer: layer["layer"])}
+        self._emit(self.last_sample); self._sampling = False
+        self._overhead += time.perf_counter() - t0
+
+    @staticmethod
+    def _optimizer_state_max(network, l):
+        result = {}
+        for attr in OPTIMIZER_WEIGHT_STATE_ATTRS:
+            state = getattr(network, attr)
+            if state and state[l]: result[attr] = max((abs(v) for row in state[l] for v in row), default=0.0)
+        return result
+
+    def end_epoch(self, network):
+        # Epoch özeti; ağırlık normu, histogram ve optimizer durumu epoch sonundaki ağırlıklardan hesaplanır.
+        t0 = time.perf_counter()
+        steps, layers = self._epoch_steps, self._ensure_layers(network)
+        record = {"type": "epoch", "epoch": self.epoch, "steps": steps, "layers": []}
+        for l, acc in enumerate(layers):
+            values = _layer_weight_values(network, l); active = acc[6]
+            record["layers"].append({
+                "layer": l, "activation": network.layer_configs[l][1],
+                "grad_norm_mean": acc[0] / steps if steps else 0.0, "grad_norm_max": acc[1], "bias_grad_norm_mean": acc[2] / steps if steps else 0.0,
+                "update_ratio": acc[3] / acc[4] if acc[4] else None,
+                "dead_relu_fraction": (len(active) - sum(active)) / len(active) if active and steps else None,
+                "inactive_fraction": acc[5] / (len(active) * steps) if active and steps else None,
+                "weight_norm": math.hypot(*values), "optimizer_state_max": self._optimizer_state_max(network, l),
+                "histogram": histogram(values, self.histogram_bins)})
+        self._overhead += time.perf_counter() - t0
+        wall = time.perf_counter() - self._epoch_t0
+        record["overhead_s"], record["overhead_pct"] = self._overhead, 100.0 * self._overhead / wall if wall > 0 else 0.0
+        self.total_overhead_s += self._overhead
+        self.last_epoch_record = record; self._emit(record)
+        return record
+
+    def _emit(self, record):
+        if not self.jsonl_path: return
+        if self._file is None: self._file = open(self.jsonl_path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record) + "\n"); self._file.flush()
+
+    def close(self):
+        if self._file is not None: self._file.close(); self._file = None
+
+def format_histogram(hist, width=30):
+    # Yatay metin çubukları; her satır bir kutu.
+    counts, edges = hist["counts"], hist["edges"]
+    if not counts: return []
+    peak = max(counts) or 1
+    return [f"{edges[k]:>9.4f} … {edges[k + 1]:>9.4f} | {'█' * round(width * c / peak):<{width}} {c}" for k, c in enumerate(counts)]
+
+def format_telemetry(record):
+    # Epoch kaydının özet satırları (log ve telemetri paneli için).
+    lines = [f"Epoch {record['epoch']}: {record['steps']} adım, telemetri ek maliyeti {record['overhead_s'] * 1e3:.2f} ms (%{record['overhead_pct']:.2f})"]
+    for layer in record["layers"]:
+        ratio, dead = layer["update_ratio"], layer["dead_relu_fraction"]
+        opt = ", ".join(f"{k} maks {v:.3g}" for k, v in layer["optimizer_state_max"].items())
+        lines.append(f"  K{layer['layer']} ({layer['activation']}): ‖∇W‖ ort. {layer['grad_norm_mean']:.3e} (maks {layer['grad_norm_max']:.3e}), ‖∇b‖ ort. {layer['bias_grad_norm_mean']:.3e}"
+                     + (f", ‖ΔW‖/‖W‖ {ratio:.2e}" if ratio is not None else "") + (f", ölü ReLU %{100 * dead:.1f}" if dead is not None else "")
+                     + f", ‖W‖ {layer['weight_norm']:.3f}" + (f", {opt}" if opt else ""))
+    return lines
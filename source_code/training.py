@@ -0,0 +1,54 @@
+# Kaldığı yerden birebir devam ettirilebilen eğitim için yardımcılar. Örnek
+# sırası EpochSampler'a aittir: her epoch'un karıştırma sırası yalnızca
+# (tohum, epoch) çiftinden türetilir, bu yüzden durum JSON'a yazılabilecek
+# dört sayıdan ibarettir (örnek sayısı, tohum, tamamlanan epoch, epoch içi
+# konum). Kayıttan yüklenen bir örnekleyici, kesintisiz bir eğitimin göreceği
+# sırayı aynen üretir. Python'un genel rastgele sayı üreteci durumu da
+# (ağırlık başlatma vb.) JSON uyumlu biçime çevrilip geri yüklenebilir.
+
+import random
+
+def rng_state_to_json(state=None):
+    # random.getstate() -> [sürüm, [iç durum], gauss_next] (JSON'a yazılabilir liste).
+    version, internal, gauss_next = random.getstate() if state is None else state
+    return [version, list(internal), gauss_next]
+
+def rng_state_from_json(data):
+    try:
+        version, internal, gauss_next = data
+        return (int(version), tuple(int(v) for v in internal), gauss_next)
+    except (TypeError, ValueError) as e: raise ValueError(f"Geçersiz rastgele sayı üreteci durumu: {e}")
+
+class EpochSampler:
+    def __init__(self, n_samples, seed=None, shuffle=True, epoch=0, position=0):
+        if n_samples < 1: raise ValueError("Örnekleyici için en az 1 örnek gerekli.")
+        self.n_samples, self.shuffle = n_samples, shuffle
+        self.seed = random.getrandbits(32) if seed is None else seed  # tohum verilmezse genel üreteçten alınır
+        self.epoch, self.position = epoch, position  # tamamlanan epoch sayısı, mevcut epoch'ta işlenen örnek sayısı
+        self._order, self._order_epoch = None, None
+
+    def _epoch_order(self):
+        if self._order_epoch != self.epoch:
+            order = list(range(self.n_samples))
+            if self.shuffle: random.Random(f"{self.seed}:{self.epoch}").shuffle(order)
+            self._order, self._order_epoch = order, self.epoch
+        return self._order
+
+    def epoch_indices(self):
+        # Mevcut epoch'ta henüz işlenmemiş örneklerin indeksleri (sırasıyla).
+        return self._epoch_order()[self.position:]
+
+    def advance(self, n=1):
+        self.position += n
+        if self.position >= self.n_samples: self.epoch += 1; self.position = 0
+
+    def state_dict(self):
+        return {"n_samples": self.n_samples, "seed": self.seed, "shuffle": self.shuffle, "epoch": self.epoch, "position": self.position}
+
+    @classmethod
+    def from_state(cls, state, n_samples=None):
+        # n_samples verilirse kayıttaki örnek sayısıyla eşleşmesi gerekir (farklı veri setinde sıra anlamsızdır).
+        if n_samples is not None and state.get("n_samples") != n_samples:
+            raise ValueError(f"Kayıtlı örnekleyici {state.get('n_samples')} örnek için; yüklü veri {n_samples} örnek içeriyor.")
+        if not 0 <= state.get("position", 0) < state["n_samples"]: raise ValueError("Kayıtlı örnekleyici konumu geçersiz.")
+        return cls(state["n_samples"], state["seed"], state.get("shuffle", True), state.get("epoch", 0), state.get("position", 0))
@@ -53,6 +53,52 @@ def softmax(x_vector):
         max_val_idx = x_vector.index(max(x_vector))
         return [1.0 if i == max_val_idx else 0.0 for i in range(len(x_vector))]
 
+# Katman vektörü üzerinde çalışan aktivasyon çekirdekleri. Skaler fonksiyonlarla aynı
+# sonuçları verir ancak nöron başına fonksiyon çağrısı ve try/except maliyeti yoktur.
+# Türevler, ileri yayılımda saklanan aktivasyon çıktılarından (a) hesaplanır:
+# sigmoid' = a(1-a), tanh' = 1-a², relu' = 1 (a>0 ise).
+def sigmoid_vector(z_values, exp=math.exp):
+    return [1 / (1 + exp(-z)) if z >= -700 else 0.0 for z in z_values]
+
+def tanh_vector(z_values, tanh=math.tanh):
+    return list(map(tanh, z_values))
+
+def relu_vector(z_values):
+    return [z if z > 0 else 0.0 for z in z_values]
+
+def linear_vector(z_values):
+    return list(z_values)
+
+def sigmoid_derivative_from_output(a_values):
+    return [a * (1 - a) for a in a_values]
+
+def tanh_derivative_from_output(a_values):
+    return [1.0 - a * a for a in a_values]
+
+def relu_derivative_from_output(a_values):
+    return [1.0 if a > 0 else 0.0 for a in a_values]
+
+def ones_derivative_from_output(a_values):
+    return [1.0] * len(a_values)
+
+# Hızlı matematik modu: sigmoid, σ(z) = 0.5 + 0.5·tanh(z/2) özdeşliğiyle tek bir C çağrısına indirgenir.
+# Tam yola göre mutlak hata ≤ 1e-15 (ölçülen ~2.3e-16). Tablo + doğrusal ara değerleme (adım 1/64,
+# hata ~2.9e-6) ve rasyonel polinom yaklaşımları CPython'da math.exp'ten yavaş ölçüldüğü için kullanılmaz.
+# tanh zaten tek bir C çağrısıdır; hızlı modda da tam halidir.
+FAST_MATH_MAX_ABS_ERROR = {"sigmoid": 1e-15, "tanh": 0.0}
+
+def fast_sigmoid_vector(z_values, tanh=math.tanh):
+    return [0.5 + 0.5 * tanh(0.5 * z) for z in z_values]
+
+ACTIVATION_VECTOR_FUNCTIONS = {
+    "sigmoid": (sigmoid_vector, sigmoid_derivative_from_output),
+    "relu": (relu_vector, relu_derivative_from_output),
+    "tanh": (tanh_vector, tanh_derivative_from_output),
+    "linear": (linear_vector, ones_derivative_from_output),
+    "softmax": (lambda z_values: softmax(list(z_values)), ones_derivative_from_output)
+}
+FAST_ACTIVATION_VECTOR_FUNCTIONS = dict(ACTIVATION_VECTOR_FUNCTIONS, sigmoid=(fast_sigmoid_vector, sigmoid_derivative_from_output))
+
 ACTIVATION_FUNCTIONS = {
     "sigmoid": (sigmoid, sigmoid_derivative),
     "relu": (relu, relu_derivative),
@@ -89,6 +135,11 @@ LOSS_FUNCTIONS = {
     "cross_entropy": (cross_entropy_loss, cross_entropy_loss_derivative_with_softmax_for_dL_dzL)
 }
 
+def predicted_class(outputs):
+    # Tek çıkışta 0.5 eşiği, çok çıkışta argmax.
+    if len(outputs) == 1: return 1 if outputs[0] >= 0.5 else 0
+    return max(range(len(outputs)), key=outputs.__getitem__)
+
 # Vektör/Matris Yardımcı Fonksiyonları
 def multiply_row_vector_matrix(row_vector, matrix):
     if not matrix: return [] 
@@ -133,30 +184,3 @@ def add_matrices(m1, m2):
 def subtract_matrices(m1, m2):
     if len(m1) != len(m2) or (m1 and len(m1[0]) != len(m2[0])): raise ValueError("Matris boyutları çıkarma için eşleşmeli.")
     return [[m1[i][j] - m2[i][j] for j in range(len(m1[0]))] for i in range(len(m1))]
-
-# Tooltip Sınıfı
-import tkinter as tk
-from tkinter import ttk
-
-class ToolTip:
-    def __init__(self, widget, text):
-        self.widget = widget
-        self.text = text
-        self.tooltip_window = None
-        widget.bind("<Enter>", self.show_tooltip)
-        widget.bind("<Leave>", self.hide_tooltip)
-
-    def show_tooltip(self, event=None):
-        x, y, _, _ = self.widget.bbox("insert")
-        x += self.widget.winfo_rootx() + 25
-        y += self.widget.winfo_rooty() + 20
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
-        label = ttk.Label(self.tooltip_window, text=self.text, background="#ffffe0", relief="solid", borderwidth=1, padding=3, font=("Calibri", 9))
-        label.pack()
-
-    def hide_tooltip(self, event=None):
-        if self.tooltip_window:
-            self.tooltip_window.destroy()
-        self.tooltip_window = None
\ No newline at end of file